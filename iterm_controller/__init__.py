@@ -45,12 +45,16 @@ from iterm_controller.api import (
     TaskResult,
     TestStepResult,
     ProjectResult,
+    BroadcastResult,
     # Convenience functions
     spawn_session,
+    send_to_sessions,
     claim_task,
     toggle_test_step,
     list_projects,
     list_sessions,
+    get_shared_api,
+    close_shared_api,
     # State query functions
     get_state,
     get_plan,
@@ -120,6 +124,7 @@ from iterm_controller.models import (
 
 from iterm_controller.state import (
     AppState,
+    SessionSelector,
     StateSnapshot,
     StateEvent,
 )
@@ -193,12 +198,16 @@ __all__ = [
     "TaskResult",
     "TestStepResult",
     "ProjectResult",
+    "BroadcastResult",
     # Convenience functions
     "spawn_session",
+    "send_to_sessions",
     "claim_task",
     "toggle_test_step",
     "list_projects",
     "list_sessions",
+    "get_shared_api",
+    "close_shared_api",
     # State query functions
     "get_state",
     "get_plan",
@@ -255,6 +264,7 @@ __all__ = [
     "ArtifactStatus",
     # State management
     "AppState",
+    "SessionSelector",
     "StateSnapshot",
     "StateEvent",
     # iTerm2 integration
@@ -13,6 +13,11 @@ Usage:
     python -m iterm_controller kill --session SESSION_ID
     python -m iterm_controller task claim --project myproj --task 2.1
     python -m iterm_controller task done --project myproj --task 2.1
+    python -m iterm_controller notification-latency --window 3600
+    python -m iterm_controller search "connection refused" --project myproj
+
+    # Keep a daemon running; CLI commands then use it automatically
+    python -m iterm_controller daemon start
 """
 
 from __future__ import annotations
@@ -76,11 +81,27 @@ def _print_table(rows: list[dict[str, Any]], columns: list[str]) -> None:
 # =============================================================================
 
 
-async def cmd_list_projects(args: argparse.Namespace) -> int:
-    """Handle list-projects command."""
+async def _open_api(args: argparse.Namespace) -> Any:
+    """Get an API for a command.
+
+    Returns a RemoteAPI backed by the running daemon if there is one (and
+    --no-daemon was not given), otherwise a new ItermControllerAPI.
+    """
+    if not getattr(args, "no_daemon", False):
+        from iterm_controller.daemon import RemoteAPI, connect_to_daemon
+
+        client = await connect_to_daemon()
+        if client is not None:
+            return RemoteAPI(client)
+
     from iterm_controller.api import ItermControllerAPI
 
-    api = ItermControllerAPI()
+    return ItermControllerAPI()
+
+
+async def cmd_list_projects(args: argparse.Namespace) -> int:
+    """Handle list-projects command."""
+    api = await _open_api(args)
     result = await api.initialize(connect_iterm=False)
     if not result.success:
         print(f"Error: {result.error}", file=sys.stderr)
@@ -125,9 +146,7 @@ async def cmd_list_projects(args: argparse.Namespace) -> int:
 
 async def cmd_list_sessions(args: argparse.Namespace) -> int:
     """Handle list-sessions command."""
-    from iterm_controller.api import ItermControllerAPI
-
-    api = ItermControllerAPI()
+    api = await _open_api(args)
     result = await api.initialize(connect_iterm=True)
     if not result.success:
         print(f"Error: {result.error}", file=sys.stderr)
@@ -176,9 +195,7 @@ async def cmd_list_sessions(args: argparse.Namespace) -> int:
 
 async def cmd_spawn(args: argparse.Namespace) -> int:
     """Handle spawn command."""
-    from iterm_controller.api import ItermControllerAPI
-
-    api = ItermControllerAPI()
+    api = await _open_api(args)
     result = await api.initialize(connect_iterm=True)
     if not result.success:
         print(f"Error: {result.error}", file=sys.stderr)
@@ -217,9 +234,7 @@ async def cmd_spawn(args: argparse.Namespace) -> int:
 
 async def cmd_kill(args: argparse.Namespace) -> int:
     """Handle kill command."""
-    from iterm_controller.api import ItermControllerAPI
-
-    api = ItermControllerAPI()
+    api = await _open_api(args)
     result = await api.initialize(connect_iterm=True)
     if not result.success:
         print(f"Error: {result.error}", file=sys.stderr)
@@ -249,11 +264,68 @@ async def cmd_kill(args: argparse.Namespace) -> int:
         await api.shutdown()
 
 
+async def cmd_send(args: argparse.Namespace) -> int:
+    """Handle send command."""
+    if args.ctrl_c == (args.text is not None):
+        print("Error: Give either TEXT or --ctrl-c", file=sys.stderr)
+        return 1
+    if args.select is not None and not args.select.strip():
+        print("Error: Empty selector (use --all to send to every session)", file=sys.stderr)
+        return 1
+
+    from iterm_controller.state import SessionSelector
+
+    api = await _open_api(args)
+    result = await api.initialize(connect_iterm=True)
+    if not result.success:
+        print(f"Error: {result.error}", file=sys.stderr)
+        return 1
+
+    try:
+        if not api.is_connected:
+            print("Error: Not connected to iTerm2. Is iTerm2 running?", file=sys.stderr)
+            return 1
+
+        target: list[str] | str | SessionSelector
+        if args.all:
+            target = SessionSelector()
+        else:
+            target = args.session or args.select
+        if args.ctrl_c:
+            send_result = await api.send_to_sessions(target, "\x03", newline=False)
+        else:
+            send_result = await api.send_to_sessions(
+                target, args.text, newline=not args.no_newline
+            )
+
+        if args.json:
+            _print_json({
+                "success": send_result.success,
+                "error": send_result.error,
+                "results": {
+                    sid: {"success": r.success, "error": r.error}
+                    for sid, r in send_result.results.items()
+                },
+            })
+        elif not send_result.results:
+            if send_result.success:
+                print("No matching sessions")
+            else:
+                print(f"Error: {send_result.error}", file=sys.stderr)
+        else:
+            for sid in send_result.sent:
+                print(f"Sent to {sid}")
+            for sid in send_result.failed:
+                print(f"Failed {sid}: {send_result.results[sid].error}", file=sys.stderr)
+
+        return 0 if send_result.success else 1
+    finally:
+        await api.shutdown()
+
+
 async def cmd_task_claim(args: argparse.Namespace) -> int:
     """Handle task claim command."""
-    from iterm_controller.api import ItermControllerAPI
-
-    api = ItermControllerAPI()
+    api = await _open_api(args)
     result = await api.initialize(connect_iterm=False)
     if not result.success:
         print(f"Error: {result.error}", file=sys.stderr)
@@ -292,9 +364,7 @@ async def cmd_task_claim(args: argparse.Namespace) -> int:
 
 async def cmd_task_done(args: argparse.Namespace) -> int:
     """Handle task done command."""
-    from iterm_controller.api import ItermControllerAPI
-
-    api = ItermControllerAPI()
+    api = await _open_api(args)
     result = await api.initialize(connect_iterm=False)
     if not result.success:
         print(f"Error: {result.error}", file=sys.stderr)
@@ -333,10 +403,9 @@ async def cmd_task_done(args: argparse.Namespace) -> int:
 
 async def cmd_task_list(args: argparse.Namespace) -> int:
     """Handle task list command."""
-    from iterm_controller.api import ItermControllerAPI
     from iterm_controller.models import TaskStatus
 
-    api = ItermControllerAPI()
+    api = await _open_api(args)
     result = await api.initialize(connect_iterm=False)
     if not result.success:
         print(f"Error: {result.error}", file=sys.stderr)
@@ -397,9 +466,7 @@ async def cmd_task_list(args: argparse.Namespace) -> int:
 
 async def cmd_task_unclaim(args: argparse.Namespace) -> int:
     """Handle task unclaim command."""
-    from iterm_controller.api import ItermControllerAPI
-
-    api = ItermControllerAPI()
+    api = await _open_api(args)
     result = await api.initialize(connect_iterm=False)
     if not result.success:
         print(f"Error: {result.error}", file=sys.stderr)
@@ -438,9 +505,7 @@ async def cmd_task_unclaim(args: argparse.Namespace) -> int:
 
 async def cmd_task_skip(args: argparse.Namespace) -> int:
     """Handle task skip command."""
-    from iterm_controller.api import ItermControllerAPI
-
-    api = ItermControllerAPI()
+    api = await _open_api(args)
     result = await api.initialize(connect_iterm=False)
     if not result.success:
         print(f"Error: {result.error}", file=sys.stderr)
@@ -477,6 +542,232 @@ async def cmd_task_skip(args: argparse.Namespace) -> int:
         await api.shutdown()
 
 
+async def cmd_notification_latency(args: argparse.Namespace) -> int:
+    """Handle notification-latency command."""
+    from datetime import datetime
+
+    from iterm_controller.api import ItermControllerAPI
+
+    api = ItermControllerAPI()
+    report = await api.get_notification_latency(args.window)
+
+    if args.json:
+        if not args.violations:
+            report.pop("violations", None)
+        _print_json(report)
+        return 0
+
+    scope = f"last {args.window:g}s" if args.window is not None else "all recorded"
+    if not report["count"]:
+        print(f"No notifications recorded ({scope}).")
+        return 0
+
+    count = report["count"]
+    print(f"Notification latency ({scope}): {count} notifications")
+    print(
+        f"SLA ({report['sla_seconds']:g}s): {report['sla_met']} met, "
+        f"{report['sla_violated']} violated "
+        f"({report['sla_met'] / count:.1%} compliant)"
+    )
+    print()
+
+    _print_table(
+        [
+            {
+                "Stage": name,
+                **{
+                    col: f"{stats[col.lower()]:.3f}s"
+                    for col in ("P50", "P90", "P95", "P99", "Max")
+                },
+            }
+            for name, stats in report["stages"].items()
+        ],
+        ["Stage", "P50", "P90", "P95", "P99", "Max"],
+    )
+    print()
+
+    print("End-to-end histogram:")
+    histogram = report["stages"]["total"]["histogram"]
+    for bucket in histogram:
+        if bucket["le"] == "+Inf":
+            label = f"> {histogram[-2]['le']:g}s"
+        else:
+            label = f"<= {bucket['le']:g}s"
+        bar = "#" * round(40 * bucket["count"] / count)
+        print(f"  {label:>9}  {bucket['count']:>6}  {bar}")
+
+    if args.violations:
+        print()
+        print("SLA violations:")
+        _print_table(
+            [
+                {
+                    "Time": datetime.fromtimestamp(v["timestamp"]).strftime("%Y-%m-%d %H:%M:%S"),
+                    "Session": v["session_id"],
+                    "Total": f"{v['total']:.2f}s",
+                    "Detection": f"{v['detection']:.2f}s",
+                    "Dispatch": f"{v['dispatch']:.2f}s",
+                    "Delivery": f"{v['delivery']:.2f}s",
+                }
+                for v in report["violations"]
+            ],
+            ["Time", "Session", "Total", "Detection", "Dispatch", "Delivery"],
+        )
+
+    return 0
+
+
+async def cmd_search(args: argparse.Namespace) -> int:
+    """Handle search command."""
+    import time
+    from datetime import datetime
+    from pathlib import Path
+
+    from iterm_controller.exceptions import DaemonError
+
+    api = await _open_api(args)
+    # Loads the config, so the configured search_index_path is used
+    await api.initialize(connect_iterm=False)
+    try:
+        hits = await api.search_output(
+            args.query,
+            limit=args.limit,
+            context=args.context,
+            session_id=args.session,
+            project_id=args.project,
+            since=time.time() - args.since if args.since is not None else None,
+            raw=args.raw,
+            index_path=Path(args.index).expanduser() if args.index else None,
+        )
+    except (ValueError, DaemonError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    finally:
+        await api.shutdown()
+
+    if args.json:
+        _print_json(hits)
+        return 0
+
+    if not hits:
+        print("No matches.")
+        return 0
+
+    for i, hit in enumerate(hits):
+        if i:
+            print()
+        when = datetime.fromtimestamp(hit["timestamp"]).strftime("%Y-%m-%d %H:%M:%S")
+        origin = "/".join(part for part in (hit["project_id"], hit["template_id"]) if part)
+        print(f"{when}  {hit['session_id']}" + (f"  ({origin})" if origin else ""))
+        for line in hit["before"]:
+            print(f"    {line}")
+        print(f"  > {hit['line']}")
+        for line in hit["after"]:
+            print(f"    {line}")
+
+    return 0
+
+
+async def _daemon_client() -> Any:
+    """Connect to the running daemon, or return None if there is none."""
+    from iterm_controller.daemon import DaemonClient
+    from iterm_controller.exceptions import DaemonError
+
+    client = DaemonClient()
+    try:
+        await client.connect(timeout=0.5)
+    except DaemonError:
+        return None
+    return client
+
+
+async def cmd_daemon_run(args: argparse.Namespace) -> int:
+    """Handle daemon run command."""
+    from iterm_controller.daemon import run_daemon
+    from iterm_controller.exceptions import DaemonError
+
+    try:
+        await run_daemon()
+    except DaemonError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
+async def cmd_daemon_start(args: argparse.Namespace) -> int:
+    """Handle daemon start command."""
+    import subprocess
+
+    client = await _daemon_client()
+    if client is not None:
+        status = await client.call("status")
+        await client.close()
+        print(f"Daemon already running (pid {status['pid']}).")
+        return 0
+
+    subprocess.Popen(
+        [sys.executable, "-m", "iterm_controller", "daemon", "run"],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+
+    # Wait for the daemon to start listening
+    deadline = asyncio.get_running_loop().time() + args.timeout
+    while asyncio.get_running_loop().time() < deadline:
+        client = await _daemon_client()
+        if client is not None:
+            status = await client.call("status")
+            await client.close()
+            print(f"Daemon started (pid {status['pid']}).")
+            return 0
+        await asyncio.sleep(0.1)
+
+    print("Error: Daemon did not start; run 'daemon run' to see why.", file=sys.stderr)
+    return 1
+
+
+async def cmd_daemon_stop(args: argparse.Namespace) -> int:
+    """Handle daemon stop command."""
+    client = await _daemon_client()
+    if client is None:
+        print("Daemon not running.")
+        return 0
+
+    try:
+        await client.call("shutdown")
+    finally:
+        await client.close()
+    print("Daemon stopped.")
+    return 0
+
+
+async def cmd_daemon_status(args: argparse.Namespace) -> int:
+    """Handle daemon status command."""
+    client = await _daemon_client()
+    if client is None:
+        if args.json:
+            _print_json({"running": False})
+        else:
+            print("Daemon not running.")
+        return 1
+
+    try:
+        status = await client.call("status")
+    finally:
+        await client.close()
+
+    if args.json:
+        _print_json({"running": True, **status})
+    else:
+        print(f"Daemon running (pid {status['pid']}, up {status['uptime']:.0f}s)")
+        print(f"  iTerm2 connected: {'yes' if status['connected'] else 'no'}")
+        print(f"  Requests served: {status['requests']}")
+        print(f"  Open projects: {', '.join(status['open_projects']) or '-'}")
+    return 0
+
+
 def _run_async(coro: Any) -> int:
     """Run an async coroutine and return exit code."""
     return asyncio.run(coro)
@@ -518,10 +809,24 @@ Examples:
   # Kill a session
   python -m iterm_controller kill --session SESSION_ID
 
+  # Interrupt every waiting Claude session in a project
+  python -m iterm_controller send --select "project=myproj template=claude state=waiting" --ctrl-c
+
   # Task operations
   python -m iterm_controller task list --project myproj
   python -m iterm_controller task claim --project myproj --task 2.1
   python -m iterm_controller task done --project myproj --task 2.1
+
+  # Notification latency over the last hour, with SLA violations
+  python -m iterm_controller notification-latency --window 3600 --violations
+
+  # Find where an error appeared in any session's output (needs search_index_enabled)
+  python -m iterm_controller search "connection refused" --project myproj --since 86400
+
+  # Serve commands from a background daemon (skips config load and iTerm2 connect)
+  python -m iterm_controller daemon start
+  python -m iterm_controller daemon status
+  python -m iterm_controller daemon stop
 """,
     )
 
@@ -542,6 +847,11 @@ Examples:
         action="store_true",
         help="Disable logging to file",
     )
+    parser.add_argument(
+        "--no-daemon",
+        action="store_true",
+        help="Do not use a running daemon; run the command in this process",
+    )
 
     # Subcommands
     subparsers = parser.add_subparsers(dest="command", help="Available commands")
@@ -602,6 +912,44 @@ Examples:
     )
     _add_common_args(kill_parser)
 
+    # send
+    send_parser = subparsers.add_parser(
+        "send",
+        help="Send text to one or more sessions",
+    )
+    send_parser.add_argument(
+        "text",
+        nargs="?",
+        help="Text to send (a newline is appended unless --no-newline)",
+    )
+    send_target = send_parser.add_mutually_exclusive_group(required=True)
+    send_target.add_argument(
+        "--session",
+        action="append",
+        help="Session ID to send to (repeatable)",
+    )
+    send_target.add_argument(
+        "--select",
+        metavar="SELECTOR",
+        help='Sessions to send to, e.g. "project=myproj template=claude state=waiting"',
+    )
+    send_target.add_argument(
+        "--all",
+        action="store_true",
+        help="Send to every session",
+    )
+    send_parser.add_argument(
+        "--ctrl-c",
+        action="store_true",
+        help="Send Ctrl+C instead of text",
+    )
+    send_parser.add_argument(
+        "--no-newline",
+        action="store_true",
+        help="Do not append a newline to the text",
+    )
+    _add_common_args(send_parser)
+
     # task subcommands
     task_parser = subparsers.add_parser(
         "task",
@@ -694,6 +1042,100 @@ Examples:
     )
     _add_common_args(task_skip_parser)
 
+    # notification-latency
+    latency_parser = subparsers.add_parser(
+        "notification-latency",
+        help="Report notification latency percentiles and SLA violations",
+    )
+    latency_parser.add_argument(
+        "--window",
+        type=float,
+        help="Only include notifications from the last N seconds",
+    )
+    latency_parser.add_argument(
+        "--violations",
+        action="store_true",
+        help="List notifications that exceeded the SLA",
+    )
+    _add_common_args(latency_parser)
+
+    # search
+    search_parser = subparsers.add_parser(
+        "search",
+        help="Search the output of monitored sessions",
+    )
+    search_parser.add_argument(
+        "query",
+        help="Text to find; every word must appear in the line",
+    )
+    search_parser.add_argument(
+        "--project",
+        help="Only search this project's sessions",
+    )
+    search_parser.add_argument(
+        "--session",
+        help="Only search this session",
+    )
+    search_parser.add_argument(
+        "--since",
+        type=float,
+        help="Only search output from the last N seconds",
+    )
+    search_parser.add_argument(
+        "--limit",
+        type=int,
+        default=20,
+        help="Most matches to show (default: 20)",
+    )
+    search_parser.add_argument(
+        "--context",
+        type=int,
+        default=2,
+        help="Lines of output to show around each match (default: 2)",
+    )
+    search_parser.add_argument(
+        "--raw",
+        action="store_true",
+        help="Pass the query to SQLite FTS5 unchanged (phrases, prefixes, OR/NOT)",
+    )
+    search_parser.add_argument(
+        "--index",
+        help="Search database to read (default: the configured one)",
+    )
+    _add_common_args(search_parser)
+
+    # daemon subcommands
+    daemon_parser = subparsers.add_parser(
+        "daemon",
+        help="Run a background daemon that serves CLI and API calls",
+    )
+    daemon_subparsers = daemon_parser.add_subparsers(
+        dest="daemon_command", help="Daemon commands"
+    )
+    daemon_subparsers.add_parser(
+        "run",
+        help="Run the daemon in the foreground",
+    )
+    daemon_start_parser = daemon_subparsers.add_parser(
+        "start",
+        help="Start the daemon in the background",
+    )
+    daemon_start_parser.add_argument(
+        "--timeout",
+        type=float,
+        default=10.0,
+        help="Seconds to wait for the daemon to start (default: 10)",
+    )
+    daemon_subparsers.add_parser(
+        "stop",
+        help="Stop the running daemon",
+    )
+    daemon_status_parser = daemon_subparsers.add_parser(
+        "status",
+        help="Show whether the daemon is running",
+    )
+    _add_common_args(daemon_status_parser)
+
     return parser
 
 
@@ -718,6 +1160,9 @@ def main() -> int:
     if args.command == "kill":
         return _run_async(cmd_kill(args))
 
+    if args.command == "send":
+        return _run_async(cmd_send(args))
+
     if args.command == "task":
         if args.task_command == "list":
             return _run_async(cmd_task_list(args))
@@ -733,6 +1178,24 @@ def main() -> int:
         parser.parse_args(["task", "--help"])
         return 1
 
+    if args.command == "notification-latency":
+        return _run_async(cmd_notification_latency(args))
+
+    if args.command == "search":
+        return _run_async(cmd_search(args))
+
+    if args.command == "daemon":
+        if args.daemon_command == "run":
+            return _run_async(cmd_daemon_run(args))
+        if args.daemon_command == "start":
+            return _run_async(cmd_daemon_start(args))
+        if args.daemon_command == "stop":
+            return _run_async(cmd_daemon_stop(args))
+        if args.daemon_command == "status":
+            return _run_async(cmd_daemon_status(args))
+        parser.parse_args(["daemon", "--help"])
+        return 1
+
     # No subcommand - launch TUI
     from iterm_controller.app import ItermControllerApp
 
@@ -37,6 +37,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import time
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
@@ -44,6 +45,7 @@ from typing import TYPE_CHECKING, Any
 if TYPE_CHECKING:
     import iterm2
 
+    from .daemon import RemoteAPI
     from .services import ServiceContainer
 
 from .config import (
@@ -53,6 +55,7 @@ from .config import (
 from .exceptions import (
     ConfigLoadError,
     ItermConnectionError,
+    ItermControllerError,
     ItermNotConnectedError,
     PlanParseError,
     PlanWriteError,
@@ -63,6 +66,7 @@ from .iterm import (
     CloseResult,
     ItermController,
     LayoutSpawnResult,
+    SessionPool,
     SessionSpawner,
     SessionTerminator,
     SpawnResult,
@@ -84,9 +88,11 @@ from .models import (
     WindowLayout,
     WorkflowMode,
 )
+from .notifications import default_latency_log_path, load_latency_log, summarize_latencies
 from .plan_parser import PlanParser, PlanUpdater
 from .plan_watcher import PlanWatcher, PlanWriteQueue
-from .state import AppState, StateSnapshot
+from .search_index import SearchIndex
+from .state import AppState, SessionSelector, StateSnapshot
 from .test_plan_parser import TestPlanParser, TestPlanUpdater
 
 logger = logging.getLogger(__name__)
@@ -142,6 +148,104 @@ class ProjectResult(APIResult):
     project: Project | None = None
 
 
+@dataclass
+class BroadcastResult(APIResult):
+    """Result of sending text to several sessions.
+
+    success is True only if every send succeeded. results holds the outcome
+    for each targeted session, keyed by session ID.
+    """
+
+    results: dict[str, APIResult] = field(default_factory=dict)
+
+    @property
+    def sent(self) -> list[str]:
+        """Get the IDs of sessions the text was sent to."""
+        return [sid for sid, r in self.results.items() if r.success]
+
+    @property
+    def failed(self) -> list[str]:
+        """Get the IDs of sessions the text could not be sent to."""
+        return [sid for sid, r in self.results.items() if not r.success]
+
+
+# =============================================================================
+# Batch Send Helpers
+# =============================================================================
+
+# Default number of sends to one batch of sessions in flight at once
+DEFAULT_SEND_CONCURRENCY = 16
+
+
+def _resolve_send_targets(
+    state: AppState, target: list[str] | str | SessionSelector
+) -> dict[str, ManagedSession | None]:
+    """Resolve session IDs or a selector to sessions.
+
+    Args:
+        state: The state holding the sessions.
+        target: Session IDs, a selector string, or a SessionSelector.
+
+    Returns:
+        Sessions by ID, with None for IDs that are not known.
+
+    Raises:
+        ValueError: If a selector string cannot be parsed.
+    """
+    if isinstance(target, str):
+        target = SessionSelector.parse(target)
+    if isinstance(target, SessionSelector):
+        return {s.id: s for s in state.select_sessions(target)}
+    return {session_id: state.sessions.get(session_id) for session_id in target}
+
+
+async def _send_to_many(
+    iterm: ItermController,
+    targets: dict[str, ManagedSession | None],
+    text: str,
+    max_in_flight: int,
+) -> BroadcastResult:
+    """Send text to resolved sessions concurrently.
+
+    Args:
+        iterm: The connected iTerm controller.
+        targets: Sessions by ID, as returned by _resolve_send_targets.
+        text: The exact text to send.
+        max_in_flight: Maximum number of sends outstanding at once.
+
+    Returns:
+        BroadcastResult with a result per session.
+    """
+    app = iterm.app
+    if not app:
+        return BroadcastResult(success=False, error="iTerm app not available")
+
+    semaphore = asyncio.Semaphore(max(1, max_in_flight))
+
+    async def send_one(session_id: str, session: ManagedSession | None) -> APIResult:
+        if session is None:
+            return APIResult.fail(f"Session not found: {session_id}")
+        iterm_session = app.get_session_by_id(session_id)
+        if not iterm_session:
+            return APIResult.fail("Session no longer exists in iTerm2")
+        async with semaphore:
+            try:
+                await iterm_session.async_send_text(text)
+            except Exception as e:
+                logger.error("Failed to send to session %s: %s", session_id, e)
+                return APIResult.fail(str(e))
+        return APIResult.ok()
+
+    outcomes = await asyncio.gather(*(send_one(sid, s) for sid, s in targets.items()))
+    results = dict(zip(targets, outcomes, strict=True))
+    failed = sum(1 for r in outcomes if not r.success)
+    if failed:
+        return BroadcastResult(
+            success=False, error=f"{failed} of {len(results)} sends failed", results=results
+        )
+    return BroadcastResult(success=True, results=results)
+
+
 # =============================================================================
 # Main API Class
 # =============================================================================
@@ -159,11 +263,18 @@ class ItermControllerAPI:
         await api.initialize()
         await api.spawn_session("my-project", "dev-server")
         await api.shutdown()
+
+        # Or, connecting to iTerm2 only when an operation needs it:
+        async with ItermControllerAPI() as api:
+            for task_id in ("1.1", "1.2"):
+                await api.claim_task("my-project", task_id)
     """
 
     def __init__(self) -> None:
         """Initialize the API (not yet connected)."""
         self._initialized = False
+        self._connect_on_demand = False
+        self._connect_lock = asyncio.Lock()
         self._state: AppState = AppState()
         self._iterm: ItermController = ItermController()
         self._spawner: SessionSpawner | None = None
@@ -188,6 +299,43 @@ class ItermControllerAPI:
         """Get the current application state."""
         return self._state
 
+    async def __aenter__(self) -> ItermControllerAPI:
+        """Initialize, connecting to iTerm2 on first use.
+
+        Raises:
+            ItermControllerError: If the API fails to initialize.
+        """
+        result = await self.initialize(connect_iterm=False, connect_on_demand=True)
+        if not result.success:
+            raise ItermControllerError(f"Failed to initialize API: {result.error}")
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        """Shut down, keeping managed sessions open."""
+        await self.shutdown()
+
+    async def _ensure_connected(self) -> bool:
+        """Make sure there is an iTerm2 connection for an operation.
+
+        Connects now if the API was initialized with connect_on_demand.
+        A failed attempt is retried by the next operation.
+
+        Returns:
+            True if connected to iTerm2.
+        """
+        if self._iterm.is_connected:
+            return True
+        if not self._connect_on_demand:
+            return False
+        async with self._connect_lock:
+            if not self._iterm.is_connected:
+                try:
+                    await self._iterm.connect()
+                except ItermConnectionError as e:
+                    logger.warning("Could not connect to iTerm2: %s", e)
+                    return False
+        return True
+
     async def _get_project_window(self, project_id: str) -> "iterm2.Window | None":
         """Get the iTerm2 window associated with a project's sessions.
 
@@ -217,13 +365,17 @@ class ItermControllerAPI:
 
         return None
 
-    async def initialize(self, connect_iterm: bool = True) -> APIResult:
+    async def initialize(
+        self, connect_iterm: bool = True, connect_on_demand: bool = False
+    ) -> APIResult:
         """Initialize the API.
 
         Loads configuration and optionally connects to iTerm2.
 
         Args:
             connect_iterm: If True, establish iTerm2 connection.
+            connect_on_demand: If True, connect to iTerm2 when an operation
+                first needs it (spawning, killing, focusing, sending text).
 
         Returns:
             APIResult indicating success or failure.
@@ -238,6 +390,15 @@ class ItermControllerAPI:
             self._layout_manager = WindowLayoutManager(self._iterm)
             self._layout_spawner = WindowLayoutSpawner(self._iterm, self._spawner)
 
+            # Keep warm shells for fast spawning if enabled
+            settings = self._state.config.settings if self._state.config else None
+            if settings and settings.session_pool_size > 0:
+                self._spawner.pool = SessionPool(
+                    self._iterm,
+                    size=settings.session_pool_size,
+                    idle_timeout=settings.session_pool_idle_seconds,
+                )
+
             # Load layouts from config
             if self._state.config and self._state.config.window_layouts:
                 self._layout_manager.load_from_config(self._state.config.window_layouts)
@@ -249,7 +410,10 @@ class ItermControllerAPI:
                 except ItermConnectionError as e:
                     logger.warning("Could not connect to iTerm2: %s", e)
                     # Continue without iTerm2 connection
+                if self._spawner.pool and self._iterm.is_connected:
+                    await self._spawner.pool.start()
 
+            self._connect_on_demand = connect_on_demand
             self._initialized = True
             logger.info("ItermControllerAPI initialized")
             return APIResult.ok()
@@ -284,6 +448,13 @@ class ItermControllerAPI:
                     sessions, self._spawner, force=False
                 )
 
+            # Close warm shells nobody claimed
+            if self._spawner and self._spawner.pool:
+                await self._spawner.pool.stop()
+
+            if self._terminator:
+                await self._terminator.close()
+
             # Disconnect from iTerm2
             await self._iterm.disconnect()
 
@@ -362,8 +533,12 @@ class ItermControllerAPI:
         try:
             await self._state.open_project(project_id)
 
-            # Load and watch PLAN.md
-            await self._load_plan_for_project(project)
+            # Load and watch PLAN.md (an open project's watcher keeps it current)
+            if project.id not in self._plan_watchers:
+                await self._load_plan_for_project(project)
+
+            if self._spawner:
+                self._spawner.prewarm(project)
 
             return ProjectResult(success=True, project=project)
 
@@ -549,7 +724,7 @@ class ItermControllerAPI:
         Returns:
             SessionResult with the spawned session.
         """
-        if not self._iterm.is_connected:
+        if not await self._ensure_connected():
             return SessionResult(success=False, error="Not connected to iTerm2")
 
         project = self._state.projects.get(project_id)
@@ -603,7 +778,7 @@ class ItermControllerAPI:
         Returns:
             APIResult indicating success or failure.
         """
-        if not self._iterm.is_connected:
+        if not await self._ensure_connected():
             return APIResult.fail("Not connected to iTerm2")
 
         session = self._state.sessions.get(session_id)
@@ -646,7 +821,7 @@ class ItermControllerAPI:
         Returns:
             APIResult indicating success or failure.
         """
-        if not self._iterm.is_connected:
+        if not await self._ensure_connected():
             return APIResult.fail("Not connected to iTerm2")
 
         session = self._state.sessions.get(session_id)
@@ -690,7 +865,7 @@ class ItermControllerAPI:
         Returns:
             APIResult indicating success or failure.
         """
-        if not self._iterm.is_connected:
+        if not await self._ensure_connected():
             return APIResult.fail("Not connected to iTerm2")
 
         session = self._state.sessions.get(session_id)
@@ -714,6 +889,41 @@ class ItermControllerAPI:
             logger.error("Failed to send to session: %s", e)
             return APIResult.fail(str(e))
 
+    async def send_to_sessions(
+        self,
+        target: list[str] | str | SessionSelector,
+        text: str,
+        newline: bool = True,
+        max_in_flight: int = DEFAULT_SEND_CONCURRENCY,
+    ) -> BroadcastResult:
+        """Send text to several terminal sessions at once.
+
+        Sessions are resolved once, then sent to concurrently with at most
+        max_in_flight sends outstanding.
+
+        Args:
+            target: Session IDs, or a selector such as
+                "project=my-app state=waiting" (string or SessionSelector).
+            text: The text to send.
+            newline: Append a newline if not present. Pass False to send
+                control characters such as Ctrl+C ("\\x03") as-is.
+            max_in_flight: Maximum number of sends outstanding at once.
+
+        Returns:
+            BroadcastResult with a result per targeted session.
+        """
+        if not await self._ensure_connected():
+            return BroadcastResult(success=False, error="Not connected to iTerm2")
+
+        try:
+            targets = _resolve_send_targets(self._state, target)
+        except ValueError as e:
+            return BroadcastResult(success=False, error=str(e))
+
+        if newline and not text.endswith("\n"):
+            text = text + "\n"
+        return await _send_to_many(self._iterm, targets, text, max_in_flight)
+
     # =========================================================================
     # Task Operations (PLAN.md)
     # =========================================================================
@@ -1046,7 +1256,7 @@ class ItermControllerAPI:
         Returns:
             LayoutSpawnResult, or None if layout not found.
         """
-        if not self._iterm.is_connected:
+        if not await self._ensure_connected():
             return None
 
         project = self._state.projects.get(project_id)
@@ -1134,6 +1344,100 @@ class ItermControllerAPI:
             return {}
         return test_plan.summary
 
+    async def get_state_snapshot(self) -> StateSnapshot:
+        """Get a read-only snapshot of the current state.
+
+        Returns:
+            StateSnapshot of projects, sessions and plans.
+        """
+        return self._state.to_snapshot()
+
+    async def get_notification_latency(
+        self,
+        window_seconds: float | None = None,
+        log_path: Path | None = None,
+    ) -> dict[str, Any]:
+        """Get notification latency percentiles and SLA violations.
+
+        Reads the latency log written by the app's notification manager, so
+        this reports on a running app from another process.
+
+        Args:
+            window_seconds: Only include notifications from the last this
+                many seconds (everything in the log if None).
+            log_path: Latency log to read (defaults to the one in the
+                config directory).
+
+        Returns:
+            Report dictionary with count, SLA compliance, per-stage
+            percentiles and histograms, and a "violations" list of the
+            notifications that exceeded the SLA.
+        """
+        since = None
+        if window_seconds is not None:
+            since = time.time() - window_seconds
+        samples = await asyncio.to_thread(
+            load_latency_log, log_path or default_latency_log_path(), since
+        )
+        report = summarize_latencies(samples)
+        report["violations"] = [
+            s.to_dict() for s in samples if s.total > report["sla_seconds"]
+        ]
+        return report
+
+    async def search_output(
+        self,
+        query: str,
+        limit: int = 50,
+        context: int = 2,
+        session_id: str | None = None,
+        project_id: str | None = None,
+        since: float | None = None,
+        raw: bool = False,
+        index_path: Path | None = None,
+    ) -> list[dict[str, Any]]:
+        """Search the output of monitored sessions.
+
+        Reads the search index written by the app or daemon (with
+        search_index_enabled), so this works from another process.
+
+        Args:
+            query: Search text; every term must appear in the line.
+            limit: Most hits to return.
+            context: Lines of output to include before and after each hit.
+            session_id: Only search this session's output.
+            project_id: Only search output from this project's sessions.
+            since: Only lines from at or after this Unix time.
+            raw: Pass the query to SQLite FTS5 unchanged.
+            index_path: Search database to read (defaults to the configured
+                one, or the one in the config directory).
+
+        Returns:
+            Hit dictionaries with session_id, project_id, template_id,
+            timestamp, line, and the "before" and "after" context lines,
+            newest first.
+
+        Raises:
+            ValueError: If a raw query is not valid FTS5 syntax.
+        """
+        if index_path is None and self._state.config:
+            configured = self._state.config.settings.search_index_path
+            index_path = Path(configured).expanduser() if configured else None
+        index = SearchIndex(index_path)
+        try:
+            hits = await index.search(
+                query,
+                limit=limit,
+                context=context,
+                session_id=session_id,
+                project_id=project_id,
+                since=since,
+                raw=raw,
+            )
+        finally:
+            await asyncio.to_thread(index.close)
+        return [hit.to_dict() for hit in hits]
+
     # =========================================================================
     # Helper Methods
     # =========================================================================
@@ -1198,7 +1502,99 @@ class ItermControllerAPI:
 
 
 # =============================================================================
-# Convenience Functions (Stateless)
+# Shared API
+# =============================================================================
+
+_shared_api: ItermControllerAPI | RemoteAPI | None = None
+_shared_keeper: asyncio.Task[None] | None = None
+_shared_loop: asyncio.AbstractEventLoop | None = None
+_shared_lock: asyncio.Lock | None = None
+
+
+async def get_shared_api() -> ItermControllerAPI | RemoteAPI:
+    """Get the process-wide API used by the convenience functions.
+
+    The first call creates it: a RemoteAPI if a daemon is running,
+    otherwise an ItermControllerAPI that loads the config now and connects
+    to iTerm2 the first time an operation needs it. Later calls reuse it,
+    so loops of convenience calls share one config load and connection.
+
+    The API is bound to the event loop it was created in and is shut down
+    when that loop finishes (asyncio.run() cancels the task that keeps it).
+    Each asyncio.run() gets a fresh one.
+
+    Returns:
+        The shared API.
+
+    Raises:
+        ItermControllerError: If the API fails to initialize.
+    """
+    global _shared_api, _shared_keeper, _shared_loop, _shared_lock
+
+    loop = asyncio.get_running_loop()
+    if _shared_loop is not loop:
+        # Connections, watchers and locks from another loop are unusable.
+        # Its keeper shut the old API down when that loop finished.
+        _shared_api, _shared_keeper = None, None
+        _shared_loop, _shared_lock = loop, asyncio.Lock()
+    assert _shared_lock is not None
+
+    async with _shared_lock:
+        if _shared_api is not None and _shared_api.is_initialized:
+            return _shared_api
+        if _shared_keeper is not None:
+            # Shut down by a caller; let its keeper finish
+            _shared_keeper.cancel()
+            await asyncio.gather(_shared_keeper, return_exceptions=True)
+            _shared_api, _shared_keeper = None, None
+
+        from .daemon import RemoteAPI, connect_to_daemon
+
+        client = await connect_to_daemon()
+        api: ItermControllerAPI | RemoteAPI
+        if client is not None:
+            api = RemoteAPI(client)
+            result = await api.initialize()
+        else:
+            api = ItermControllerAPI()
+            result = await api.initialize(connect_iterm=False, connect_on_demand=True)
+        if not result.success:
+            raise ItermControllerError(f"Failed to initialize API: {result.error}")
+        _shared_api = api
+        _shared_keeper = loop.create_task(_shut_down_with_loop(api))
+        # Let the keeper start, or cancelling it would skip the shutdown
+        await asyncio.sleep(0)
+        return api
+
+
+async def _shut_down_with_loop(api: ItermControllerAPI | RemoteAPI) -> None:
+    """Wait until cancelled, then shut the shared API down.
+
+    asyncio.run() cancels outstanding tasks before closing its loop, so this
+    runs while the API's connections can still be closed.
+    """
+    try:
+        await asyncio.get_running_loop().create_future()
+    except asyncio.CancelledError:
+        await api.shutdown()
+
+
+async def close_shared_api() -> None:
+    """Shut down the shared API, if there is one in this event loop.
+
+    The next convenience call creates a new one (reloading the config).
+    """
+    global _shared_api, _shared_keeper
+
+    keeper = _shared_keeper
+    _shared_api, _shared_keeper = None, None
+    if keeper is not None and _shared_loop is asyncio.get_running_loop():
+        keeper.cancel()
+        await asyncio.gather(keeper, return_exceptions=True)
+
+
+# =============================================================================
+# Convenience Functions
 # =============================================================================
 
 
@@ -1207,7 +1603,7 @@ async def spawn_session(
 ) -> SessionResult:
     """Convenience function to spawn a session.
 
-    Creates a temporary API instance, spawns the session, and returns.
+    Uses the shared API (see get_shared_api), spawns the session, and returns.
     For multiple operations, use ItermControllerAPI directly.
 
     Args:
@@ -1218,21 +1614,41 @@ async def spawn_session(
     Returns:
         SessionResult with the spawned session.
     """
-    api = ItermControllerAPI()
-    result = await api.initialize()
-    if not result.success:
-        return SessionResult(success=False, error=result.error)
+    try:
+        api = await get_shared_api()
+    except ItermControllerError as e:
+        return SessionResult(success=False, error=e.message)
+
+    return await api.spawn_session(project_id, template_id, task_id)
+
+
+async def send_to_sessions(
+    target: list[str] | str | SessionSelector, text: str, newline: bool = True
+) -> BroadcastResult:
+    """Convenience function to send text to several sessions.
+
+    Uses the shared API (see get_shared_api), sends the text, and returns.
 
+    Args:
+        target: Session IDs, or a selector such as "project=my-app state=waiting".
+        text: The text to send.
+        newline: Append a newline if not present.
+
+    Returns:
+        BroadcastResult with a result per targeted session.
+    """
     try:
-        return await api.spawn_session(project_id, template_id, task_id)
-    finally:
-        await api.shutdown()
+        api = await get_shared_api()
+    except ItermControllerError as e:
+        return BroadcastResult(success=False, error=e.message)
+
+    return await api.send_to_sessions(target, text, newline=newline)
 
 
 async def claim_task(project_id: str, task_id: str) -> TaskResult:
     """Convenience function to claim a task.
 
-    Creates a temporary API instance, claims the task, and returns.
+    Uses the shared API (see get_shared_api), claims the task, and returns.
 
     Args:
         project_id: The project's unique identifier.
@@ -1241,15 +1657,12 @@ async def claim_task(project_id: str, task_id: str) -> TaskResult:
     Returns:
         TaskResult with the claimed task.
     """
-    api = ItermControllerAPI()
-    result = await api.initialize(connect_iterm=False)
-    if not result.success:
-        return TaskResult(success=False, error=result.error)
-
     try:
-        return await api.claim_task(project_id, task_id)
-    finally:
-        await api.shutdown()
+        api = await get_shared_api()
+    except ItermControllerError as e:
+        return TaskResult(success=False, error=e.message)
+
+    return await api.claim_task(project_id, task_id)
 
 
 async def toggle_test_step(
@@ -1259,7 +1672,7 @@ async def toggle_test_step(
 ) -> TestStepResult:
     """Convenience function to toggle a test step.
 
-    Creates a temporary API instance, toggles the step, and returns.
+    Uses the shared API (see get_shared_api), toggles the step, and returns.
 
     Args:
         project_id: The project's unique identifier.
@@ -1269,40 +1682,34 @@ async def toggle_test_step(
     Returns:
         TestStepResult with the updated step.
     """
-    api = ItermControllerAPI()
-    result = await api.initialize(connect_iterm=False)
-    if not result.success:
-        return TestStepResult(success=False, error=result.error)
-
     try:
-        return await api.toggle_test_step(project_id, step_id, new_status)
-    finally:
-        await api.shutdown()
+        api = await get_shared_api()
+    except ItermControllerError as e:
+        return TestStepResult(success=False, error=e.message)
+
+    return await api.toggle_test_step(project_id, step_id, new_status)
 
 
 async def list_projects() -> list[Project]:
     """Convenience function to list all projects.
 
-    Creates a temporary API instance and returns the project list.
+    Uses the shared API (see get_shared_api) and returns the project list.
 
     Returns:
         List of configured projects.
     """
-    api = ItermControllerAPI()
-    result = await api.initialize(connect_iterm=False)
-    if not result.success:
+    try:
+        api = await get_shared_api()
+    except ItermControllerError:
         return []
 
-    try:
-        return await api.list_projects()
-    finally:
-        await api.shutdown()
+    return await api.list_projects()
 
 
 async def list_sessions(project_id: str | None = None) -> list[ManagedSession]:
     """Convenience function to list sessions.
 
-    Creates a temporary API instance and returns the session list.
+    Uses the shared API (see get_shared_api) and returns the session list.
 
     Args:
         project_id: Optional project to filter by.
@@ -1310,15 +1717,12 @@ async def list_sessions(project_id: str | None = None) -> list[ManagedSession]:
     Returns:
         List of managed sessions.
     """
-    api = ItermControllerAPI()
-    result = await api.initialize()
-    if not result.success:
+    try:
+        api = await get_shared_api()
+    except ItermControllerError:
         return []
 
-    try:
-        return await api.list_sessions(project_id)
-    finally:
-        await api.shutdown()
+    return await api.list_sessions(project_id)
 
 
 # =============================================================================
@@ -1329,7 +1733,7 @@ async def list_sessions(project_id: str | None = None) -> list[ManagedSession]:
 async def get_state() -> StateSnapshot | None:
     """Get a snapshot of the current application state.
 
-    Creates a temporary API instance and returns a read-only snapshot
+    Uses the shared API (see get_shared_api) and returns a read-only snapshot
     of all state data. Useful for external tools that need to query
     sessions, tasks, projects, and plans without interacting with the TUI.
 
@@ -1346,21 +1750,18 @@ async def get_state() -> StateSnapshot | None:
             for session in state.sessions.values():
                 print(f"  Session {session.name}: {session.attention_state}")
     """
-    api = ItermControllerAPI()
-    result = await api.initialize(connect_iterm=False)
-    if not result.success:
+    try:
+        api = await get_shared_api()
+    except ItermControllerError:
         return None
 
-    try:
-        return api.state.to_snapshot()
-    finally:
-        await api.shutdown()
+    return await api.get_state_snapshot()
 
 
 async def get_plan(project_id: str) -> Plan | None:
     """Get the parsed PLAN.md for a project.
 
-    Creates a temporary API instance and returns the plan.
+    Uses the shared API (see get_shared_api) and returns the plan.
 
     Args:
         project_id: The project's unique identifier.
@@ -1376,22 +1777,19 @@ async def get_plan(project_id: str) -> Plan | None:
             for task in plan.all_tasks:
                 print(f"{task.id}: {task.title} [{task.status.value}]")
     """
-    api = ItermControllerAPI()
-    result = await api.initialize(connect_iterm=False)
-    if not result.success:
+    try:
+        api = await get_shared_api()
+    except ItermControllerError:
         return None
 
-    try:
-        await api.open_project(project_id)
-        return await api.get_plan(project_id)
-    finally:
-        await api.shutdown()
+    await api.open_project(project_id)
+    return await api.get_plan(project_id)
 
 
 async def get_project(project_id: str) -> Project | None:
     """Get a project by ID.
 
-    Creates a temporary API instance and returns the project.
+    Uses the shared API (see get_shared_api) and returns the project.
 
     Args:
         project_id: The project's unique identifier.
@@ -1407,22 +1805,19 @@ async def get_project(project_id: str) -> Project | None:
             print(f"Path: {project.path}")
             print(f"Template: {project.template_id}")
     """
-    api = ItermControllerAPI()
-    result = await api.initialize(connect_iterm=False)
-    if not result.success:
+    try:
+        api = await get_shared_api()
+    except ItermControllerError:
         return None
 
-    try:
-        return await api.get_project(project_id)
-    finally:
-        await api.shutdown()
+    return await api.get_project(project_id)
 
 
 async def get_sessions(project_id: str | None = None) -> list[ManagedSession]:
     """Get managed sessions (alias for list_sessions).
 
-    Creates a temporary API instance and returns the session list.
-    This function connects to iTerm2 to get live session data.
+    Uses the shared API (see get_shared_api) and returns the sessions it
+    tracks (the daemon's, if one is running). It does not connect to iTerm2.
 
     Args:
         project_id: Optional project to filter by.
@@ -1443,7 +1838,7 @@ async def get_sessions(project_id: str | None = None) -> list[ManagedSession]:
 async def get_task_progress(project_id: str) -> dict[str, int]:
     """Get task completion summary for a project.
 
-    Creates a temporary API instance and returns task counts by status.
+    Uses the shared API (see get_shared_api) and returns task counts by status.
 
     Args:
         project_id: The project's unique identifier.
@@ -1457,22 +1852,19 @@ async def get_task_progress(project_id: str) -> dict[str, int]:
         progress = await get_task_progress("my-project")
         print(f"Completed: {progress.get('complete', 0)}/{sum(progress.values())}")
     """
-    api = ItermControllerAPI()
-    result = await api.initialize(connect_iterm=False)
-    if not result.success:
+    try:
+        api = await get_shared_api()
+    except ItermControllerError:
         return {}
 
-    try:
-        await api.open_project(project_id)
-        return await api.get_task_progress(project_id)
-    finally:
-        await api.shutdown()
+    await api.open_project(project_id)
+    return await api.get_task_progress(project_id)
 
 
 async def get_test_plan(project_id: str) -> TestPlan | None:
     """Get the parsed TEST_PLAN.md for a project.
 
-    Creates a temporary API instance and returns the test plan.
+    Uses the shared API (see get_shared_api) and returns the test plan.
 
     Args:
         project_id: The project's unique identifier.
@@ -1488,16 +1880,13 @@ async def get_test_plan(project_id: str) -> TestPlan | None:
             for step in test_plan.all_steps:
                 print(f"{step.id}: {step.description} [{step.status.value}]")
     """
-    api = ItermControllerAPI()
-    result = await api.initialize(connect_iterm=False)
-    if not result.success:
+    try:
+        api = await get_shared_api()
+    except ItermControllerError:
         return None
 
-    try:
-        await api.open_project(project_id)
-        return await api.get_test_plan(project_id)
-    finally:
-        await api.shutdown()
+    await api.open_project(project_id)
+    return await api.get_test_plan(project_id)
 
 
 # =============================================================================
@@ -1836,6 +2225,41 @@ class AppAPI:
             logger.error("Failed to send to session: %s", e)
             return APIResult.fail(str(e))
 
+    async def send_to_sessions(
+        self,
+        target: list[str] | str | SessionSelector,
+        text: str,
+        newline: bool = True,
+        max_in_flight: int = DEFAULT_SEND_CONCURRENCY,
+    ) -> BroadcastResult:
+        """Send text to several terminal sessions at once.
+
+        Sessions are resolved once, then sent to concurrently with at most
+        max_in_flight sends outstanding.
+
+        Args:
+            target: Session IDs, or a selector such as
+                "project=my-app state=waiting" (string or SessionSelector).
+            text: The text to send.
+            newline: Append a newline if not present. Pass False to send
+                control characters such as Ctrl+C ("\\x03") as-is.
+            max_in_flight: Maximum number of sends outstanding at once.
+
+        Returns:
+            BroadcastResult with a result per targeted session.
+        """
+        if not self._app.iterm.is_connected:
+            return BroadcastResult(success=False, error="Not connected to iTerm2")
+
+        try:
+            targets = _resolve_send_targets(self._app.state, target)
+        except ValueError as e:
+            return BroadcastResult(success=False, error=str(e))
+
+        if newline and not text.endswith("\n"):
+            text = text + "\n"
+        return await _send_to_many(self._app.iterm, targets, text, max_in_flight)
+
     # =========================================================================
     # Task Operations (PLAN.md)
     # =========================================================================
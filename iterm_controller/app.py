@@ -5,12 +5,14 @@ This module provides the main iTerm Controller TUI application.
 
 from __future__ import annotations
 
+from pathlib import Path
 from typing import TYPE_CHECKING
 
 from textual.app import App
 from textual.binding import Binding
 
 from iterm_controller.api import AppAPI
+from iterm_controller.notifications import default_latency_log_path
 from iterm_controller.screens.mission_control import MissionControlScreen
 from iterm_controller.screens.modes import TestModeScreen
 from iterm_controller.screens.new_project import NewProjectScreen
@@ -19,9 +21,16 @@ from iterm_controller.screens.project_screen import ProjectScreen
 from iterm_controller.screens.settings import SettingsScreen
 from iterm_controller.services import ServiceContainer, screen_factory
 from iterm_controller.state import AppState
-from iterm_controller.state.events import TabFocused
+from iterm_controller.state.events import (
+    GitHubStatusChanged,
+    ProjectClosed,
+    ProjectOpened,
+    TabFocused,
+)
 
 if TYPE_CHECKING:
+    from iterm_controller.iterm import ReconcileResult
+    from iterm_controller.models import GitHubStatus
     from iterm_controller.screens.modals.quit_confirm import QuitAction
 
 
@@ -94,20 +103,49 @@ class ItermControllerApp(App):
             self.services.spawner.set_skip_permissions(
                 self.state.config.settings.dangerously_skip_permissions
             )
+            self.services.configure_session_pool(
+                self.state.config.settings.session_pool_size,
+                self.state.config.settings.session_pool_idle_seconds,
+            )
+            # Keep what the monitor sees in on-disk transcripts
+            if self.state.config.settings.transcripts_enabled:
+                transcript_dir = self.state.config.settings.transcript_dir
+                await self.services.enable_transcripts(
+                    Path(transcript_dir).expanduser() if transcript_dir else None
+                )
+            # Index what the monitor sees for `iterm_controller search`
+            if self.state.config.settings.search_index_enabled:
+                index_path = self.state.config.settings.search_index_path
+                await self.services.enable_search_index(
+                    Path(index_path).expanduser() if index_path else None
+                )
+            # Notify when monitored sessions need attention
+            if self.state.config.settings.notifications.enabled:
+                await self.services.enable_notifications(
+                    self.state,
+                    self.state.config.settings.notifications,
+                    default_latency_log_path(),
+                )
 
         # Load window layouts from config into service container
         if self.state.config and self.state.config.window_layouts:
             self.services.load_layouts(self.state.config.window_layouts)
 
         # Try to connect to iTerm2 (non-blocking)
+        self.services.supervisor.on_reconciled = self._on_sessions_reconciled
         try:
             await self.services.connect_iterm()
         except Exception as e:
             self.notify(f"iTerm2 connection failed: {e}", severity="warning")
 
-        # Initialize GitHub (non-blocking)
+        # Initialize GitHub (non-blocking); the poller owns all refreshes
+        self.services.github_poller.on_update = self._on_github_status_updated
         await self.services.initialize_github()
 
+        # Sample CPU/RSS of managed sessions for the sparklines
+        self.services.resources.sessions_provider = lambda: self.state.sessions.values()
+        await self.services.resources.start()
+
         # Start the focus watcher to detect when our tab becomes active
         try:
             await self.services.start_focus_watcher(
@@ -182,6 +220,27 @@ class ItermControllerApp(App):
         if not isinstance(self.screen, MissionControlScreen):
             self.push_screen(MissionControlScreen())
 
+    def _on_github_status_updated(
+        self, project_path: str, status: GitHubStatus | None
+    ) -> None:
+        """Callback invoked by the GitHub poller after each repo refresh.
+
+        Posted to the active screen so a project screen can update its
+        GitHub panel; the message then bubbles up to the app.
+        """
+        self.screen.post_message(GitHubStatusChanged(project_path, status))
+
+    def on_project_opened(self, event: ProjectOpened) -> None:
+        """Start polling GitHub for the opened project and warm its shells."""
+        self.services.github_poller.track(event.project.path, active=True)
+        self.services.spawner.prewarm(event.project)
+
+    def on_project_closed(self, event: ProjectClosed) -> None:
+        """Stop polling GitHub for the closed project."""
+        project = self.state.projects.get(event.project_id)
+        if project:
+            self.services.github_poller.untrack(project.path)
+
     def _on_tab_focused(self) -> None:
         """Callback invoked when the TUI's iTerm2 tab becomes active.
 
@@ -190,6 +249,16 @@ class ItermControllerApp(App):
         """
         self.post_message(TabFocused())
 
+    def _on_sessions_reconciled(self, result: ReconcileResult) -> None:
+        """Callback invoked by the connection supervisor after a resync.
+
+        Drops sessions that vanished from iTerm2 in one batch and tells the
+        user once, rather than per session.
+        """
+        self.state.purge_sessions(result.purged_session_ids, result.reconnected)
+        if result.reconnected or result.purged_session_ids:
+            self.notify(result.summary, severity="warning")
+
     def on_tab_focused(self, event: TabFocused) -> None:
         """Handle the TabFocused event by refreshing the current screen.
 
@@ -0,0 +1,875 @@
+"""Long-lived headless daemon serving the API over a Unix socket.
+
+Every CLI command and convenience function otherwise builds a fresh
+ItermControllerAPI: it loads config, connects to iTerm2 and parses plans,
+then throws all of it away. The daemon keeps one initialized API, its plan
+watchers and a session monitor running, and answers requests over a Unix
+domain socket in a few milliseconds.
+
+Protocol:
+    One JSON object per line in each direction. A request is
+    ``{"id": 1, "method": "list_tasks", "params": {"project_id": "p"}}``
+    and its response ``{"id": 1, "result": ...}`` or
+    ``{"id": 1, "error": "..."}``. Models are sent as dictionaries
+    (model_to_dict) and rebuilt on the client by RemoteAPI.
+
+Usage:
+    # Terminal 1
+    python -m iterm_controller daemon run
+
+    # Terminal 2 - CLI commands use the daemon automatically
+    python -m iterm_controller task list --project myproj
+
+    # Python
+    client = await connect_to_daemon()
+    if client:
+        api = RemoteAPI(client)
+        tasks = await api.list_tasks("myproj")
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import signal
+import socket
+import time
+import types
+import typing
+from dataclasses import is_dataclass
+from datetime import datetime
+from enum import Enum
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, TypeVar, cast
+
+import dacite
+
+from iterm_controller import models
+from iterm_controller.api import (
+    DEFAULT_SEND_CONCURRENCY,
+    APIResult,
+    BroadcastResult,
+    ItermControllerAPI,
+    ProjectResult,
+    SessionResult,
+    TaskResult,
+    TestStepResult,
+)
+from iterm_controller.exceptions import DaemonError, record_error
+from iterm_controller.models import (
+    ManagedSession,
+    Plan,
+    Project,
+    Task,
+    TaskStatus,
+    TestPlan,
+    TestStatus,
+    TestStep,
+    _custom_encoder,
+    model_to_dict,
+)
+from iterm_controller.state import SessionSelector, StateSnapshot
+
+if TYPE_CHECKING:
+    from iterm_controller.iterm import ConnectionSupervisor, ReconcileResult
+    from iterm_controller.search_index import SearchIndex
+    from iterm_controller.session_monitor import SessionMonitor
+    from iterm_controller.transcripts import TranscriptWriter
+
+logger = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+_R = TypeVar("_R", bound=APIResult)
+
+# File name of the daemon socket in the config directory
+SOCKET_FILENAME = "daemon.sock"
+
+# Set to "0" to make clients ignore a running daemon
+DAEMON_ENV_VAR = "ITERM_CONTROLLER_DAEMON"
+
+# Largest request or response line accepted
+MAX_MESSAGE_BYTES = 16 * 1024 * 1024
+
+# API methods the daemon serves, by name
+API_METHODS = frozenset(
+    {
+        "list_projects",
+        "get_project",
+        "open_project",
+        "list_sessions",
+        "get_session",
+        "spawn_session",
+        "kill_session",
+        "focus_session",
+        "send_to_session",
+        "send_to_sessions",
+        "get_plan",
+        "list_tasks",
+        "get_task",
+        "claim_task",
+        "unclaim_task",
+        "complete_task",
+        "skip_task",
+        "get_test_plan",
+        "list_test_steps",
+        "toggle_test_step",
+        "get_task_progress",
+        "get_test_progress",
+        "get_sessions_waiting",
+        "get_notification_latency",
+        "search_output",
+        "get_state_snapshot",
+    }
+)
+
+# Request parameters that are sent as strings but typed on the API
+_PARAM_TYPES: dict[str, type] = {
+    "status": TaskStatus,
+    "new_status": TestStatus,
+    "log_path": Path,
+    "index_path": Path,
+}
+
+# dacite needs the model classes to resolve StateSnapshot's deferred annotations
+_DECODE_CONFIG = dacite.Config(
+    cast=[Enum],
+    type_hooks={datetime: datetime.fromisoformat},
+    forward_references={
+        name: getattr(models, name) for name in dir(models) if not name.startswith("_")
+    },
+)
+
+
+def default_socket_path() -> Path:
+    """Get the default location of the daemon socket."""
+    from iterm_controller.config import get_config_dir
+
+    return get_config_dir() / SOCKET_FILENAME
+
+
+def daemon_disabled() -> bool:
+    """Check whether clients should ignore a running daemon."""
+    return os.environ.get(DAEMON_ENV_VAR, "").strip().lower() in ("0", "false", "no", "off")
+
+
+# =============================================================================
+# Wire Encoding
+# =============================================================================
+
+
+def _encode(value: Any) -> Any:
+    """Convert an API return value to JSON-compatible data."""
+    if is_dataclass(value) and not isinstance(value, type):
+        return model_to_dict(value)
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (list, tuple)):
+        return [_encode(v) for v in value]
+    if isinstance(value, dict):
+        return {k: _encode(v) for k, v in value.items()}
+    return value
+
+
+def _decode(tp: Any, data: Any) -> Any:
+    """Rebuild a value of type ``tp`` from JSON data."""
+    if data is None:
+        return None
+    origin = typing.get_origin(tp)
+    if origin in (typing.Union, types.UnionType):
+        inner = [a for a in typing.get_args(tp) if a is not type(None)]
+        return _decode(inner[0], data) if len(inner) == 1 else data
+    if origin is list:
+        (item,) = typing.get_args(tp)
+        return [_decode(item, d) for d in data]
+    if isinstance(tp, type) and is_dataclass(tp):
+        return dacite.from_dict(data_class=tp, data=data, config=_DECODE_CONFIG)
+    return data
+
+
+def _dumps(message: dict[str, Any]) -> bytes:
+    return json.dumps(message, separators=(",", ":"), default=_custom_encoder).encode() + b"\n"
+
+
+# =============================================================================
+# Server
+# =============================================================================
+
+
+class DaemonServer:
+    """Serves a long-lived ItermControllerAPI over a Unix domain socket.
+
+    The API is initialized once (config loaded, iTerm2 connected). Opened
+    projects keep their plan watchers, so later requests see the current
+    PLAN.md without re-parsing it. If iTerm2 is connected, a SessionMonitor
+    keeps session attention states current.
+
+    Example:
+        server = DaemonServer()
+        await server.start()
+        await server.serve_forever()
+    """
+
+    def __init__(
+        self,
+        api: ItermControllerAPI | None = None,
+        socket_path: Path | None = None,
+        monitor_sessions: bool = True,
+    ) -> None:
+        """Initialize the server.
+
+        Args:
+            api: API to serve (a new one is created and initialized if None).
+            socket_path: Socket to listen on (defaults to the config directory).
+            monitor_sessions: Whether to run a SessionMonitor while connected.
+        """
+        self.api = api or ItermControllerAPI()
+        self.socket_path = socket_path or default_socket_path()
+        self.monitor_sessions = monitor_sessions
+        self.started_at: float | None = None
+        self.requests_served = 0
+        self._server: asyncio.AbstractServer | None = None
+        self._clients: set[asyncio.StreamWriter] = set()
+        self._monitor: SessionMonitor | None = None
+        self._supervisor: ConnectionSupervisor | None = None
+        self._transcripts: TranscriptWriter | None = None
+        self._search_index: SearchIndex | None = None
+        self._stopped = asyncio.Event()
+
+    async def start(self) -> None:
+        """Initialize the API and start listening.
+
+        Raises:
+            DaemonError: If another daemon is already listening on the socket
+                or the API fails to initialize.
+        """
+        if await _socket_alive(self.socket_path):
+            raise DaemonError(
+                "A daemon is already running", socket_path=str(self.socket_path)
+            )
+        self.socket_path.unlink(missing_ok=True)
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+
+        if not self.api.is_initialized:
+            result = await self.api.initialize(connect_iterm=True)
+            if not result.success:
+                raise DaemonError(f"Failed to initialize API: {result.error}")
+
+        # The API creates its spawner when it connects to iTerm2
+        spawner = self.api._spawner if self.api.is_connected else None  # noqa: SLF001
+
+        if self.monitor_sessions and spawner is not None:
+            from iterm_controller.session_monitor import SessionMonitor
+
+            self._monitor = SessionMonitor(self.api._iterm, spawner)  # noqa: SLF001
+            await self._start_transcripts(self._monitor)
+            await self._start_search_index(self._monitor)
+            await self._monitor.start()
+
+        if spawner is not None:
+            from iterm_controller.iterm import ConnectionSupervisor
+
+            # The daemon outlives iTerm2 restarts: reconnect and drop dead sessions
+            self._supervisor = ConnectionSupervisor(
+                self.api._iterm,  # noqa: SLF001
+                spawner,
+                on_reconciled=self._on_sessions_reconciled,
+            )
+            if self._monitor is not None:
+                self._supervisor.add_purge_hook(self._monitor.purge_sessions)
+            await self._supervisor.start()
+
+        self._server = await asyncio.start_unix_server(
+            self._handle_client,
+            sock=_bind_private_socket(self.socket_path),
+            limit=MAX_MESSAGE_BYTES,
+        )
+        self.started_at = time.monotonic()
+        self._stopped.clear()
+        logger.info("Daemon listening on %s", self.socket_path)
+
+    async def serve_forever(self) -> None:
+        """Serve until stop() is called or a client requests shutdown."""
+        await self._stopped.wait()
+
+    async def stop(self) -> None:
+        """Stop listening, stop the monitor and shut down the API."""
+        if self._server is not None:
+            self._server.close()
+            for writer in list(self._clients):
+                writer.close()
+            await self._server.wait_closed()
+            self._server = None
+        if self._supervisor is not None:
+            await self._supervisor.stop()
+            self._supervisor = None
+        if self._monitor is not None:
+            await self._monitor.stop()
+            self._monitor = None
+        if self._transcripts is not None:
+            await self._transcripts.stop()
+            self._transcripts = None
+        if self._search_index is not None:
+            await self._search_index.stop()
+            self._search_index = None
+        await self.api.shutdown()
+        self.socket_path.unlink(missing_ok=True)
+        self._stopped.set()
+        logger.info("Daemon stopped")
+
+    async def _start_transcripts(self, monitor: SessionMonitor) -> None:
+        """Write monitored output to transcripts if enabled in the settings."""
+        config = self.api.get_config()
+        if not config or not config.settings.transcripts_enabled:
+            return
+        from iterm_controller.transcripts import TranscriptWriter
+
+        directory = config.settings.transcript_dir
+        self._transcripts = TranscriptWriter(Path(directory).expanduser() if directory else None)
+        monitor.add_output_hook(self._transcripts.on_output)
+        await self._transcripts.start()
+
+    async def _start_search_index(self, monitor: SessionMonitor) -> None:
+        """Index monitored output for search if enabled in the settings."""
+        config = self.api.get_config()
+        if not config or not config.settings.search_index_enabled:
+            return
+        from iterm_controller.search_index import SearchIndex
+
+        path = config.settings.search_index_path
+        self._search_index = SearchIndex(Path(path).expanduser() if path else None)
+        monitor.add_output_hook(self._search_index.on_output)
+        await self._search_index.start()
+
+    def _on_sessions_reconciled(self, result: ReconcileResult) -> None:
+        """Drop sessions that vanished from iTerm2 from the API state."""
+        self.api.state.purge_sessions(result.purged_session_ids, result.reconnected)
+
+    @property
+    def is_serving(self) -> bool:
+        """Check if the server is listening."""
+        return self._server is not None
+
+    def status(self) -> dict[str, Any]:
+        """Get daemon status."""
+        return {
+            "pid": os.getpid(),
+            "uptime": time.monotonic() - self.started_at if self.started_at else 0.0,
+            "connected": self.api.is_connected,
+            "monitoring": self._monitor is not None and self._monitor.is_running,
+            "requests": self.requests_served,
+            "open_projects": sorted(self.api._plan_watchers),  # noqa: SLF001
+        }
+
+    async def handle_request(self, request: dict[str, Any]) -> dict[str, Any]:
+        """Handle one request.
+
+        Args:
+            request: Decoded request with "method" and optional "params".
+
+        Returns:
+            Response with "result" or "error" (and the request's "id").
+        """
+        request_id = request.get("id")
+        method = request.get("method")
+        params = request.get("params") or {}
+        self.requests_served += 1
+        try:
+            result = await self._call(method, params)
+            return {"id": request_id, "result": _encode(result)}
+        except Exception as e:
+            logger.warning("Daemon request %s failed: %s", method, e)
+            record_error(e)
+            return {"id": request_id, "error": str(e)}
+
+    async def _call(self, method: Any, params: dict[str, Any]) -> Any:
+        """Run a method by name."""
+        if method == "status":
+            return self.status()
+        if method == "shutdown":
+            # Stop after this response has been sent
+            asyncio.get_running_loop().call_soon(lambda: asyncio.ensure_future(self.stop()))
+            return True
+        if method not in API_METHODS:
+            raise DaemonError(f"Unknown method: {method}")
+
+        for name, param_type in _PARAM_TYPES.items():
+            if params.get(name) is not None:
+                params[name] = param_type(params[name])
+        return await getattr(self.api, method)(**params)
+
+    async def _handle_client(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Answer requests from one client until it disconnects."""
+        self._clients.add(writer)
+        try:
+            while line := await reader.readline():
+                try:
+                    request = json.loads(line)
+                except ValueError:
+                    response = {"id": None, "error": "Malformed request"}
+                else:
+                    response = await self.handle_request(request)
+                writer.write(_dumps(response))
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError) as e:
+            logger.debug("Daemon client disconnected: %s", e)
+        finally:
+            self._clients.discard(writer)
+            writer.close()
+
+
+def _bind_private_socket(path: Path) -> socket.socket:
+    """Bind a Unix socket that only the current user can connect to.
+
+    The socket is bound under a 177 umask, so it is created with mode
+    0600 and is never reachable by other users, even briefly.
+
+    Args:
+        path: Socket path to bind.
+
+    Returns:
+        The bound socket, ready to listen on.
+    """
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    old_umask = os.umask(0o177)
+    try:
+        sock.bind(str(path))
+    except OSError:
+        sock.close()
+        raise
+    finally:
+        os.umask(old_umask)
+    return sock
+
+
+async def _socket_alive(path: Path) -> bool:
+    """Check whether something is accepting connections on a socket path."""
+    if not path.exists():
+        return False
+    try:
+        _, writer = await asyncio.open_unix_connection(str(path))
+    except OSError:
+        return False
+    writer.close()
+    return True
+
+
+async def run_daemon(socket_path: Path | None = None) -> None:
+    """Run a daemon in the foreground until it is asked to shut down.
+
+    Args:
+        socket_path: Socket to listen on (defaults to the config directory).
+    """
+    server = DaemonServer(socket_path=socket_path)
+    await server.start()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, lambda: asyncio.ensure_future(server.stop()))
+    try:
+        await server.serve_forever()
+    finally:
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            loop.remove_signal_handler(sig)
+        if server.is_serving:
+            await server.stop()
+
+
+# =============================================================================
+# Client
+# =============================================================================
+
+
+class DaemonClient:
+    """Connection to a running daemon.
+
+    Calls are sent one at a time over a single connection.
+
+    Example:
+        client = DaemonClient(default_socket_path())
+        await client.connect()
+        projects = await client.call("list_projects")
+        await client.close()
+    """
+
+    def __init__(self, socket_path: Path | None = None) -> None:
+        """Initialize the client.
+
+        Args:
+            socket_path: Daemon socket (defaults to the config directory).
+        """
+        self.socket_path = socket_path or default_socket_path()
+        self._reader: asyncio.StreamReader | None = None
+        self._writer: asyncio.StreamWriter | None = None
+        self._lock = asyncio.Lock()
+        self._next_id = 0
+
+    @property
+    def is_connected(self) -> bool:
+        """Check if the client has an open connection."""
+        return self._writer is not None and not self._writer.is_closing()
+
+    async def connect(self, timeout: float = 1.0) -> None:
+        """Open the connection.
+
+        Args:
+            timeout: Seconds to wait for the daemon to accept.
+
+        Raises:
+            DaemonError: If the daemon cannot be reached.
+        """
+        try:
+            self._reader, self._writer = await asyncio.wait_for(
+                asyncio.open_unix_connection(str(self.socket_path), limit=MAX_MESSAGE_BYTES),
+                timeout,
+            )
+        except (OSError, TimeoutError) as e:
+            raise DaemonError(
+                "Daemon not reachable", socket_path=str(self.socket_path), cause=e
+            ) from e
+
+    async def call(self, method: str, **params: Any) -> Any:
+        """Call a daemon method.
+
+        Args:
+            method: Method name (an API method or "status").
+            **params: Keyword arguments for the method.
+
+        Returns:
+            The JSON-decoded result.
+
+        Raises:
+            DaemonError: If the connection fails or the method raised.
+        """
+        if self._reader is None or self._writer is None:
+            raise DaemonError("Daemon client is not connected")
+        async with self._lock:
+            self._next_id += 1
+            request_id = self._next_id
+            try:
+                self._writer.write(
+                    _dumps({"id": request_id, "method": method, "params": params})
+                )
+                await self._writer.drain()
+                line = await self._reader.readline()
+            except (OSError, ValueError) as e:
+                await self.close()
+                raise DaemonError(f"Daemon connection failed: {e}", cause=e) from e
+            if not line:
+                await self.close()
+                raise DaemonError("Daemon closed the connection")
+        response = json.loads(line)
+        if "error" in response:
+            raise DaemonError(response["error"], context={"method": method})
+        return response.get("result")
+
+    async def close(self) -> None:
+        """Close the connection (the daemon keeps running)."""
+        if self._writer is not None:
+            self._writer.close()
+            try:
+                await self._writer.wait_closed()
+            except OSError:
+                pass
+        self._reader = None
+        self._writer = None
+
+
+async def connect_to_daemon(
+    socket_path: Path | None = None, timeout: float = 0.2
+) -> DaemonClient | None:
+    """Connect to a running daemon, if there is one.
+
+    Args:
+        socket_path: Daemon socket (defaults to the config directory).
+        timeout: Seconds to wait for the daemon to accept.
+
+    Returns:
+        A connected client, or None if no daemon is running or the
+        ITERM_CONTROLLER_DAEMON environment variable is "0".
+    """
+    if daemon_disabled():
+        return None
+    client = DaemonClient(socket_path)
+    if not client.socket_path.exists():
+        return None
+    try:
+        await client.connect(timeout)
+    except DaemonError as e:
+        logger.debug("Not using daemon: %s", e)
+        return None
+    return client
+
+
+class RemoteAPI:
+    """ItermControllerAPI look-alike that forwards calls to the daemon.
+
+    Methods take the same arguments and return the same model and result
+    types as ItermControllerAPI, so callers can use either. initialize()
+    only fetches the daemon's status and shutdown() only closes the
+    connection; the daemon keeps its state.
+    """
+
+    def __init__(self, client: DaemonClient) -> None:
+        """Initialize the remote API.
+
+        Args:
+            client: Connected daemon client.
+        """
+        self.client = client
+        self._connected = False
+
+    @property
+    def is_initialized(self) -> bool:
+        """Check if the client is connected to the daemon."""
+        return self.client.is_connected
+
+    @property
+    def is_connected(self) -> bool:
+        """Check if the daemon is connected to iTerm2."""
+        return self._connected
+
+    async def _call(self, tp: type[_T], method: str, **params: Any) -> _T:
+        return cast("_T", _decode(tp, await self.client.call(method, **params)))
+
+    async def _call_optional(self, tp: type[_T], method: str, **params: Any) -> _T | None:
+        """Call a method that returns a value of type ``tp`` or None."""
+        return cast("_T | None", _decode(tp, await self.client.call(method, **params)))
+
+    async def _result(self, tp: type[_R], method: str, **params: Any) -> _R:
+        """Call a method returning an APIResult, reporting failures in it."""
+        try:
+            return await self._call(tp, method, **params)
+        except DaemonError as e:
+            return tp(success=False, error=str(e))
+
+    async def initialize(self, connect_iterm: bool = True) -> APIResult:
+        """Fetch the daemon's status.
+
+        Args:
+            connect_iterm: Unused; the daemon owns the iTerm2 connection.
+
+        Returns:
+            APIResult indicating whether the daemon answered.
+        """
+        try:
+            status = await self.client.call("status")
+        except DaemonError as e:
+            return APIResult.fail(str(e))
+        self._connected = bool(status.get("connected"))
+        return APIResult.ok()
+
+    async def shutdown(self, close_sessions: bool = False) -> APIResult:
+        """Close the connection to the daemon.
+
+        Args:
+            close_sessions: Unused; sessions belong to the daemon.
+
+        Returns:
+            APIResult indicating success.
+        """
+        await self.client.close()
+        return APIResult.ok()
+
+    async def status(self) -> dict[str, Any]:
+        """Get the daemon's status."""
+        return await self._call(dict, "status")
+
+    async def get_state_snapshot(self) -> StateSnapshot:
+        """Get a snapshot of the daemon's application state."""
+        return await self._call(StateSnapshot, "get_state_snapshot")
+
+    # Projects
+
+    async def list_projects(self) -> list[Project]:
+        """List all configured projects."""
+        return await self._call(list[Project], "list_projects")
+
+    async def get_project(self, project_id: str) -> Project | None:
+        """Get a project by ID."""
+        return await self._call_optional(Project, "get_project", project_id=project_id)
+
+    async def open_project(self, project_id: str) -> ProjectResult:
+        """Open a project (the daemon keeps its plan watched)."""
+        return await self._result(ProjectResult, "open_project", project_id=project_id)
+
+    # Sessions
+
+    async def list_sessions(self, project_id: str | None = None) -> list[ManagedSession]:
+        """List managed sessions."""
+        return await self._call(list[ManagedSession], "list_sessions", project_id=project_id)
+
+    async def get_session(self, session_id: str) -> ManagedSession | None:
+        """Get a session by ID."""
+        return await self._call_optional(ManagedSession, "get_session", session_id=session_id)
+
+    async def get_sessions_waiting(self, project_id: str | None = None) -> list[ManagedSession]:
+        """Get sessions in WAITING state."""
+        return await self._call(
+            list[ManagedSession], "get_sessions_waiting", project_id=project_id
+        )
+
+    async def spawn_session(
+        self, project_id: str, template_id: str, task_id: str | None = None
+    ) -> SessionResult:
+        """Spawn a session in the daemon's iTerm2 connection."""
+        return await self._result(
+            SessionResult,
+            "spawn_session",
+            project_id=project_id,
+            template_id=template_id,
+            task_id=task_id,
+        )
+
+    async def kill_session(self, session_id: str, force: bool = False) -> APIResult:
+        """Kill a session."""
+        return await self._result(APIResult, "kill_session", session_id=session_id, force=force)
+
+    async def focus_session(self, session_id: str) -> APIResult:
+        """Focus a session in iTerm2."""
+        return await self._result(APIResult, "focus_session", session_id=session_id)
+
+    async def send_to_session(self, session_id: str, text: str) -> APIResult:
+        """Send text to a session."""
+        return await self._result(
+            APIResult, "send_to_session", session_id=session_id, text=text
+        )
+
+    async def send_to_sessions(
+        self,
+        target: list[str] | str | SessionSelector,
+        text: str,
+        newline: bool = True,
+        max_in_flight: int = DEFAULT_SEND_CONCURRENCY,
+    ) -> BroadcastResult:
+        """Send text to several sessions, by ID or selector."""
+        if isinstance(target, SessionSelector):
+            target = str(target)
+        return await self._result(
+            BroadcastResult,
+            "send_to_sessions",
+            target=target,
+            text=text,
+            newline=newline,
+            max_in_flight=max_in_flight,
+        )
+
+    # Plans and tasks
+
+    async def get_plan(self, project_id: str) -> Plan | None:
+        """Get the parsed PLAN.md for a project."""
+        return await self._call_optional(Plan, "get_plan", project_id=project_id)
+
+    async def list_tasks(
+        self, project_id: str, status: TaskStatus | None = None
+    ) -> list[Task]:
+        """List tasks, optionally filtered by status."""
+        return await self._call(
+            list[Task],
+            "list_tasks",
+            project_id=project_id,
+            status=status.value if status else None,
+        )
+
+    async def get_task(self, project_id: str, task_id: str) -> Task | None:
+        """Get a task by ID."""
+        return await self._call_optional(Task, "get_task", project_id=project_id, task_id=task_id)
+
+    async def claim_task(self, project_id: str, task_id: str) -> TaskResult:
+        """Claim a task."""
+        return await self._result(TaskResult, "claim_task", project_id=project_id, task_id=task_id)
+
+    async def unclaim_task(self, project_id: str, task_id: str) -> TaskResult:
+        """Unclaim a task."""
+        return await self._result(
+            TaskResult, "unclaim_task", project_id=project_id, task_id=task_id
+        )
+
+    async def complete_task(self, project_id: str, task_id: str) -> TaskResult:
+        """Mark a task complete."""
+        return await self._result(
+            TaskResult, "complete_task", project_id=project_id, task_id=task_id
+        )
+
+    async def skip_task(self, project_id: str, task_id: str) -> TaskResult:
+        """Skip a task."""
+        return await self._result(TaskResult, "skip_task", project_id=project_id, task_id=task_id)
+
+    async def get_task_progress(self, project_id: str) -> dict[str, int]:
+        """Get task completion counts for a project."""
+        return await self._call(dict, "get_task_progress", project_id=project_id)
+
+    # Test plans
+
+    async def get_test_plan(self, project_id: str) -> TestPlan | None:
+        """Get the parsed TEST_PLAN.md for a project."""
+        return await self._call_optional(TestPlan, "get_test_plan", project_id=project_id)
+
+    async def list_test_steps(
+        self, project_id: str, status: TestStatus | None = None
+    ) -> list[TestStep]:
+        """List test steps, optionally filtered by status."""
+        return await self._call(
+            list[TestStep],
+            "list_test_steps",
+            project_id=project_id,
+            status=status.value if status else None,
+        )
+
+    async def toggle_test_step(
+        self, project_id: str, step_id: str, new_status: TestStatus | None = None
+    ) -> TestStepResult:
+        """Toggle or set a test step's status."""
+        return await self._result(
+            TestStepResult,
+            "toggle_test_step",
+            project_id=project_id,
+            step_id=step_id,
+            new_status=new_status.value if new_status else None,
+        )
+
+    async def get_test_progress(self, project_id: str) -> dict[str, int]:
+        """Get test step completion counts for a project."""
+        return await self._call(dict, "get_test_progress", project_id=project_id)
+
+    # Notifications
+
+    async def get_notification_latency(
+        self, window_seconds: float | None = None, log_path: Path | None = None
+    ) -> dict[str, Any]:
+        """Get notification latency percentiles and SLA violations."""
+        return await self._call(
+            dict,
+            "get_notification_latency",
+            window_seconds=window_seconds,
+            log_path=str(log_path) if log_path else None,
+        )
+
+    # Search
+
+    async def search_output(
+        self,
+        query: str,
+        limit: int = 50,
+        context: int = 2,
+        session_id: str | None = None,
+        project_id: str | None = None,
+        since: float | None = None,
+        raw: bool = False,
+        index_path: Path | None = None,
+    ) -> list[dict[str, Any]]:
+        """Search the output of monitored sessions."""
+        return await self._call(
+            list,
+            "search_output",
+            query=query,
+            limit=limit,
+            context=context,
+            session_id=session_id,
+            project_id=project_id,
+            since=since,
+            raw=raw,
+            index_path=str(index_path) if index_path else None,
+        )
@@ -134,6 +134,11 @@ class CommandNotAllowedError(ItermControllerError):
         self.allowed_patterns = allowed_patterns
 
 
+# Daemon Errors
+class DaemonError(ItermControllerError):
+    """Raised when the daemon cannot be reached or a daemon call fails."""
+
+
 # Legacy compatibility - no-op error recording
 def record_error(error: Exception) -> None:
     """Record an error (no-op for compatibility)."""
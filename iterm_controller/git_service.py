@@ -7,10 +7,15 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import os
+import shutil
 import subprocess
+import tempfile
+from collections.abc import AsyncIterator
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from pathlib import Path
+from typing import NoReturn
 
 from .exceptions import (
     GitCommandError,
@@ -25,6 +30,11 @@ logger = logging.getLogger(__name__)
 # Default cache TTL
 DEFAULT_CACHE_TTL = timedelta(seconds=5)
 
+# Streaming diff limits
+DIFF_READ_CHUNK_BYTES = 64 * 1024
+DEFAULT_DIFF_FILE_MAX_BYTES = 256 * 1024
+DEFAULT_DIFF_TOTAL_MAX_BYTES = 2 * 1024 * 1024
+
 
 @dataclass
 class CachedStatus:
@@ -34,6 +44,82 @@ class CachedStatus:
     cached_at: datetime
 
 
+@dataclass
+class FileDiff:
+    """Diff for a single file, possibly truncated.
+
+    Attributes:
+        path: Path of the file (post-image path for renames).
+        text: Diff text that was kept (header plus hunks).
+        binary: Whether git reported the file as binary.
+        truncated: Whether bytes were dropped because of a size cap.
+        size_bytes: Size of the file's full diff, including dropped bytes.
+    """
+
+    path: str
+    text: str = ""
+    binary: bool = False
+    truncated: bool = False
+    size_bytes: int = 0
+
+
+@dataclass
+class DiffStat:
+    """Per-file line counts from `git diff --numstat`.
+
+    Attributes:
+        path: Path of the changed file.
+        added: Lines added, or None for binary files.
+        deleted: Lines deleted, or None for binary files.
+    """
+
+    path: str
+    added: int | None
+    deleted: int | None
+
+    @property
+    def binary(self) -> bool:
+        """Check if git reported the file as binary."""
+        return self.added is None
+
+
+@dataclass
+class _FileDiffBuilder:
+    """Accumulates a single file's diff within a byte budget."""
+
+    path: str
+    parts: list[bytes] = field(default_factory=list)
+    kept: int = 0
+    size: int = 0
+    binary: bool = False
+    truncated: bool = False
+
+    def add(self, data: bytes, budget: int) -> int:
+        """Add diff bytes, keeping at most budget of them.
+
+        Returns:
+            Number of bytes kept.
+        """
+        self.size += len(data)
+        keep = max(0, min(len(data), budget))
+        if keep:
+            self.parts.append(data[:keep])
+            self.kept += keep
+        if keep < len(data):
+            self.truncated = True
+        return keep
+
+    def build(self) -> FileDiff:
+        """Build the finished FileDiff."""
+        return FileDiff(
+            path=self.path,
+            text=b"".join(self.parts).decode(errors="replace"),
+            binary=self.binary,
+            truncated=self.truncated,
+            size_bytes=self.size,
+        )
+
+
 class GitService:
     """Handles all git operations for projects.
 
@@ -119,13 +205,21 @@ class GitService:
         project_path: Path,
         staged_only: bool = False,
         base_branch: str | None = None,
+        max_file_bytes: int | None = None,
+        max_total_bytes: int | None = None,
     ) -> str:
         """Get diff output.
 
+        Without size caps the whole diff is returned. With either cap the
+        diff is streamed through iter_diff() and oversized files are
+        replaced by a truncation note, so memory stays bounded.
+
         Args:
             project_path: Path to the git repository.
             staged_only: If True, show only staged changes.
             base_branch: If provided, diff against this branch.
+            max_file_bytes: Optional cap on bytes kept per file.
+            max_total_bytes: Optional cap on bytes kept across all files.
 
         Returns:
             Diff output as string.
@@ -134,14 +228,222 @@ class GitService:
             GitNotARepoError: If path is not a git repository.
             GitCommandError: If git command fails.
         """
-        args = ["diff"]
+        if max_file_bytes is None and max_total_bytes is None:
+            return await self._run_git(
+                project_path, *self._diff_args(staged_only, base_branch)
+            )
 
+        total_cap = max_total_bytes or DEFAULT_DIFF_TOTAL_MAX_BYTES
+        parts: list[str] = []
+        kept = 0
+        async for file_diff in self.iter_diff(
+            project_path,
+            staged_only=staged_only,
+            base_branch=base_branch,
+            max_file_bytes=max_file_bytes or total_cap,
+            max_total_bytes=total_cap,
+        ):
+            parts.append(file_diff.text)
+            kept += len(file_diff.text.encode())
+            if file_diff.truncated:
+                if not file_diff.text.endswith("\n"):
+                    parts.append("\n")
+                parts.append(
+                    f"[... diff truncated: {file_diff.path} is "
+                    f"{file_diff.size_bytes} bytes ...]\n"
+                )
+        if kept >= total_cap:
+            parts.append(
+                f"[... diff truncated at {total_cap} bytes; remaining files omitted ...]\n"
+            )
+        return "".join(parts)
+
+    async def get_diff_stat(
+        self,
+        project_path: Path,
+        staged_only: bool = False,
+        base_branch: str | None = None,
+    ) -> list[DiffStat]:
+        """Get a per-file summary of the diff without the hunks.
+
+        Runs: git diff --numstat. This is cheap even for huge diffs, so
+        consumers can pick the files they need and pass them to iter_diff().
+
+        Args:
+            project_path: Path to the git repository.
+            staged_only: If True, summarize only staged changes.
+            base_branch: If provided, diff against this branch.
+
+        Returns:
+            List of DiffStat entries, one per changed file.
+
+        Raises:
+            GitNotARepoError: If path is not a git repository.
+            GitCommandError: If git command fails.
+        """
+        output = await self._run_git(
+            project_path, *self._diff_args(staged_only, base_branch, "--numstat")
+        )
+        stats: list[DiffStat] = []
+        for line in output.splitlines():
+            parts = line.split("\t", 2)
+            if len(parts) != 3:
+                continue
+            added, deleted, path = parts
+            stats.append(
+                DiffStat(
+                    path=path,
+                    added=None if added == "-" else int(added),
+                    deleted=None if deleted == "-" else int(deleted),
+                )
+            )
+        return stats
+
+    async def iter_diff(
+        self,
+        project_path: Path,
+        staged_only: bool = False,
+        base_branch: str | None = None,
+        paths: list[str] | None = None,
+        max_file_bytes: int = DEFAULT_DIFF_FILE_MAX_BYTES,
+        max_total_bytes: int = DEFAULT_DIFF_TOTAL_MAX_BYTES,
+    ) -> AsyncIterator[FileDiff]:
+        """Stream the diff one file at a time.
+
+        git's stdout is read in fixed-size chunks, so a diff of any size is
+        processed in bounded memory. Bytes past max_file_bytes are counted
+        but dropped, binary files yield only their header, and once
+        max_total_bytes have been kept the git process is killed and
+        iteration stops.
+
+        Args:
+            project_path: Path to the git repository.
+            staged_only: If True, show only staged changes.
+            base_branch: If provided, diff against this branch.
+            paths: Optional list of paths to limit the diff to.
+            max_file_bytes: Maximum bytes kept for a single file.
+            max_total_bytes: Maximum bytes kept across all files.
+
+        Yields:
+            FileDiff for each changed file, in git's order.
+
+        Raises:
+            GitNotARepoError: If path is not a git repository.
+            GitCommandError: If git command fails.
+        """
+        args = self._diff_args(staged_only, base_branch, "--no-color", "--no-ext-diff")
+        if paths:
+            args.extend(["--", *paths])
+
+        proc = await self._spawn_git(project_path, *args)
+        assert proc.stdout is not None
+        current: _FileDiffBuilder | None = None
+        total = 0
+        finished = False
+
+        try:
+            async for line, at_line_start in self._iter_diff_lines(proc.stdout):
+                if at_line_start and line.startswith(b"diff --git "):
+                    if current is not None:
+                        yield current.build()
+                    current = _FileDiffBuilder(path=self._parse_diff_header(line))
+                if current is None:
+                    continue
+
+                if at_line_start and (
+                    line.startswith(b"Binary files ")
+                    or line.startswith(b"GIT binary patch")
+                ):
+                    # Keep the marker line, then drop any binary payload
+                    current.binary = True
+                    budget = min(max_file_bytes - current.kept, max_total_bytes - total)
+                    total += current.add(line, budget)
+                    continue
+
+                if current.binary:
+                    budget = 0
+                else:
+                    budget = min(max_file_bytes - current.kept, max_total_bytes - total)
+                total += current.add(line, budget)
+
+                if total >= max_total_bytes:
+                    logger.debug(
+                        "Diff for %s hit %d byte cap, stopping", project_path, max_total_bytes
+                    )
+                    current.truncated = True
+                    break
+            else:
+                finished = True
+
+            if current is not None:
+                yield current.build()
+
+            if finished:
+                assert proc.stderr is not None
+                stderr = await proc.stderr.read()
+                returncode = await proc.wait()
+                if returncode != 0:
+                    self._raise_git_error(project_path, args, returncode, stderr)
+        finally:
+            if proc.returncode is None:
+                proc.kill()
+                await proc.wait()
+
+    @staticmethod
+    async def _iter_diff_lines(
+        stream: asyncio.StreamReader,
+    ) -> AsyncIterator[tuple[bytes, bool]]:
+        """Split a byte stream into lines without unbounded buffering.
+
+        Lines longer than one read chunk (e.g. minified files) are yielded
+        in pieces; the flag tells whether a piece starts a new line.
+
+        Yields:
+            Tuples of (line bytes including newline, starts_new_line).
+        """
+        pending = b""
+        at_line_start = True
+        while True:
+            chunk = await stream.read(DIFF_READ_CHUNK_BYTES)
+            if not chunk:
+                break
+            pending += chunk
+            start = 0
+            while True:
+                newline = pending.find(b"\n", start)
+                if newline < 0:
+                    break
+                yield pending[start : newline + 1], at_line_start
+                at_line_start = True
+                start = newline + 1
+            pending = pending[start:]
+            if len(pending) > DIFF_READ_CHUNK_BYTES:
+                yield pending, at_line_start
+                at_line_start = False
+                pending = b""
+        if pending:
+            yield pending, at_line_start
+
+    @staticmethod
+    def _parse_diff_header(line: bytes) -> str:
+        """Extract the post-image path from a `diff --git a/x b/y` line."""
+        header = line.decode(errors="replace").rstrip("\n")
+        _, sep, b_path = header.rpartition(" b/")
+        if sep:
+            return b_path
+        return header[len("diff --git ") :]
+
+    @staticmethod
+    def _diff_args(
+        staged_only: bool, base_branch: str | None, *extra: str
+    ) -> list[str]:
+        """Build `git diff` arguments shared by the diff methods."""
+        args = ["diff", *extra]
         if staged_only:
             args.append("--cached")
         elif base_branch:
             args.append(f"{base_branch}...HEAD")
-
-        return await self._run_git(project_path, *args)
+        return args
 
     async def stage_files(
         self,
@@ -435,6 +737,37 @@ class GitService:
         except GitCommandError:
             return False
 
+    async def get_worktree_hash(self, project_path: Path) -> str:
+        """Get a content hash of the working copy.
+
+        Stages the whole working tree, including untracked files that are
+        not ignored, into a throwaway copy of the index and writes it as a
+        tree object. The real index is left untouched. Two working copies
+        with identical contents produce the same hash, whatever is staged.
+
+        Args:
+            project_path: Path to the git repository.
+
+        Returns:
+            The tree object ID.
+
+        Raises:
+            GitNotARepoError: If path is not a git repository.
+            GitCommandError: If a git command fails.
+        """
+        git_dir = Path(
+            (await self._run_git(project_path, "rev-parse", "--absolute-git-dir")).strip()
+        )
+        with tempfile.TemporaryDirectory(prefix="iterm-controller-") as tmp:
+            index = Path(tmp) / "index"
+            real_index = git_dir / "index"
+            if real_index.exists():
+                # Reuse the stat cache so only changed files are rehashed
+                shutil.copyfile(real_index, index)
+            env = {"GIT_INDEX_FILE": str(index)}
+            await self._run_git(project_path, "add", "-A", env=env)
+            return (await self._run_git(project_path, "write-tree", env=env)).strip()
+
     def _invalidate_cache(self, project_path: Path) -> None:
         """Invalidate cached status for a project.
 
@@ -525,12 +858,15 @@ class GitService:
 
         return status
 
-    async def _run_git(self, project_path: Path, *args: str) -> str:
+    async def _run_git(
+        self, project_path: Path, *args: str, env: dict[str, str] | None = None
+    ) -> str:
         """Run a git command.
 
         Args:
             project_path: Path to the git repository.
             *args: Git command arguments.
+            env: Extra environment variables for the git process.
 
         Returns:
             Command stdout.
@@ -539,34 +875,64 @@ class GitService:
             GitNotARepoError: If path is not a git repository.
             GitCommandError: If command fails.
         """
+        result = await self._spawn_git(project_path, *args, env=env)
+        stdout, stderr = await result.communicate()
+
+        if result.returncode != 0:
+            self._raise_git_error(project_path, list(args), result.returncode, stderr)
+
+        return stdout.decode()
+
+    async def _spawn_git(
+        self, project_path: Path, *args: str, env: dict[str, str] | None = None
+    ) -> asyncio.subprocess.Process:
+        """Start a git process with piped stdout and stderr.
+
+        Args:
+            project_path: Path to the git repository.
+            *args: Git command arguments.
+            env: Extra environment variables, added to the current environment.
+
+        Returns:
+            The running process.
+
+        Raises:
+            GitCommandError: If git is not installed.
+        """
         try:
-            result = await asyncio.create_subprocess_exec(
+            return await asyncio.create_subprocess_exec(
                 "git",
                 "-C",
                 str(project_path),
                 *args,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
+                env={**os.environ, **env} if env else None,
             )
-            stdout, stderr = await result.communicate()
-
-            if result.returncode != 0:
-                error = stderr.decode()
-                if "not a git repository" in error.lower():
-                    raise GitNotARepoError(
-                        f"Not a git repository: {project_path}",
-                        project_path=str(project_path),
-                    )
-                raise GitCommandError(
-                    f"Git command failed: {error.strip()}",
-                    command=" ".join(args),
-                    returncode=result.returncode,
-                )
-
-            return stdout.decode()
-
         except FileNotFoundError as e:
             raise GitCommandError(
                 "git not found in PATH",
                 cause=e,
             ) from e
+
+    @staticmethod
+    def _raise_git_error(
+        project_path: Path, args: list[str], returncode: int | None, stderr: bytes
+    ) -> NoReturn:
+        """Raise the appropriate error for a failed git command.
+
+        Raises:
+            GitNotARepoError: If path is not a git repository.
+            GitCommandError: For any other failure.
+        """
+        error = stderr.decode()
+        if "not a git repository" in error.lower():
+            raise GitNotARepoError(
+                f"Not a git repository: {project_path}",
+                project_path=str(project_path),
+            )
+        raise GitCommandError(
+            f"Git command failed: {error.strip()}",
+            command=" ".join(args),
+            returncode=returncode,
+        )
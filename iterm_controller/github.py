@@ -9,7 +9,10 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
+import random
 import subprocess
+import time
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from datetime import datetime
 
@@ -36,6 +39,81 @@ class NetworkError(BaseNetworkError):
     pass
 
 
+@dataclass
+class RateLimitBudget:
+    """Remaining GitHub API request budget.
+
+    The gh CLI uses both the REST (core) and GraphQL APIs, so the budget
+    tracks whichever of the two has the smaller fraction remaining.
+    """
+
+    limit: int = 5000
+    remaining: int = 5000
+    reset_at: float | None = None  # Unix timestamp when the budget resets
+
+    @classmethod
+    def from_api(cls, data: dict[str, object]) -> RateLimitBudget:
+        """Build a budget from `gh api rate_limit` JSON.
+
+        Args:
+            data: Parsed rate_limit response.
+
+        Returns:
+            Budget for the most constrained resource.
+        """
+        resources = data.get("resources")
+        candidates: list[dict[str, int]] = []
+        if isinstance(resources, dict):
+            for name in ("core", "graphql"):
+                resource = resources.get(name)
+                if isinstance(resource, dict):
+                    candidates.append(resource)
+        rate = data.get("rate")
+        if not candidates and isinstance(rate, dict):
+            candidates.append(rate)
+        if not candidates:
+            return cls()
+
+        tightest = min(
+            candidates,
+            key=lambda r: r.get("remaining", 0) / max(r.get("limit", 1), 1),
+        )
+        return cls(
+            limit=int(tightest.get("limit", 5000)),
+            remaining=int(tightest.get("remaining", 0)),
+            reset_at=float(tightest["reset"]) if "reset" in tightest else None,
+        )
+
+    @property
+    def fraction_remaining(self) -> float:
+        """Get the remaining budget as a fraction of the limit."""
+        if self.limit <= 0:
+            return 0.0
+        return max(0.0, min(1.0, self.remaining / self.limit))
+
+    def consume(self, cost: int) -> None:
+        """Record requests spent since the last rate_limit refresh.
+
+        Args:
+            cost: Estimated number of API requests made.
+        """
+        self.remaining = max(0, self.remaining - cost)
+
+    def seconds_until_reset(self, now: float | None = None) -> float:
+        """Get seconds until the budget resets.
+
+        Args:
+            now: Current Unix time (defaults to time.time()).
+
+        Returns:
+            Seconds until reset, 0 if unknown or already past.
+        """
+        if self.reset_at is None:
+            return 0.0
+        current = time.time() if now is None else now
+        return max(0.0, self.reset_at - current)
+
+
 @dataclass
 class GitHubIntegration:
     """GitHub integration with graceful degradation.
@@ -350,7 +428,7 @@ class GitHubIntegration:
             stdout, stderr = await asyncio.wait_for(
                 proc.communicate(), timeout=timeout
             )
-        except asyncio.TimeoutError:
+        except TimeoutError:
             logger.warning("git %s timed out after %.1fs", args[0], timeout)
             raise GitHubError(
                 f"git {args[0]} timed out after {timeout}s",
@@ -365,12 +443,12 @@ class GitHubIntegration:
         return stdout.decode()
 
     async def _run_gh(
-        self, path: str, *args: str, timeout: float = 30.0
+        self, path: str | None, *args: str, timeout: float = 30.0
     ) -> str:
         """Run a gh command.
 
         Args:
-            path: Working directory for the command.
+            path: Working directory for the command (None for the current one).
             *args: gh subcommand and arguments.
             timeout: Command timeout in seconds (default 30).
 
@@ -394,7 +472,7 @@ class GitHubIntegration:
             stdout, stderr = await asyncio.wait_for(
                 proc.communicate(), timeout=timeout
             )
-        except asyncio.TimeoutError:
+        except TimeoutError:
             logger.warning("gh %s timed out after %.1fs", args[0], timeout)
             raise NetworkError(
                 f"gh {args[0]} timed out after {timeout}s",
@@ -464,6 +542,29 @@ class GitHubIntegration:
             record_error(e)
             return []
 
+    async def get_rate_limit(self) -> RateLimitBudget | None:
+        """Get the remaining GitHub API budget.
+
+        Queries `gh api rate_limit`, which does not itself count against
+        the rate limit.
+
+        Returns:
+            RateLimitBudget if available, None on error.
+        """
+        if not self.available:
+            return None
+
+        try:
+            result = await self._run_gh(None, "api", "rate_limit")
+            budget = RateLimitBudget.from_api(json.loads(result))
+            logger.debug(
+                "GitHub rate limit: %d/%d remaining", budget.remaining, budget.limit
+            )
+            return budget
+        except Exception as e:
+            logger.debug("Could not fetch GitHub rate limit: %s", e)
+            return None
+
     def clear_cache(self, project_path: str | None = None) -> None:
         """Clear cached status.
 
@@ -475,3 +576,398 @@ class GitHubIntegration:
             self.cached_status.pop(project_path, None)
         else:
             self.cached_status.clear()
+
+
+# Estimated API requests per refresh: `gh pr view` + `gh pr checks`.
+STATUS_REQUEST_COST = 2
+# Estimated API requests per `gh run list`.
+RUNS_REQUEST_COST = 1
+
+
+@dataclass
+class _RepoSchedule:
+    """Polling schedule for a single repository."""
+
+    project_path: str
+    next_due: float
+    include_runs: bool = False
+
+
+class GitHubPoller:
+    """Background scheduler that owns all GitHub refreshes.
+
+    Widgets and modals read from the poller's cache rather than fetching
+    directly. The poller:
+    - Spreads polls across repos with jittered per-repo intervals
+    - Polls the active project more often (and includes workflow runs)
+    - Tracks the remaining rate-limit budget from `gh api rate_limit`
+    - Stretches intervals as the budget drains and pauses until reset
+      once it drops to the reserve
+
+    Example:
+        poller = GitHubPoller(github, on_update=handle_update)
+        poller.track("/path/to/project", active=True)
+        await poller.start()
+        status = poller.get_cached_status("/path/to/project")
+    """
+
+    def __init__(
+        self,
+        github: GitHubIntegration,
+        on_update: Callable[[str, GitHubStatus | None], None] | None = None,
+        base_interval: float = 120.0,
+        active_interval: float = 30.0,
+        jitter: float = 0.2,
+        low_budget_fraction: float = 0.25,
+        reserve_requests: int = 100,
+        rate_limit_interval: float = 300.0,
+        max_backoff: float = 8.0,
+        min_sleep: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+        rng: random.Random | None = None,
+    ) -> None:
+        """Initialize the poller.
+
+        Args:
+            github: GitHub integration used for fetching.
+            on_update: Optional callback invoked after each repo refresh.
+            base_interval: Seconds between polls of background repos.
+            active_interval: Seconds between polls of the active repo.
+            jitter: Fractional jitter applied to each interval (0.2 = ±20%).
+            low_budget_fraction: Budget fraction below which intervals stretch.
+            reserve_requests: Budget kept in reserve; polling pauses until
+                the rate limit resets once remaining drops to this level.
+            rate_limit_interval: Seconds between `gh api rate_limit` refreshes.
+            max_backoff: Maximum interval multiplier when the budget is low.
+            min_sleep: Minimum seconds between polling rounds, so a repo
+                that stays due (e.g. after a failed poll) cannot spin the loop.
+            clock: Monotonic clock (injectable for tests).
+            rng: Random source for jitter (injectable for tests).
+        """
+        self.github = github
+        self.on_update = on_update
+        self.base_interval = base_interval
+        self.active_interval = active_interval
+        self.jitter = jitter
+        self.low_budget_fraction = low_budget_fraction
+        self.reserve_requests = reserve_requests
+        self.rate_limit_interval = rate_limit_interval
+        self.max_backoff = max_backoff
+        self.min_sleep = min_sleep
+        self.budget = RateLimitBudget()
+        self._clock = clock
+        self._rng = rng or random.Random()
+        self._repos: dict[str, _RepoSchedule] = {}
+        self._active_path: str | None = None
+        self._cached_runs: dict[str, list[dict[str, str | int | None]]] = {}
+        self._next_rate_limit_check = 0.0
+        self._task: asyncio.Task[None] | None = None
+        self._wakeup = asyncio.Event()
+
+    # -------------------------------------------------------------------------
+    # Registration
+    # -------------------------------------------------------------------------
+
+    def track(self, project_path: str, active: bool = False) -> None:
+        """Start polling a repository.
+
+        New repos are staggered across the first interval so that tracking
+        many projects at once does not produce a burst of requests.
+
+        Args:
+            project_path: Path to the project directory.
+            active: Whether this becomes the active project.
+        """
+        if project_path not in self._repos:
+            offset = self._rng.uniform(0, self.base_interval * self.jitter)
+            self._repos[project_path] = _RepoSchedule(
+                project_path=project_path,
+                next_due=self._clock() + offset,
+            )
+            logger.debug("Tracking GitHub status for %s", project_path)
+        if active:
+            self.set_active(project_path)
+
+    def untrack(self, project_path: str) -> None:
+        """Stop polling a repository and drop its cached data.
+
+        Args:
+            project_path: Path to the project directory.
+        """
+        self._repos.pop(project_path, None)
+        self._cached_runs.pop(project_path, None)
+        self.github.clear_cache(project_path)
+        if self._active_path == project_path:
+            self._active_path = None
+
+    def set_active(self, project_path: str | None) -> None:
+        """Mark a project as active so it is polled first and more often.
+
+        Args:
+            project_path: Path to the active project, or None to clear.
+        """
+        self._active_path = project_path
+        if project_path is not None:
+            repo = self._repos.get(project_path)
+            if repo is None:
+                self.track(project_path)
+                repo = self._repos[project_path]
+            repo.include_runs = True
+            repo.next_due = min(repo.next_due, self._clock())
+            self._wakeup.set()
+
+    @property
+    def active_path(self) -> str | None:
+        """Get the active project path."""
+        return self._active_path
+
+    @property
+    def tracked_paths(self) -> list[str]:
+        """Get all tracked project paths."""
+        return list(self._repos)
+
+    # -------------------------------------------------------------------------
+    # Cache access
+    # -------------------------------------------------------------------------
+
+    def get_cached_status(self, project_path: str) -> GitHubStatus | None:
+        """Get the last fetched status for a project.
+
+        Args:
+            project_path: Path to the project directory.
+
+        Returns:
+            Cached GitHubStatus, or None if not yet fetched.
+        """
+        return self.github.cached_status.get(project_path)
+
+    def get_cached_runs(
+        self, project_path: str
+    ) -> list[dict[str, str | int | None]] | None:
+        """Get the last fetched workflow runs for a project.
+
+        Args:
+            project_path: Path to the project directory.
+
+        Returns:
+            Cached workflow runs, or None if not yet fetched.
+        """
+        return self._cached_runs.get(project_path)
+
+    def request_refresh(self, project_path: str, include_runs: bool = False) -> None:
+        """Ask for a repo to be refreshed at the next opportunity.
+
+        The refresh still goes through the budget checks, so a user mashing
+        refresh cannot exhaust the rate limit.
+
+        Args:
+            project_path: Path to the project directory.
+            include_runs: Whether workflow runs should be fetched too.
+        """
+        self.track(project_path)
+        repo = self._repos[project_path]
+        repo.include_runs = repo.include_runs or include_runs
+        repo.next_due = self._clock()
+        self._wakeup.set()
+
+    # -------------------------------------------------------------------------
+    # Scheduling
+    # -------------------------------------------------------------------------
+
+    @property
+    def is_budget_exhausted(self) -> bool:
+        """Check whether the budget has dropped to the reserve."""
+        return self.budget.remaining <= self.reserve_requests
+
+    def backoff_factor(self) -> float:
+        """Get the interval multiplier for the current budget.
+
+        Returns:
+            1.0 while the budget is healthy, growing towards max_backoff
+            as the remaining fraction approaches zero.
+        """
+        fraction = self.budget.fraction_remaining
+        if fraction >= self.low_budget_fraction:
+            return 1.0
+        factor = self.low_budget_fraction / max(fraction, 1e-6)
+        return min(self.max_backoff, factor)
+
+    def interval_for(self, project_path: str) -> float:
+        """Get the jittered polling interval for a repo.
+
+        Args:
+            project_path: Path to the project directory.
+
+        Returns:
+            Seconds until the repo should be polled again.
+        """
+        base = (
+            self.active_interval
+            if project_path == self._active_path
+            else self.base_interval
+        )
+        spread = base * self.jitter
+        return (base + self._rng.uniform(-spread, spread)) * self.backoff_factor()
+
+    def _due_repos(self, now: float) -> list[_RepoSchedule]:
+        """Get repos that are due, active project first, then oldest due."""
+        due = [r for r in self._repos.values() if r.next_due <= now]
+        due.sort(key=lambda r: (r.project_path != self._active_path, r.next_due))
+        return due
+
+    def _reschedule_due(self) -> None:
+        """Push repos that are still due to their next interval."""
+        now = self._clock()
+        for repo in self._due_repos(now):
+            repo.next_due = now + self.interval_for(repo.project_path)
+
+    def seconds_until_next_poll(self) -> float:
+        """Get seconds until the next repo becomes due.
+
+        Returns:
+            Seconds to wait, or rate_limit_interval if nothing is tracked.
+        """
+        if not self._repos:
+            return self.rate_limit_interval
+        now = self._clock()
+        next_due = min(r.next_due for r in self._repos.values())
+        return max(0.0, next_due - now)
+
+    # -------------------------------------------------------------------------
+    # Fetching
+    # -------------------------------------------------------------------------
+
+    async def refresh_rate_limit(self) -> RateLimitBudget:
+        """Refresh the budget from `gh api rate_limit`.
+
+        Returns:
+            The current budget (unchanged if the query failed).
+        """
+        budget = await self.github.get_rate_limit()
+        if budget is not None:
+            self.budget = budget
+        elif self.is_budget_exhausted and self.budget.seconds_until_reset() == 0:
+            # Could not confirm the budget; assume it reset so polling resumes.
+            # A still-limited API will flag the next status as rate limited.
+            self.budget = RateLimitBudget(
+                limit=self.budget.limit, remaining=self.budget.limit
+            )
+        self._next_rate_limit_check = self._clock() + self.rate_limit_interval
+        return self.budget
+
+    async def refresh(
+        self, project_path: str, include_runs: bool = False
+    ) -> GitHubStatus | None:
+        """Refresh one repo now, respecting the rate-limit budget.
+
+        Args:
+            project_path: Path to the project directory.
+            include_runs: Whether to fetch workflow runs as well.
+
+        Returns:
+            The fresh status, or the cached status if skipped or failed.
+        """
+        if not self.github.available:
+            return None
+
+        if self.is_budget_exhausted:
+            logger.debug("Skipping GitHub refresh for %s: budget exhausted", project_path)
+            cached = self.get_cached_status(project_path)
+            if cached:
+                cached.rate_limited = True
+            return cached
+
+        status = await self.github.get_status(project_path)
+        self.budget.consume(STATUS_REQUEST_COST)
+
+        if status is not None and status.rate_limited:
+            # GitHub disagrees with our estimate; stop until the reset.
+            self.budget.remaining = 0
+            self._next_rate_limit_check = self._clock()
+        elif include_runs:
+            runs = await self.github.get_workflow_runs(project_path)
+            self._cached_runs[project_path] = runs
+            self.budget.consume(RUNS_REQUEST_COST)
+
+        if self.on_update:
+            self.on_update(project_path, status)
+        return status
+
+    async def poll_once(self) -> int:
+        """Refresh every repo that is currently due.
+
+        Returns:
+            Number of repos refreshed.
+        """
+        now = self._clock()
+        if now >= self._next_rate_limit_check:
+            await self.refresh_rate_limit()
+
+        if self.is_budget_exhausted:
+            # Push every repo past the reset time rather than retrying.
+            delay = max(self.budget.seconds_until_reset(), self.base_interval)
+            logger.info("GitHub budget low, pausing polls for %.0fs", delay)
+            for repo in self._repos.values():
+                repo.next_due = max(repo.next_due, now + delay)
+            self._next_rate_limit_check = min(self._next_rate_limit_check, now + delay)
+            return 0
+
+        refreshed = 0
+        for repo in self._due_repos(now):
+            if repo.project_path not in self._repos:
+                continue  # Untracked while we were fetching
+            await self.refresh(repo.project_path, include_runs=repo.include_runs)
+            repo.include_runs = repo.project_path == self._active_path
+            repo.next_due = self._clock() + self.interval_for(repo.project_path)
+            refreshed += 1
+            if self.is_budget_exhausted:
+                break
+        return refreshed
+
+    # -------------------------------------------------------------------------
+    # Lifecycle
+    # -------------------------------------------------------------------------
+
+    async def start(self) -> None:
+        """Start the background polling task."""
+        if self._task is not None and not self._task.done():
+            return
+        self._wakeup = asyncio.Event()
+        self._task = asyncio.create_task(self._run())
+        logger.debug("GitHub poller started")
+
+    async def stop(self) -> None:
+        """Stop the background polling task."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        logger.debug("GitHub poller stopped")
+
+    @property
+    def is_running(self) -> bool:
+        """Check if the background task is running."""
+        return self._task is not None and not self._task.done()
+
+    async def _run(self) -> None:
+        """Polling loop: refresh due repos, then sleep until the next one."""
+        while True:
+            if self.github.available:
+                try:
+                    await self.poll_once()
+                except Exception as e:
+                    logger.error("GitHub poll failed: %s", e)
+                    record_error(e)
+                    self._reschedule_due()
+
+            self._wakeup.clear()
+            timeout = min(self.seconds_until_next_poll(), self.rate_limit_interval)
+            timeout = max(timeout, self.min_sleep)
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=timeout)
+            except TimeoutError:
+                pass
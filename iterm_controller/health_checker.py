@@ -2,13 +2,22 @@
 
 Polls HTTP endpoints to verify services are running and healthy.
 Supports environment variable placeholder resolution in URLs.
+
+Pollers can run standalone (one task and one client each) or attach to a
+shared HealthCheckEngine, which schedules every check from every project
+on a single task and sends all requests through one pooled client.
 """
 
 from __future__ import annotations
 
 import asyncio
+import heapq
+import importlib.util
+import itertools
 import logging
 import re
+import time
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, Callable
 
 import httpx
@@ -21,23 +30,290 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# HTTP/2 needs the optional h2 package; fall back to HTTP/1.1 without it
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Default engine limits
+DEFAULT_MAX_CONCURRENT_CHECKS = 16
+DEFAULT_MAX_CONNECTIONS = 32
+DEFAULT_MAX_CONNECTIONS_PER_HOST = 4
+
+# Adaptive scheduling defaults
+DEFAULT_MAX_BACKOFF_SECONDS = 300.0
+DEFAULT_RECOVERY_PROBE_SECONDS = 2.0
+DEFAULT_RECOVERY_PROBES = 3
+
+
+@dataclass
+class _CheckState:
+    """Scheduling state for one check.
+
+    Attributes:
+        consecutive_failures: UNHEALTHY results in a row.
+        recovery_probes_left: Fast probes still owed after a recovery.
+    """
+
+    consecutive_failures: int = 0
+    recovery_probes_left: int = 0
+
+
+@dataclass
+class _ScheduledCheck:
+    """A check registered with the engine.
+
+    Attributes:
+        poller: Poller that owns the check and records its status.
+        check: Health check configuration.
+        generation: Bumped on every (re)registration so stale heap entries
+            and in-flight runs can be recognised and dropped.
+    """
+
+    poller: HealthCheckPoller
+    check: HealthCheck
+    generation: int
+
+
+class HealthCheckEngine:
+    """Process-wide scheduler and HTTP client for health checks.
+
+    Every check from every attached poller is kept in one min-heap of due
+    times serviced by a single scheduler task, so the number of checks
+    does not change the number of long-lived tasks. Requests share one
+    pooled client and are bounded by a global concurrency cap and a
+    per-host cap, so a project with many checks against one dev server
+    cannot starve the others.
+
+    Example:
+        engine = HealthCheckEngine()
+        poller = HealthCheckPoller(env, on_status_change, engine=engine)
+        await poller.start_polling(checks)
+        ...
+        await engine.close()
+    """
+
+    def __init__(
+        self,
+        max_concurrent: int = DEFAULT_MAX_CONCURRENT_CHECKS,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        max_connections_per_host: int = DEFAULT_MAX_CONNECTIONS_PER_HOST,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the engine.
+
+        Args:
+            max_concurrent: Maximum checks in flight across all projects.
+            max_connections: Connection pool size of the shared client.
+            max_connections_per_host: Maximum checks in flight per host:port.
+            clock: Monotonic clock (injectable for tests).
+        """
+        self.max_concurrent = max_concurrent
+        self.max_connections = max_connections
+        self.max_connections_per_host = max_connections_per_host
+        self._clock = clock
+        self._client: httpx.AsyncClient | None = None
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+        self._host_semaphores: dict[str, asyncio.Semaphore] = {}
+        self._entries: dict[tuple[int, str], _ScheduledCheck] = {}
+        self._heap: list[tuple[float, int, tuple[int, str], int]] = []
+        self._sequence = itertools.count()
+        self._generations = itertools.count(1)
+        self._in_flight: set[asyncio.Task[None]] = set()
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+
+    # -------------------------------------------------------------------------
+    # HTTP
+    # -------------------------------------------------------------------------
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Get the shared client, creating it on first use."""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections,
+                ),
+                http2=HTTP2_AVAILABLE,
+            )
+        return self._client
+
+    def _host_semaphore(self, url: str) -> asyncio.Semaphore:
+        """Get the concurrency limiter for a URL's host:port."""
+        try:
+            parsed = httpx.URL(url)
+            key = f"{parsed.host}:{parsed.port or parsed.scheme}"
+        except Exception:
+            key = url
+        semaphore = self._host_semaphores.get(key)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.max_connections_per_host)
+            self._host_semaphores[key] = semaphore
+        return semaphore
+
+    async def request(self, method: str, url: str, timeout: float) -> httpx.Response:
+        """Send a request through the shared client within the limits.
+
+        Args:
+            method: HTTP method.
+            url: Fully resolved URL.
+            timeout: Request timeout in seconds.
+
+        Returns:
+            The HTTP response.
+        """
+        async with self._semaphore, self._host_semaphore(url):
+            return await self.client.request(method=method, url=url, timeout=timeout)
+
+    # -------------------------------------------------------------------------
+    # Scheduling
+    # -------------------------------------------------------------------------
+
+    def schedule(self, poller: HealthCheckPoller, check: HealthCheck, delay: float = 0.0) -> None:
+        """Register a check for periodic polling.
+
+        Re-registering a check replaces its previous schedule.
+
+        Args:
+            poller: Poller that owns the check.
+            check: Health check configuration (interval_seconds must be > 0).
+            delay: Seconds until the first run.
+        """
+        key = (id(poller), check.name)
+        entry = _ScheduledCheck(poller, check, next(self._generations))
+        self._entries[key] = entry
+        self._push(key, entry.generation, delay)
+        self._ensure_running()
+
+    def unschedule(self, poller: HealthCheckPoller, name: str | None = None) -> None:
+        """Stop polling one check, or every check of a poller.
+
+        Args:
+            poller: Poller that owns the checks.
+            name: Check name, or None for all of the poller's checks.
+        """
+        owner = id(poller)
+        for key in list(self._entries):
+            if key[0] == owner and (name is None or key[1] == name):
+                del self._entries[key]
+        # Heap entries are dropped lazily when they come due
+
+    def is_scheduled(self, poller: HealthCheckPoller, name: str) -> bool:
+        """Check whether a check is registered for polling."""
+        return (id(poller), name) in self._entries
+
+    @property
+    def scheduled_count(self) -> int:
+        """Get the number of checks registered for polling."""
+        return len(self._entries)
+
+    def _push(self, key: tuple[int, str], generation: int, delay: float) -> None:
+        """Add a heap entry and wake the scheduler if it is now the earliest."""
+        due = self._clock() + max(0.0, delay)
+        heapq.heappush(self._heap, (due, next(self._sequence), key, generation))
+        if self._heap[0][0] == due:
+            self._wakeup.set()
+
+    def _ensure_running(self) -> None:
+        """Start the scheduler task if it is not already running."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    @property
+    def is_running(self) -> bool:
+        """Check if the scheduler task is running."""
+        return self._task is not None and not self._task.done()
+
+    async def _run(self) -> None:
+        """Scheduler loop: dispatch due checks, then sleep until the next one."""
+        while True:
+            self._wakeup.clear()
+            now = self._clock()
+            while self._heap and self._heap[0][0] <= now:
+                _, _, key, generation = heapq.heappop(self._heap)
+                entry = self._entries.get(key)
+                if entry is None or entry.generation != generation:
+                    continue  # Unscheduled or rescheduled since
+                task = asyncio.create_task(self._run_check(key, entry))
+                self._in_flight.add(task)
+                task.add_done_callback(self._in_flight.discard)
+
+            timeout = self._heap[0][0] - now if self._heap else None
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout)
+            except TimeoutError:
+                pass
+
+    async def _run_check(self, key: tuple[int, str], entry: _ScheduledCheck) -> None:
+        """Run one check and queue its next run."""
+        try:
+            await entry.poller._perform_check(entry.check)
+        except Exception as e:
+            logger.error("Health check %s failed unexpectedly: %s", entry.check.name, e)
+            record_error(e)
+        current = self._entries.get(key)
+        if current is entry:
+            self._push(key, entry.generation, entry.poller.next_interval(entry.check))
+
+    async def close(self) -> None:
+        """Stop the scheduler, cancel in-flight checks and close the client.
+
+        The engine can be reused afterwards; the client is recreated lazily.
+        """
+        self._entries.clear()
+        self._heap.clear()
+        tasks = [t for t in (self._task, *self._in_flight) if t is not None]
+        for task in tasks:
+            task.cancel()
+        for task in tasks:
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
+        self._in_flight.clear()
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
 
 class HealthCheckPoller:
-    """Polls HTTP health check endpoints."""
+    """Polls HTTP health check endpoints.
+
+    Polling adapts to each check's recent results: a healthy check runs
+    every ``interval_seconds``, a failing one backs off exponentially up to
+    ``max_backoff_seconds``, and a check that just recovered is probed a
+    few times at ``recovery_probe_seconds`` to confirm it is stable.
+    """
 
     def __init__(
         self,
         env: dict[str, str],
         on_status_change: Callable[[str, HealthStatus], None] | None = None,
+        engine: HealthCheckEngine | None = None,
+        max_backoff_seconds: float = DEFAULT_MAX_BACKOFF_SECONDS,
+        recovery_probe_seconds: float = DEFAULT_RECOVERY_PROBE_SECONDS,
+        recovery_probes: int = DEFAULT_RECOVERY_PROBES,
     ):
         """Initialize the poller.
 
         Args:
             env: Environment variables for URL placeholder resolution.
             on_status_change: Optional callback when status changes.
+            engine: Optional shared engine. When set, checks are scheduled
+                and sent by the engine instead of per-check tasks and a
+                per-poller client.
+            max_backoff_seconds: Longest interval for a failing check.
+            recovery_probe_seconds: Interval of the probes after a recovery.
+            recovery_probes: Number of fast probes after a recovery.
         """
         self.env = env
         self.on_status_change = on_status_change
+        self.engine = engine
+        self.max_backoff_seconds = max_backoff_seconds
+        self.recovery_probe_seconds = recovery_probe_seconds
+        self.recovery_probes = recovery_probes
+        self._check_state: dict[str, _CheckState] = {}
         self._running = False
         self._tasks: dict[str, asyncio.Task[None]] = {}
         self._status: dict[str, HealthStatus] = {}
@@ -69,6 +345,14 @@ class HealthCheckPoller:
         """
         self._running = True
 
+        if self.engine is not None:
+            for check in checks:
+                self._checks[check.name] = check
+                if check.interval_seconds > 0:
+                    self._status[check.name] = HealthStatus.UNKNOWN
+                    self.engine.schedule(self, check)
+            return
+
         # Create a shared httpx client for connection pooling
         self._client = httpx.AsyncClient()
 
@@ -85,6 +369,8 @@ class HealthCheckPoller:
     async def stop_polling(self) -> None:
         """Stop all polling tasks."""
         self._running = False
+        if self.engine is not None:
+            self.engine.unschedule(self)
         for task in self._tasks.values():
             task.cancel()
             try:
@@ -106,7 +392,63 @@ class HealthCheckPoller:
         """
         while self._running:
             await self._perform_check(check)
-            await asyncio.sleep(check.interval_seconds)
+            await asyncio.sleep(self.next_interval(check))
+
+    def next_interval(self, check: HealthCheck) -> float:
+        """Get the delay before a check's next scheduled run.
+
+        Args:
+            check: Health check configuration.
+
+        Returns:
+            Seconds to wait, based on the check's recent results.
+        """
+        base = check.interval_seconds
+        state = self._check_state.get(check.name)
+        if state is None:
+            return base
+        if state.consecutive_failures > 1:
+            # The first failure keeps the normal cadence in case it was a blip
+            backoff = base * 2.0 ** (state.consecutive_failures - 1)
+            return min(backoff, max(base, self.max_backoff_seconds))
+        if state.recovery_probes_left > 0:
+            return min(base, self.recovery_probe_seconds)
+        return base
+
+    def _record_result(self, check: HealthCheck, new_status: HealthStatus) -> bool:
+        """Update a check's scheduling state with a result.
+
+        Args:
+            check: Health check configuration.
+            new_status: Settled result of the check.
+
+        Returns:
+            True if this result is a recovery from a failing streak.
+        """
+        state = self._check_state.setdefault(check.name, _CheckState())
+        if new_status == HealthStatus.UNHEALTHY:
+            state.consecutive_failures += 1
+            state.recovery_probes_left = 0
+            return False
+        recovered = state.consecutive_failures > 0
+        state.consecutive_failures = 0
+        if recovered:
+            state.recovery_probes_left = self.recovery_probes
+        elif state.recovery_probes_left > 0:
+            state.recovery_probes_left -= 1
+        return recovered
+
+    def get_failure_count(self, name: str) -> int:
+        """Get the number of consecutive failures of a check.
+
+        Args:
+            name: Health check name.
+
+        Returns:
+            Consecutive UNHEALTHY results (0 if healthy or never run).
+        """
+        state = self._check_state.get(name)
+        return state.consecutive_failures if state else 0
 
     async def _perform_check(self, check: HealthCheck) -> HealthStatus:
         """Perform a single health check.
@@ -118,25 +460,34 @@ class HealthCheckPoller:
             The resulting health status.
         """
         old_status = self._status.get(check.name)
-        self._set_status(check.name, HealthStatus.CHECKING)
+        # Only show CHECKING before the first result; re-checks keep the
+        # settled status so that watchers are not refreshed on every probe
+        if old_status in (None, HealthStatus.UNKNOWN):
+            self._set_status(check.name, HealthStatus.CHECKING)
 
         url = self.resolve_url(check.url)
         logger.debug("Checking %s at %s", check.name, url)
 
-        # Use shared client if available, otherwise create a temporary one
-        # (for check_now() called before start_polling())
+        # Prefer the engine, then the poller's client; otherwise create a
+        # temporary one (for check_now() called before start_polling())
         client = self._client
         should_close = False
-        if client is None:
+        if self.engine is None and client is None:
             client = httpx.AsyncClient()
             should_close = True
 
         try:
-            response = await client.request(
-                method=check.method,
-                url=url,
-                timeout=check.timeout_seconds,
-            )
+            if self.engine is not None:
+                response = await self.engine.request(
+                    check.method, url, check.timeout_seconds
+                )
+            else:
+                assert client is not None
+                response = await client.request(
+                    method=check.method,
+                    url=url,
+                    timeout=check.timeout_seconds,
+                )
 
             if response.status_code == check.expected_status:
                 new_status = HealthStatus.HEALTHY
@@ -170,10 +521,21 @@ class HealthCheckPoller:
             new_status = HealthStatus.UNHEALTHY
         finally:
             # Close temporary client if we created one
-            if should_close:
+            if should_close and client is not None:
                 await client.aclose()
 
         self._set_status(check.name, new_status)
+        recovered = self._record_result(check, new_status)
+
+        # A manual check can clear a long backoff; pull the next run forward
+        if (
+            recovered
+            and self.engine is not None
+            and self._running
+            and check.interval_seconds > 0
+            and self.engine.is_scheduled(self, check.name)
+        ):
+            self.engine.schedule(self, check, delay=self.next_interval(check))
 
         # Call callback on actual status change (not just CHECKING transitions)
         if self.on_status_change and old_status != new_status:
@@ -250,11 +612,21 @@ class HealthCheckPoller:
 
 
 class ProjectHealthManager:
-    """Manages health checks for multiple projects."""
+    """Manages health checks for multiple projects.
+
+    All projects share one HealthCheckEngine, so the whole app uses a
+    single scheduler task and connection pool for health checks.
+    """
+
+    def __init__(self, engine: HealthCheckEngine | None = None) -> None:
+        """Initialize the manager.
 
-    def __init__(self) -> None:
-        """Initialize the manager."""
+        Args:
+            engine: Shared engine to schedule checks on. A new one is
+                created if not provided.
+        """
         self.pollers: dict[str, HealthCheckPoller] = {}
+        self.engine = engine or HealthCheckEngine()
 
     async def start_project_checks(
         self,
@@ -277,7 +649,7 @@ class ProjectHealthManager:
         # Stop existing poller if any
         await self.stop_project_checks(project.id)
 
-        poller = HealthCheckPoller(env, on_status_change)
+        poller = HealthCheckPoller(env, on_status_change, engine=self.engine)
         await poller.start_polling(checks)
         self.pollers[project.id] = poller
         return poller
@@ -293,9 +665,10 @@ class ProjectHealthManager:
             await poller.stop_polling()
 
     async def stop_all(self) -> None:
-        """Stop all health check pollers."""
+        """Stop all health check pollers and release the engine's resources."""
         for project_id in list(self.pollers.keys()):
             await self.stop_project_checks(project_id)
+        await self.engine.close()
 
     def get_project_status(self, project_id: str) -> dict[str, HealthStatus]:
         """Get health status for a project.
@@ -11,6 +11,8 @@ focused modules:
 - layout_manager: Window layout persistence (WindowLayoutManager)
 - adapter: Protocol adapters for terminal abstraction (ItermTerminalProvider)
 - focus_watcher: Tab focus monitoring for screen refresh (FocusWatcher)
+- supervisor: Reconnect and state resync (ConnectionSupervisor, ReconcileResult)
+- session_pool: Pre-warmed shells for fast spawning (SessionPool)
 """
 
 from iterm_controller.iterm.adapter import (
@@ -33,10 +35,15 @@ from iterm_controller.iterm.layout_spawner import (
     LayoutSpawnResult,
     WindowLayoutSpawner,
 )
+from iterm_controller.iterm.session_pool import SessionPool
 from iterm_controller.iterm.spawner import (
     SessionSpawner,
     SpawnResult,
 )
+from iterm_controller.iterm.supervisor import (
+    ConnectionSupervisor,
+    ReconcileResult,
+)
 from iterm_controller.iterm.terminator import (
     CloseResult,
     SessionTerminator,
@@ -54,6 +61,7 @@ __all__ = [
     # Spawner
     "SessionSpawner",
     "SpawnResult",
+    "SessionPool",
     # Terminator
     "SessionTerminator",
     "CloseResult",
@@ -67,6 +75,9 @@ __all__ = [
     "LayoutSpawnResult",
     # Focus
     "FocusWatcher",
+    # Supervision
+    "ConnectionSupervisor",
+    "ReconcileResult",
     # Protocol Adapters
     "ItermTerminalProvider",
     "ItermConnectionAdapter",
@@ -219,14 +219,8 @@ class ItermOutputReaderAdapter:
         self._reader = reader
 
     async def read_output(self, session_id: str, lines: int = 50) -> str:
-        # Create a temporary reader with the specified line count
-        original_lines = self._reader.lines_to_read
-        self._reader.lines_to_read = lines
-        try:
-            result = await self._reader.read_batch([session_id])
-            return result.get(session_id, "")
-        finally:
-            self._reader.lines_to_read = original_lines
+        result = await self._reader.read_batch([session_id], lines=lines)
+        return result.get(session_id, "")
 
     async def read_batch(self, session_ids: list[str]) -> dict[str, str]:
         return await self._reader.read_batch(session_ids)
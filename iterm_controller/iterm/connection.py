@@ -78,6 +78,18 @@ class ItermController:
         """Check if currently connected to iTerm2."""
         return self._connected and self.connection is not None
 
+    @property
+    def is_connection_lost(self) -> bool:
+        """Check if the connection was established but its websocket closed.
+
+        This happens when iTerm2 quits or restarts under us. The controller
+        still looks connected until reconnect() replaces the connection.
+        """
+        if not self.is_connected:
+            return False
+        websocket = getattr(self.connection, "websocket", None)
+        return getattr(websocket, "closed", False) is True
+
     async def verify_version(self) -> tuple[bool, str]:
         """Check iTerm2 version meets requirements.
 
@@ -91,14 +103,18 @@ class ItermController:
         # implies compatible version (3.5+ required for Python API)
         return (True, "Connected to iTerm2 (3.5+ required)")
 
-    def require_connection(self) -> None:
+    def require_connection(self) -> iterm2.Connection:
         """Raise if not connected.
 
+        Returns:
+            The live connection.
+
         Raises:
             ItermNotConnectedError: If not connected to iTerm2.
         """
-        if not self.is_connected:
+        if not self.is_connected or self.connection is None:
             raise ItermNotConnectedError("Not connected to iTerm2. Call connect() first.")
+        return self.connection
 
 
 async def with_reconnect(
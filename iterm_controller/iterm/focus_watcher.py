@@ -15,6 +15,8 @@ from typing import TYPE_CHECKING
 
 import iterm2
 
+from iterm_controller.process_tree import ProcessTreeCache, get_process_tree_cache
+
 if TYPE_CHECKING:
     from iterm_controller.iterm.connection import ItermController
 
@@ -38,21 +40,25 @@ class FocusWatcher:
     Attributes:
         controller: The iTerm2 controller for API access.
         on_tab_focused: Callback to invoke when TUI's tab becomes active.
+        process_tree: Process tree snapshots used to find our parent chain.
     """
 
     def __init__(
         self,
         controller: ItermController,
         on_tab_focused: TabFocusedCallback | None = None,
+        process_tree: ProcessTreeCache | None = None,
     ) -> None:
         """Initialize the focus watcher.
 
         Args:
             controller: The iTerm2 controller with active connection.
             on_tab_focused: Callback to invoke when TUI's tab becomes active.
+            process_tree: Process tree snapshots (defaults to the shared cache).
         """
         self.controller = controller
         self.on_tab_focused = on_tab_focused
+        self.process_tree = process_tree or get_process_tree_cache()
         self._our_tab_id: str | None = None
         self._our_session_id: str | None = None
         self._task: asyncio.Task | None = None
@@ -62,7 +68,8 @@ class FocusWatcher:
         """Find the tab containing this TUI application.
 
         Searches all iTerm2 sessions for one whose process tree contains
-        the current Python process.
+        the current Python process. Session pids are fetched concurrently
+        and matched against this process's parent chain.
 
         Returns:
             The tab ID if found, None otherwise.
@@ -72,26 +79,35 @@ class FocusWatcher:
             return None
 
         our_pid = os.getpid()
-        parent_pids = self._get_parent_pids(our_pid)
-
-        for window in self.controller.app.terminal_windows:
-            for tab in window.tabs:
-                for session in tab.sessions:
-                    try:
-                        session_pid = await session.async_get_variable("pid")
-                        if session_pid and session_pid in parent_pids:
-                            self._our_session_id = session.session_id
-                            self._our_tab_id = tab.tab_id
-                            logger.debug(
-                                "Found TUI tab: tab_id=%s, session_id=%s, pid=%s",
-                                tab.tab_id,
-                                session.session_id,
-                                session_pid,
-                            )
-                            return tab.tab_id
-                    except Exception as e:
-                        logger.debug("Error getting session pid: %s", e)
-                        continue
+        parent_pids = await asyncio.to_thread(self._get_parent_pids, our_pid)
+        pid_set = set(parent_pids)
+        sessions = [
+            (tab, session)
+            for window in self.controller.app.terminal_windows
+            for tab in window.tabs
+            for session in tab.sessions
+        ]
+
+        async def get_pid(session: iterm2.Session) -> int | None:
+            try:
+                pid = await session.async_get_variable("pid")
+            except Exception as e:
+                logger.debug("Error getting session pid: %s", e)
+                return None
+            return int(pid) if pid is not None else None
+
+        session_pids = await asyncio.gather(*(get_pid(session) for _, session in sessions))
+        for (tab, session), session_pid in zip(sessions, session_pids, strict=True):
+            if session_pid and session_pid in pid_set:
+                self._our_session_id = session.session_id
+                self._our_tab_id = tab.tab_id
+                logger.debug(
+                    "Found TUI tab: tab_id=%s, session_id=%s, pid=%s",
+                    tab.tab_id,
+                    session.session_id,
+                    session_pid,
+                )
+                return tab.tab_id
 
         logger.warning(
             "Could not find TUI's tab (searched for pids: %s)",
@@ -102,56 +118,21 @@ class FocusWatcher:
     def _get_parent_pids(self, start_pid: int) -> list[int]:
         """Get the process ID chain from start_pid up to init.
 
+        Reads the parent chain from the shared process tree snapshot, so
+        this costs at most one process table scan. Blocks while the table
+        is read.
+
         Args:
             start_pid: The process ID to start from.
 
         Returns:
             List of process IDs including start_pid and all parents.
         """
-        pids = [start_pid]
         try:
-            # Use psutil if available, otherwise try /proc
-            try:
-                import psutil
-
-                current = start_pid
-                while current > 1:
-                    pids.append(current)
-                    try:
-                        parent = psutil.Process(current).ppid()
-                        if parent == current:
-                            break
-                        current = parent
-                    except (psutil.NoSuchProcess, psutil.AccessDenied):
-                        break
-            except ImportError:
-                # Fallback for systems without psutil (macOS has /proc-like)
-                # On macOS we can use ps command
-                import subprocess
-
-                result = subprocess.run(
-                    ["ps", "-o", "ppid=", "-p", str(start_pid)],
-                    capture_output=True,
-                    text=True,
-                )
-                if result.returncode == 0 and result.stdout.strip():
-                    parent_pid = int(result.stdout.strip())
-                    if parent_pid > 1 and parent_pid != start_pid:
-                        pids.append(parent_pid)
-                        # Get grandparent
-                        result = subprocess.run(
-                            ["ps", "-o", "ppid=", "-p", str(parent_pid)],
-                            capture_output=True,
-                            text=True,
-                        )
-                        if result.returncode == 0 and result.stdout.strip():
-                            grandparent = int(result.stdout.strip())
-                            if grandparent > 1:
-                                pids.append(grandparent)
+            return self.process_tree.ancestors(start_pid)
         except Exception as e:
             logger.debug("Error getting parent pids: %s", e)
-
-        return pids
+            return [start_pid]
 
     async def start(self) -> None:
         """Start watching for focus changes.
@@ -2,12 +2,21 @@
 
 This module provides functionality for spawning predefined window layouts
 with tabs and sessions.
+
+Spawning is pipelined to keep iTerm2 round-trips off the critical path.
+The layout is first planned into a tab/pane tree. Tabs are then created
+one after another (iTerm2 appends them in order), and each tab's splits
+start as soon as the tab exists, running alongside the creation of later
+tabs. Every pane's command is sent the moment the pane exists, so text
+sends never wait on each other or on the remaining structure.
 """
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from dataclasses import dataclass
+from collections.abc import Callable
+from dataclasses import dataclass, field
 
 import iterm2
 
@@ -16,9 +25,7 @@ from iterm_controller.iterm.spawner import SessionSpawner, SpawnResult
 from iterm_controller.models import (
     ManagedSession,
     Project,
-    SessionLayout,
     SessionTemplate,
-    TabLayout,
     WindowLayout,
 )
 
@@ -45,6 +52,36 @@ class LayoutSpawnResult:
         return [r.session_id for r in self.results if r.success]
 
 
+@dataclass
+class PanePlan:
+    """A session to create in a tab."""
+
+    index: int
+    """Position of this session's result in LayoutSpawnResult.results."""
+
+    template_id: str
+    template: SessionTemplate | None
+    """None if the layout references an unknown template."""
+
+    command: str = ""
+    """Full command line to send (cd, env and template command)."""
+
+    vertical: bool = True
+    """Split direction when this pane is split from the previous one."""
+
+
+@dataclass
+class TabPlan:
+    """A tab to create and the sessions it holds, in order."""
+
+    name: str
+    panes: list[PanePlan] = field(default_factory=list)
+
+
+# Called with each session's result as soon as its command has been sent
+SpawnResultCallback = Callable[[SpawnResult], None]
+
+
 class WindowLayoutSpawner:
     """Spawns window layouts with predefined tabs and sessions."""
 
@@ -52,11 +89,49 @@ class WindowLayoutSpawner:
         self.controller = controller
         self.spawner = spawner
 
+    def plan_layout(
+        self,
+        layout: WindowLayout,
+        project: Project,
+        session_templates: dict[str, SessionTemplate],
+    ) -> list[TabPlan]:
+        """Build the tab/pane tree for a layout without touching iTerm2.
+
+        Args:
+            layout: The window layout configuration.
+            project: Project context for working directories and environment.
+            session_templates: Mapping of template IDs to SessionTemplate objects.
+
+        Returns:
+            One TabPlan per tab, with panes numbered in layout order.
+        """
+        tabs: list[TabPlan] = []
+        index = 0
+        for tab_layout in layout.tabs:
+            tab_plan = TabPlan(name=tab_layout.name)
+            for session_layout in tab_layout.sessions:
+                template = session_templates.get(session_layout.template_id)
+                tab_plan.panes.append(
+                    PanePlan(
+                        index=index,
+                        template_id=session_layout.template_id,
+                        template=template,
+                        command=(
+                            self.spawner._build_command(template, project) if template else ""
+                        ),
+                        vertical=session_layout.split == "vertical",
+                    )
+                )
+                index += 1
+            tabs.append(tab_plan)
+        return tabs
+
     async def spawn_layout(
         self,
         layout: WindowLayout,
         project: Project,
         session_templates: dict[str, SessionTemplate],
+        on_result: SpawnResultCallback | None = None,
     ) -> LayoutSpawnResult:
         """Spawn a complete window layout.
 
@@ -67,17 +142,31 @@ class WindowLayoutSpawner:
             layout: The window layout configuration specifying tabs and sessions.
             project: Project context for working directories and environment.
             session_templates: Mapping of template IDs to SessionTemplate objects.
+            on_result: Called with each session's SpawnResult as it lands
+                (in completion order, not layout order).
 
         Returns:
-            LayoutSpawnResult containing the window ID, individual spawn results,
-            and overall success status.
+            LayoutSpawnResult containing the window ID, individual spawn results
+            (in layout order), and overall success status.
         """
-        self.controller.require_connection()
-        results: list[SpawnResult] = []
+        connection = self.controller.require_connection()
+        plan = self.plan_layout(layout, project, session_templates)
+        slots: list[SpawnResult | None] = [None] * sum(len(t.panes) for t in plan)
+        sends: list[asyncio.Task[None]] = []
+
+        def landed(pane: PanePlan, result: SpawnResult) -> None:
+            slots[pane.index] = result
+            if on_result is not None:
+                try:
+                    on_result(result)
+                except Exception as e:
+                    logger.warning(f"Layout result callback failed: {e}")
 
         try:
             # Create new window
-            window = await iterm2.Window.async_create(self.controller.connection)
+            window = await iterm2.Window.async_create(connection)
+            if window is None:
+                raise RuntimeError("iTerm2 did not create a window")
             window_id = window.window_id
             logger.info(f"Created new window {window_id} for layout '{layout.name}'")
 
@@ -85,200 +174,174 @@ class WindowLayoutSpawner:
                 logger.warning(f"Layout '{layout.name}' has no tabs defined")
                 return LayoutSpawnResult(
                     window_id=window_id,
-                    results=results,
+                    results=[],
                     success=True,
                 )
 
-            for tab_index, tab_layout in enumerate(layout.tabs):
-                tab_results = await self._spawn_tab(
-                    window=window,
-                    tab_index=tab_index,
-                    tab_layout=tab_layout,
-                    project=project,
-                    session_templates=session_templates,
+            # Tabs are created in order; each tab is filled while the next is created
+            tab_tasks: list[asyncio.Task[None]] = []
+            for tab_index, tab_plan in enumerate(plan):
+                try:
+                    # First tab uses window's default tab, others create new tabs
+                    tab = (
+                        window.current_tab if tab_index == 0 else await window.async_create_tab()
+                    )
+                    if tab is None:
+                        raise RuntimeError("iTerm2 did not create a tab")
+                except Exception as e:
+                    logger.error(f"Failed to create tab '{tab_plan.name}': {e}")
+                    for pane in tab_plan.panes:
+                        landed(pane, SpawnResult("", "", success=False, error=str(e)))
+                    continue
+                tab_tasks.append(
+                    asyncio.create_task(
+                        self._fill_tab(tab, window_id, tab_plan, project, sends, landed)
+                    )
                 )
-                results.extend(tab_results)
-
-            success = all(r.success for r in results) if results else True
-            logger.info(
-                f"Layout '{layout.name}' spawned with {len(results)} sessions "
-                f"({sum(1 for r in results if r.success)} successful)"
-            )
 
-            return LayoutSpawnResult(
-                window_id=window_id,
-                results=results,
-                success=success,
-            )
+            await asyncio.gather(*tab_tasks)
+            await asyncio.gather(*sends)
 
         except Exception as e:
             logger.error(f"Failed to spawn layout '{layout.name}': {e}")
+            for task in sends:
+                task.cancel()
             return LayoutSpawnResult(
                 window_id="",
-                results=results,
+                results=[r for r in slots if r is not None],
                 success=False,
                 error=str(e),
             )
 
-    async def _spawn_tab(
+        results = [r for r in slots if r is not None]
+        success = all(r.success for r in results) if results else True
+        logger.info(
+            f"Layout '{layout.name}' spawned with {len(results)} sessions "
+            f"({sum(1 for r in results if r.success)} successful)"
+        )
+        return LayoutSpawnResult(
+            window_id=window_id,
+            results=results,
+            success=success,
+        )
+
+    async def _fill_tab(
         self,
-        window: iterm2.Window,
-        tab_index: int,
-        tab_layout: TabLayout,
+        tab: iterm2.Tab,
+        window_id: str,
+        tab_plan: TabPlan,
         project: Project,
-        session_templates: dict[str, SessionTemplate],
-    ) -> list[SpawnResult]:
-        """Spawn a single tab with its sessions.
+        sends: list[asyncio.Task[None]],
+        landed: Callable[[PanePlan, SpawnResult], None],
+    ) -> None:
+        """Title a tab and create its panes, starting each pane's command.
+
+        Splits are chained (each pane splits the previous one) so they run
+        in order, but commands are handed to separate tasks in ``sends``
+        and do not hold up the next split.
 
         Args:
-            window: The iTerm2 window to create the tab in.
-            tab_index: Index of this tab (0 = use window's default tab).
-            tab_layout: Configuration for this tab's layout.
+            tab: The tab to fill.
+            window_id: ID of the tab's window.
+            tab_plan: Panes to create in the tab.
             project: Project context.
-            session_templates: Available session templates.
-
-        Returns:
-            List of SpawnResult for each session in the tab.
+            sends: Task list to add command-sending tasks to.
+            landed: Records a pane's final result.
         """
-        results: list[SpawnResult] = []
-
-        try:
-            # First tab uses window's default tab, others create new tabs
-            if tab_index == 0:
-                tab = window.current_tab
-                if tab is None:
-                    logger.error("Window has no current tab")
-                    return results
-            else:
-                tab = await window.async_create_tab()
-
-            # Set tab title
-            if tab_layout.name:
-                await tab.async_set_title(tab_layout.name)
-                logger.debug(f"Set tab title to '{tab_layout.name}'")
-
-            if not tab_layout.sessions:
-                logger.debug(f"Tab '{tab_layout.name}' has no sessions defined")
-                return results
-
-            # Get the tab's initial session as the parent for splits
-            current_session = tab.current_session
-            if current_session is None:
-                logger.error(f"Tab '{tab_layout.name}' has no current session")
-                return results
-
-            for session_index, session_layout in enumerate(tab_layout.sessions):
-                result = await self._spawn_session_in_tab(
-                    tab=tab,
-                    current_session=current_session,
-                    session_index=session_index,
-                    session_layout=session_layout,
-                    project=project,
-                    session_templates=session_templates,
+        title_task = None
+        if tab_plan.name:
+            title_task = asyncio.create_task(tab.async_set_title(tab_plan.name))
+
+        # The tab's initial session hosts the first pane and parents the splits
+        parent = tab.current_session
+        for position, pane in enumerate(tab_plan.panes):
+            if pane.template is None:
+                logger.warning(f"Session template '{pane.template_id}' not found, skipping")
+                landed(
+                    pane,
+                    SpawnResult(
+                        session_id="",
+                        tab_id=tab.tab_id,
+                        success=False,
+                        error=f"Template '{pane.template_id}' not found",
+                    ),
                 )
-                if result:
-                    results.append(result)
-                    # Update current_session for the next split if successful
-                    if result.success and session_index > 0:
-                        # After a split, continue splitting from the new session
-                        try:
-                            new_session = self.controller.app.get_session_by_id(
-                                result.session_id
-                            )
-                            if new_session:
-                                current_session = new_session
-                        except Exception:
-                            pass  # Keep using the previous session
-
-        except Exception as e:
-            logger.error(f"Failed to spawn tab '{tab_layout.name}': {e}")
+                continue
+            if parent is None:
+                landed(
+                    pane,
+                    SpawnResult("", tab.tab_id, success=False, error="Tab has no session"),
+                )
+                continue
+
+            try:
+                if position == 0:
+                    session = parent
+                else:
+                    session = await parent.async_split_pane(vertical=pane.vertical)
+                    parent = session
+            except Exception as e:
+                logger.error(f"Failed to split pane for template '{pane.template_id}': {e}")
+                landed(pane, SpawnResult("", tab.tab_id, success=False, error=str(e)))
+                continue
+
+            sends.append(
+                asyncio.create_task(
+                    self._start_session(session, tab.tab_id, window_id, pane, project, landed)
+                )
+            )
 
-        return results
+        if title_task is not None:
+            try:
+                await title_task
+                logger.debug(f"Set tab title to '{tab_plan.name}'")
+            except Exception as e:
+                logger.warning(f"Failed to set tab title '{tab_plan.name}': {e}")
 
-    async def _spawn_session_in_tab(
+    async def _start_session(
         self,
-        tab: iterm2.Tab,
-        current_session: iterm2.Session,
-        session_index: int,
-        session_layout: SessionLayout,
+        session: iterm2.Session,
+        tab_id: str,
+        window_id: str,
+        pane: PanePlan,
         project: Project,
-        session_templates: dict[str, SessionTemplate],
-    ) -> SpawnResult | None:
-        """Spawn a single session within a tab.
+        landed: Callable[[PanePlan, SpawnResult], None],
+    ) -> None:
+        """Send a pane's command and start tracking its session.
 
         Args:
-            tab: The tab to spawn the session in.
-            current_session: The session to use or split from.
-            session_index: Index of this session (0 = use tab's default session).
-            session_layout: Configuration for this session.
+            session: The pane's iTerm2 session.
+            tab_id: ID of the pane's tab.
+            window_id: ID of the pane's window.
+            pane: The planned pane.
             project: Project context.
-            session_templates: Available session templates.
-
-        Returns:
-            SpawnResult for this session, or None if template not found.
+            landed: Records the pane's final result.
         """
-        template = session_templates.get(session_layout.template_id)
-        if not template:
-            logger.warning(
-                f"Session template '{session_layout.template_id}' not found, skipping"
-            )
-            return SpawnResult(
-                session_id="",
-                tab_id=tab.tab_id,
-                success=False,
-                error=f"Template '{session_layout.template_id}' not found",
-            )
-
+        assert pane.template is not None
         try:
-            if session_index == 0:
-                # First session uses the tab's default session
-                # Send command directly to it
-                full_command = self.spawner._build_command(template, project)
-                await current_session.async_send_text(full_command + "\n")
-
-                # Get window_id from the tab's window
-                window_id = ""
-                if tab.window:
-                    window_id = tab.window.window_id
-
-                # Track session
-                managed = ManagedSession(
-                    id=current_session.session_id,
-                    template_id=template.id,
-                    project_id=project.id,
-                    tab_id=tab.tab_id,
-                    window_id=window_id,
-                )
-                self.spawner.managed_sessions[current_session.session_id] = managed
-
-                logger.info(
-                    f"Initialized tab's default session with template '{template.name}' "
-                    f"in window {window_id}"
-                )
-
-                return SpawnResult(
-                    session_id=current_session.session_id,
-                    tab_id=tab.tab_id,
-                    success=True,
-                    window_id=window_id,
-                )
-            else:
-                # Subsequent sessions are splits
-                vertical = session_layout.split == "vertical"
-                return await self.spawner.spawn_split(
-                    template=template,
-                    project=project,
-                    parent_session=current_session,
-                    vertical=vertical,
-                )
-
+            await session.async_send_text(pane.command + "\n")
         except Exception as e:
-            logger.error(
-                f"Failed to spawn session from template '{template.id}': {e}"
-            )
-            return SpawnResult(
-                session_id="",
-                tab_id=tab.tab_id,
-                success=False,
-                error=str(e),
-            )
+            logger.error(f"Failed to spawn session from template '{pane.template_id}': {e}")
+            landed(pane, SpawnResult("", tab_id, success=False, error=str(e)))
+            return
+
+        self.spawner.managed_sessions[session.session_id] = ManagedSession(
+            id=session.session_id,
+            template_id=pane.template.id,
+            project_id=project.id,
+            tab_id=tab_id,
+            window_id=window_id,
+        )
+        logger.info(
+            f"Spawned layout session {session.session_id} from template "
+            f"'{pane.template.name}' in window {window_id}"
+        )
+        landed(
+            pane,
+            SpawnResult(
+                session_id=session.session_id,
+                tab_id=tab_id,
+                success=True,
+                window_id=window_id,
+            ),
+        )
@@ -0,0 +1,297 @@
+"""Pre-warmed shells for fast session spawning.
+
+Spawning a session normally creates a tab and sends ``cd``, ``export`` and
+the template command in one line, so the user waits for the shell to start
+and the directory change to run before the command even begins.
+SessionPool keeps a few shells per project context ready in a background
+window: each one already ran its ``cd``/``export`` prefix. A spawn that
+matches a pooled context moves a warm tab into the target window and sends
+only the final command. The pool then refills in the background.
+
+Pooled shells are keyed by project ID and prefix (working directory plus
+environment), so a shell is only reused for exactly the context it was
+prepared for. Shells that stay unclaimed for ``idle_timeout`` seconds are
+closed, and ``max_sessions`` caps the pool across all keys.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+import iterm2
+
+if TYPE_CHECKING:
+    from iterm_controller.iterm.connection import ItermController
+
+logger = logging.getLogger(__name__)
+
+# (project ID, cd/export prefix the shell was prepared with)
+PoolKey = tuple[str, str]
+
+
+@dataclass
+class WarmSession:
+    """A prepared shell waiting in the pool.
+
+    Attributes:
+        session_id: iTerm2 session ID.
+        tab_id: iTerm2 tab ID in the pool window.
+        key: The context the shell was prepared for.
+        created_at: Clock time the shell was added to the pool.
+    """
+
+    session_id: str
+    tab_id: str
+    key: PoolKey
+    created_at: float
+
+
+class SessionPool:
+    """Keeps pre-spawned shells ready for each project context.
+
+    Example:
+        pool = SessionPool(controller, size=2)
+        spawner.pool = pool
+        await pool.start()
+        spawner.prewarm(project)  # optional, warms the project root context
+    """
+
+    def __init__(
+        self,
+        controller: ItermController,
+        size: int = 2,
+        max_sessions: int = 8,
+        idle_timeout: float = 600.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the pool.
+
+        Args:
+            controller: The iTerm2 controller.
+            size: Warm shells to keep per project context.
+            max_sessions: Most warm shells across all contexts.
+            idle_timeout: Seconds an unclaimed shell is kept before closing it.
+            clock: Monotonic clock (injectable for tests).
+        """
+        self.controller = controller
+        self.size = size
+        self.max_sessions = max_sessions
+        self.idle_timeout = idle_timeout
+        self._clock = clock
+        self._ready: dict[PoolKey, list[WarmSession]] = {}
+        self._pending: dict[PoolKey, int] = {}
+        self._window_id: str | None = None
+        self._window_lock = asyncio.Lock()
+        self._tasks: set[asyncio.Task[Any]] = set()
+        self._evict_task: asyncio.Task[None] | None = None
+
+    def __len__(self) -> int:
+        """Get the number of warm shells across all contexts."""
+        return sum(len(warm) for warm in self._ready.values())
+
+    def available(self, key: PoolKey) -> int:
+        """Get the number of warm shells ready for a context."""
+        return len(self._ready.get(key, []))
+
+    def is_pool_window(self, window_id: str) -> bool:
+        """Check if a window is the pool's background window."""
+        return window_id == self._window_id
+
+    # -------------------------------------------------------------------------
+    # Lifecycle
+    # -------------------------------------------------------------------------
+
+    async def start(self) -> None:
+        """Start evicting idle shells in the background."""
+        if self._evict_task is None or self._evict_task.done():
+            self._evict_task = asyncio.create_task(self._evict_loop())
+
+    async def stop(self, close_sessions: bool = True) -> None:
+        """Stop refills and eviction.
+
+        Args:
+            close_sessions: Whether to close the shells still in the pool.
+        """
+        tasks = list(self._tasks)
+        if self._evict_task is not None:
+            tasks.append(self._evict_task)
+            self._evict_task = None
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._pending.clear()
+
+        warm = [w for ready in self._ready.values() for w in ready]
+        self._ready.clear()
+        if close_sessions:
+            await asyncio.gather(*(self._close(w) for w in warm))
+
+    async def _evict_loop(self) -> None:
+        """Close idle shells periodically."""
+        interval = max(self.idle_timeout / 4, 1.0)
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.evict_idle()
+            except Exception as e:
+                logger.warning(f"Failed to evict idle pool sessions: {e}")
+
+    # -------------------------------------------------------------------------
+    # Claiming
+    # -------------------------------------------------------------------------
+
+    async def claim(self, key: PoolKey, window: Any) -> tuple[Any, Any] | None:
+        """Take a warm shell for a context and move its tab into a window.
+
+        Args:
+            key: The context the shell must have been prepared for.
+            window: The iTerm2 window to move the shell's tab into.
+
+        Returns:
+            (tab, session) of the claimed shell, or None if none is ready.
+        """
+        app = self.controller.app
+        ready = self._ready.get(key)
+        while app and ready:
+            warm = ready.pop(0)
+            session = app.get_session_by_id(warm.session_id)
+            tab = app.get_tab_by_id(warm.tab_id)
+            if session is None or tab is None:
+                continue  # Closed by the user or lost with iTerm2
+            try:
+                await window.async_set_tabs([*window.tabs, tab])
+            except Exception as e:
+                logger.warning(f"Failed to move warm session {warm.session_id}: {e}")
+                await self._close(warm)
+                continue
+            logger.debug(f"Claimed warm session {warm.session_id} for {key[0]}")
+            return tab, session
+        return None
+
+    # -------------------------------------------------------------------------
+    # Refilling
+    # -------------------------------------------------------------------------
+
+    def refill(self, key: PoolKey) -> None:
+        """Top up a context's warm shells in the background."""
+        task = asyncio.get_running_loop().create_task(self.fill(key))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def fill(self, key: PoolKey) -> int:
+        """Top up a context's warm shells to the pool size.
+
+        Args:
+            key: The context to prepare shells for.
+
+        Returns:
+            The number of shells added.
+        """
+        if not self.controller.is_connected:
+            return 0
+        pending = self._pending.get(key, 0)
+        total = len(self) + sum(self._pending.values())
+        count = min(
+            self.size - self.available(key) - pending,
+            self.max_sessions - total,
+        )
+        if count <= 0:
+            return 0
+
+        self._pending[key] = pending + count
+        try:
+            results = await asyncio.gather(
+                *(self._spawn_warm(key) for _ in range(count)), return_exceptions=True
+            )
+        finally:
+            remaining = self._pending.get(key, 0) - count
+            if remaining > 0:
+                self._pending[key] = remaining
+            else:
+                self._pending.pop(key, None)
+
+        added = 0
+        for result in results:
+            if isinstance(result, WarmSession):
+                self._ready.setdefault(key, []).append(result)
+                added += 1
+            else:
+                logger.warning(f"Failed to warm session for {key[0]}: {result}")
+        return added
+
+    async def _spawn_warm(self, key: PoolKey) -> WarmSession:
+        """Create a shell in the pool window and send its prefix."""
+        tab = await self._create_tab()
+        session = tab.current_session
+        if session is None:
+            raise RuntimeError("Pool tab has no session")
+        await session.async_send_text(key[1] + "\n")
+        return WarmSession(
+            session_id=session.session_id,
+            tab_id=tab.tab_id,
+            key=key,
+            created_at=self._clock(),
+        )
+
+    async def _create_tab(self) -> iterm2.Tab:
+        """Create a tab in the pool window, creating the window if needed."""
+        connection = self.controller.require_connection()
+        async with self._window_lock:
+            app = self.controller.app
+            assert app is not None
+            window = app.get_window_by_id(self._window_id) if self._window_id else None
+            if window is None:
+                # Creating a window focuses it; hand focus back afterwards
+                previous = app.current_terminal_window
+                window = await iterm2.Window.async_create(connection)
+                if window is None:
+                    raise RuntimeError("iTerm2 did not create the pool window")
+                self._window_id = window.window_id
+                if previous is not None:
+                    await previous.async_activate()
+                logger.info(f"Created session pool window {window.window_id}")
+                tab = window.current_tab
+            else:
+                tab = await window.async_create_tab()
+        if tab is None:
+            raise RuntimeError("iTerm2 did not create a pool tab")
+        return tab
+
+    # -------------------------------------------------------------------------
+    # Eviction
+    # -------------------------------------------------------------------------
+
+    async def evict_idle(self) -> int:
+        """Close shells that have waited longer than the idle timeout.
+
+        Returns:
+            The number of shells closed.
+        """
+        cutoff = self._clock() - self.idle_timeout
+        expired: list[WarmSession] = []
+        for key in list(self._ready):
+            ready = self._ready[key]
+            expired.extend(w for w in ready if w.created_at <= cutoff)
+            ready[:] = [w for w in ready if w.created_at > cutoff]
+            if not ready:
+                del self._ready[key]
+        await asyncio.gather(*(self._close(w) for w in expired))
+        if expired:
+            logger.debug(f"Evicted {len(expired)} idle pool session(s)")
+        return len(expired)
+
+    async def _close(self, warm: WarmSession) -> None:
+        """Close a pooled shell, ignoring shells that are already gone."""
+        app = self.controller.app
+        session = app.get_session_by_id(warm.session_id) if app else None
+        if session is None:
+            return
+        try:
+            await session.async_close(force=True)
+        except Exception as e:
+            logger.debug(f"Failed to close pool session {warm.session_id}: {e}")
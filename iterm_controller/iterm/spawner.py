@@ -14,6 +14,7 @@ from dataclasses import dataclass
 import iterm2
 
 from iterm_controller.iterm.connection import ItermController
+from iterm_controller.iterm.session_pool import SessionPool
 from iterm_controller.models import (
     ManagedSession,
     Project,
@@ -44,10 +45,12 @@ class SpawnResult:
 class SessionSpawner:
     """Spawns and manages terminal sessions."""
 
-    def __init__(self, controller: ItermController) -> None:
+    def __init__(self, controller: ItermController, pool: SessionPool | None = None) -> None:
         self.controller = controller
         self.managed_sessions: dict[str, ManagedSession] = {}
         self._skip_permissions: bool = False
+        # Warm shells to claim instead of creating tabs, if enabled
+        self.pool = pool
 
     def set_skip_permissions(self, skip: bool) -> None:
         """Configure whether to add --dangerously-skip-permissions to Claude commands.
@@ -108,6 +111,26 @@ class SessionSpawner:
 
         Includes cd to working directory, environment exports, and the template command.
 
+        Raises:
+            ValueError: If any environment variable key is invalid.
+        """
+        parts = [self._build_prefix(template, project)]
+
+        # Add the main command if specified
+        if template.command:
+            # Modify Claude commands to add skip permissions flag if configured
+            command = self._modify_claude_command(template.command)
+            parts.append(command)
+
+        return " && ".join(parts)
+
+    def _build_prefix(
+        self,
+        template: SessionTemplate,
+        project: Project,
+    ) -> str:
+        """Build the cd and environment export part of a session's command.
+
         Raises:
             ValueError: If any environment variable key is invalid.
         """
@@ -128,12 +151,6 @@ class SessionSpawner:
                 env_pairs.append(f"{key}={self._escape_value(value)}")
             parts.append(f"export {' '.join(env_pairs)}")
 
-        # Add the main command if specified
-        if template.command:
-            # Modify Claude commands to add skip permissions flag if configured
-            command = self._modify_claude_command(template.command)
-            parts.append(command)
-
         return " && ".join(parts)
 
     def _quote_path(self, path: str) -> str:
@@ -177,21 +194,40 @@ class SessionSpawner:
             app = self.controller.app
             assert app is not None  # require_connection ensures this
 
-            # Use provided window, current window, or create new
+            # Use provided window, current window, or create new. The pool's
+            # background window is never a spawn target.
             if window is None:
                 window = app.current_terminal_window
+                if window is not None and self.pool and self.pool.is_pool_window(
+                    window.window_id
+                ):
+                    window = None
                 if window is None:
                     window = await iterm2.Window.async_create(self.controller.connection)
                     logger.info("Created new iTerm2 window")
 
-            # Create new tab
-            tab = await window.async_create_tab()
-            session = tab.current_session
-            assert session is not None
-
-            # Build and send command
-            full_command = self._build_command(template, project)
-            await session.async_send_text(full_command + "\n")
+            prefix = self._build_prefix(template, project)
+            claimed = None
+            if self.pool is not None:
+                key = (project.id, prefix)
+                claimed = await self.pool.claim(key, window)
+                self.pool.refill(key)
+
+            if claimed is not None:
+                # The warm shell already ran the prefix
+                tab, session = claimed
+                if template.command:
+                    command = self._modify_claude_command(template.command)
+                    await session.async_send_text(command + "\n")
+            else:
+                # Create new tab
+                tab = await window.async_create_tab()
+                session = tab.current_session
+                assert session is not None
+
+                # Build and send command
+                full_command = self._build_command(template, project)
+                await session.async_send_text(full_command + "\n")
 
             # Track session with window_id for same-window spawning
             window_id = window.window_id if window else ""
@@ -297,6 +333,19 @@ class SessionSpawner:
                 error=str(e),
             )
 
+    def prewarm(self, project: Project) -> None:
+        """Start warming shells for a project's root directory.
+
+        Does nothing if the spawner has no pool.
+
+        Args:
+            project: Project whose default session context to warm.
+        """
+        if self.pool is None or not self.controller.is_connected:
+            return
+        prefix = f"cd {self._quote_path(project.path)}"
+        self.pool.refill((project.id, prefix))
+
     def get_session(self, session_id: str) -> ManagedSession | None:
         """Get a managed session by ID."""
         return self.managed_sessions.get(session_id)
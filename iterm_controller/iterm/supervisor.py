@@ -0,0 +1,248 @@
+"""Connection supervision and state resync after reconnects.
+
+When iTerm2 restarts or the websocket drops, the controller's connection
+is dead but everything built on it (the spawner's managed sessions, the
+window tracker, the monitor's output caches) still describes the old
+world. ConnectionSupervisor watches for the drop, reconnects with
+exponential backoff, then reconciles the managed sessions against the
+sessions iTerm2 actually has in one pass. Dead sessions are dropped from
+the spawner and handed to purge hooks so other components can forget
+them, and a single ReconcileResult is reported instead of one error per
+session per poll.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from iterm_controller.exceptions import ItermConnectionError
+
+if TYPE_CHECKING:
+    from iterm_controller.iterm.connection import ItermController
+    from iterm_controller.iterm.spawner import SessionSpawner
+    from iterm_controller.iterm.tracker import WindowTracker
+
+logger = logging.getLogger(__name__)
+
+# Called with the IDs of managed sessions that no longer exist
+PurgeHook = Callable[[list[str]], Awaitable[None] | None]
+
+# Called once per reconcile with its result
+ReconcileCallback = Callable[["ReconcileResult"], Awaitable[None] | None]
+
+
+@dataclass
+class ReconcileResult:
+    """Outcome of reconciling managed sessions with iTerm2.
+
+    Attributes:
+        live_session_ids: Managed sessions that still exist.
+        purged_session_ids: Managed sessions that were gone and were dropped.
+        reconnected: Whether this reconcile followed a reconnect.
+        attempts: Connection attempts it took to reconnect.
+        duration: Seconds spent reconnecting and reconciling.
+    """
+
+    live_session_ids: list[str] = field(default_factory=list)
+    purged_session_ids: list[str] = field(default_factory=list)
+    reconnected: bool = False
+    attempts: int = 0
+    duration: float = 0.0
+
+    @property
+    def summary(self) -> str:
+        """Get a one-line description for logs and notifications."""
+        prefix = (
+            f"Reconnected to iTerm2 after {self.attempts} attempt"
+            f"{'s' if self.attempts != 1 else ''}"
+            if self.reconnected
+            else "Resynced with iTerm2"
+        )
+        return (
+            f"{prefix}: {len(self.live_session_ids)} session(s) live, "
+            f"{len(self.purged_session_ids)} gone"
+        )
+
+
+class ConnectionSupervisor:
+    """Keeps the iTerm2 connection alive and state in sync with it.
+
+    Example:
+        supervisor = ConnectionSupervisor(controller, spawner, tracker)
+        supervisor.add_purge_hook(monitor.purge_sessions)
+        supervisor.on_reconciled = lambda result: logger.info(result.summary)
+        await supervisor.start()
+    """
+
+    def __init__(
+        self,
+        controller: ItermController,
+        spawner: SessionSpawner,
+        tracker: WindowTracker | None = None,
+        on_reconciled: ReconcileCallback | None = None,
+        check_interval: float = 2.0,
+        initial_backoff: float = 0.5,
+        max_backoff: float = 30.0,
+        backoff_factor: float = 2.0,
+    ) -> None:
+        """Initialize the supervisor.
+
+        Args:
+            controller: The iTerm2 controller to supervise.
+            spawner: The spawner whose managed sessions are reconciled.
+            tracker: Window tracker to refresh after reconnecting.
+            on_reconciled: Called with the result of each reconcile.
+            check_interval: Seconds between connection checks.
+            initial_backoff: Delay before the first retry after a failed attempt.
+            max_backoff: Longest delay between attempts.
+            backoff_factor: Multiplier applied to the delay after each failure.
+        """
+        self.controller = controller
+        self.spawner = spawner
+        self.tracker = tracker
+        self.on_reconciled = on_reconciled
+        self.check_interval = check_interval
+        self.initial_backoff = initial_backoff
+        self.max_backoff = max_backoff
+        self.backoff_factor = backoff_factor
+        self._purge_hooks: list[PurgeHook] = []
+        self._task: asyncio.Task[None] | None = None
+        self._lock = asyncio.Lock()
+
+    @property
+    def is_running(self) -> bool:
+        """Check if the supervision loop is running."""
+        return self._task is not None and not self._task.done()
+
+    def add_purge_hook(self, hook: PurgeHook) -> None:
+        """Register a callable that forgets sessions which no longer exist.
+
+        Args:
+            hook: Called with the purged session IDs, once per reconcile.
+        """
+        self._purge_hooks.append(hook)
+
+    async def start(self) -> None:
+        """Start watching the connection in the background."""
+        if self.is_running:
+            return
+        self._task = asyncio.create_task(self._supervise())
+        logger.info("Connection supervisor started")
+
+    async def stop(self) -> None:
+        """Stop watching the connection."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        logger.info("Connection supervisor stopped")
+
+    async def _supervise(self) -> None:
+        """Check the connection periodically and recover it when lost."""
+        while True:
+            await asyncio.sleep(self.check_interval)
+            if not self.controller.is_connection_lost:
+                continue
+            logger.warning("Lost connection to iTerm2, reconnecting")
+            try:
+                await self.recover()
+            except Exception as e:
+                logger.error(f"Error recovering iTerm2 connection: {e}")
+
+    async def recover(self) -> ReconcileResult:
+        """Reconnect with exponential backoff, then reconcile.
+
+        Retries until a connection is made or the supervisor is stopped.
+
+        Returns:
+            The reconcile result.
+        """
+        async with self._lock:
+            started = time.monotonic()
+            attempts = 0
+            delay = self.initial_backoff
+            while True:
+                attempts += 1
+                try:
+                    await self.controller.reconnect()
+                    break
+                except ItermConnectionError as e:
+                    logger.debug(f"Reconnect attempt {attempts} failed: {e}")
+                await asyncio.sleep(delay)
+                delay = min(delay * self.backoff_factor, self.max_backoff)
+
+            result = await self._reconcile()
+            result.reconnected = True
+            result.attempts = attempts
+            result.duration = time.monotonic() - started
+            await self._report(result)
+            return result
+
+    async def reconcile(self) -> ReconcileResult:
+        """Reconcile managed sessions with the live iTerm2 sessions.
+
+        Returns:
+            The reconcile result.
+        """
+        async with self._lock:
+            started = time.monotonic()
+            result = await self._reconcile()
+            result.duration = time.monotonic() - started
+            await self._report(result)
+            return result
+
+    async def _reconcile(self) -> ReconcileResult:
+        """Drop managed sessions iTerm2 no longer has, in one pass."""
+        self.controller.require_connection()
+        live: set[str] = set()
+        if self.controller.app:
+            for window in self.controller.app.terminal_windows:
+                for tab in window.tabs:
+                    live.update(session.session_id for session in tab.sessions)
+
+        result = ReconcileResult()
+        for session_id in list(self.spawner.managed_sessions):
+            if session_id in live:
+                result.live_session_ids.append(session_id)
+            else:
+                result.purged_session_ids.append(session_id)
+                self.spawner.untrack_session(session_id)
+
+        if result.purged_session_ids:
+            for hook in self._purge_hooks:
+                try:
+                    outcome = hook(list(result.purged_session_ids))
+                    if inspect.isawaitable(outcome):
+                        await outcome
+                except Exception as e:
+                    logger.error(f"Error in purge hook: {e}")
+
+        if self.tracker is not None:
+            try:
+                await self.tracker.refresh()
+            except Exception as e:
+                logger.warning(f"Failed to refresh window tracker: {e}")
+
+        return result
+
+    async def _report(self, result: ReconcileResult) -> None:
+        """Log the result and invoke the reconcile callback once."""
+        logger.info(result.summary)
+        if self.on_reconciled is None:
+            return
+        try:
+            outcome = self.on_reconciled(result)
+            if inspect.isawaitable(outcome):
+                await outcome
+        except Exception as e:
+            logger.error(f"Error in reconcile callback: {e}")
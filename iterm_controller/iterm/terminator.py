@@ -2,6 +2,11 @@
 
 This module provides graceful session termination with timeout handling
 and force-close fallback.
+
+Termination is event-driven: the terminator subscribes once per connection
+to iTerm2's session-termination and prompt notifications and resolves a
+future per session when they arrive, instead of polling each session's
+screen contents. If the subscription fails, it falls back to polling.
 """
 
 from __future__ import annotations
@@ -17,6 +22,9 @@ from iterm_controller.iterm.connection import ItermController
 from iterm_controller.models import ManagedSession
 
 if TYPE_CHECKING:
+    from iterm2.api_pb2 import PromptNotification, TerminateSessionNotification
+    from iterm2.notifications import NotificationToken
+
     from iterm_controller.iterm.spawner import SessionSpawner
 
 logger = logging.getLogger(__name__)
@@ -40,7 +48,8 @@ class SessionTerminator:
     """
 
     SIGTERM_TIMEOUT = 5.0  # Seconds to wait for graceful shutdown
-    POLL_INTERVAL = 0.1  # Seconds between session state polls
+    PROMPT_TIMEOUT = 0.5  # Max seconds to wait for a prompt after Ctrl+C
+    POLL_INTERVAL = 0.1  # Seconds between session state polls (fallback)
 
     def __init__(self, controller: ItermController) -> None:
         """Initialize the terminator with an iTerm controller.
@@ -49,6 +58,102 @@ class SessionTerminator:
             controller: The iTerm controller for session operations.
         """
         self.controller = controller
+        # Pending waits, keyed by session ID
+        self._termination_waiters: dict[str, asyncio.Future[None]] = {}
+        self._prompt_waiters: dict[str, asyncio.Future[None]] = {}
+        # Connection the notification subscriptions belong to
+        self._subscribed_connection: iterm2.Connection | None = None
+        self._unsupported_connection: iterm2.Connection | None = None
+        self._tokens: list[NotificationToken] = []
+        self._prompt_events = False
+        self._subscribe_lock = asyncio.Lock()
+
+    async def _ensure_subscribed(self) -> bool:
+        """Subscribe to termination and prompt notifications once per connection.
+
+        Returns:
+            True if session termination notifications are available.
+        """
+        connection = self.controller.connection
+        if connection is None or connection is self._unsupported_connection:
+            return False
+        if connection is self._subscribed_connection:
+            return True
+
+        async with self._subscribe_lock:
+            if connection is self._subscribed_connection:
+                return True
+            if connection is self._unsupported_connection:
+                return False
+
+            # Tokens belong to the previous connection, which is gone
+            self._tokens.clear()
+            subscribe_terminate = (
+                iterm2.notifications.async_subscribe_to_terminate_session_notification
+            )
+            try:
+                token = await subscribe_terminate(connection, self._on_session_terminated)
+            except Exception as e:
+                logger.debug(f"Termination notifications unavailable, polling instead: {e}")
+                self._unsupported_connection = connection
+                return False
+            self._tokens.append(token)
+
+            try:
+                token = await iterm2.notifications.async_subscribe_to_prompt_notification(
+                    connection,
+                    self._on_prompt,
+                    None,
+                    [iterm2.PromptMonitor.Mode.PROMPT.value],
+                )
+                self._tokens.append(token)
+                self._prompt_events = True
+            except Exception as e:
+                logger.debug(f"Prompt notifications unavailable: {e}")
+                self._prompt_events = False
+
+            self._subscribed_connection = connection
+            return True
+
+    async def close(self) -> None:
+        """Unsubscribe from termination and prompt notifications."""
+        async with self._subscribe_lock:
+            connection = self._subscribed_connection
+            tokens = list(self._tokens)
+            self._subscribed_connection = None
+            self._tokens.clear()
+            self._prompt_events = False
+            if connection is None:
+                return
+            for token in tokens:
+                try:
+                    await iterm2.notifications.async_unsubscribe(connection, token)
+                except Exception as e:
+                    logger.debug(f"Failed to unsubscribe: {e}")
+
+    async def _on_session_terminated(
+        self, connection: iterm2.Connection, message: TerminateSessionNotification
+    ) -> None:
+        """Resolve the termination waiter for a session that ended."""
+        waiter = self._termination_waiters.pop(message.session_id, None)
+        if waiter is not None and not waiter.done():
+            waiter.set_result(None)
+
+    async def _on_prompt(
+        self, connection: iterm2.Connection, message: PromptNotification
+    ) -> None:
+        """Resolve the prompt waiter for a session that showed a prompt."""
+        waiter = self._prompt_waiters.pop(message.session, None)
+        if waiter is not None and not waiter.done():
+            waiter.set_result(None)
+
+    def _add_waiter(
+        self, waiters: dict[str, asyncio.Future[None]], session_id: str
+    ) -> asyncio.Future[None]:
+        """Register a future resolved by a notification for a session."""
+        waiter = asyncio.get_running_loop().create_future()
+        waiters[session_id] = waiter
+        return waiter
 
     async def close_session(
         self,
@@ -59,8 +164,8 @@ class SessionTerminator:
 
         For graceful shutdown:
         1. Send Ctrl+C to interrupt any running process
-        2. Wait briefly, then send "exit" command
-        3. Wait up to SIGTERM_TIMEOUT for session to close
+        2. Wait for the shell prompt (at most PROMPT_TIMEOUT), then send "exit"
+        3. Wait up to SIGTERM_TIMEOUT for the session termination notification
         4. Force close if timeout exceeded
 
         Args:
@@ -82,39 +187,54 @@ class SessionTerminator:
                     force_required=True,
                 )
 
-            # Try graceful shutdown
-            # Send Ctrl+C to interrupt any running process
-            await session.async_send_text("\x03")
-            await asyncio.sleep(0.5)
-
-            # Send exit command
-            await session.async_send_text("exit\n")
-            logger.debug(f"Sent exit command to session {session_id}")
+            # Try graceful shutdown. Waiters are registered before sending, so
+            # a notification that arrives immediately is not missed.
+            events = await self._ensure_subscribed()
+            prompt = (
+                self._add_waiter(self._prompt_waiters, session_id)
+                if events and self._prompt_events
+                else None
+            )
+            terminated = (
+                self._add_waiter(self._termination_waiters, session_id) if events else None
+            )
 
-            # Wait for session to close
             try:
-                await asyncio.wait_for(
-                    self._wait_for_close(session),
-                    timeout=self.SIGTERM_TIMEOUT,
-                )
-                logger.info(f"Gracefully closed session {session_id}")
-                return CloseResult(
-                    session_id=session_id,
-                    success=True,
-                    force_required=False,
-                )
-            except asyncio.TimeoutError:
-                # Graceful shutdown failed, force close
-                logger.warning(
-                    f"Graceful shutdown timed out for session {session_id}, forcing close"
-                )
-                await session.async_close(force=True)
-                logger.info(f"Force-closed session {session_id} after timeout")
-                return CloseResult(
-                    session_id=session_id,
-                    success=True,
-                    force_required=True,
-                )
+                # Send Ctrl+C to interrupt any running process
+                await session.async_send_text("\x03")
+                await self._wait_for_prompt(prompt)
+
+                # Send exit command
+                await session.async_send_text("exit\n")
+                logger.debug(f"Sent exit command to session {session_id}")
+
+                # Wait for session to close
+                try:
+                    await asyncio.wait_for(
+                        self._wait_for_close(session, terminated),
+                        timeout=self.SIGTERM_TIMEOUT,
+                    )
+                    logger.info(f"Gracefully closed session {session_id}")
+                    return CloseResult(
+                        session_id=session_id,
+                        success=True,
+                        force_required=False,
+                    )
+                except TimeoutError:
+                    # Graceful shutdown failed, force close
+                    logger.warning(
+                        f"Graceful shutdown timed out for session {session_id}, forcing close"
+                    )
+                    await session.async_close(force=True)
+                    logger.info(f"Force-closed session {session_id} after timeout")
+                    return CloseResult(
+                        session_id=session_id,
+                        success=True,
+                        force_required=True,
+                    )
+            finally:
+                self._discard_waiter(self._prompt_waiters, session_id, prompt)
+                self._discard_waiter(self._termination_waiters, session_id, terminated)
 
         except Exception as e:
             logger.error(f"Failed to close session {session_id}: {e}")
@@ -124,15 +244,52 @@ class SessionTerminator:
                 error=str(e),
             )
 
-    async def _wait_for_close(self, session: iterm2.Session) -> None:
+    def _discard_waiter(
+        self,
+        waiters: dict[str, asyncio.Future[None]],
+        session_id: str,
+        waiter: asyncio.Future[None] | None,
+    ) -> None:
+        """Remove a session's waiter if it is still the registered one."""
+        if waiter is not None and waiters.get(session_id) is waiter:
+            del waiters[session_id]
+
+    async def _wait_for_prompt(self, prompt: asyncio.Future[None] | None) -> None:
+        """Wait for the shell prompt after interrupting a session.
+
+        Without prompt notifications (no shell integration, or the
+        subscription failed) this waits the full PROMPT_TIMEOUT.
+
+        Args:
+            prompt: Future resolved by a prompt notification, if available.
+        """
+        if prompt is None:
+            await asyncio.sleep(self.PROMPT_TIMEOUT)
+            return
+        try:
+            await asyncio.wait_for(prompt, timeout=self.PROMPT_TIMEOUT)
+        except TimeoutError:
+            logger.debug("No prompt after Ctrl+C, sending exit anyway")
+
+    async def _wait_for_close(
+        self,
+        session: iterm2.Session,
+        terminated: asyncio.Future[None] | None = None,
+    ) -> None:
         """Wait for a session to terminate.
 
-        Polls the session state until it's no longer valid, indicating
-        the session has closed.
+        Waits for the session termination notification when one is
+        available. Otherwise polls the session state until it's no longer
+        valid, indicating the session has closed.
 
         Args:
             session: The session to wait for.
+            terminated: Future resolved by the termination notification.
         """
+        if terminated is not None:
+            await terminated
+            return
+
         while True:
             try:
                 # Try to access session properties - raises if session is gone
@@ -170,8 +327,9 @@ class SessionTerminator:
     ) -> tuple[int, list[CloseResult]]:
         """Close all managed sessions, return count closed.
 
-        Closes sessions in parallel for efficiency, then updates the spawner
-        to untrack closed sessions.
+        Closes sessions in parallel, so closing many sessions takes about
+        one timeout window rather than one per session. Closed sessions are
+        untracked from the spawner.
 
         Args:
             sessions: List of managed sessions to close.
@@ -191,6 +349,9 @@ class SessionTerminator:
 
         results: list[CloseResult] = []
 
+        # Subscribe once up front rather than from every concurrent close
+        await self._ensure_subscribed()
+
         # Gather all close operations to run in parallel
         async def close_one(managed: ManagedSession) -> CloseResult:
             try:
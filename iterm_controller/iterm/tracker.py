@@ -2,15 +2,31 @@
 
 This module provides tracking of iTerm2 window and tab state,
 including which tabs are managed by this application.
+
+The first refresh loads every tab title with one concurrent gather and
+subscribes to iTerm2 layout-change notifications and to each tab's title
+variable. After that the model is patched in place as notifications
+arrive: a layout change re-reads the window/tab/session hierarchy that
+iterm2.App already keeps up to date (no RPC) and fetches titles only for
+new tabs. If the subscriptions fail, every refresh reloads all titles.
 """
 
 from __future__ import annotations
 
+import asyncio
+import json
 import logging
+from collections.abc import Coroutine, Iterable
 from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+import iterm2
 
 from iterm_controller.iterm.connection import ItermController
 
+if TYPE_CHECKING:
+    from iterm2.notifications import NotificationToken
+
 logger = logging.getLogger(__name__)
 
 
@@ -39,38 +55,229 @@ class WindowTracker:
     def __init__(self, controller: ItermController) -> None:
         self.controller = controller
         self.windows: dict[str, WindowState] = {}
+        # Tracked tabs by ID, rebuilt with the layout
+        self._tabs: dict[str, TabState] = {}
+        # Tabs marked managed that are not in the layout (yet)
+        self._pending_managed: set[str] = set()
+        # Notification subscriptions for the connection being watched
+        self._watched_connection: iterm2.Connection | None = None
+        self._layout_token: NotificationToken | None = None
+        self._title_tokens: dict[str, NotificationToken] = {}
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    @property
+    def is_watching(self) -> bool:
+        """Check if the model is kept current by iTerm2 notifications."""
+        connection = self.controller.connection
+        return connection is not None and connection is self._watched_connection
 
     async def refresh(self) -> None:
-        """Refresh window state from iTerm2."""
+        """Refresh window state from iTerm2.
+
+        While watching notifications this only re-syncs the layout from the
+        app's hierarchy and loads titles for tabs not seen before. Otherwise
+        it starts watching, or reloads every title if notifications are
+        unavailable. Managed-tab marks are kept for tabs that still exist.
+        """
         self.controller.require_connection()
-        self.windows.clear()
 
         if not self.controller.app:
+            self.windows.clear()
+            return
+
+        if self.is_watching:
+            new_tabs = self._sync_layout()
+            await self._load_tabs(new_tabs)
+            return
+
+        await self._start_watching()
+
+    async def _start_watching(self) -> None:
+        """Load every tab and subscribe to layout and title notifications."""
+        connection = self.controller.require_connection()
+        try:
+            token = await iterm2.notifications.async_subscribe_to_layout_change_notification(
+                connection, self._on_layout_change
+            )
+        except Exception as e:
+            logger.debug(f"Layout notifications unavailable, reloading all tabs: {e}")
+            self._title_tokens.clear()
+            self._sync_layout(reload=True)
+            await self._fetch_titles(self._all_tabs())
             return
 
-        for window in self.controller.app.terminal_windows:
-            state = WindowState(window_id=window.window_id)
+        self._layout_token = token
+        self._watched_connection = connection
+        # Tokens belong to the previous connection, which is gone
+        self._title_tokens.clear()
+        self._sync_layout(reload=True)
+        await self._load_tabs(self._all_tabs())
+
+    async def stop_watching(self) -> None:
+        """Unsubscribe from notifications and cancel pending title loads."""
+        for task in list(self._tasks):
+            task.cancel()
+        connection = self._watched_connection
+        tokens = list(self._title_tokens.values())
+        if self._layout_token is not None:
+            tokens.append(self._layout_token)
+        self._watched_connection = None
+        self._layout_token = None
+        self._title_tokens.clear()
+        if connection is None:
+            return
+        for token in tokens:
+            try:
+                await iterm2.notifications.async_unsubscribe(connection, token)
+            except Exception as e:
+                logger.debug(f"Failed to unsubscribe: {e}")
+
+    def _all_tabs(self) -> list[Any]:
+        """Get every iTerm2 tab in the app."""
+        if not self.controller.app:
+            return []
+        return [tab for window in self.controller.app.terminal_windows for tab in window.tabs]
+
+    def _sync_layout(self, reload: bool = False) -> list[Any]:
+        """Patch the model to match the app's window/tab/session hierarchy.
+
+        Existing WindowState and TabState objects are updated in place.
+        Managed marks follow their tabs, including into other windows.
+
+        Args:
+            reload: If True, treat every tab as new (its title is unknown).
+
+        Returns:
+            The iTerm2 tabs that were not tracked before.
+        """
+        old_tabs = {} if reload else self._tabs
+        managed = self.get_managed_tab_ids() | self._pending_managed
+        windows: dict[str, WindowState] = {}
+        new_tabs = []
 
+        for window in self.controller.app.terminal_windows if self.controller.app else []:
+            state = self.windows.get(window.window_id) or WindowState(window_id=window.window_id)
+            tabs = []
             for tab in window.tabs:
-                try:
-                    title = await tab.async_get_variable("title") or ""
-                except Exception:
-                    title = ""
-
-                tab_state = TabState(
-                    tab_id=tab.tab_id,
-                    title=title,
-                    session_ids=[s.session_id for s in tab.sessions],
-                    is_managed=tab.tab_id in state.managed_tab_ids,
+                tab_state = old_tabs.get(tab.tab_id)
+                if tab_state is None:
+                    tab_state = TabState(tab_id=tab.tab_id, title="")
+                    new_tabs.append(tab)
+                tab_state.session_ids = [s.session_id for s in tab.sessions]
+                tab_state.is_managed = tab.tab_id in managed
+                tabs.append(tab_state)
+            state.tabs = tabs
+            state.managed_tab_ids = {t.tab_id for t in tabs if t.is_managed}
+            windows[window.window_id] = state
+
+        self._tabs = {t.tab_id: t for w in windows.values() for t in w.tabs}
+        # Keep marks for tabs that are not in the layout yet, e.g. a tab
+        # marked right after it was created. Tab IDs are never reused.
+        self._pending_managed = managed - self._tabs.keys()
+        gone = [tab_id for tab_id in self._title_tokens if tab_id not in self._tabs]
+        if gone:
+            self._spawn(self._unwatch_titles(gone))
+
+        self.windows = windows
+        return new_tabs
+
+    async def _load_tabs(self, tabs: list[Any]) -> None:
+        """Fetch titles for tabs and subscribe to their title changes."""
+        if not tabs:
+            return
+        await asyncio.gather(self._fetch_titles(tabs), self._watch_titles(tabs))
+
+    async def _fetch_titles(self, tabs: Iterable[Any]) -> None:
+        """Fetch tab titles concurrently into the model."""
+        tabs = list(tabs)
+
+        async def fetch(tab: Any) -> str:
+            try:
+                return await tab.async_get_variable("title") or ""
+            except Exception:
+                return ""
+
+        titles = await asyncio.gather(*(fetch(tab) for tab in tabs))
+        for tab, title in zip(tabs, titles, strict=True):
+            tab_state = self._tabs.get(tab.tab_id)
+            if tab_state is not None:
+                tab_state.title = title
+
+    async def _watch_titles(self, tabs: Iterable[Any]) -> None:
+        """Subscribe to title changes for tabs, concurrently."""
+        connection = self._watched_connection
+        if connection is None:
+            return
+
+        async def watch(tab_id: str) -> None:
+            try:
+                token = await iterm2.notifications.async_subscribe_to_variable_change_notification(
+                    connection,
+                    self._on_title_changed,
+                    iterm2.VariableScopes.TAB.value,
+                    "title",
+                    tab_id,
                 )
-                state.tabs.append(tab_state)
+            except Exception as e:
+                logger.debug(f"Could not watch title of tab {tab_id}: {e}")
+                return
+            self._title_tokens[tab_id] = token
+
+        await asyncio.gather(
+            *(watch(tab.tab_id) for tab in tabs if tab.tab_id not in self._title_tokens)
+        )
+
+    async def _unwatch_titles(self, tab_ids: list[str]) -> None:
+        """Unsubscribe from title changes of tabs that closed."""
+        connection = self._watched_connection
+        for tab_id in tab_ids:
+            token = self._title_tokens.pop(tab_id, None)
+            if token is None or connection is None:
+                continue
+            try:
+                await iterm2.notifications.async_unsubscribe(connection, token)
+            except Exception as e:
+                logger.debug(f"Failed to unwatch title of tab {tab_id}: {e}")
+
+    async def _on_layout_change(self, connection: object, message: object) -> None:
+        """Patch the model when windows, tabs or sessions change.
 
-            self.windows[window.window_id] = state
+        iterm2.App subscribed before the tracker, so its hierarchy is
+        already updated. Notification handlers run inside the connection's
+        dispatch loop, so RPCs for new tabs run in a separate task.
+        """
+        new_tabs = self._sync_layout()
+        if new_tabs:
+            self._spawn(self._load_tabs(new_tabs))
+
+    async def _on_title_changed(self, connection: object, message: Any) -> None:
+        """Update a tab's title from a variable-change notification."""
+        tab_state = self._tabs.get(message.identifier)
+        if tab_state is None:
+            return
+        try:
+            tab_state.title = json.loads(message.json_new_value) or ""
+        except (TypeError, ValueError):
+            tab_state.title = ""
+
+    def _spawn(self, coro: Coroutine[Any, Any, None]) -> None:
+        """Run a coroutine in a tracked background task."""
+        task = asyncio.get_running_loop().create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
 
     def mark_managed(self, tab_id: str, window_id: str) -> None:
-        """Mark a tab as managed by this application."""
+        """Mark a tab as managed by this application.
+
+        A tab the tracker has not seen yet is marked when it shows up.
+        """
+        tab_state = self._tabs.get(tab_id)
+        if tab_state is not None:
+            tab_state.is_managed = True
         if window_id in self.windows:
             self.windows[window_id].managed_tab_ids.add(tab_id)
+        else:
+            self._pending_managed.add(tab_id)
 
     def get_managed_tab_ids(self, window_id: str | None = None) -> set[str]:
         """Get all managed tab IDs, optionally filtered by window."""
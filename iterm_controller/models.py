@@ -131,6 +131,7 @@ class ReviewContextConfig:
     include_test_results: bool = True
     include_lint_results: bool = False
     include_session_log: bool = False
+    max_diff_bytes: int = 200_000
 
 
 @dataclass
@@ -143,6 +144,8 @@ class ReviewConfig:
     max_revisions: int = 3
     trigger: str = "script_completion"
     context: ReviewContextConfig | None = None
+    timeout_seconds: float = 600.0  # Give up waiting for review output
+    completion_marker: str = "REVIEW COMPLETE"  # Printed alone on a line when done
 
 
 # =============================================================================
@@ -623,6 +626,12 @@ class AppSettings:
     github_refresh_seconds: int = 60
     health_check_interval_seconds: float = 10.0
     dangerously_skip_permissions: bool = False  # Add --dangerously-skip-permissions to Claude sessions
+    session_pool_size: int = 0  # Warm shells kept per project context (0 disables the pool)
+    session_pool_idle_seconds: int = 600  # Close warm shells unclaimed for this long
+    transcripts_enabled: bool = False  # Write monitored session output to disk
+    transcript_dir: str = ""  # Transcript directory (default: config dir/transcripts)
+    search_index_enabled: bool = False  # Index monitored session output for search
+    search_index_path: str = ""  # Search database (default: config dir/search.db)
     notifications: NotificationSettings = field(default_factory=NotificationSettings)
 
 
@@ -1,72 +1,234 @@
-"""macOS notification sender and manager.
+"""Desktop notification sender and manager.
 
-This module provides macOS notification integration via terminal-notifier.
-It includes latency tracking to verify the 5-second SLA for notifications.
+This module provides desktop notification integration through pluggable
+backends: terminal-notifier on macOS and notify-send on Linux (tests use the
+in-memory sink from iterm_controller.testing). It includes latency
+tracking to verify the 5-second SLA for notifications, and a dispatcher
+that coalesces bursts of notifications into summaries.
 """
 
 from __future__ import annotations
 
 import asyncio
+import bisect
+import heapq
+import itertools
+import json
 import logging
+import math
+import os
+import re
+import sys
+import threading
 import time
+from collections import deque
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import TYPE_CHECKING
+from enum import IntEnum
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from iterm_controller.exceptions import record_error
+from iterm_controller.ports import NotificationBackend, NotificationRequest
 
 if TYPE_CHECKING:
     from iterm_controller.models import AttentionState, ManagedSession, NotificationSettings, Project
+    from iterm_controller.session_monitor import SessionMonitor
     from iterm_controller.state import AppState
 
 logger = logging.getLogger(__name__)
 
 
 # =============================================================================
-# Notifier (terminal-notifier wrapper)
+# Notification Backends
+# =============================================================================
+
+
+async def _which(program: str) -> tuple[bool, str | None]:
+    """Check whether a program is on the PATH.
+
+    Returns:
+        Tuple of (available, error_message).
+    """
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            "which",
+            program,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        stdout, _ = await proc.communicate()
+
+        if proc.returncode == 0 and stdout.strip():
+            return (True, None)
+        return (False, f"{program} not found")
+
+    except Exception as e:
+        return (False, str(e))
+
+
+async def _run_quiet(*args: str) -> bool:
+    """Run a command with output discarded.
+
+    Returns:
+        True if the command exited with status 0.
+    """
+    proc = await asyncio.create_subprocess_exec(
+        *args,
+        stdout=asyncio.subprocess.DEVNULL,
+        stderr=asyncio.subprocess.DEVNULL,
+    )
+    await proc.wait()
+    return proc.returncode == 0
+
+
+class TerminalNotifierBackend:
+    """macOS notification backend using terminal-notifier.
+
+    terminal-notifier delivers one notification per process, so a batch is
+    delivered by starting up to ``max_concurrency`` processes at a time, in
+    list order, instead of waiting for each one in turn.
+    """
+
+    name = "terminal-notifier"
+
+    def __init__(self, max_concurrency: int = 4) -> None:
+        """Initialize the backend.
+
+        Args:
+            max_concurrency: Maximum terminal-notifier processes at once.
+        """
+        self.max_concurrency = max_concurrency
+
+    async def check_available(self) -> tuple[bool, str | None]:
+        """Check if terminal-notifier is installed."""
+        return await _which("terminal-notifier")
+
+    async def send(self, request: NotificationRequest) -> bool:
+        """Deliver a notification with terminal-notifier."""
+        args = [
+            "terminal-notifier",
+            "-title",
+            request.title,
+            "-message",
+            request.message,
+            "-group",
+            request.group,
+        ]
+
+        if request.subtitle:
+            args.extend(["-subtitle", request.subtitle])
+
+        if request.sound:
+            args.extend(["-sound", request.sound])
+
+        try:
+            return await _run_quiet(*args)
+        except Exception as e:
+            logger.debug(f"Failed to send notification: {e}")
+            return False
+
+    async def send_batch(self, requests: list[NotificationRequest]) -> list[bool]:
+        """Deliver notifications with bounded concurrency."""
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def send_one(request: NotificationRequest) -> bool:
+            async with semaphore:
+                return await self.send(request)
+
+        return list(await asyncio.gather(*(send_one(r) for r in requests)))
+
+    async def remove_group(self, group: str) -> bool:
+        """Remove delivered notifications with terminal-notifier -remove."""
+        try:
+            return await _run_quiet("terminal-notifier", "-remove", group)
+        except Exception:
+            return False
+
+
+class NotifySendBackend:
+    """Linux notification backend using notify-send.
+
+    notify-send cannot replace or withdraw notifications, so groups are
+    ignored and remove_group() always reports failure. Sounds are not
+    played.
+    """
+
+    name = "notify-send"
+
+    async def check_available(self) -> tuple[bool, str | None]:
+        """Check if notify-send is installed."""
+        return await _which("notify-send")
+
+    async def send(self, request: NotificationRequest) -> bool:
+        """Deliver a notification with notify-send."""
+        title = f"{request.title} - {request.subtitle}" if request.subtitle else request.title
+        try:
+            return await _run_quiet(
+                "notify-send", "--app-name=iterm-controller", title, request.message
+            )
+        except Exception as e:
+            logger.debug(f"Failed to send notification: {e}")
+            return False
+
+    async def send_batch(self, requests: list[NotificationRequest]) -> list[bool]:
+        """Deliver notifications one after another."""
+        return [await self.send(request) for request in requests]
+
+    async def remove_group(self, group: str) -> bool:
+        """Not supported by notify-send."""
+        return False
+
+
+def default_notification_backend() -> NotificationBackend:
+    """Get the notification backend for the current platform.
+
+    Returns:
+        NotifySendBackend on Linux, TerminalNotifierBackend otherwise.
+    """
+    if sys.platform.startswith("linux"):
+        return NotifySendBackend()
+    return TerminalNotifierBackend()
+
+
+# =============================================================================
+# Notifier
 # =============================================================================
 
 
 @dataclass
 class Notifier:
-    """macOS notification sender using terminal-notifier.
+    """Desktop notification sender.
 
-    Provides notification support with graceful degradation when
-    terminal-notifier is not installed.
+    Delivers notifications through a NotificationBackend (terminal-notifier
+    by default) and degrades gracefully when the backend is not available.
     """
 
     available: bool = False
     enabled: bool = True
     error_message: str | None = None
+    backend: NotificationBackend = field(default_factory=TerminalNotifierBackend)
 
     async def initialize(self) -> bool:
-        """Check terminal-notifier availability.
+        """Check backend availability.
 
-        Sets available=True if terminal-notifier is installed.
+        Sets available=True if the backend can deliver notifications.
 
         Returns:
-            True if terminal-notifier is available.
+            True if the backend is available.
         """
         self.available, self.error_message = await self._check_available()
         return self.available
 
     async def _check_available(self) -> tuple[bool, str | None]:
-        """Check if terminal-notifier is available.
+        """Check if the backend is available.
 
         Returns:
             Tuple of (available, error_message).
         """
         try:
-            proc = await asyncio.create_subprocess_exec(
-                "which",
-                "terminal-notifier",
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-            )
-            stdout, _ = await proc.communicate()
-
-            if proc.returncode == 0 and stdout.strip():
-                return (True, None)
-            return (False, "terminal-notifier not found")
-
+            return await self.backend.check_available()
         except Exception as e:
             return (False, str(e))
 
@@ -78,7 +240,7 @@ class Notifier:
         sound: str | None = "default",
         group: str = "iterm-controller",
     ) -> bool:
-        """Send a macOS notification.
+        """Send a desktop notification.
 
         Args:
             title: The notification title.
@@ -93,35 +255,35 @@ class Notifier:
         if not self.available or not self.enabled:
             return False
 
+        request = NotificationRequest(
+            title=title, message=message, subtitle=subtitle, sound=sound, group=group
+        )
         try:
-            args = [
-                "terminal-notifier",
-                "-title",
-                title,
-                "-message",
-                message,
-                "-group",
-                group,
-            ]
-
-            if subtitle:
-                args.extend(["-subtitle", subtitle])
-
-            if sound:
-                args.extend(["-sound", sound])
-
-            proc = await asyncio.create_subprocess_exec(
-                *args,
-                stdout=asyncio.subprocess.DEVNULL,
-                stderr=asyncio.subprocess.DEVNULL,
-            )
-            await proc.wait()
-            return proc.returncode == 0
-
+            return await self.backend.send(request)
         except Exception as e:
             logger.debug(f"Failed to send notification: {e}")
             return False
 
+    async def notify_batch(self, requests: list[NotificationRequest]) -> list[bool]:
+        """Send several notifications through the backend's batch path.
+
+        Args:
+            requests: The notifications to send, in delivery order.
+
+        Returns:
+            Whether each notification was sent, in the same order.
+        """
+        if not requests:
+            return []
+        if not self.available or not self.enabled:
+            return [False] * len(requests)
+
+        try:
+            return await self.backend.send_batch(requests)
+        except Exception as e:
+            logger.debug(f"Failed to send notifications: {e}")
+            return [False] * len(requests)
+
     async def notify_session_waiting(
         self,
         session: ManagedSession,
@@ -152,19 +314,22 @@ class Notifier:
         Returns:
             True if the clear was successful.
         """
+        return await self.remove_group(f"session-{session.id}")
+
+    async def remove_group(self, group: str) -> bool:
+        """Remove delivered notifications in a group.
+
+        Args:
+            group: The notification group to remove.
+
+        Returns:
+            True if the removal was successful.
+        """
         if not self.available:
             return False
 
         try:
-            proc = await asyncio.create_subprocess_exec(
-                "terminal-notifier",
-                "-remove",
-                f"session-{session.id}",
-                stdout=asyncio.subprocess.DEVNULL,
-                stderr=asyncio.subprocess.DEVNULL,
-            )
-            await proc.wait()
-            return proc.returncode == 0
+            return await self.backend.remove_group(group)
         except Exception:
             return False
 
@@ -179,7 +344,6 @@ class Notifier:
         """Send a notification with sound.
 
         This is a convenience method that explicitly includes sound.
-        Uses terminal-notifier's -sound flag.
 
         Args:
             title: The notification title.
@@ -234,6 +398,179 @@ class Notifier:
 # Notification Latency Tracker
 # =============================================================================
 
+# Stages of a WAITING notification, in order, plus the end-to-end total
+LATENCY_STAGES = ("detection", "dispatch", "delivery", "total")
+
+# Upper bounds (seconds) of the latency histogram buckets
+LATENCY_HISTOGRAM_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+# File name of the latency log in the config directory
+LATENCY_LOG_FILENAME = "notification-latency.jsonl"
+
+
+def default_latency_log_path() -> Path:
+    """Get the default location of the notification latency log."""
+    from iterm_controller.config import get_config_dir
+
+    return get_config_dir() / LATENCY_LOG_FILENAME
+
+
+@dataclass
+class LatencySample:
+    """Timing of one delivered notification, broken down by stage.
+
+    Attributes:
+        session_id: The session the notification was about.
+        timestamp: Wall-clock time of delivery (Unix seconds).
+        detection: Seconds from the session's last output to the monitor
+            detecting the state change.
+        dispatch: Seconds from detection to handing the notification to
+            terminal-notifier (includes any coalescing window).
+        delivery: Seconds terminal-notifier took to send it.
+    """
+
+    session_id: str
+    timestamp: float
+    detection: float
+    dispatch: float
+    delivery: float
+
+    @property
+    def total(self) -> float:
+        """Get the end-to-end latency in seconds."""
+        return self.detection + self.dispatch + self.delivery
+
+    def stage(self, name: str) -> float:
+        """Get the latency of one stage by name.
+
+        Args:
+            name: One of LATENCY_STAGES.
+
+        Returns:
+            The stage latency in seconds.
+        """
+        return self.total if name == "total" else getattr(self, name)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a JSON-serializable dictionary."""
+        return {
+            "session_id": self.session_id,
+            "timestamp": self.timestamp,
+            "detection": self.detection,
+            "dispatch": self.dispatch,
+            "delivery": self.delivery,
+            "total": self.total,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> LatencySample:
+        """Create a sample from a dictionary written by to_dict.
+
+        Args:
+            data: The sample fields.
+
+        Returns:
+            The sample.
+        """
+        return cls(
+            session_id=data["session_id"],
+            timestamp=float(data["timestamp"]),
+            detection=float(data["detection"]),
+            dispatch=float(data["dispatch"]),
+            delivery=float(data["delivery"]),
+        )
+
+
+def _percentile(ordered: list[float], pct: float) -> float:
+    """Nearest-rank percentile of an ascending list."""
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def summarize_latencies(
+    samples: Iterable[LatencySample],
+    sla_seconds: float = 5.0,
+    buckets: tuple[float, ...] = LATENCY_HISTOGRAM_BUCKETS,
+) -> dict[str, Any]:
+    """Build a latency report from a set of samples.
+
+    Args:
+        samples: The samples to summarize.
+        sla_seconds: End-to-end latency allowed by the SLA.
+        buckets: Upper bounds of the histogram buckets, ascending.
+
+    Returns:
+        Dictionary with the sample count, SLA compliance counts and, per
+        stage, min/max/avg, p50/p90/p95/p99 and a histogram. Histogram
+        counts are per bucket (not cumulative); the last bucket, "+Inf",
+        holds everything above the largest bound.
+    """
+    samples = list(samples)
+    report: dict[str, Any] = {"count": len(samples), "sla_seconds": sla_seconds}
+    if not samples:
+        return report
+
+    violated = sum(1 for s in samples if s.total > sla_seconds)
+    report["sla_met"] = len(samples) - violated
+    report["sla_violated"] = violated
+    report["first"] = min(s.timestamp for s in samples)
+    report["last"] = max(s.timestamp for s in samples)
+
+    stages = {}
+    for name in LATENCY_STAGES:
+        values = sorted(s.stage(name) for s in samples)
+        counts = [0] * (len(buckets) + 1)
+        for value in values:
+            counts[bisect.bisect_left(buckets, value)] += 1
+        bounds: list[float | str] = [*buckets, "+Inf"]
+        stages[name] = {
+            "min": values[0],
+            "max": values[-1],
+            "avg": sum(values) / len(values),
+            "p50": _percentile(values, 50),
+            "p90": _percentile(values, 90),
+            "p95": _percentile(values, 95),
+            "p99": _percentile(values, 99),
+            "histogram": [
+                {"le": bound, "count": count} for bound, count in zip(bounds, counts, strict=True)
+            ],
+        }
+    report["stages"] = stages
+    return report
+
+
+def load_latency_log(path: Path, since: float | None = None) -> list[LatencySample]:
+    """Read samples from a latency log, oldest first.
+
+    The rotated log (``<name>.1``) is read too, so a window that spans a
+    rotation stays complete. Malformed lines are skipped.
+
+    Args:
+        path: The log file.
+        since: Only return samples delivered at or after this Unix time.
+
+    Returns:
+        The samples.
+    """
+    samples: list[LatencySample] = []
+    for file in (path.with_name(path.name + ".1"), path):
+        try:
+            with open(file, encoding="utf-8") as f:
+                lines = f.readlines()
+        except FileNotFoundError:
+            continue
+        except OSError as e:
+            logger.warning("Failed to read latency log %s: %s", file, e)
+            continue
+        for line in lines:
+            try:
+                sample = LatencySample.from_dict(json.loads(line))
+            except (ValueError, KeyError, TypeError):
+                continue
+            if since is None or sample.timestamp >= since:
+                samples.append(sample)
+    return samples
+
 
 @dataclass
 class NotificationLatencyTracker:
@@ -241,19 +578,58 @@ class NotificationLatencyTracker:
 
     The SLA requires notifications to fire within 5 seconds of a session
     entering the WAITING state.
+
+    Besides the latest timestamps per session, every delivered notification
+    is kept as a LatencySample in a rolling window of ``max_samples``, so
+    percentiles and histograms can be reported per stage over time. Samples
+    that exceed the SLA are also kept in a separate violation log. With a
+    ``log_path``, samples are appended to a JSON-lines file as well, so the
+    CLI can report on a running app. On an event loop the file is written in
+    a worker thread; ``flush_log()`` waits for pending writes.
     """
 
     sla_seconds: float = 5.0
     state_change_times: dict[str, float] = field(default_factory=dict)
     notification_times: dict[str, float] = field(default_factory=dict)
-
-    def record_state_change(self, session_id: str) -> None:
+    max_samples: int = 10_000
+    max_violations: int = 1_000
+    log_path: Path | None = None
+    max_log_bytes: int = 5_000_000
+    samples: deque[LatencySample] = field(init=False)
+    violations: deque[LatencySample] = field(init=False)
+    _detection: dict[str, float] = field(default_factory=dict, init=False, repr=False)
+    _dispatch_times: dict[str, float] = field(default_factory=dict, init=False, repr=False)
+    _log_writes: set[asyncio.Task[None]] = field(default_factory=set, init=False, repr=False)
+    _log_lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.samples = deque(maxlen=self.max_samples)
+        self.violations = deque(maxlen=self.max_violations)
+
+    def record_state_change(
+        self, session_id: str, observed_at: datetime | None = None
+    ) -> None:
         """Record when a session entered WAITING state.
 
         Args:
             session_id: The session ID.
+            observed_at: When the output that caused the change was read
+                (the session's ``last_activity``). Used for the detection
+                stage; without it detection counts as zero.
         """
         self.state_change_times[session_id] = time.monotonic()
+        detection = 0.0
+        if observed_at is not None:
+            detection = max(0.0, (datetime.now() - observed_at).total_seconds())
+        self._detection[session_id] = detection
+
+    def record_dispatch(self, session_id: str) -> None:
+        """Record when a notification was handed to terminal-notifier.
+
+        Args:
+            session_id: The session ID.
+        """
+        self._dispatch_times[session_id] = time.monotonic()
 
     def record_notification_sent(self, session_id: str) -> None:
         """Record when notification was sent.
@@ -316,19 +692,449 @@ class NotificationLatencyTracker:
             "sla_violated": sum(1 for lat in latencies if lat > self.sla_seconds),
         }
 
+    def get_report(self, window_seconds: float | None = None) -> dict[str, Any]:
+        """Get per-stage percentiles and histograms over recent samples.
+
+        Args:
+            window_seconds: Only include notifications delivered in the last
+                this many seconds (all retained samples if None).
+
+        Returns:
+            Report dictionary (see summarize_latencies).
+        """
+        return summarize_latencies(self._recent(self.samples, window_seconds), self.sla_seconds)
+
+    def get_violations(self, window_seconds: float | None = None) -> list[LatencySample]:
+        """Get notifications that exceeded the SLA, oldest first.
+
+        Args:
+            window_seconds: Only include violations from the last this many
+                seconds (all retained violations if None).
+
+        Returns:
+            The violating samples.
+        """
+        return self._recent(self.violations, window_seconds)
+
+    @staticmethod
+    def _recent(
+        samples: Iterable[LatencySample], window_seconds: float | None
+    ) -> list[LatencySample]:
+        if window_seconds is None:
+            return list(samples)
+        cutoff = time.time() - window_seconds
+        return [s for s in samples if s.timestamp >= cutoff]
+
     def clear_session(self, session_id: str) -> None:
         """Clear tracking data for a session.
 
+        Samples already recorded for the session are kept.
+
         Args:
             session_id: The session ID.
         """
         self.state_change_times.pop(session_id, None)
         self.notification_times.pop(session_id, None)
+        self._detection.pop(session_id, None)
+        self._dispatch_times.pop(session_id, None)
 
     def clear_all(self) -> None:
-        """Clear all tracking data."""
+        """Clear all tracking data, including samples."""
         self.state_change_times.clear()
         self.notification_times.clear()
+        self._detection.clear()
+        self._dispatch_times.clear()
+        self.samples.clear()
+        self.violations.clear()
+
+    def record_delivery(self, session_id: str) -> None:
+        """Record a sent notification and log whether it met the SLA.
+
+        The first delivery after a state change also becomes a sample.
+
+        Args:
+            session_id: The session ID.
+        """
+        self.record_notification_sent(session_id)
+        sample = self._take_sample(session_id)
+        if sample is None:
+            return
+        if sample.total > self.sla_seconds:
+            self.violations.append(sample)
+            logger.warning(
+                f"Notification SLA violated for session {session_id}: "
+                f"{sample.total:.2f}s > {self.sla_seconds}s "
+                f"(detection {sample.detection:.2f}s, dispatch {sample.dispatch:.2f}s, "
+                f"delivery {sample.delivery:.2f}s)"
+            )
+        else:
+            logger.debug(f"Notification sent for session {session_id} in {sample.total:.2f}s")
+
+    def _take_sample(self, session_id: str) -> LatencySample | None:
+        """Build the sample for a session's pending state change, if any."""
+        detection = self._detection.pop(session_id, None)
+        changed = self.state_change_times.get(session_id)
+        sent = self.notification_times[session_id]
+        if detection is None or changed is None:
+            return None
+        # Without a recorded dispatch, the whole wait counts as dispatch
+        dispatched = min(max(self._dispatch_times.pop(session_id, sent), changed), sent)
+        sample = LatencySample(
+            session_id=session_id,
+            timestamp=time.time(),
+            detection=detection,
+            dispatch=dispatched - changed,
+            delivery=sent - dispatched,
+        )
+        self.samples.append(sample)
+        if self.log_path is not None:
+            self._write_log(self.log_path, sample)
+        return sample
+
+    def _write_log(self, path: Path, sample: LatencySample) -> None:
+        """Append a sample to the log, off the event loop if there is one."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._append_log(path, sample)
+            return
+        task = loop.create_task(asyncio.to_thread(self._append_log, path, sample))
+        self._log_writes.add(task)
+        task.add_done_callback(self._log_writes.discard)
+
+    async def flush_log(self) -> None:
+        """Wait for latency log writes still in progress."""
+        if self._log_writes:
+            await asyncio.gather(*self._log_writes)
+
+    def _append_log(self, path: Path, sample: LatencySample) -> None:
+        """Append a sample to the log file, rotating it when it gets large."""
+        try:
+            # Writer threads must not rotate under each other
+            with self._log_lock:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                if path.exists() and path.stat().st_size > self.max_log_bytes:
+                    os.replace(path, path.with_name(path.name + ".1"))
+                with open(path, "a", encoding="utf-8") as f:
+                    f.write(json.dumps(sample.to_dict()) + "\n")
+        except OSError as e:
+            logger.warning("Failed to write latency log %s: %s", path, e)
+            record_error(e)
+
+
+# =============================================================================
+# Notification Dispatcher
+# =============================================================================
+
+
+class NotificationPriority(IntEnum):
+    """Delivery order for queued notifications (lower is sent first)."""
+
+    ERROR = 0
+    QUESTION = 1
+    IDLE = 2
+
+
+# Output in a session's last lines that means it stopped on an error
+ERROR_PATTERNS = [
+    r"Traceback \(most recent call last\)",  # Python
+    r"^\s*[\w.]*(?:Error|Exception): ",  # ValueError: ..., TypeError: ...
+    r"^error(?:\[\w+\])?: ",  # rustc, gcc, go
+    r"^npm ERR! ",
+    r"\bAPI Error\b",  # Claude API failures
+]
+
+_ERROR_PATTERN = re.compile("|".join(ERROR_PATTERNS), re.MULTILINE)
+
+# Number of trailing output lines checked for ERROR_PATTERNS
+ERROR_TAIL_LINES = 10
+
+
+def output_shows_error(output: str) -> bool:
+    """Check whether a session's latest output ends on an error.
+
+    Only the last ERROR_TAIL_LINES lines are checked, so an error that
+    scrolled past earlier in the session does not count.
+
+    Args:
+        output: The session's recent output.
+
+    Returns:
+        True if one of ERROR_PATTERNS matches.
+    """
+    tail = "\n".join(output.rstrip().splitlines()[-ERROR_TAIL_LINES:])
+    return _ERROR_PATTERN.search(tail) is not None
+
+
+# Summary text when several notifications of one priority are coalesced
+_SUMMARY_MESSAGES = {
+    NotificationPriority.ERROR: "{count} sessions reported errors",
+    NotificationPriority.QUESTION: "{count} sessions need your attention",
+    NotificationPriority.IDLE: "{count} sessions are idle",
+}
+
+
+@dataclass(order=True)
+class _QueuedNotification:
+    """A notification waiting in the dispatcher queue."""
+
+    priority: NotificationPriority
+    sequence: int
+    session_id: str = field(compare=False)
+    title: str = field(compare=False)
+    message: str = field(compare=False)
+    subtitle: str | None = field(default=None, compare=False)
+    group: str = field(default="iterm-controller", compare=False)
+    sound: str | None = field(default="default", compare=False)
+
+
+class NotificationDispatcher:
+    """Queues notifications and delivers them from a single worker.
+
+    Notifications submitted within ``coalesce_window`` seconds of each
+    other are delivered together. Several notifications of the same
+    priority become one summary notification ("3 sessions need your
+    attention"), priorities are sent in order (errors, then questions,
+    then idle), and only the first notification of a batch plays a sound.
+    A session that was notified less than ``rate_limit_seconds`` ago is
+    not notified again.
+
+    Example:
+        dispatcher = NotificationDispatcher(notifier, latency_tracker=tracker)
+        dispatcher.submit(session.id, project.name, "Session needs your attention")
+    """
+
+    def __init__(
+        self,
+        notifier: Notifier,
+        coalesce_window: float = 0.25,
+        rate_limit_seconds: float = 30.0,
+        latency_tracker: NotificationLatencyTracker | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the dispatcher.
+
+        Args:
+            notifier: Notifier used to deliver notifications.
+            coalesce_window: Seconds to wait for more notifications to batch.
+            rate_limit_seconds: Minimum seconds between notifications for
+                one session.
+            latency_tracker: Tracker to record delivery times in.
+            clock: Monotonic clock (injectable for tests).
+        """
+        self.notifier = notifier
+        self.coalesce_window = coalesce_window
+        self.rate_limit_seconds = rate_limit_seconds
+        self.latency_tracker = latency_tracker
+        self._clock = clock
+        self._queue: list[_QueuedNotification] = []
+        self._sequence = itertools.count()
+        self._last_sent: dict[str, float] = {}
+        self._summary_members: dict[str, set[str]] = {}
+        self._wakeup = asyncio.Event()
+        self._worker: asyncio.Task[None] | None = None
+
+    def submit(
+        self,
+        session_id: str,
+        title: str,
+        message: str,
+        priority: NotificationPriority = NotificationPriority.QUESTION,
+        subtitle: str | None = None,
+        group: str | None = None,
+        sound: str | None = "default",
+    ) -> bool:
+        """Queue a notification for a session.
+
+        Args:
+            session_id: Session the notification is about.
+            title: Notification title (usually the project name).
+            message: Notification body.
+            priority: Delivery priority.
+            subtitle: Optional subtitle.
+            group: Notification group (defaults to the session's group).
+            sound: Sound to play if this is the first of its batch.
+
+        Returns:
+            False if the notification was dropped by rate limiting or
+            because one is already queued for the session.
+        """
+        last = self._last_sent.get(session_id)
+        if last is not None and self._clock() - last < self.rate_limit_seconds:
+            logger.debug("Rate limited notification for session %s", session_id)
+            return False
+        if any(n.session_id == session_id for n in self._queue):
+            return False
+
+        heapq.heappush(
+            self._queue,
+            _QueuedNotification(
+                priority=priority,
+                sequence=next(self._sequence),
+                session_id=session_id,
+                title=title,
+                message=message,
+                subtitle=subtitle,
+                group=group or f"session-{session_id}",
+                sound=sound,
+            ),
+        )
+        self._ensure_worker()
+        self._wakeup.set()
+        return True
+
+    def cancel(self, session_id: str) -> bool:
+        """Drop a session's queued notification.
+
+        Args:
+            session_id: The session ID.
+
+        Returns:
+            True if a queued notification was removed.
+        """
+        before = len(self._queue)
+        self._queue = [n for n in self._queue if n.session_id != session_id]
+        heapq.heapify(self._queue)
+        return len(self._queue) < before
+
+    async def clear_session(self, session_id: str) -> None:
+        """Drop queued notifications and remove delivered ones for a session.
+
+        A coalesced summary is removed once none of its sessions still
+        need it. The session's rate limit is reset, since its next
+        notification is for a new state change.
+
+        Args:
+            session_id: The session ID.
+        """
+        self.cancel(session_id)
+        self._last_sent.pop(session_id, None)
+        await self.notifier.remove_group(f"session-{session_id}")
+        for group, members in list(self._summary_members.items()):
+            members.discard(session_id)
+            if not members:
+                del self._summary_members[group]
+                await self.notifier.remove_group(group)
+
+    def forget_session(self, session_id: str) -> None:
+        """Drop all state for a closed session.
+
+        Args:
+            session_id: The session ID.
+        """
+        self.cancel(session_id)
+        self._last_sent.pop(session_id, None)
+
+    @property
+    def pending(self) -> int:
+        """Get the number of queued notifications."""
+        return len(self._queue)
+
+    # -------------------------------------------------------------------------
+    # Worker
+    # -------------------------------------------------------------------------
+
+    def _ensure_worker(self) -> None:
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._run())
+
+    async def _run(self) -> None:
+        """Deliver queued notifications in coalesced batches."""
+        while True:
+            await self._wakeup.wait()
+            # Give simultaneous events a moment to arrive
+            await asyncio.sleep(self.coalesce_window)
+            self._wakeup.clear()
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.warning("Notification delivery failed: %s", e)
+                record_error(e)
+
+    async def flush(self) -> int:
+        """Deliver everything queued now, without waiting for the window.
+
+        Returns:
+            Number of notifications sent (a summary counts as one).
+        """
+        batch = [heapq.heappop(self._queue) for _ in range(len(self._queue))]
+        if not batch:
+            return 0
+
+        by_priority: dict[NotificationPriority, list[_QueuedNotification]] = {}
+        for item in batch:
+            by_priority.setdefault(item.priority, []).append(item)
+
+        # One request per priority, highest first; only the first plays a sound
+        requests: list[NotificationRequest] = []
+        batches: list[list[_QueuedNotification]] = []
+        play_sound = True
+        for priority in sorted(by_priority):
+            items = by_priority[priority]
+            sound = next((i.sound for i in items if i.sound), None) if play_sound else None
+            play_sound = play_sound and sound is None
+            if len(items) == 1:
+                item = items[0]
+                request = NotificationRequest(
+                    title=item.title,
+                    message=item.message,
+                    subtitle=item.subtitle,
+                    sound=sound,
+                    group=item.group,
+                )
+            else:
+                request = NotificationRequest(
+                    **self._summarize(priority, items),
+                    sound=sound,
+                    group=f"iterm-controller-{priority.name.lower()}",
+                )
+            requests.append(request)
+            batches.append(items)
+
+        if self.latency_tracker is not None:
+            for item in batch:
+                self.latency_tracker.record_dispatch(item.session_id)
+        results = await self.notifier.notify_batch(requests)
+
+        sent = 0
+        for request, items, ok in zip(requests, batches, results, strict=True):
+            if not ok:
+                continue
+            sent += 1
+            if len(items) > 1:
+                self._summary_members.setdefault(request.group, set()).update(
+                    i.session_id for i in items
+                )
+            now = self._clock()
+            for item in items:
+                self._last_sent[item.session_id] = now
+                if self.latency_tracker is not None:
+                    self.latency_tracker.record_delivery(item.session_id)
+        return sent
+
+    @staticmethod
+    def _summarize(
+        priority: NotificationPriority, items: list[_QueuedNotification]
+    ) -> dict[str, str]:
+        """Build the title, subtitle and message for a coalesced batch."""
+        titles = list(dict.fromkeys(i.title for i in items))
+        title = titles[0] if len(titles) == 1 else f"{len(titles)} projects"
+        names = [i.subtitle or i.session_id for i in items]
+        subtitle = ", ".join(names[:3]) + (f" +{len(names) - 3}" if len(names) > 3 else "")
+        message = _SUMMARY_MESSAGES[priority].format(count=len(items))
+        return {"title": title, "subtitle": subtitle, "message": message}
+
+    async def stop(self) -> None:
+        """Stop the worker and drop anything still queued."""
+        self._queue.clear()
+        if self._worker is None:
+            return
+        self._worker.cancel()
+        try:
+            await self._worker
+        except asyncio.CancelledError:
+            pass
+        self._worker = None
 
 
 # =============================================================================
@@ -347,6 +1153,9 @@ class NotificationManager:
 
     Integrates with the session monitor to send notifications when sessions
     enter the WAITING state and clear them when they leave.
+
+    With a NotificationDispatcher, notifications are queued and coalesced
+    instead of being sent one subprocess at a time as events arrive.
     """
 
     def __init__(
@@ -354,6 +1163,8 @@ class NotificationManager:
         notifier: Notifier,
         state: AppState,
         settings: NotificationSettings | None = None,
+        dispatcher: NotificationDispatcher | None = None,
+        latency_log: Path | None = None,
     ) -> None:
         """Initialize the notification manager.
 
@@ -361,6 +1172,10 @@ class NotificationManager:
             notifier: The notifier to send notifications with.
             state: The application state for looking up projects.
             settings: Optional notification settings.
+            dispatcher: Optional dispatcher that coalesces notifications.
+                Without one, each notification is sent immediately.
+            latency_log: File to append latency samples to, for reporting
+                from the CLI (see default_latency_log_path).
         """
         self.notifier = notifier
         self.state = state
@@ -369,7 +1184,10 @@ class NotificationManager:
             self.settings = NotificationSettings()
         else:
             self.settings = settings
-        self.latency_tracker = NotificationLatencyTracker()
+        self.latency_tracker = NotificationLatencyTracker(log_path=latency_log)
+        self.dispatcher = dispatcher
+        if dispatcher is not None and dispatcher.latency_tracker is None:
+            dispatcher.latency_tracker = self.latency_tracker
         self._pending_notifications: dict[str, asyncio.Task] = {}
 
     async def on_session_state_change(
@@ -405,33 +1223,72 @@ class NotificationManager:
                 del self._pending_notifications[session.id]
 
             # Record state change time for latency tracking
-            self.latency_tracker.record_state_change(session.id)
+            self.latency_tracker.record_state_change(session.id, session.last_activity)
+
+            if self.dispatcher is not None:
+                # Delivered (and latency recorded) by the dispatcher worker
+                error = output_shows_error(session.last_output)
+                self.dispatcher.submit(
+                    session.id,
+                    title=project.name,
+                    subtitle=session.template_id,
+                    message="Session hit an error" if error else "Session needs your attention",
+                    priority=(
+                        NotificationPriority.ERROR if error else NotificationPriority.QUESTION
+                    ),
+                    sound=self._sound(),
+                )
+                return
 
             # Send notification
+            self.latency_tracker.record_dispatch(session.id)
             success = await self.notifier.notify_session_waiting(session, project)
 
-            # Record notification time
+            # Record notification time and check SLA
             if success:
-                self.latency_tracker.record_notification_sent(session.id)
-
-                # Check SLA
-                if not self.latency_tracker.check_sla(session.id):
-                    latency = self.latency_tracker.get_latency(session.id)
-                    logger.warning(
-                        f"Notification SLA violated for session {session.id}: "
-                        f"{latency:.2f}s > {self.latency_tracker.sla_seconds}s"
-                    )
-                else:
-                    latency = self.latency_tracker.get_latency(session.id)
-                    logger.debug(
-                        f"Notification sent for session {session.id} in {latency:.2f}s"
-                    )
+                self.latency_tracker.record_delivery(session.id)
 
         elif old_state == AttentionState.WAITING:
             # Clear notification when no longer waiting
-            await self.notifier.clear_session_notification(session)
+            if self.dispatcher is not None:
+                await self.dispatcher.clear_session(session.id)
+            else:
+                await self.notifier.clear_session_notification(session)
             self.latency_tracker.clear_session(session.id)
 
+        if new_state == AttentionState.IDLE and self.settings.on_session_idle:
+            if self.dispatcher is not None:
+                if output_shows_error(session.last_output):
+                    self.dispatcher.submit(
+                        session.id,
+                        title=project.name,
+                        subtitle=session.template_id,
+                        message="Session stopped with an error",
+                        priority=NotificationPriority.ERROR,
+                        sound=self._sound(),
+                    )
+                    return
+                self.dispatcher.submit(
+                    session.id,
+                    title=project.name,
+                    subtitle=session.template_id,
+                    message="Session is idle",
+                    priority=NotificationPriority.IDLE,
+                    sound=None,
+                )
+            else:
+                await self.notifier.notify(
+                    title=project.name,
+                    subtitle=session.template_id,
+                    message="Session is idle",
+                    sound=None,
+                    group=f"session-{session.id}",
+                )
+
+    def _sound(self) -> str | None:
+        """Get the sound to play, or None if sounds are disabled."""
+        return self.settings.sound_name if self.settings.sound_enabled else None
+
     def get_latency_stats(self) -> dict:
         """Get notification latency statistics.
 
@@ -440,6 +1297,17 @@ class NotificationManager:
         """
         return self.latency_tracker.get_stats()
 
+    def get_latency_report(self, window_seconds: float | None = None) -> dict[str, Any]:
+        """Get per-stage latency percentiles and histograms.
+
+        Args:
+            window_seconds: Only include recent notifications (all if None).
+
+        Returns:
+            Report dictionary (see summarize_latencies).
+        """
+        return self.latency_tracker.get_report(window_seconds)
+
     def cleanup_session(self, session_id: str) -> None:
         """Clean up tracking data for a closed session.
 
@@ -449,8 +1317,16 @@ class NotificationManager:
         if session_id in self._pending_notifications:
             self._pending_notifications[session_id].cancel()
             del self._pending_notifications[session_id]
+        if self.dispatcher is not None:
+            self.dispatcher.forget_session(session_id)
         self.latency_tracker.clear_session(session_id)
 
+    async def close(self) -> None:
+        """Stop the dispatcher worker, if any, and finish latency log writes."""
+        if self.dispatcher is not None:
+            await self.dispatcher.stop()
+        await self.latency_tracker.flush_log()
+
 
 # =============================================================================
 # Session Monitor Integration
@@ -462,6 +1338,8 @@ class SessionMonitorWithNotifications:
 
     This class provides a callback that can be registered with the
     SessionMonitor to handle attention state changes and send notifications.
+    Notifications go through a NotificationDispatcher, so sessions that
+    change state in the same poll cycle produce one summary notification.
     """
 
     def __init__(
@@ -469,6 +1347,8 @@ class SessionMonitorWithNotifications:
         notifier: Notifier,
         state: AppState,
         settings: NotificationSettings | None = None,
+        dispatcher: NotificationDispatcher | None = None,
+        latency_log: Path | None = None,
     ) -> None:
         """Initialize the notification-enabled monitor wrapper.
 
@@ -476,8 +1356,46 @@ class SessionMonitorWithNotifications:
             notifier: The notifier to use.
             state: The application state.
             settings: Optional notification settings.
+            dispatcher: Dispatcher to coalesce notifications with. A default
+                one is created if not provided.
+            latency_log: File to append latency samples to, for reporting
+                from the CLI (see default_latency_log_path).
         """
-        self.notification_manager = NotificationManager(notifier, state, settings)
+        self.notification_manager = NotificationManager(
+            notifier,
+            state,
+            settings,
+            dispatcher or NotificationDispatcher(notifier),
+            latency_log=latency_log,
+        )
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    def attach(self, monitor: SessionMonitor) -> None:
+        """Register as a session monitor's attention state callback.
+
+        The monitor calls back synchronously, so each change is handled in
+        its own task.
+
+        Args:
+            monitor: The session monitor to receive state changes from.
+        """
+
+        def on_change(
+            session: ManagedSession, old_state: AttentionState, new_state: AttentionState
+        ) -> None:
+            task = asyncio.get_running_loop().create_task(
+                self.on_attention_change(session, old_state, new_state)
+            )
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+        monitor.on_attention_state_change = on_change
+
+    async def close(self) -> None:
+        """Finish handling state changes and stop delivering notifications."""
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        await self.notification_manager.close()
 
     async def on_attention_change(
         self,
@@ -507,6 +1425,17 @@ class SessionMonitorWithNotifications:
         """
         return self.notification_manager.get_latency_stats()
 
+    def get_latency_report(self, window_seconds: float | None = None) -> dict[str, Any]:
+        """Get per-stage latency percentiles and histograms.
+
+        Args:
+            window_seconds: Only include recent notifications (all if None).
+
+        Returns:
+            Report dictionary (see summarize_latencies).
+        """
+        return self.notification_manager.get_latency_report(window_seconds)
+
     def cleanup_session(self, session_id: str) -> None:
         """Clean up tracking data for a closed session.
 
@@ -523,8 +1452,15 @@ class SessionMonitorWithNotifications:
 # NotificationSettings is defined in models.py and can be imported from there.
 # This module provides the getter function for internal use.
 __all__ = [
+    "LatencySample",
     "Notifier",
+    "NotificationDispatcher",
     "NotificationLatencyTracker",
     "NotificationManager",
+    "NotificationPriority",
     "SessionMonitorWithNotifications",
+    "default_latency_log_path",
+    "load_latency_log",
+    "output_shows_error",
+    "summarize_latencies",
 ]
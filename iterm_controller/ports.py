@@ -2,7 +2,8 @@
 
 This module defines protocols (interfaces) for terminal operations, allowing the
 application to work with different terminal implementations (iTerm2, mock for testing,
-or potentially other terminal emulators in the future).
+or potentially other terminal emulators in the future). Desktop notifications
+are abstracted the same way, through NotificationBackend.
 
 The abstraction follows the "ports and adapters" (hexagonal) architecture pattern,
 where ports define the interfaces and adapters (like the iterm/ package) provide
@@ -465,6 +466,88 @@ class TerminalProvider(Protocol):
         ...
 
 
+# =============================================================================
+# Notification Backend Protocol
+# =============================================================================
+
+
+@dataclass
+class NotificationRequest:
+    """A desktop notification to deliver."""
+
+    title: str
+    """Notification title."""
+
+    message: str
+    """Notification body text."""
+
+    subtitle: str | None = None
+    """Optional subtitle."""
+
+    sound: str | None = None
+    """Sound to play, or None for silent."""
+
+    group: str = "iterm-controller"
+    """Group used to replace or remove related notifications."""
+
+
+@runtime_checkable
+class NotificationBackend(Protocol):
+    """Protocol for delivering desktop notifications.
+
+    Implementations wrap a platform notification mechanism (terminal-notifier
+    on macOS, notify-send on Linux) or record deliveries for tests.
+    """
+
+    name: str
+    """Short backend name for logs and error messages."""
+
+    @abstractmethod
+    async def check_available(self) -> tuple[bool, str | None]:
+        """Check whether notifications can be delivered.
+
+        Returns:
+            Tuple of (available, error_message).
+        """
+        ...
+
+    @abstractmethod
+    async def send(self, request: NotificationRequest) -> bool:
+        """Deliver one notification.
+
+        Args:
+            request: The notification to deliver.
+
+        Returns:
+            True if the notification was delivered.
+        """
+        ...
+
+    @abstractmethod
+    async def send_batch(self, requests: list[NotificationRequest]) -> list[bool]:
+        """Deliver several notifications, in order of the list.
+
+        Args:
+            requests: The notifications to deliver.
+
+        Returns:
+            Whether each notification was delivered, in the same order.
+        """
+        ...
+
+    @abstractmethod
+    async def remove_group(self, group: str) -> bool:
+        """Remove delivered notifications in a group.
+
+        Args:
+            group: The notification group.
+
+        Returns:
+            True if the notifications were removed.
+        """
+        ...
+
+
 # =============================================================================
 # Screen Factory Protocol
 # =============================================================================
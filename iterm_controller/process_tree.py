@@ -0,0 +1,459 @@
+"""Process table snapshots for resolving session process trees.
+
+Reads the whole process table in one pass into a pid-indexed snapshot so
+that descendant and ancestor lookups do not need a subprocess or syscall
+per process. ProcessTreeCache shares a recent snapshot between callers, so
+several lookups close together cost one scan.
+
+Three backends are supported, picked in order of preference:
+- psutil, when installed
+- /proc, on Linux
+- ``ps -axo``, as a last resort (macOS without psutil)
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import subprocess
+import threading
+import time
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# Default location of the proc filesystem
+PROC_ROOT = Path("/proc")
+
+
+@dataclass
+class ProcessInfo:
+    """A single row of the process table.
+
+    Attributes:
+        pid: Process ID.
+        ppid: Parent process ID.
+        cpu_seconds: Total user + system CPU time consumed so far.
+        rss_bytes: Resident set size in bytes.
+    """
+
+    pid: int
+    ppid: int
+    cpu_seconds: float = 0.0
+    rss_bytes: int = 0
+
+
+@dataclass
+class ProcessTable:
+    """Snapshot of the process table indexed by pid and by parent.
+
+    Attributes:
+        processes: Mapping of pid to ProcessInfo.
+        fd_counter: Optional callable returning the open FD count for a pid.
+    """
+
+    processes: dict[int, ProcessInfo] = field(default_factory=dict)
+    fd_counter: Callable[[int], int | None] | None = None
+    _children: dict[int, list[int]] | None = field(default=None, repr=False)
+
+    @classmethod
+    def from_processes(
+        cls,
+        processes: Iterable[ProcessInfo],
+        fd_counter: Callable[[int], int | None] | None = None,
+    ) -> ProcessTable:
+        """Build a table from process rows.
+
+        Args:
+            processes: Process rows to index.
+            fd_counter: Optional FD counting callable.
+
+        Returns:
+            A new ProcessTable.
+        """
+        return cls(processes={p.pid: p for p in processes}, fd_counter=fd_counter)
+
+    def __contains__(self, pid: object) -> bool:
+        return pid in self.processes
+
+    def __len__(self) -> int:
+        return len(self.processes)
+
+    def get(self, pid: int) -> ProcessInfo | None:
+        """Get the row for a pid.
+
+        Args:
+            pid: Process ID.
+
+        Returns:
+            ProcessInfo, or None if the process does not exist.
+        """
+        return self.processes.get(pid)
+
+    def children(self, pid: int) -> list[int]:
+        """Get direct children of a process.
+
+        The parent index is built lazily on first use.
+
+        Args:
+            pid: Parent process ID.
+
+        Returns:
+            List of child pids.
+        """
+        if self._children is None:
+            index: dict[int, list[int]] = {}
+            for info in self.processes.values():
+                if info.ppid != info.pid:
+                    index.setdefault(info.ppid, []).append(info.pid)
+            self._children = index
+        return self._children.get(pid, [])
+
+    def descendants(self, root_pid: int, include_root: bool = True) -> Iterator[ProcessInfo]:
+        """Iterate over a process and everything below it.
+
+        Args:
+            root_pid: Process ID at the top of the tree.
+            include_root: Whether to yield the root itself.
+
+        Yields:
+            ProcessInfo for each process in the tree that still exists.
+        """
+        stack = [root_pid] if include_root else list(self.children(root_pid))
+        seen: set[int] = set()
+        while stack:
+            pid = stack.pop()
+            if pid in seen:
+                continue
+            seen.add(pid)
+            info = self.processes.get(pid)
+            if info is None:
+                continue
+            yield info
+            stack.extend(self.children(pid))
+
+    def ancestors(self, pid: int, include_self: bool = True) -> list[int]:
+        """Get the parent chain of a process, nearest first.
+
+        Walks the pid-to-ppid index, so the cost is the depth of the chain.
+
+        Args:
+            pid: Process ID to start from.
+            include_self: Whether to include pid itself.
+
+        Returns:
+            Pids from pid (or its parent) up to the root of the table. With
+            include_self, pid is included even if it is not in the table.
+        """
+        chain = [pid] if include_self else []
+        seen = {pid}
+        info = self.processes.get(pid)
+        while info is not None and info.ppid > 0 and info.ppid not in seen:
+            chain.append(info.ppid)
+            seen.add(info.ppid)
+            info = self.processes.get(info.ppid)
+        return chain
+
+    def is_descendant(self, pid: int, ancestor_pid: int) -> bool:
+        """Check whether a process is ancestor_pid or runs below it.
+
+        Args:
+            pid: Process ID to check.
+            ancestor_pid: Process ID of the possible ancestor.
+
+        Returns:
+            True if ancestor_pid is in pid's parent chain (or is pid).
+        """
+        return ancestor_pid in self.ancestors(pid)
+
+    def count_fds(self, pid: int) -> int | None:
+        """Count open file descriptors for a process.
+
+        Args:
+            pid: Process ID.
+
+        Returns:
+            Number of open FDs, or None if unavailable.
+        """
+        if self.fd_counter is None:
+            return None
+        try:
+            return self.fd_counter(pid)
+        except Exception:
+            return None
+
+
+# =============================================================================
+# Backends
+# =============================================================================
+
+
+def read_proc_table(proc_root: Path = PROC_ROOT) -> ProcessTable:
+    """Read the process table from a /proc filesystem.
+
+    Args:
+        proc_root: Root of the proc filesystem (overridable for tests).
+
+    Returns:
+        ProcessTable with FD counting via /proc/<pid>/fd.
+    """
+    clock_ticks = os.sysconf("SC_CLK_TCK") if hasattr(os, "sysconf") else 100
+    page_size = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+    processes: list[ProcessInfo] = []
+    for entry in proc_root.iterdir():
+        if not entry.name.isdigit():
+            continue
+        try:
+            stat = (entry / "stat").read_text()
+        except OSError:
+            continue  # Process exited while we were scanning
+        info = _parse_proc_stat(stat, clock_ticks, page_size)
+        if info is not None:
+            processes.append(info)
+
+    def count_fds(pid: int) -> int | None:
+        try:
+            return len(os.listdir(proc_root / str(pid) / "fd"))
+        except OSError:
+            return None
+
+    return ProcessTable.from_processes(processes, fd_counter=count_fds)
+
+
+def _parse_proc_stat(stat: str, clock_ticks: int, page_size: int) -> ProcessInfo | None:
+    """Parse a /proc/<pid>/stat line.
+
+    The command name is wrapped in parentheses and may itself contain
+    spaces or parentheses, so fields are split after the last ')'.
+    """
+    open_paren = stat.find("(")
+    close_paren = stat.rfind(")")
+    if open_paren < 0 or close_paren < 0:
+        return None
+    try:
+        pid = int(stat[:open_paren].strip())
+        fields = stat[close_paren + 2 :].split()
+        # fields[0] is state (field 3); utime/stime are fields 14/15, rss is 24
+        ppid = int(fields[1])
+        utime = int(fields[11])
+        stime = int(fields[12])
+        rss_pages = int(fields[21])
+    except (ValueError, IndexError):
+        return None
+    return ProcessInfo(
+        pid=pid,
+        ppid=ppid,
+        cpu_seconds=(utime + stime) / clock_ticks,
+        rss_bytes=rss_pages * page_size,
+    )
+
+
+def read_psutil_table() -> ProcessTable:
+    """Read the process table using psutil.
+
+    Returns:
+        ProcessTable with FD counting via psutil.
+
+    Raises:
+        ImportError: If psutil is not installed.
+    """
+    import psutil
+
+    processes: list[ProcessInfo] = []
+    for proc in psutil.process_iter(["pid", "ppid", "cpu_times", "memory_info"]):
+        data = proc.info
+        cpu_times = data.get("cpu_times")
+        memory = data.get("memory_info")
+        processes.append(
+            ProcessInfo(
+                pid=data["pid"],
+                ppid=data.get("ppid") or 0,
+                cpu_seconds=(cpu_times.user + cpu_times.system) if cpu_times else 0.0,
+                rss_bytes=memory.rss if memory else 0,
+            )
+        )
+
+    def count_fds(pid: int) -> int | None:
+        try:
+            return int(psutil.Process(pid).num_fds())
+        except (psutil.Error, AttributeError):
+            return None
+
+    return ProcessTable.from_processes(processes, fd_counter=count_fds)
+
+
+def read_ps_table() -> ProcessTable:
+    """Read the process table with a single ``ps`` invocation.
+
+    FD counts are not available from ps.
+
+    Returns:
+        ProcessTable without FD counting.
+    """
+    result = subprocess.run(
+        ["ps", "-axo", "pid=,ppid=,rss=,time="],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    processes: list[ProcessInfo] = []
+    for line in result.stdout.splitlines():
+        parts = line.split()
+        if len(parts) < 4:
+            continue
+        try:
+            processes.append(
+                ProcessInfo(
+                    pid=int(parts[0]),
+                    ppid=int(parts[1]),
+                    rss_bytes=int(parts[2]) * 1024,
+                    cpu_seconds=_parse_ps_time(parts[3]),
+                )
+            )
+        except ValueError:
+            continue
+    return ProcessTable.from_processes(processes)
+
+
+def _parse_ps_time(value: str) -> float:
+    """Parse ps TIME output like ``1-02:03:04``, ``02:03:04`` or ``3:04.56``."""
+    days = 0
+    if "-" in value:
+        day_part, value = value.split("-", 1)
+        days = int(day_part)
+    seconds = 0.0
+    for part in value.split(":"):
+        seconds = seconds * 60 + float(part)
+    return days * 86400 + seconds
+
+
+def read_process_table() -> ProcessTable:
+    """Read the process table with the best available backend.
+
+    Returns:
+        ProcessTable snapshot (empty if every backend failed).
+    """
+    try:
+        return read_psutil_table()
+    except ImportError:
+        pass
+    except Exception as e:
+        logger.debug("psutil process scan failed: %s", e)
+
+    if PROC_ROOT.is_dir():
+        try:
+            return read_proc_table()
+        except OSError as e:
+            logger.debug("/proc process scan failed: %s", e)
+
+    try:
+        return read_ps_table()
+    except Exception as e:
+        logger.debug("ps process scan failed: %s", e)
+        return ProcessTable()
+
+
+# =============================================================================
+# Shared snapshots
+# =============================================================================
+
+
+class ProcessTreeCache:
+    """Hands out a process table snapshot, re-reading it when it gets old.
+
+    Callers that need the process tree at about the same time (finding the
+    TUI's tab, resource sampling) share one scan instead of each walking
+    the process table. Safe to use from worker threads.
+
+    Example:
+        cache = ProcessTreeCache(max_age=1.0)
+        table = await asyncio.to_thread(cache.snapshot)
+        chain = table.ancestors(os.getpid())
+    """
+
+    def __init__(
+        self,
+        reader: Callable[[], ProcessTable] = read_process_table,
+        max_age: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            reader: Reads a fresh process table.
+            max_age: Seconds a snapshot is reused for.
+            clock: Monotonic clock (injectable for tests).
+        """
+        self.reader = reader
+        self.max_age = max_age
+        self._clock = clock
+        self._table: ProcessTable | None = None
+        self._read_at = 0.0
+        self._lock = threading.Lock()
+
+    def snapshot(self, max_age: float | None = None) -> ProcessTable:
+        """Get a process table no older than max_age.
+
+        Blocks while the table is read, so call it from a worker thread in
+        async code.
+
+        Args:
+            max_age: Override of the cache's max_age for this call. Pass 0
+                to force a fresh read.
+
+        Returns:
+            The cached or freshly read ProcessTable.
+        """
+        limit = self.max_age if max_age is None else max_age
+        with self._lock:
+            now = self._clock()
+            if self._table is None or now - self._read_at > limit or limit <= 0:
+                self._table = self.reader()
+                self._read_at = self._clock()
+            return self._table
+
+    def invalidate(self) -> None:
+        """Drop the cached snapshot so the next call reads a fresh one."""
+        with self._lock:
+            self._table = None
+
+    def ancestors(self, pid: int) -> list[int]:
+        """Get a process's parent chain from a recent snapshot.
+
+        Args:
+            pid: Process ID to start from.
+
+        Returns:
+            Pids from pid up to the root, nearest first.
+        """
+        return self.snapshot().ancestors(pid)
+
+
+_shared_cache: ProcessTreeCache | None = None
+
+
+def get_process_tree_cache() -> ProcessTreeCache:
+    """Get the process tree cache shared across the application.
+
+    Returns:
+        The shared ProcessTreeCache, created on first use.
+    """
+    global _shared_cache
+    if _shared_cache is None:
+        _shared_cache = ProcessTreeCache()
+    return _shared_cache
+
+
+def read_shared_process_table() -> ProcessTable:
+    """Read a fresh process table and publish it through the shared cache.
+
+    For callers such as the resource sampler that need current data each
+    time. Other users of the shared cache then reuse the new snapshot.
+
+    Returns:
+        A freshly read ProcessTable.
+    """
+    return get_process_tree_cache().snapshot(max_age=0)
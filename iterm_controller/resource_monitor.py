@@ -0,0 +1,391 @@
+"""Per-session CPU, memory and file descriptor sampling.
+
+Resolves each managed session's process tree (shell plus everything it
+started) and samples CPU%, RSS and open FDs into a fixed-size ring buffer
+per session. Widgets render the buffers as sparklines.
+
+The sampling rate adapts to load: it speeds up while any session is busy
+and backs off while everything is quiet.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from iterm_controller.exceptions import record_error
+from iterm_controller.process_tree import ProcessTable, read_shared_process_table
+
+if TYPE_CHECKING:
+    from iterm_controller.iterm import ItermController
+    from iterm_controller.models import ManagedSession
+
+logger = logging.getLogger(__name__)
+
+# Characters used for sparklines, lowest to highest
+SPARKLINE_BLOCKS = "▁▂▃▄▅▆▇█"
+
+# Type aliases for injected dependencies
+SessionsProvider = Callable[[], Iterable["ManagedSession"]]
+PidResolver = Callable[[str], Awaitable["int | None"]]
+TableReader = Callable[[], ProcessTable]
+
+
+@dataclass
+class ResourceSample:
+    """Aggregate resource usage of one session's process tree.
+
+    Attributes:
+        timestamp: Monotonic time the sample was taken.
+        cpu_percent: CPU usage since the previous sample (100 = one core).
+        rss_bytes: Total resident memory across the tree.
+        open_fds: Total open file descriptors, or None if unavailable.
+        process_count: Number of processes in the tree.
+    """
+
+    timestamp: float
+    cpu_percent: float
+    rss_bytes: int
+    open_fds: int | None
+    process_count: int
+
+
+class ResourceTimeline:
+    """Fixed-size ring buffer of samples for one session."""
+
+    def __init__(self, max_samples: int = 120) -> None:
+        """Initialize the timeline.
+
+        Args:
+            max_samples: Number of samples kept; older ones are dropped.
+        """
+        self._samples: deque[ResourceSample] = deque(maxlen=max_samples)
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def append(self, sample: ResourceSample) -> None:
+        """Add a sample, evicting the oldest if full."""
+        self._samples.append(sample)
+
+    @property
+    def samples(self) -> list[ResourceSample]:
+        """Get all samples, oldest first."""
+        return list(self._samples)
+
+    @property
+    def latest(self) -> ResourceSample | None:
+        """Get the most recent sample."""
+        return self._samples[-1] if self._samples else None
+
+    def cpu_series(self) -> list[float]:
+        """Get CPU% values, oldest first."""
+        return [s.cpu_percent for s in self._samples]
+
+    def rss_series(self) -> list[int]:
+        """Get RSS values in bytes, oldest first."""
+        return [s.rss_bytes for s in self._samples]
+
+    @property
+    def peak_rss(self) -> int:
+        """Get the highest RSS seen in the buffer."""
+        return max((s.rss_bytes for s in self._samples), default=0)
+
+
+def render_sparkline(
+    values: Iterable[float], width: int = 20, max_value: float | None = None
+) -> str:
+    """Render values as a sparkline of block characters.
+
+    Args:
+        values: Values to plot, oldest first.
+        width: Maximum number of characters (most recent values are kept).
+        max_value: Value mapped to the tallest block (defaults to the max).
+
+    Returns:
+        Sparkline string, empty if there are no values.
+    """
+    points = list(values)[-width:]
+    if not points:
+        return ""
+    top = max_value if max_value is not None else max(points)
+    if top <= 0:
+        return SPARKLINE_BLOCKS[0] * len(points)
+    last = len(SPARKLINE_BLOCKS) - 1
+    return "".join(
+        SPARKLINE_BLOCKS[max(0, min(last, round(v / top * last)))] for v in points
+    )
+
+
+def format_bytes(num_bytes: int) -> str:
+    """Format a byte count compactly (e.g. ``512K``, ``1.2G``)."""
+    value = float(num_bytes)
+    for unit in ("B", "K", "M"):
+        if value < 1024:
+            return f"{value:.0f}{unit}" if unit != "M" else f"{value:.1f}{unit}"
+        value /= 1024
+    return f"{value:.1f}G"
+
+
+async def resolve_session_pid(controller: ItermController, session_id: str) -> int | None:
+    """Get the pid of the process iTerm2 started for a session.
+
+    Args:
+        controller: Connected iTerm2 controller.
+        session_id: iTerm2 session ID.
+
+    Returns:
+        The session's root pid, or None if unavailable.
+    """
+    if not controller.app:
+        return None
+    session = controller.app.get_session_by_id(session_id)
+    if session is None:
+        return None
+    pid = await session.async_get_variable("pid")
+    return int(pid) if pid else None
+
+
+class ResourceSampler:
+    """Samples resource usage for every managed session.
+
+    Each sample reads the whole process table once (off the event loop)
+    and aggregates every session's tree from that snapshot, so the cost is
+    one table scan per tick regardless of session count.
+
+    Example:
+        sampler = ResourceSampler(
+            sessions_provider=lambda: state.sessions.values(),
+            pid_resolver=lambda sid: resolve_session_pid(controller, sid),
+        )
+        await sampler.start()
+        timeline = sampler.get_timeline(session.id)
+    """
+
+    def __init__(
+        self,
+        sessions_provider: SessionsProvider | None = None,
+        pid_resolver: PidResolver | None = None,
+        table_reader: TableReader = read_shared_process_table,
+        max_samples: int = 120,
+        min_interval: float = 2.0,
+        max_interval: float = 15.0,
+        busy_cpu_percent: float = 10.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the sampler.
+
+        Args:
+            sessions_provider: Returns the sessions to sample each tick.
+            pid_resolver: Resolves a session ID to its root pid.
+            table_reader: Reads a process table snapshot.
+            max_samples: Ring buffer size per session.
+            min_interval: Fastest sampling interval in seconds.
+            max_interval: Slowest sampling interval in seconds.
+            busy_cpu_percent: CPU% above which a session counts as busy.
+            clock: Monotonic clock (injectable for tests).
+        """
+        self.sessions_provider = sessions_provider
+        self.pid_resolver = pid_resolver
+        self.table_reader = table_reader
+        self.max_samples = max_samples
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.busy_cpu_percent = busy_cpu_percent
+        self._clock = clock
+        self._root_pids: dict[str, int] = {}
+        self._timelines: dict[str, ResourceTimeline] = {}
+        self._last_cpu: dict[str, dict[int, float]] = {}
+        self._last_sampled_at: float | None = None
+        self._interval = min_interval
+        self._task: asyncio.Task[None] | None = None
+
+    # -------------------------------------------------------------------------
+    # Registration
+    # -------------------------------------------------------------------------
+
+    def register(self, session_id: str, root_pid: int) -> None:
+        """Start sampling a session's process tree.
+
+        Args:
+            session_id: The session ID.
+            root_pid: Pid of the session's shell (or other root process).
+        """
+        self._root_pids[session_id] = root_pid
+        self._timelines.setdefault(session_id, ResourceTimeline(self.max_samples))
+
+    def unregister(self, session_id: str) -> None:
+        """Stop sampling a session and drop its timeline.
+
+        Args:
+            session_id: The session ID.
+        """
+        self._root_pids.pop(session_id, None)
+        self._timelines.pop(session_id, None)
+        self._last_cpu.pop(session_id, None)
+
+    def get_timeline(self, session_id: str) -> ResourceTimeline | None:
+        """Get the sample history for a session.
+
+        Args:
+            session_id: The session ID.
+
+        Returns:
+            The session's timeline, or None if not sampled.
+        """
+        return self._timelines.get(session_id)
+
+    @property
+    def interval(self) -> float:
+        """Get the current sampling interval in seconds."""
+        return self._interval
+
+    @property
+    def session_ids(self) -> list[str]:
+        """Get the IDs of sampled sessions."""
+        return list(self._root_pids)
+
+    async def _sync_sessions(self) -> None:
+        """Register new sessions and drop ones that went away."""
+        if self.sessions_provider is None:
+            return
+        live = {s.id for s in self.sessions_provider() if s.is_active}
+        for session_id in list(self._root_pids):
+            if session_id not in live:
+                self.unregister(session_id)
+        if self.pid_resolver is None:
+            return
+        for session_id in live - self._root_pids.keys():
+            try:
+                pid = await self.pid_resolver(session_id)
+            except Exception as e:
+                logger.debug("Could not resolve pid for %s: %s", session_id, e)
+                continue
+            if pid:
+                self.register(session_id, pid)
+
+    # -------------------------------------------------------------------------
+    # Sampling
+    # -------------------------------------------------------------------------
+
+    async def sample_once(self) -> dict[str, ResourceSample]:
+        """Take one sample of every registered session.
+
+        Returns:
+            Mapping of session ID to the new sample.
+        """
+        await self._sync_sessions()
+        if not self._root_pids:
+            return {}
+
+        roots = dict(self._root_pids)
+        trees = await asyncio.to_thread(self._collect, roots)
+
+        now = self._clock()
+        elapsed = None if self._last_sampled_at is None else now - self._last_sampled_at
+        self._last_sampled_at = now
+
+        samples: dict[str, ResourceSample] = {}
+        for session_id, (cpu_by_pid, rss, fds) in trees.items():
+            timeline = self._timelines.get(session_id)
+            if timeline is None:
+                continue  # Unregistered while we were reading
+            previous = self._last_cpu.get(session_id, {})
+            self._last_cpu[session_id] = cpu_by_pid
+            cpu_percent = 0.0
+            if elapsed and elapsed > 0:
+                spent = 0.0
+                for pid, cpu in cpu_by_pid.items():
+                    # New processes count at most the elapsed wall time
+                    spent += max(0.0, cpu - previous[pid]) if pid in previous else min(
+                        cpu, elapsed
+                    )
+                cpu_percent = spent / elapsed * 100
+            sample = ResourceSample(
+                timestamp=now,
+                cpu_percent=cpu_percent,
+                rss_bytes=rss,
+                open_fds=fds,
+                process_count=len(cpu_by_pid),
+            )
+            timeline.append(sample)
+            samples[session_id] = sample
+
+        self._adapt_interval(samples)
+        return samples
+
+    def _collect(
+        self, roots: dict[str, int]
+    ) -> dict[str, tuple[dict[int, float], int, int | None]]:
+        """Read the process table and aggregate each session's tree.
+
+        Runs in a worker thread.
+
+        Returns:
+            Mapping of session ID to (cpu seconds by pid, total RSS, total FDs).
+        """
+        table = self.table_reader()
+        result: dict[str, tuple[dict[int, float], int, int | None]] = {}
+        for session_id, root_pid in roots.items():
+            cpu_by_pid: dict[int, float] = {}
+            rss = 0
+            fds: int | None = None
+            for info in table.descendants(root_pid):
+                cpu_by_pid[info.pid] = info.cpu_seconds
+                rss += info.rss_bytes
+                count = table.count_fds(info.pid)
+                if count is not None:
+                    fds = (fds or 0) + count
+            result[session_id] = (cpu_by_pid, rss, fds)
+        return result
+
+    def _adapt_interval(self, samples: dict[str, ResourceSample]) -> None:
+        """Sample faster while any session is busy, back off when quiet."""
+        busy = any(s.cpu_percent >= self.busy_cpu_percent for s in samples.values())
+        if busy:
+            self._interval = self.min_interval
+        else:
+            self._interval = min(self.max_interval, self._interval * 1.5)
+
+    # -------------------------------------------------------------------------
+    # Lifecycle
+    # -------------------------------------------------------------------------
+
+    async def start(self) -> None:
+        """Start the background sampling task."""
+        if self._task is not None and not self._task.done():
+            return
+        self._task = asyncio.create_task(self._run())
+        logger.debug("Resource sampler started")
+
+    async def stop(self) -> None:
+        """Stop the background sampling task."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        logger.debug("Resource sampler stopped")
+
+    @property
+    def is_running(self) -> bool:
+        """Check if the background task is running."""
+        return self._task is not None and not self._task.done()
+
+    async def _run(self) -> None:
+        """Sampling loop."""
+        while True:
+            try:
+                await self.sample_once()
+            except Exception as e:
+                logger.warning("Resource sampling failed: %s", e)
+                record_error(e)
+            await asyncio.sleep(self._interval)
@@ -0,0 +1,336 @@
+"""Classification of free-form review output.
+
+Extracts the verdict, blocking flag, issues and summary from a reviewer's
+output in a single pass. Reviews from long sessions can produce
+transcripts of a megabyte or more, so the text is scanned once with
+precompiled patterns instead of once per pattern.
+
+The patterns are grouped in a ReviewPatternSet, which can be replaced to
+tune classification for a particular reviewer.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+
+from iterm_controller.models import ReviewResult
+
+# Verdict categories, highest priority first
+_REJECTED = "rejected"
+_NEEDS_REVISION = "needs_revision"
+_APPROVED = "approved"
+_BLOCKING = "blocking"
+
+
+@dataclass(frozen=True)
+class ReviewPatternSet:
+    """Patterns used to classify review output.
+
+    Verdict patterns are checked in priority order: any rejection pattern
+    wins over revision patterns, which win over approval patterns. Output
+    that matches none is treated as needing revision. All patterns are
+    matched case-insensitively.
+
+    Attributes:
+        rejected: Patterns that mark the review as rejected.
+        needs_revision: Patterns that mark the review as needing revision.
+        approved: Patterns that mark the review as approved.
+        blocking: Patterns that mark the review as needing a human.
+        issue_labels: Words that introduce an issue (``Issue: ...``).
+        min_issue_length: Shorter bullet/numbered items are ignored.
+        max_issues: Maximum number of issues returned.
+        summary_min_chars: Summary collection stops past this length.
+        summary_max_chars: Summaries are truncated to this length.
+    """
+
+    rejected: tuple[str, ...] = (
+        r"\brejected\b",
+        r"\bblocking\s+issue\b",
+        r"\bcritical\s+(?:error|problem|issue)\b",
+        r"\bcannot\s+(?:approve|pass)\b",
+    )
+    needs_revision: tuple[str, ...] = (
+        r"\bneeds?\s+(?:revision|changes?|work)\b",
+        r"\brequires?\s+(?:changes?|updates?|fixes?)\b",
+        r"\bplease\s+(?:fix|update|change)\b",
+    )
+    approved: tuple[str, ...] = (
+        r"\bapproved\b",
+        r"\bpasses?\b(?:\s+(?:all|the))?\s+(?:review|tests?)",
+        r"\blgtm\b",
+        r"\ball\s+good\b",
+    )
+    blocking: tuple[str, ...] = (
+        r"\bblocking\b",
+        r"\bsecurity\s+(?:issue|vulnerability|risk)\b",
+        r"\bdata\s+(?:loss|corruption)\b",
+        r"\bbreaking\s+change\b",
+        r"\brequires?\s+human\b",
+        r"\bmanual\s+intervention\b",
+        r"\barchitectural\s+(?:issue|problem)\b",
+    )
+    issue_labels: tuple[str, ...] = ("issue", "problem", "error", "bug", "fix", "todo")
+    min_issue_length: int = 10
+    max_issues: int = 10
+    summary_min_chars: int = 200
+    summary_max_chars: int = 300
+
+
+DEFAULT_REVIEW_PATTERNS = ReviewPatternSet()
+
+
+@dataclass
+class ReviewClassification:
+    """Everything extracted from one review output.
+
+    Attributes:
+        result: The review verdict.
+        blocking: Whether the review needs human intervention.
+        issues: Issues found, in order, without duplicates.
+        summary: Short summary (the first prose paragraph).
+    """
+
+    result: ReviewResult
+    blocking: bool
+    issues: list[str] = field(default_factory=list)
+    summary: str = ""
+
+
+def _alternation(patterns: tuple[str, ...]) -> str:
+    return "|".join(f"(?:{p})" for p in patterns) or r"(?!)"
+
+
+class ReviewClassifier:
+    """Classifies review output in one pass over the text.
+
+    Verdict and blocking patterns are compiled into a single alternation
+    that is searched once through the text. Where it hits, the individual
+    categories are tested at the same position, so overlapping phrases
+    (``blocking issue`` is both a rejection and a blocking marker) count
+    for every category they match. Scanning stops early once the output is
+    known to be rejected and blocking.
+
+    Issues and the summary are collected during a single walk over the
+    lines; lines are only handed to a regex when a cheap prefix check says
+    they could match.
+
+    Example:
+        classifier = ReviewClassifier()
+        classification = classifier.classify(review_output)
+    """
+
+    def __init__(self, patterns: ReviewPatternSet = DEFAULT_REVIEW_PATTERNS) -> None:
+        """Compile a pattern set.
+
+        Args:
+            patterns: Patterns to classify with.
+        """
+        self.patterns = patterns
+        flags = re.IGNORECASE
+        self._categories: dict[str, re.Pattern[str]] = {
+            _REJECTED: re.compile(_alternation(patterns.rejected), flags),
+            _NEEDS_REVISION: re.compile(_alternation(patterns.needs_revision), flags),
+            _APPROVED: re.compile(_alternation(patterns.approved), flags),
+            _BLOCKING: re.compile(_alternation(patterns.blocking), flags),
+        }
+        self._any_marker = re.compile(
+            "|".join(
+                _alternation(getattr(patterns, name))
+                for name in ("rejected", "needs_revision", "approved", "blocking")
+            ),
+            flags,
+        )
+        self._bullet = re.compile(r"^\s*[-*•]\s+(.+?)$")
+        self._numbered = re.compile(r"^\s*\d+[.)]\s+(.+?)$")
+        self._label = re.compile(
+            rf"(?:{'|'.join(re.escape(label) for label in patterns.issue_labels)}):\s*(.*)$",
+            flags,
+        )
+
+    # -------------------------------------------------------------------------
+    # Public API
+    # -------------------------------------------------------------------------
+
+    def classify(self, output: str) -> ReviewClassification:
+        """Extract verdict, blocking flag, issues and summary.
+
+        Args:
+            output: Raw review output.
+
+        Returns:
+            The classification.
+        """
+        found = self._scan_markers(output)
+        issues, summary = self._scan_lines(output)
+        return ReviewClassification(
+            result=self._verdict(found),
+            blocking=_BLOCKING in found,
+            issues=issues,
+            summary=summary,
+        )
+
+    def detect_result(self, output: str) -> ReviewResult:
+        """Detect only the review verdict.
+
+        Args:
+            output: Review output (any case).
+
+        Returns:
+            Detected ReviewResult.
+        """
+        return self._verdict(self._scan_markers(output, stop_at={_REJECTED}))
+
+    def detect_blocking(self, output: str) -> bool:
+        """Detect only whether the review is blocking.
+
+        Args:
+            output: Review output (any case).
+
+        Returns:
+            True if a blocking pattern is present.
+        """
+        return self._categories[_BLOCKING].search(output) is not None
+
+    def extract_issues(self, output: str) -> list[str]:
+        """Extract only the issues.
+
+        Args:
+            output: Raw review output.
+
+        Returns:
+            Issue descriptions.
+        """
+        return self._scan_lines(output)[0]
+
+    def extract_summary(self, output: str) -> str:
+        """Extract only the summary.
+
+        Args:
+            output: Raw review output.
+
+        Returns:
+            Summary text.
+        """
+        return self._scan_lines(output, issues=False)[1]
+
+    # -------------------------------------------------------------------------
+    # Scanning
+    # -------------------------------------------------------------------------
+
+    def _scan_markers(
+        self, output: str, stop_at: set[str] | None = None
+    ) -> set[str]:
+        """Find which marker categories occur in the output.
+
+        Args:
+            output: Text to scan.
+            stop_at: Stop as soon as all of these categories are found
+                (defaults to rejected and blocking, which settle everything).
+
+        Returns:
+            Names of the categories found.
+        """
+        stop_at = stop_at or {_REJECTED, _BLOCKING}
+        found: set[str] = set()
+        search = self._any_marker.search
+        pos = 0
+        match = search(output, pos)
+        while match is not None:
+            start = match.start()
+            for name, pattern in self._categories.items():
+                if name not in found and pattern.match(output, start):
+                    found.add(name)
+            if stop_at <= found:
+                break
+            # Resume just past this hit's start so overlapping phrases are seen
+            match = search(output, start + 1)
+        return found
+
+    @staticmethod
+    def _verdict(found: set[str]) -> ReviewResult:
+        if _REJECTED in found:
+            return ReviewResult.REJECTED
+        if _NEEDS_REVISION in found:
+            return ReviewResult.NEEDS_REVISION
+        if _APPROVED in found:
+            return ReviewResult.APPROVED
+        return ReviewResult.NEEDS_REVISION
+
+    def _scan_lines(self, output: str, issues: bool = True) -> tuple[list[str], str]:
+        """Collect issues and the summary in one walk over the lines.
+
+        Issues are ordered as bullet items, then numbered items, then
+        labeled items (``Issue: ...``), with duplicates removed.
+
+        Args:
+            output: Raw review output.
+            issues: Whether to collect issues (the summary alone stops early).
+
+        Returns:
+            Tuple of (issues, summary).
+        """
+        patterns = self.patterns
+        min_length = patterns.min_issue_length
+        bullets: list[str] = []
+        numbered: list[str] = []
+        labeled: list[str] = []
+        label_pending = False
+
+        summary_lines: list[str] = []
+        summary_chars = 0
+        summary_done = False
+
+        for line in output.strip().split("\n"):
+            stripped = line.strip()
+
+            if not summary_done:
+                if not stripped or stripped.startswith(("#", "```")):
+                    summary_done = bool(summary_lines)
+                elif stripped[0] not in "-*•" and not stripped[0].isdigit():
+                    summary_lines.append(stripped)
+                    summary_chars += len(stripped)
+                    summary_done = summary_chars > patterns.summary_min_chars
+                if summary_done and not issues:
+                    break
+
+            if not issues or not stripped:
+                continue
+
+            # A label at the end of a line introduces the next non-blank line
+            continues_label = label_pending
+            if label_pending:
+                labeled.append(stripped)
+                label_pending = False
+
+            first = stripped[0]
+            if first in "-*•":
+                match = self._bullet.match(line)
+                if match:
+                    item = match.group(1).strip()
+                    if len(item) > min_length:
+                        bullets.append(item)
+            elif first.isdigit():
+                match = self._numbered.match(line)
+                if match:
+                    item = match.group(1).strip()
+                    if len(item) > min_length:
+                        numbered.append(item)
+
+            if not continues_label and ":" in line:
+                match = self._label.search(line)
+                if match:
+                    item = match.group(1).strip()
+                    if item:
+                        labeled.append(item)
+                    else:
+                        label_pending = True
+
+        summary = " ".join(summary_lines)
+        if len(summary) > patterns.summary_max_chars:
+            summary = summary[: patterns.summary_max_chars - 3] + "..."
+
+        if not issues:
+            return [], summary
+        unique = list(dict.fromkeys(bullets + numbered + labeled))
+        return unique[: patterns.max_issues], summary
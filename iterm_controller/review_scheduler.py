@@ -0,0 +1,303 @@
+"""Admission control for task reviews.
+
+Each review spawns a Claude session and usually a full test run, so
+running every triggered review at once overloads the machine. The
+ReviewScheduler queues reviews and runs them within a global and a
+per-project concurrency limit, highest priority first, and merges
+duplicate requests for the same task.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import bisect
+import itertools
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+from iterm_controller.exceptions import record_error
+
+logger = logging.getLogger(__name__)
+
+# Default concurrency limits
+DEFAULT_MAX_CONCURRENT_REVIEWS = 2
+DEFAULT_MAX_REVIEWS_PER_PROJECT = 1
+
+
+@dataclass
+class ReviewQueueStats:
+    """Snapshot of the review queue.
+
+    Attributes:
+        queued: Reviews waiting for a slot.
+        running: Reviews currently running.
+        max_concurrent: Global concurrency limit.
+        queued_by_project: Waiting reviews per project ID.
+        running_by_project: Running reviews per project ID.
+        oldest_wait_seconds: How long the longest-waiting review has queued.
+    """
+
+    queued: int = 0
+    running: int = 0
+    max_concurrent: int = DEFAULT_MAX_CONCURRENT_REVIEWS
+    queued_by_project: dict[str, int] = field(default_factory=dict)
+    running_by_project: dict[str, int] = field(default_factory=dict)
+    oldest_wait_seconds: float = 0.0
+
+    @property
+    def is_idle(self) -> bool:
+        """Check whether nothing is queued or running."""
+        return self.queued == 0 and self.running == 0
+
+
+@dataclass(order=True)
+class _ReviewRequest:
+    """A queued review, ordered by (priority, arrival)."""
+
+    priority: int
+    sequence: int
+    task_id: str = field(compare=False)
+    project_id: str = field(compare=False)
+    run: Callable[[], Awaitable[Any]] = field(compare=False, repr=False)
+    future: asyncio.Future[Any] = field(compare=False, repr=False)
+    enqueued_at: float = field(compare=False)
+
+
+class ReviewScheduler:
+    """Queues reviews and runs them within concurrency limits.
+
+    Lower priority values run first; ties run in arrival order. A project
+    that already uses its slots does not hold up other projects: the
+    scheduler skips past its queued reviews to the next eligible one.
+
+    Example:
+        scheduler = ReviewScheduler(max_concurrent=2, max_per_project=1)
+        review = await scheduler.submit(project.id, task.id, run_review)
+    """
+
+    def __init__(
+        self,
+        max_concurrent: int = DEFAULT_MAX_CONCURRENT_REVIEWS,
+        max_per_project: int = DEFAULT_MAX_REVIEWS_PER_PROJECT,
+        on_change: Callable[[ReviewQueueStats], None] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the scheduler.
+
+        Args:
+            max_concurrent: Maximum reviews running across all projects.
+            max_per_project: Maximum reviews running per project.
+            on_change: Called with fresh stats whenever the queue changes.
+            clock: Monotonic clock (injectable for tests).
+        """
+        self.max_concurrent = max_concurrent
+        self.max_per_project = max_per_project
+        self.on_change = on_change
+        self._clock = clock
+        self._queue: list[_ReviewRequest] = []
+        self._running: dict[str, _ReviewRequest] = {}
+        self._tasks: dict[str, asyncio.Task[None]] = {}
+        self._sequence = itertools.count()
+
+    # -------------------------------------------------------------------------
+    # Submission
+    # -------------------------------------------------------------------------
+
+    def submit(
+        self,
+        project_id: str,
+        task_id: str,
+        run: Callable[[], Awaitable[Any]],
+        priority: int = 0,
+    ) -> asyncio.Future[Any]:
+        """Queue a review.
+
+        If the task already has a queued or running review, no new review
+        is queued and the existing future is returned. A queued duplicate
+        with a better (lower) priority moves the existing request up.
+
+        Args:
+            project_id: Project the task belongs to.
+            task_id: Task to review.
+            run: Coroutine function that performs the review.
+            priority: Lower values run first.
+
+        Returns:
+            Future resolving to the result of ``run``.
+        """
+        running = self._running.get(task_id)
+        if running is not None:
+            logger.debug("Review for task %s already running", task_id)
+            return running.future
+
+        queued = self._find_queued(task_id)
+        if queued is not None:
+            if priority < queued.priority:
+                self._queue.remove(queued)
+                queued.priority = priority
+                bisect.insort(self._queue, queued)
+                self._notify()
+            logger.debug("Review for task %s already queued", task_id)
+            return queued.future
+
+        request = _ReviewRequest(
+            priority=priority,
+            sequence=next(self._sequence),
+            task_id=task_id,
+            project_id=project_id,
+            run=run,
+            future=asyncio.get_running_loop().create_future(),
+            enqueued_at=self._clock(),
+        )
+        bisect.insort(self._queue, request)
+        logger.info(
+            "Queued review for task %s (priority %d, %d queued)",
+            task_id,
+            priority,
+            len(self._queue),
+        )
+        self._dispatch()
+        self._notify()
+        return request.future
+
+    def cancel(self, task_id: str) -> bool:
+        """Drop a queued review. Running reviews are not interrupted.
+
+        Args:
+            task_id: Task whose queued review to drop.
+
+        Returns:
+            True if a queued review was removed.
+        """
+        request = self._find_queued(task_id)
+        if request is None:
+            return False
+        self._queue.remove(request)
+        request.future.cancel()
+        self._notify()
+        return True
+
+    # -------------------------------------------------------------------------
+    # Queries
+    # -------------------------------------------------------------------------
+
+    def is_pending(self, task_id: str) -> bool:
+        """Check whether a task has a queued or running review."""
+        return task_id in self._running or self._find_queued(task_id) is not None
+
+    def is_running(self, task_id: str) -> bool:
+        """Check whether a task's review is running."""
+        return task_id in self._running
+
+    def position(self, task_id: str) -> int | None:
+        """Get a task's 1-based position in the queue.
+
+        Args:
+            task_id: The task ID.
+
+        Returns:
+            Queue position, or None if the task is not queued.
+        """
+        for index, request in enumerate(self._queue, 1):
+            if request.task_id == task_id:
+                return index
+        return None
+
+    def stats(self) -> ReviewQueueStats:
+        """Get a snapshot of queue depth and slot usage."""
+        queued_by_project: dict[str, int] = {}
+        for request in self._queue:
+            queued_by_project[request.project_id] = (
+                queued_by_project.get(request.project_id, 0) + 1
+            )
+        now = self._clock()
+        oldest = min((r.enqueued_at for r in self._queue), default=now)
+        return ReviewQueueStats(
+            queued=len(self._queue),
+            running=len(self._running),
+            max_concurrent=self.max_concurrent,
+            queued_by_project=queued_by_project,
+            running_by_project=self._running_by_project(),
+            oldest_wait_seconds=now - oldest,
+        )
+
+    # -------------------------------------------------------------------------
+    # Dispatch
+    # -------------------------------------------------------------------------
+
+    def _find_queued(self, task_id: str) -> _ReviewRequest | None:
+        for request in self._queue:
+            if request.task_id == task_id:
+                return request
+        return None
+
+    def _running_by_project(self) -> dict[str, int]:
+        counts: dict[str, int] = {}
+        for request in self._running.values():
+            counts[request.project_id] = counts.get(request.project_id, 0) + 1
+        return counts
+
+    def _dispatch(self) -> None:
+        """Start queued reviews while slots are free."""
+        if len(self._running) >= self.max_concurrent:
+            return
+        per_project = self._running_by_project()
+        for request in list(self._queue):
+            if len(self._running) >= self.max_concurrent:
+                break
+            if per_project.get(request.project_id, 0) >= self.max_per_project:
+                continue
+            self._queue.remove(request)
+            per_project[request.project_id] = per_project.get(request.project_id, 0) + 1
+            self._running[request.task_id] = request
+            self._tasks[request.task_id] = asyncio.create_task(self._run(request))
+            logger.info(
+                "Starting review for task %s after %.1fs in queue",
+                request.task_id,
+                self._clock() - request.enqueued_at,
+            )
+
+    async def _run(self, request: _ReviewRequest) -> None:
+        """Run one review and hand its slot to the next request."""
+        try:
+            result = await request.run()
+        except asyncio.CancelledError:
+            request.future.cancel()
+            raise
+        except Exception as e:
+            if not request.future.done():
+                request.future.set_exception(e)
+        else:
+            if not request.future.done():
+                request.future.set_result(result)
+        finally:
+            self._running.pop(request.task_id, None)
+            self._tasks.pop(request.task_id, None)
+            self._dispatch()
+            self._notify()
+
+    def _notify(self) -> None:
+        if self.on_change is None:
+            return
+        try:
+            self.on_change(self.stats())
+        except Exception as e:
+            logger.warning("Review queue listener failed: %s", e)
+            record_error(e)
+
+    async def shutdown(self) -> None:
+        """Cancel queued and running reviews."""
+        for request in self._queue:
+            request.future.cancel()
+        self._queue.clear()
+        tasks = list(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+        for task in tasks:
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
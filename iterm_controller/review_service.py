@@ -15,6 +15,8 @@ import json
 import logging
 import re
 import uuid
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
@@ -33,16 +35,80 @@ from iterm_controller.models import (
     TaskReview,
     TaskStatus,
 )
+from iterm_controller.review_classifier import ReviewClassifier
+from iterm_controller.session_monitor import SessionOutputCapture
 
 if TYPE_CHECKING:
     from iterm_controller.git_service import GitService
     from iterm_controller.iterm.spawner import SessionSpawner
     from iterm_controller.notifications import Notifier
+    from iterm_controller.session_monitor import (
+        AttentionDetector,
+        SessionMonitor,
+        SessionOutputStream,
+    )
     from iterm_controller.state.plan_manager import PlanStateManager
 
 
 logger = logging.getLogger(__name__)
 
+# Maximum review output kept for parsing (the verdict is at the end)
+REVIEW_OUTPUT_MAX_BYTES = 256 * 1024
+
+# Number of cached test/lint outputs kept (keyed by project, tree and kind)
+CHECK_OUTPUT_CACHE_SIZE = 32
+
+# Bracketed paste markers, so a multi-line prompt is submitted as one message
+BRACKETED_PASTE_START = "\x1b[200~"
+BRACKETED_PASTE_END = "\x1b[201~"
+
+# Most seconds to wait for claude to show its input prompt before pasting
+REVIEW_STARTUP_TIMEOUT_SECONDS = 30.0
+
+# Quiet time after startup output before checking for claude's prompt
+REVIEW_STARTUP_SETTLE_SECONDS = 1.0
+
+# Captured lines at least this long that appear anywhere in the prompt are
+# treated as (wrapped) prompt echo
+_MIN_ECHO_FRAGMENT = 20
+
+# Decoration around echoed input lines (claude's input box and "> " prefix)
+_ECHO_DECORATION = " \t│>"
+
+
+def strip_prompt_echo(output: str, prompt: str) -> str:
+    """Remove the terminal's echo of a pasted prompt from captured output.
+
+    Everything up to the echo of the prompt's last line is dropped. Lines
+    after it that repeat the prompt (a redrawn or wrapped echo) are removed
+    too, so the diff, test and lint output in the prompt are never
+    mistaken for the reviewer's words.
+
+    Args:
+        output: Output captured after the prompt was submitted.
+        prompt: The prompt that was pasted.
+
+    Returns:
+        The output without the echoed prompt.
+    """
+    prompt_lines = [line.strip(_ECHO_DECORATION) for line in prompt.splitlines()]
+    prompt_set = {line for line in prompt_lines if line}
+    if not prompt_set:
+        return output
+    last = next(line for line in reversed(prompt_lines) if line)
+    pos = output.rfind(last)
+    if pos != -1:
+        end = output.find("\n", pos)
+        output = "" if end == -1 else output[end + 1 :]
+
+    def is_echo(line: str) -> bool:
+        line = line.strip(_ECHO_DECORATION)
+        if not line:
+            return False
+        return line in prompt_set or (len(line) >= _MIN_ECHO_FRAGMENT and line in prompt)
+
+    return "\n".join(line for line in output.split("\n") if not is_echo(line))
+
 
 # =============================================================================
 # Exceptions
@@ -140,33 +206,14 @@ class ReviewService:
         notifier: Optional notifier for sending alerts.
     """
 
-    # Patterns for detecting review results in output
-    _APPROVED_PATTERNS = [
-        r"\bapproved\b",
-        r"\bpasses?\b(?:\s+(?:all|the))?\s+(?:review|tests?)",
-        r"\blgtm\b",
-        r"\ball\s+good\b",
-    ]
-
-    _NEEDS_REVISION_PATTERNS = [
-        r"\bneeds?\s+(?:revision|changes?|work)\b",
-        r"\brequires?\s+(?:changes?|updates?|fixes?)\b",
-        r"\bplease\s+(?:fix|update|change)\b",
-    ]
-
-    _REJECTED_PATTERNS = [
-        r"\brejected\b",
-        r"\bblocking\s+issue\b",
-        r"\bcritical\s+(?:error|problem|issue)\b",
-        r"\bcannot\s+(?:approve|pass)\b",
-    ]
-
     def __init__(
         self,
         session_spawner: SessionSpawner,
         git_service: GitService,
         plan_manager: PlanStateManager,
         notifier: Notifier | None = None,
+        session_monitor: SessionMonitor | None = None,
+        classifier: ReviewClassifier | None = None,
     ) -> None:
         """Initialize the review service.
 
@@ -175,15 +222,30 @@ class ReviewService:
             git_service: Service for git operations.
             plan_manager: Manager for updating task status.
             notifier: Optional notifier for alerts.
+            session_monitor: Monitor used to capture review session output.
+                Without it the review session is spawned but its output
+                is not captured.
+            classifier: Classifier for review output. Defaults to one with
+                the standard pattern set.
         """
         self.session_spawner = session_spawner
         self.git_service = git_service
         self.plan_manager = plan_manager
         self.notifier = notifier
+        self.session_monitor = session_monitor
+        self.classifier = classifier or ReviewClassifier()
+        self.startup_timeout = REVIEW_STARTUP_TIMEOUT_SECONDS
+        self.startup_settle = REVIEW_STARTUP_SETTLE_SECONDS
 
         # Track active reviews
         self._active_reviews: dict[str, TaskReview] = {}
 
+        # Test/lint output by (project path, worktree hash, kind). Values
+        # are tasks so concurrent reviews of the same tree share one run.
+        self._check_cache: OrderedDict[
+            tuple[str, str, str], asyncio.Task[str | None]
+        ] = OrderedDict()
+
     # =========================================================================
     # Public API
     # =========================================================================
@@ -219,26 +281,29 @@ class ReviewService:
             if config.include_task_definition:
                 context.task_definition = self._format_task_definition(task)
 
-            if config.include_git_diff:
-                try:
-                    base_branch = (
-                        project.git_config.default_branch
-                        if project.git_config
-                        else "main"
-                    )
-                    context.git_diff = await self.git_service.get_diff(
-                        Path(project.path),
-                        base_branch=base_branch,
-                    )
-                except Exception as e:
-                    logger.warning(f"Failed to get git diff for review: {e}")
-                    context.git_diff = f"[Error getting diff: {e}]"
-
-            if config.include_test_results:
-                context.test_results = await self._run_tests(project)
-
-            if config.include_lint_results:
-                context.lint_results = await self._run_lint(project)
+            # Diff, tests and lint are independent; gather them concurrently.
+            # Tests and lint share one worktree hash for their cache key.
+            tree_hash: asyncio.Task[str | None] | None = None
+            if config.include_test_results or config.include_lint_results:
+                tree_hash = asyncio.ensure_future(self._get_worktree_hash(project))
+
+            async def nothing() -> str | None:
+                return None
+
+            git_diff, test_results, lint_results = await asyncio.gather(
+                self._get_review_diff(project, config)
+                if config.include_git_diff
+                else nothing(),
+                self._get_check_output(project, "tests", self._run_tests, tree_hash)
+                if config.include_test_results and tree_hash is not None
+                else nothing(),
+                self._get_check_output(project, "lint", self._run_lint, tree_hash)
+                if config.include_lint_results and tree_hash is not None
+                else nothing(),
+            )
+            context.git_diff = git_diff
+            context.test_results = test_results
+            context.lint_results = lint_results
 
         except Exception as e:
             raise ReviewContextError(
@@ -326,6 +391,10 @@ class ReviewService:
 
         return review
 
+    def clear_check_cache(self) -> None:
+        """Forget all cached test and lint outputs."""
+        self._check_cache.clear()
+
     def get_active_review(self, task_id: str) -> TaskReview | None:
         """Get the currently active review for a task.
 
@@ -418,21 +487,17 @@ class ReviewService:
                 session.session_type = SessionType.REVIEW
                 session.task_id = task.id
 
-            # In a real implementation, we would:
-            # 1. Send the prompt to the session
-            # 2. Monitor output for completion markers
-            # 3. Capture and return the review output
-            #
-            # For now, we'll simulate waiting for output
-            # The actual implementation would use the session monitor
-            # to capture output and detect when the review is complete.
-
-            # Wait a reasonable time for review (this is a placeholder)
-            await asyncio.sleep(0.1)
+            if self.session_monitor is None:
+                logger.warning(
+                    "No session monitor; review output for task %s is not captured",
+                    task.id,
+                )
+                return f"[Review output capture unavailable]\n\nContext:\n{prompt}"
 
-            # Return placeholder - in production this would be captured output
-            logger.info(f"Review session spawned for task {task.id}")
-            return f"[Review session spawned - output capture not yet implemented]\n\nContext:\n{prompt}"
+            config = project.review_config or ReviewConfig()
+            return await self._capture_review_output(
+                result.session_id, task, prompt, config
+            )
 
         except ReviewCommandError:
             raise
@@ -443,6 +508,132 @@ class ReviewService:
                 cause=e,
             ) from e
 
+    async def _capture_review_output(
+        self,
+        session_id: str,
+        task: Task,
+        prompt: str,
+        config: ReviewConfig,
+    ) -> str:
+        """Send the review prompt and capture output until the review ends.
+
+        Output arrives through the session monitor's output stream; the
+        wait is event-driven, so concurrent reviews do not poll. The prompt
+        is pasted once claude shows its input prompt, and only output after
+        the submitted prompt's echo, up to the completion marker, is kept.
+
+        Args:
+            session_id: ID of the spawned review session.
+            task: Task being reviewed.
+            prompt: Formatted review prompt.
+            config: Review settings (completion marker, timeout).
+
+        Returns:
+            Captured review output.
+
+        Raises:
+            ReviewCommandError: If the review does not finish in time.
+        """
+        monitor = self.session_monitor
+        assert monitor is not None
+        if not monitor.is_running:
+            await monitor.start()
+
+        stream = monitor.get_output_stream(session_id)
+        await self._wait_until_ready(stream, monitor.detector, session_id)
+
+        marker = config.completion_marker
+        patterns = (
+            [re.compile(rf"^\s*{re.escape(marker)}\s*$", re.MULTILINE)] if marker else []
+        )
+        if marker:
+            prompt += f"\n\nWhen the review is finished, print {marker} on its own line."
+        capture = SessionOutputCapture(
+            stream,
+            detector=monitor.detector,
+            completion_patterns=patterns,
+            max_bytes=REVIEW_OUTPUT_MAX_BYTES,
+            transform=lambda text: strip_prompt_echo(text, prompt),
+        )
+
+        async with capture:
+            await self._send_prompt(session_id, prompt)
+            logger.info("Review session %s started for task %s", session_id, task.id)
+            finished = await capture.wait(config.timeout_seconds)
+
+        if not finished:
+            raise ReviewCommandError(
+                f"Review timed out after {config.timeout_seconds:.0f}s",
+                context={
+                    "task_id": task.id,
+                    "session_id": session_id,
+                    "captured_bytes": len(capture.text),
+                },
+            )
+
+        logger.debug(
+            "Review for task %s finished (%s, %d chars%s)",
+            task.id,
+            capture.completion_reason,
+            len(capture.text),
+            ", truncated" if capture.truncated else "",
+        )
+        output = capture.text
+        for pattern in patterns:
+            # Whatever follows the marker is the session going idle again
+            match = pattern.search(output)
+            if match:
+                output = output[: match.start()]
+        return output
+
+    async def _wait_until_ready(
+        self, stream: SessionOutputStream, detector: AttentionDetector, session_id: str
+    ) -> None:
+        """Wait for a freshly spawned review session to show its input prompt.
+
+        Pasting before claude has started loses or garbles the prompt, and
+        startup output would otherwise be captured as review output. If no
+        prompt shows up within the startup timeout, the prompt is pasted
+        anyway.
+
+        Args:
+            stream: The session's output stream.
+            detector: Attention detector used to recognise the prompt.
+            session_id: ID of the review session (for logging).
+        """
+        startup = SessionOutputCapture(
+            stream, detector=detector, settle_seconds=self.startup_settle
+        )
+        async with startup:
+            ready = await startup.wait(self.startup_timeout)
+        if not ready:
+            logger.warning(
+                "Review session %s showed no prompt within %.0fs; sending prompt anyway",
+                session_id,
+                self.startup_timeout,
+            )
+
+    async def _send_prompt(self, session_id: str, prompt: str) -> None:
+        """Paste the review prompt into the review session.
+
+        Args:
+            session_id: iTerm2 session ID.
+            prompt: Prompt text to submit.
+
+        Raises:
+            ReviewCommandError: If the session cannot be found.
+        """
+        app = self.session_spawner.controller.app
+        iterm_session = app.get_session_by_id(session_id) if app else None
+        if iterm_session is None:
+            raise ReviewCommandError(
+                f"Review session {session_id} not found",
+                context={"session_id": session_id},
+            )
+        await iterm_session.async_send_text(
+            f"{BRACKETED_PASTE_START}{prompt}{BRACKETED_PASTE_END}\r"
+        )
+
     async def _get_project_window(self, project: Project) -> Any:
         """Get the iTerm2 window for a project's sessions.
 
@@ -484,9 +675,10 @@ class ReviewService:
     ) -> ParsedReviewResult:
         """Parse review output to extract structured result.
 
-        Uses pattern matching to determine the review result and extract
-        issues. In the future, this could use a parser subagent for more
-        sophisticated interpretation.
+        Uses the review classifier, which extracts the verdict, blocking
+        flag, issues and summary in one pass over the output. In the
+        future, this could use a parser subagent for more sophisticated
+        interpretation.
 
         Args:
             raw_output: Free-form review output.
@@ -495,56 +687,27 @@ class ReviewService:
         Returns:
             ParsedReviewResult with structured data.
         """
-        output_lower = raw_output.lower()
-
-        # Determine result based on patterns
-        result = self._detect_result(output_lower)
-
-        # Extract issues (look for bullet points, numbered items, or "issue:" patterns)
-        issues = self._extract_issues(raw_output)
-
-        # Extract summary (first paragraph or sentence)
-        summary = self._extract_summary(raw_output)
-
-        # Check for blocking indicators
-        blocking = self._detect_blocking(output_lower)
-
+        classification = self.classifier.classify(raw_output)
         return ParsedReviewResult(
-            result=result,
-            issues=issues,
-            summary=summary,
-            blocking=blocking,
+            result=classification.result,
+            issues=classification.issues,
+            summary=classification.summary,
+            blocking=classification.blocking,
         )
 
     def _detect_result(self, output_lower: str) -> ReviewResult:
         """Detect the review result from output text.
 
-        Checks for approval, revision, or rejection patterns.
+        Rejection wins over revision, which wins over approval.
         Defaults to NEEDS_REVISION if unclear.
 
         Args:
-            output_lower: Lowercase output text.
+            output_lower: Output text (matched case-insensitively).
 
         Returns:
             Detected ReviewResult.
         """
-        # Check for rejection first (highest priority)
-        for pattern in self._REJECTED_PATTERNS:
-            if re.search(pattern, output_lower):
-                return ReviewResult.REJECTED
-
-        # Check for needs revision
-        for pattern in self._NEEDS_REVISION_PATTERNS:
-            if re.search(pattern, output_lower):
-                return ReviewResult.NEEDS_REVISION
-
-        # Check for approval
-        for pattern in self._APPROVED_PATTERNS:
-            if re.search(pattern, output_lower):
-                return ReviewResult.APPROVED
-
-        # Default to needs revision if unclear
-        return ReviewResult.NEEDS_REVISION
+        return self.classifier.detect_result(output_lower)
 
     def _extract_issues(self, output: str) -> list[str]:
         """Extract issues from review output.
@@ -557,38 +720,7 @@ class ReviewService:
         Returns:
             List of issue descriptions.
         """
-        issues: list[str] = []
-
-        # Match bullet points: - text, * text, • text
-        bullet_pattern = r"^[\s]*[-*•]\s+(.+?)$"
-        for match in re.finditer(bullet_pattern, output, re.MULTILINE):
-            issue = match.group(1).strip()
-            if issue and len(issue) > 10:  # Skip very short items
-                issues.append(issue)
-
-        # Match numbered items: 1. text, 1) text
-        numbered_pattern = r"^[\s]*\d+[.)]\s+(.+?)$"
-        for match in re.finditer(numbered_pattern, output, re.MULTILINE):
-            issue = match.group(1).strip()
-            if issue and len(issue) > 10:
-                issues.append(issue)
-
-        # Match "Issue:" or "Problem:" patterns
-        issue_pattern = r"(?:issue|problem|error|bug|fix|todo):\s*(.+?)(?:\n|$)"
-        for match in re.finditer(issue_pattern, output, re.IGNORECASE):
-            issue = match.group(1).strip()
-            if issue:
-                issues.append(issue)
-
-        # Deduplicate while preserving order
-        seen = set()
-        unique_issues = []
-        for issue in issues:
-            if issue not in seen:
-                seen.add(issue)
-                unique_issues.append(issue)
-
-        return unique_issues[:10]  # Limit to 10 issues
+        return self.classifier.extract_issues(output)
 
     def _extract_summary(self, output: str) -> str:
         """Extract a summary from review output.
@@ -601,36 +733,7 @@ class ReviewService:
         Returns:
             Summary text (1-2 sentences).
         """
-        # Skip any leading whitespace or headers
-        lines = output.strip().split("\n")
-
-        summary_lines = []
-        for line in lines:
-            line = line.strip()
-
-            # Skip empty lines, headers, and code blocks
-            if not line or line.startswith("#") or line.startswith("```"):
-                if summary_lines:
-                    break
-                continue
-
-            # Skip bullet points and numbered items
-            if re.match(r"^[-*•\d]", line):
-                continue
-
-            summary_lines.append(line)
-
-            # Stop after ~200 characters
-            if sum(len(l) for l in summary_lines) > 200:
-                break
-
-        summary = " ".join(summary_lines)
-
-        # Truncate if too long
-        if len(summary) > 300:
-            summary = summary[:297] + "..."
-
-        return summary
+        return self.classifier.extract_summary(output)
 
     def _detect_blocking(self, output_lower: str) -> bool:
         """Detect if the review indicates a blocking issue.
@@ -639,26 +742,12 @@ class ReviewService:
         the number of revision attempts.
 
         Args:
-            output_lower: Lowercase output text.
+            output_lower: Output text (matched case-insensitively).
 
         Returns:
             True if blocking, False otherwise.
         """
-        blocking_patterns = [
-            r"\bblocking\b",
-            r"\bsecurity\s+(?:issue|vulnerability|risk)\b",
-            r"\bdata\s+(?:loss|corruption)\b",
-            r"\bbreaking\s+change\b",
-            r"\brequires?\s+human\b",
-            r"\bmanual\s+intervention\b",
-            r"\barchitectural\s+(?:issue|problem)\b",
-        ]
-
-        for pattern in blocking_patterns:
-            if re.search(pattern, output_lower):
-                return True
-
-        return False
+        return self.classifier.detect_blocking(output_lower)
 
     # =========================================================================
     # Result Handling
@@ -785,6 +874,94 @@ class ReviewService:
 
         return "\n\n".join(sections)
 
+    # =========================================================================
+    # Context Sources
+    # =========================================================================
+
+    async def _get_review_diff(
+        self, project: Project, config: ReviewContextConfig
+    ) -> str:
+        """Get the diff against the base branch, or an error note.
+
+        Args:
+            project: The project being reviewed.
+            config: Context config (for the diff size cap).
+
+        Returns:
+            The diff text, or a bracketed error message.
+        """
+        try:
+            base_branch = (
+                project.git_config.default_branch if project.git_config else "main"
+            )
+            return await self.git_service.get_diff(
+                Path(project.path),
+                base_branch=base_branch,
+                max_total_bytes=config.max_diff_bytes,
+            )
+        except Exception as e:
+            logger.warning(f"Failed to get git diff for review: {e}")
+            return f"[Error getting diff: {e}]"
+
+    async def _get_worktree_hash(self, project: Project) -> str | None:
+        """Get the project's worktree hash for caching, if available.
+
+        Args:
+            project: The project being reviewed.
+
+        Returns:
+            The worktree hash, or None if it could not be computed.
+        """
+        try:
+            return await self.git_service.get_worktree_hash(Path(project.path))
+        except Exception as e:
+            logger.debug("No worktree hash for %s, not caching: %s", project.path, e)
+            return None
+
+    async def _get_check_output(
+        self,
+        project: Project,
+        kind: str,
+        runner: Callable[[Project], Awaitable[str | None]],
+        tree_hash: Awaitable[str | None],
+    ) -> str | None:
+        """Run a test or lint command, reusing output for an unchanged tree.
+
+        Args:
+            project: The project being reviewed.
+            kind: Cache namespace ("tests" or "lint").
+            runner: Coroutine function that runs the command.
+            tree_hash: Resolves to the worktree hash, or None to skip caching.
+
+        Returns:
+            The command output, or None if nothing could be run.
+        """
+        digest = await tree_hash
+        if digest is None:
+            return await runner(project)
+
+        key = (project.path, digest, kind)
+        cached = self._check_cache.get(key)
+        if cached is not None:
+            self._check_cache.move_to_end(key)
+            logger.debug("Reusing %s output for %s at %s", kind, project.path, digest[:12])
+            return await asyncio.shield(cached)
+
+        run = asyncio.ensure_future(runner(project))
+        self._check_cache[key] = run
+        while len(self._check_cache) > CHECK_OUTPUT_CACHE_SIZE:
+            self._check_cache.popitem(last=False)
+        try:
+            # Shielded so a cancelled review does not kill a run others share
+            return await asyncio.shield(run)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            # Do not cache failures
+            if self._check_cache.get(key) is run:
+                del self._check_cache[key]
+            raise
+
     async def _run_tests(self, project: Project) -> str | None:
         """Run tests and capture output.
 
@@ -832,7 +1009,7 @@ class ReviewService:
                     timeout=120,  # 2 minute timeout
                 )
                 return stdout.decode(errors="replace")
-            except asyncio.TimeoutError:
+            except TimeoutError:
                 return "[Test timeout after 2 minutes]"
             except Exception as e:
                 logger.debug(f"Test command '{cmd}' failed: {e}")
@@ -880,7 +1057,7 @@ class ReviewService:
                     timeout=60,  # 1 minute timeout
                 )
                 return stdout.decode(errors="replace")
-            except asyncio.TimeoutError:
+            except TimeoutError:
                 return "[Lint timeout after 1 minute]"
             except Exception as e:
                 logger.debug(f"Lint command '{cmd}' failed: {e}")
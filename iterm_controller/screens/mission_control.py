@@ -23,6 +23,7 @@ from iterm_controller.state import (
     SessionClosed,
     SessionOutputUpdated,
     SessionSpawned,
+    SessionsReconciled,
     SessionStatusChanged,
 )
 from iterm_controller.widgets import SessionList
@@ -35,6 +36,9 @@ logger = logging.getLogger(__name__)
 # Debounce interval for UI refresh (in seconds)
 REFRESH_DEBOUNCE_SECONDS = 0.1  # 100ms
 
+# How often resource sparklines are redrawn from the sampler's buffers
+RESOURCE_REFRESH_SECONDS = 2.0
+
 
 class MissionControlScreen(Screen):
     """Main mission control showing live output from all active sessions.
@@ -164,6 +168,17 @@ class MissionControlScreen(Screen):
     async def on_mount(self) -> None:
         """Load sessions when screen mounts."""
         await self.refresh_sessions()
+        self.set_interval(RESOURCE_REFRESH_SECONDS, self.refresh_resources)
+
+    def refresh_resources(self) -> None:
+        """Redraw resource sparklines from the sampler's ring buffers."""
+        app: ItermControllerApp = self.app  # type: ignore[assignment]
+        sampler = app.services.resources
+        session_list = self.query_one("#session-list", SessionList)
+        for session in session_list.sessions:
+            timeline = sampler.get_timeline(session.id)
+            if timeline is not None:
+                session_list.update_session_resources(session.id, timeline)
 
     async def refresh_sessions(self) -> None:
         """Refresh session list from state."""
@@ -424,8 +439,18 @@ class MissionControlScreen(Screen):
 
         Uses debounced refresh to batch multiple rapid events.
         """
+        self._remove_sessions([event.session.id])
+
+    def on_sessions_reconciled(self, event: SessionsReconciled) -> None:
+        """Handle sessions that vanished from iTerm2, all at once."""
+        if event.closed:
+            self._remove_sessions([session.id for session in event.closed])
+
+    def _remove_sessions(self, session_ids: list[str]) -> None:
+        """Remove sessions from the list and update the count."""
         session_list = self.query_one("#session-list", SessionList)
-        session_list.remove_session(event.session.id)
+        for session_id in session_ids:
+            session_list.remove_session(session_id)
 
         # Update count
         count = session_list.session_count
@@ -134,8 +134,16 @@ class GitHubActionsModal(ModalScreen[None]):
 
         await self._load_runs()
 
-    async def _load_runs(self) -> None:
-        """Load workflow runs from GitHub."""
+    async def _load_runs(self, force: bool = False) -> None:
+        """Load workflow runs from the GitHub poller's cache.
+
+        The poller owns all GitHub fetches. A cache miss or an explicit
+        refresh asks the poller to fetch (subject to its rate-limit budget)
+        rather than calling gh directly.
+
+        Args:
+            force: Whether to ask the poller for a fresh fetch.
+        """
         self._loading = True
         self._error = None
 
@@ -155,8 +163,12 @@ class GitHubActionsModal(ModalScreen[None]):
             self._update_display()
             return
 
+        poller = app.services.github_poller
         try:
-            runs_data = await app.github.get_workflow_runs(self._project_path)
+            runs_data = poller.get_cached_runs(self._project_path)
+            if runs_data is None or force:
+                await poller.refresh(self._project_path, include_runs=True)
+                runs_data = poller.get_cached_runs(self._project_path) or []
             self._runs = [
                 WorkflowRun(
                     id=r["id"],
@@ -281,11 +293,11 @@ class GitHubActionsModal(ModalScreen[None]):
         if button_id == "close-button":
             self.dismiss(None)
         elif button_id == "refresh-button":
-            await self._load_runs()
+            await self._load_runs(force=True)
 
     async def action_refresh(self) -> None:
         """Refresh workflow runs."""
-        await self._load_runs()
+        await self._load_runs(force=True)
 
     def action_dismiss(self) -> None:
         """Close the modal."""
@@ -6,7 +6,7 @@ Displays full review output including issues and allows approve/reject/revise ac
 from __future__ import annotations
 
 from enum import Enum
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from textual.app import ComposeResult
 from textual.binding import Binding
@@ -16,6 +16,9 @@ from textual.widgets import Button, Static
 
 from iterm_controller.models import ReviewResult, Task, TaskReview
 
+if TYPE_CHECKING:
+    from iterm_controller.review_scheduler import ReviewQueueStats
+
 
 class ReviewAction(Enum):
     """Actions that can be taken on a review."""
@@ -148,6 +151,8 @@ class ReviewDetailModal(ModalScreen[ReviewAction]):
         self,
         review_task: Task,
         review: TaskReview | None = None,
+        queue_position: int | None = None,
+        queue_stats: ReviewQueueStats | None = None,
         **kwargs: Any,
     ) -> None:
         """Initialize the review detail modal.
@@ -155,11 +160,16 @@ class ReviewDetailModal(ModalScreen[ReviewAction]):
         Args:
             review_task: The task being reviewed.
             review: The review to display. If None, uses review_task.current_review.
+            queue_position: Position of the task's review in the queue, if
+                it is waiting for a slot.
+            queue_stats: Review queue snapshot for the queue depth line.
             **kwargs: Additional arguments passed to ModalScreen.
         """
         super().__init__(**kwargs)
         self._review_target = review_task
         self._review = review or review_task.current_review
+        self._queue_position = queue_position
+        self._queue_stats = queue_stats
 
     @property
     def review_task(self) -> Task:
@@ -177,6 +187,7 @@ class ReviewDetailModal(ModalScreen[ReviewAction]):
             Static(f"Review: {self._review_target.id}", classes="modal-title"),
             Static(self._review_target.title, classes="task-title"),
             self._build_review_status(),
+            Static(self._format_queue_info(), id="queue-info", classes="hint"),
             Static("Summary", classes="section-header"),
             ScrollableContainer(
                 Static(id="summary-text"),
@@ -199,6 +210,13 @@ class ReviewDetailModal(ModalScreen[ReviewAction]):
 
     def _build_review_status(self) -> Static:
         """Build the review status display."""
+        if self._queue_position is not None:
+            return Static(
+                f"[queued #{self._queue_position}]",
+                id="review-status",
+                classes="status-pending",
+            )
+
         if not self._review:
             return Static(
                 "[pending] No review available",
@@ -215,6 +233,16 @@ class ReviewDetailModal(ModalScreen[ReviewAction]):
             classes=status_class,
         )
 
+    def _format_queue_info(self) -> str:
+        """Format the review queue depth line."""
+        stats = self._queue_stats
+        if stats is None or stats.is_idle:
+            return ""
+        return (
+            f"Review queue: {stats.running}/{stats.max_concurrent} running, "
+            f"{stats.queued} waiting"
+        )
+
     def _build_revision_info(self) -> Static:
         """Build the revision count display."""
         if self._review_target.revision_count > 0:
@@ -27,11 +27,17 @@ from iterm_controller.models import (
 )
 from iterm_controller.screens.mode_screen import ModeScreen
 from iterm_controller.state import (
+    OrchestratorProgress,
     SessionClosed,
     SessionSpawned,
     SessionStatusChanged,
 )
-from iterm_controller.test_output_parser import UnitTestResults, parse_test_output
+from iterm_controller.test_output_parser import (
+    StreamingTestParser,
+    UnitTestResults,
+    create_streaming_parser,
+    parse_test_output,
+)
 from iterm_controller.widgets.mode_indicator import ModeIndicatorWidget
 from iterm_controller.widgets.session_list import SessionListWidget
 from iterm_controller.widgets.test_plan import TestPlanWidget
@@ -179,6 +185,8 @@ class TestModeScreen(ModeScreen):
         self._test_runner_session_id: str | None = None
         self._test_runner_output: str = ""
         self._unit_test_results: UnitTestResults | None = None
+        # Parses the test runner's output live as the monitor streams it
+        self._test_stream: StreamingTestParser | None = None
 
     def compose(self) -> ComposeResult:
         """Compose the screen layout."""
@@ -389,7 +397,16 @@ class TestModeScreen(ModeScreen):
                 if results.failed > 0:
                     progress_parts.append(f"{results.failed} failed")
         elif self._test_runner_session_id:
-            progress_parts.append("Unit: Running...")
+            stream = self._test_stream
+            if stream is not None and stream.state.completed > 0:
+                progress = stream.progress
+                progress_parts.append(
+                    f"Unit: Running {progress.completed_tasks}/{progress.total_tasks}"
+                )
+                if stream.results.failed > 0:
+                    progress_parts.append(f"{stream.results.failed} failed")
+            else:
+                progress_parts.append("Unit: Running...")
 
         # Join parts
         if progress_parts:
@@ -634,8 +651,6 @@ class TestModeScreen(ModeScreen):
 
         async def _do_spawn() -> None:
             try:
-                from iterm_controller.iterm import SessionSpawner
-
                 # Create a temporary template for the test runner session
                 template = SessionTemplate(
                     id="test-runner",
@@ -644,7 +659,8 @@ class TestModeScreen(ModeScreen):
                     env={},
                 )
 
-                spawner = SessionSpawner(app.iterm)
+                # Use the shared spawner so the session monitor streams its output
+                spawner = app.services.spawner
                 result = await spawner.spawn_session(template, self.project)
 
                 if result.success:
@@ -659,6 +675,7 @@ class TestModeScreen(ModeScreen):
                         managed.metadata["test_command"] = command
                         app.state.add_session(managed)
 
+                    await self._start_test_stream(result.session_id, command)
                     await self._load_data()
                 else:
                     self.notify(f"Failed to spawn session: {result.error}", severity="error")
@@ -671,8 +688,63 @@ class TestModeScreen(ModeScreen):
 
         self.call_later(_do_spawn)
 
+    async def _start_test_stream(self, session_id: str, command: str) -> None:
+        """Parse the test runner's output as the session monitor streams it.
+
+        Args:
+            session_id: The test runner session ID.
+            command: The test command being run.
+        """
+        app: ItermControllerApp = self.app  # type: ignore[assignment]
+        monitor = app.services.monitor
+
+        self._stop_test_stream()
+        stream = create_streaming_parser(command, on_progress=self._on_test_progress)
+        monitor.subscribe_output(session_id, stream.feed_async)
+        self._test_stream = stream
+
+        if not monitor.is_running:
+            await monitor.start()
+
+    def _stop_test_stream(self) -> StreamingTestParser | None:
+        """Stop feeding the streaming parser.
+
+        Returns:
+            The parser that was active, if any.
+        """
+        stream = self._test_stream
+        self._test_stream = None
+        if stream is not None and self._test_runner_session_id:
+            app: ItermControllerApp = self.app  # type: ignore[assignment]
+            app.services.monitor.unsubscribe_output(
+                self._test_runner_session_id, stream.feed_async
+            )
+        return stream
+
+    def _on_test_progress(self, stream: StreamingTestParser) -> None:
+        """Show live counts while the test runner is running.
+
+        Args:
+            stream: The streaming parser whose counts changed.
+        """
+        app: ItermControllerApp = self.app  # type: ignore[assignment]
+
+        unit_tests = self.query_one("#unit-tests", UnitTestWidget)
+        unit_tests.refresh_results(stream.results)
+
+        session_id = self._test_runner_session_id
+        session = app.state.sessions.get(session_id) if session_id else None
+        if session is not None:
+            session.progress = stream.progress
+            app.post_message(
+                OrchestratorProgress(self.project.id, session.id, session.progress)
+            )
+
+        self._update_progress_bar()
+
     def _reset_test_runner_state(self) -> None:
         """Reset test runner tracking state."""
+        self._stop_test_stream()
         self._test_runner_session_id = None
         self._test_runner_output = ""
         unit_tests = self.query_one("#unit-tests", UnitTestWidget)
@@ -749,13 +821,17 @@ class TestModeScreen(ModeScreen):
         Args:
             session: The completed test runner session.
         """
-        # Get full output from the session
-        if session.last_output:
-            self._test_runner_output = session.last_output
-
-        # Parse the test output
         test_command = session.metadata.get("test_command", self._test_command)
-        results = parse_test_output(self._test_runner_output, test_command)
+
+        stream = self._stop_test_stream()
+        if stream is not None and stream.lines_seen > 0:
+            # Counts were kept up to date while the output streamed in
+            results = stream.finish()
+        else:
+            # No streamed output; parse whatever the session last showed
+            if session.last_output:
+                self._test_runner_output = session.last_output
+            results = parse_test_output(self._test_runner_output, test_command)
         self._unit_test_results = results
 
         # Update the widget
@@ -808,5 +884,6 @@ class TestModeScreen(ModeScreen):
 
     async def on_unmount(self) -> None:
         """Clean up when screen unmounts."""
+        self._stop_test_stream()
         if self._test_plan_watcher:
             await self._test_plan_watcher.stop_watching()
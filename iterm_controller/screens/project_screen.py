@@ -17,10 +17,12 @@ from textual.containers import Container, Horizontal, Vertical
 from textual.screen import Screen
 from textual.widgets import Footer, Header, Static
 
-from iterm_controller.models import ManagedSession, Plan, Project
+from iterm_controller.models import ManagedSession, Plan, Project, Task, TaskStatus
 from iterm_controller.state import (
+    GitHubStatusChanged,
     GitStatusChanged,
     PlanReloaded,
+    ReviewQueueChanged,
     SessionClosed,
     SessionOutputUpdated,
     SessionSpawned,
@@ -30,6 +32,7 @@ from iterm_controller.state import (
 from iterm_controller.widgets import (
     DocsSection,
     EnvSection,
+    GitHubPanelWidget,
     GitSection,
     PlanningSection,
     ScriptToolbar,
@@ -193,6 +196,7 @@ class ProjectScreen(Screen):
                 Vertical(
                     DocsSection(id="docs"),
                     GitSection(id="git"),
+                    GitHubPanelWidget(id="github"),
                     EnvSection(id="env"),
                     id="right-column",
                 ),
@@ -214,6 +218,7 @@ class ProjectScreen(Screen):
         """Load project data when screen mounts."""
         await self._load_project()
         await self._load_git_status()
+        self._load_github_status()
         await self._load_sessions()
         await self._load_plan()
 
@@ -263,6 +268,14 @@ class ProjectScreen(Screen):
             # Update git section widget
             self.query_one("#git", GitSection).set_git_status(self._git_status)
 
+    def _load_github_status(self) -> None:
+        """Show the GitHub poller's cached status for the project."""
+        if not self._project:
+            return
+        self.query_one("#github", GitHubPanelWidget).load_from_poller(
+            self.app.services.github_poller, self._project.path
+        )
+
     async def _load_sessions(self) -> None:
         """Load sessions for the project."""
         self._sessions = [
@@ -283,6 +296,9 @@ class ProjectScreen(Screen):
 
         if self._plan:
             self.query_one("#tasks", TasksSection).set_plan(self._plan)
+        self.query_one("#tasks", TasksSection).set_review_queue(
+            self.app.state.get_review_queue_stats()
+        )
 
     # =========================================================================
     # Event handlers for state changes
@@ -309,6 +325,16 @@ class ProjectScreen(Screen):
                     jira_suffix = f"  ({self._project.jira_ticket})" if self._project.jira_ticket else ""
                     self.query_one("#branch-info", Static).update(f"{branch_text}{jira_suffix}")
 
+    def on_git_hub_status_changed(self, message: GitHubStatusChanged) -> None:
+        """Handle a GitHub poller refresh.
+
+        Args:
+            message: The GitHub status changed message.
+        """
+        if self._project and message.project_path == self._project.path:
+            if message.status is not None:
+                self.query_one("#github", GitHubPanelWidget).update_status(message.status)
+
     async def on_plan_reloaded(self, message: PlanReloaded) -> None:
         """Handle plan reloaded event.
 
@@ -328,6 +354,14 @@ class ProjectScreen(Screen):
         # Refresh the tasks section
         self.query_one("#tasks", TasksSection).refresh()
 
+    def on_review_queue_changed(self, message: ReviewQueueChanged) -> None:
+        """Show the new review queue depth in the tasks section.
+
+        Args:
+            message: The review queue changed message.
+        """
+        self.query_one("#tasks", TasksSection).set_review_queue(message.stats)
+
     async def on_session_spawned(self, message: SessionSpawned) -> None:
         """Handle session spawned event.
 
@@ -490,8 +524,12 @@ class ProjectScreen(Screen):
         Args:
             message: The task selected message.
         """
+        task = message.task
+        if task.status == TaskStatus.AWAITING_REVIEW or self.app.state.is_reviewing(task.id):
+            self._show_review_modal(task)
+            return
         # Future: Show task detail modal
-        self.notify(f"Task: {message.task.id} - {message.task.title}")
+        self.notify(f"Task: {task.id} - {task.title}")
 
     async def on_env_section_edit_env_requested(
         self, message: EnvSection.EditEnvRequested
@@ -530,6 +568,10 @@ class ProjectScreen(Screen):
     async def action_refresh(self) -> None:
         """Refresh all data."""
         await self._load_git_status()
+        github_poller = self.app.services.github_poller
+        if self._project and github_poller.github.available:
+            # The poller fetches within its budget and posts GitHubStatusChanged
+            github_poller.request_refresh(self._project.path)
         await self._load_sessions()
         await self._load_plan()
         self.query_one("#planning", PlanningSection).refresh_artifacts()
@@ -631,6 +673,24 @@ class ProjectScreen(Screen):
 
         self.app.push_screen(CommitModal(), on_commit)
 
+    def _show_review_modal(self, task: Task) -> None:
+        """Show a task's review with its place in the review queue.
+
+        Args:
+            task: The task under review.
+        """
+        from iterm_controller.screens.modals.review_detail import ReviewDetailModal
+
+        state = self.app.state
+        self.app.push_screen(
+            ReviewDetailModal(
+                task,
+                review=state.get_active_review(task.id),
+                queue_position=state.get_review_queue_position(task.id),
+                queue_stats=state.get_review_queue_stats(),
+            )
+        )
+
     async def _do_commit(self, message: str) -> None:
         """Execute the commit.
 
@@ -21,6 +21,7 @@ from iterm_controller.models import (
 
 if TYPE_CHECKING:
     from iterm_controller.iterm.spawner import SessionSpawner
+    from iterm_controller.iterm.terminator import SessionTerminator
 
 
 logger = logging.getLogger(__name__)
@@ -40,13 +41,20 @@ class ScriptService:
         session_spawner: The session spawner for creating terminal sessions.
     """
 
-    def __init__(self, session_spawner: "SessionSpawner") -> None:
+    def __init__(
+        self,
+        session_spawner: "SessionSpawner",
+        terminator: SessionTerminator | None = None,
+    ) -> None:
         """Initialize the script service.
 
         Args:
             session_spawner: The session spawner for creating terminal sessions.
+            terminator: The terminator for stopping scripts. One is created on
+                first use if not provided.
         """
         self.session_spawner = session_spawner
+        self.terminator = terminator
         self._running_scripts: dict[str, RunningScript] = {}
 
     async def run_script(
@@ -256,11 +264,13 @@ class ScriptService:
         # Get the session
         session = self.session_spawner.get_session(running.session_id)
         if session:
-            # Use the terminator from the controller to close the session
-            # Import terminator here to avoid circular imports
-            from iterm_controller.iterm.terminator import SessionTerminator
+            # Reuse one terminator so its notification subscriptions are shared
+            if self.terminator is None:
+                # Import terminator here to avoid circular imports
+                from iterm_controller.iterm.terminator import SessionTerminator
 
-            terminator = SessionTerminator(self.session_spawner.controller)
+                self.terminator = SessionTerminator(self.session_spawner.controller)
+            terminator = self.terminator
 
             # Get the iTerm2 session
             app = self.session_spawner.controller.app
@@ -0,0 +1,455 @@
+"""Full-text search over session output.
+
+SearchIndex keeps an on-disk SQLite FTS5 index of every line of output the
+session monitor sees, so an error message can be found across sessions and
+projects long after it scrolled out of the monitor's in-memory buffers:
+
+    lines        one row per output line: session, timestamp, text
+    lines_fts    FTS5 index over lines.text (external content, so the text
+                 is stored once), kept in sync by an insert trigger
+    sessions     session, project and template IDs, keyed by a small integer
+
+Like TranscriptWriter, SearchIndex is fed by a monitor output hook. Lines
+are buffered in memory and inserted in batches by a background flush in a
+worker thread, so the event loop never waits on SQLite; buffered lines past
+``max_buffered_lines`` trigger an early flush, which keeps memory bounded
+when sessions produce output faster than the flush interval.
+
+Queries go through the FTS5 index and stop at ``limit`` hits, newest first,
+so they stay fast however much output is indexed. Context lines come from
+the same session's neighbouring rows. The database runs in WAL mode, so the
+CLI can search while the app or daemon is indexing. Row IDs are assigned by
+SQLite, so the app and the daemon can both index into the same database.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import sqlite3
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from iterm_controller.config import get_config_dir
+
+if TYPE_CHECKING:
+    from iterm_controller.models import ManagedSession
+    from iterm_controller.session_monitor import OutputChange
+
+logger = logging.getLogger(__name__)
+
+# Flush early once this many lines are buffered
+DEFAULT_MAX_BUFFERED_LINES = 5000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    id INTEGER PRIMARY KEY,
+    session_id TEXT NOT NULL UNIQUE,
+    project_id TEXT NOT NULL DEFAULT '',
+    template_id TEXT NOT NULL DEFAULT ''
+);
+CREATE TABLE IF NOT EXISTS lines (
+    id INTEGER PRIMARY KEY,
+    session INTEGER NOT NULL REFERENCES sessions(id),
+    ts REAL NOT NULL,
+    text TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS lines_session ON lines(session, id);
+CREATE VIRTUAL TABLE IF NOT EXISTS lines_fts USING fts5(
+    text, content='lines', content_rowid='id'
+);
+CREATE TRIGGER IF NOT EXISTS lines_fts_insert AFTER INSERT ON lines BEGIN
+    INSERT INTO lines_fts (rowid, text) VALUES (new.id, new.text);
+END;
+"""
+
+
+def default_search_index_path() -> Path:
+    """Get the default search index path (in the config directory)."""
+    return get_config_dir() / "search.db"
+
+
+def build_match_query(text: str) -> str:
+    """Turn free text into an FTS5 query matching lines with every term.
+
+    Each whitespace-separated term is quoted, so punctuation in error
+    messages (``TypeError:``, ``ECONNREFUSED``, paths) is never parsed as
+    FTS5 syntax.
+
+    Args:
+        text: The user's search text.
+
+    Returns:
+        An FTS5 MATCH expression, or "" if the text has no terms.
+    """
+    terms = ['"' + term.replace('"', '""') + '"' for term in text.split()]
+    return " ".join(terms)
+
+
+@dataclass
+class SearchHit:
+    """A line of output that matched a search.
+
+    Attributes:
+        session_id: The session that produced the line.
+        project_id: The session's project.
+        template_id: The template the session was spawned from.
+        timestamp: Unix time the monitor saw the line.
+        line: The matching line.
+        before: Lines the session printed just before the match.
+        after: Lines the session printed just after the match.
+    """
+
+    session_id: str
+    project_id: str
+    template_id: str
+    timestamp: float
+    line: str
+    before: list[str] = field(default_factory=list)
+    after: list[str] = field(default_factory=list)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a JSON-serializable dictionary."""
+        return {
+            "session_id": self.session_id,
+            "project_id": self.project_id,
+            "template_id": self.template_id,
+            "timestamp": self.timestamp,
+            "line": self.line,
+            "before": self.before,
+            "after": self.after,
+        }
+
+
+class SearchIndex:
+    """Indexes session output for full-text search.
+
+    Example:
+        index = SearchIndex()
+        monitor.add_output_hook(index.on_output)
+        await index.start()
+        hits = await index.search("connection refused", context=2)
+        await index.stop()  # Flushes what is still buffered
+    """
+
+    def __init__(
+        self,
+        path: Path | None = None,
+        flush_interval: float = 1.0,
+        max_buffered_lines: int = DEFAULT_MAX_BUFFERED_LINES,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """Initialize the index.
+
+        Args:
+            path: Database file (defaults to the config directory).
+            flush_interval: Seconds between background flushes.
+            max_buffered_lines: Buffered lines that trigger an early flush.
+            clock: Wall clock for line timestamps (injectable for tests).
+        """
+        self.path = path or default_search_index_path()
+        self.flush_interval = flush_interval
+        self.max_buffered_lines = max_buffered_lines
+        self._clock = clock
+        # (session_id, timestamp, line) waiting to be inserted
+        self._buffer: list[tuple[str, float, str]] = []
+        self._session_meta: dict[str, tuple[str, str]] = {}
+        self._session_keys: dict[str, int] = {}
+        self._conn: sqlite3.Connection | None = None
+        # Worker threads share one connection; SQLite calls are serialized
+        self._db_lock = threading.Lock()
+        self._flush_lock = asyncio.Lock()
+        self._task: asyncio.Task[None] | None = None
+        self._flush_task: asyncio.Task[int] | None = None
+
+    @property
+    def buffered_lines(self) -> int:
+        """Get the number of lines waiting to be indexed."""
+        return len(self._buffer)
+
+    def append(
+        self,
+        session_id: str,
+        output: str,
+        project_id: str = "",
+        template_id: str = "",
+        timestamp: float | None = None,
+    ) -> None:
+        """Buffer a chunk of output for indexing.
+
+        Blank lines are skipped.
+
+        Args:
+            session_id: The session that produced the output.
+            output: The new output.
+            project_id: The session's project.
+            template_id: The session's template.
+            timestamp: Unix time of the output (defaults to now).
+        """
+        lines = [line for line in output.splitlines() if line.strip()]
+        if not lines:
+            return
+        timestamp = self._clock() if timestamp is None else timestamp
+        self._buffer.extend((session_id, timestamp, line) for line in lines)
+        if session_id not in self._session_keys:
+            self._session_meta[session_id] = (project_id, template_id)
+
+        if len(self._buffer) >= self.max_buffered_lines:
+            self._schedule_flush()
+
+    def on_output(self, session: ManagedSession, change: OutputChange) -> None:
+        """Monitor output hook: buffer a session's new output."""
+        self.append(
+            session.id,
+            change.new_output,
+            project_id=session.project_id,
+            template_id=session.template_id,
+        )
+
+    def _schedule_flush(self) -> None:
+        """Flush in the background unless a flush is already scheduled."""
+        if self._flush_task is not None and not self._flush_task.done():
+            return
+        try:
+            self._flush_task = asyncio.get_running_loop().create_task(self.flush())
+        except RuntimeError:
+            pass  # No loop; the next flush picks the lines up
+
+    # -------------------------------------------------------------------------
+    # Lifecycle
+    # -------------------------------------------------------------------------
+
+    async def start(self) -> None:
+        """Start indexing buffered output periodically."""
+        if self._task is not None and not self._task.done():
+            return
+        self._task = asyncio.create_task(self._run())
+        logger.debug(f"Search index started ({self.path})")
+
+    async def stop(self) -> None:
+        """Stop the periodic flush, index what is buffered and close the database."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+        await asyncio.to_thread(self.close)
+        logger.debug("Search index stopped")
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._db_lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+                self._session_keys.clear()
+
+    async def _run(self) -> None:
+        """Flush periodically."""
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            await self.flush()
+
+    def _connect(self, create: bool = True) -> sqlite3.Connection | None:
+        """Open the database (call with the database lock held).
+
+        Args:
+            create: Whether to create the database if it does not exist.
+
+        Returns:
+            The connection, or None if the database does not exist and
+            create is False.
+        """
+        if self._conn is not None:
+            return self._conn
+        if not create and not self.path.exists():
+            return None
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.path, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript(_SCHEMA)
+        self._conn = conn
+        return conn
+
+    # -------------------------------------------------------------------------
+    # Indexing
+    # -------------------------------------------------------------------------
+
+    async def flush(self) -> int:
+        """Insert buffered lines in a worker thread.
+
+        Returns:
+            The number of lines indexed.
+        """
+        async with self._flush_lock:
+            if not self._buffer:
+                return 0
+            lines, self._buffer = self._buffer, []
+            meta, self._session_meta = self._session_meta, {}
+            try:
+                return await asyncio.to_thread(self._insert, lines, meta)
+            except sqlite3.Error as e:
+                logger.error(f"Failed to index session output: {e}")
+                return 0
+
+    def _insert(
+        self, lines: list[tuple[str, float, str]], meta: dict[str, tuple[str, str]]
+    ) -> int:
+        """Insert a batch of lines in one transaction (runs in a worker thread)."""
+        with self._db_lock:
+            conn = self._connect()
+            assert conn is not None
+            keys = dict(self._session_keys)
+            with conn:
+                # Take the write lock up front; another process may be indexing too
+                conn.execute("BEGIN IMMEDIATE")
+                for session_id in {session_id for session_id, _, _ in lines}:
+                    if session_id not in keys:
+                        keys[session_id] = self._session_key(
+                            conn, session_id, *meta.get(session_id, ("", ""))
+                        )
+                # The insert trigger indexes each row under its SQLite-assigned ID
+                conn.executemany(
+                    "INSERT INTO lines (session, ts, text) VALUES (?, ?, ?)",
+                    [(keys[sid], ts, text) for sid, ts, text in lines],
+                )
+            self._session_keys = keys
+        return len(lines)
+
+    @staticmethod
+    def _session_key(
+        conn: sqlite3.Connection, session_id: str, project_id: str, template_id: str
+    ) -> int:
+        """Get a session's integer key, registering the session if it is new."""
+        conn.execute(
+            "INSERT OR IGNORE INTO sessions (session_id, project_id, template_id) "
+            "VALUES (?, ?, ?)",
+            (session_id, project_id, template_id),
+        )
+        row = conn.execute(
+            "SELECT id FROM sessions WHERE session_id = ?", (session_id,)
+        ).fetchone()
+        if row is None:
+            raise sqlite3.IntegrityError(f"Session {session_id!r} was not registered")
+        return int(row[0])
+
+    # -------------------------------------------------------------------------
+    # Searching
+    # -------------------------------------------------------------------------
+
+    async def search(
+        self,
+        query: str,
+        limit: int = 50,
+        context: int = 2,
+        session_id: str | None = None,
+        project_id: str | None = None,
+        since: float | None = None,
+        until: float | None = None,
+        raw: bool = False,
+    ) -> list[SearchHit]:
+        """Find output lines matching a query, newest first.
+
+        Runs in a worker thread so the event loop never waits on SQLite.
+
+        Args:
+            query: Search text; every term must appear in the line.
+            limit: Most hits to return.
+            context: Lines of the session's output to include before and
+                after each hit.
+            session_id: Only search this session's output.
+            project_id: Only search output from this project's sessions.
+            since: Only lines at or after this Unix time.
+            until: Only lines at or before this Unix time.
+            raw: Pass the query to FTS5 unchanged (for phrase, prefix and
+                boolean queries).
+
+        Returns:
+            Matching lines with their context.
+
+        Raises:
+            ValueError: If a raw query is not valid FTS5 syntax.
+        """
+        match = query.strip() if raw else build_match_query(query)
+        if not match:
+            return []
+        return await asyncio.to_thread(
+            self._search, match, limit, context, session_id, project_id, since, until
+        )
+
+    def _search(
+        self,
+        match: str,
+        limit: int,
+        context: int,
+        session_id: str | None,
+        project_id: str | None,
+        since: float | None,
+        until: float | None,
+    ) -> list[SearchHit]:
+        """Run a search (runs in a worker thread)."""
+        sql = (
+            "SELECT lines.id, lines.session, lines.ts, lines.text, "
+            "sessions.session_id, sessions.project_id, sessions.template_id "
+            "FROM lines_fts JOIN lines ON lines.id = lines_fts.rowid "
+            "JOIN sessions ON sessions.id = lines.session "
+            "WHERE lines_fts MATCH ?"
+        )
+        params: list[Any] = [match]
+        if session_id is not None:
+            sql += " AND sessions.session_id = ?"
+            params.append(session_id)
+        if project_id is not None:
+            sql += " AND sessions.project_id = ?"
+            params.append(project_id)
+        if since is not None:
+            sql += " AND lines.ts >= ?"
+            params.append(since)
+        if until is not None:
+            sql += " AND lines.ts <= ?"
+            params.append(until)
+        sql += " ORDER BY lines_fts.rowid DESC LIMIT ?"
+        params.append(limit)
+
+        with self._db_lock:
+            conn = self._connect(create=False)
+            if conn is None:
+                return []
+            try:
+                rows = conn.execute(sql, params).fetchall()
+            except sqlite3.OperationalError as e:
+                raise ValueError(f"Invalid search query {match!r}: {e}") from e
+            hits = []
+            for line_id, session, ts, text, sid, project, template in rows:
+                hit = SearchHit(sid, project, template, ts, text)
+                if context > 0:
+                    hit.before = self._context(conn, session, line_id, context, before=True)
+                    hit.after = self._context(conn, session, line_id, context, before=False)
+                hits.append(hit)
+        return hits
+
+    @staticmethod
+    def _context(
+        conn: sqlite3.Connection, session: int, line_id: int, count: int, before: bool
+    ) -> list[str]:
+        """Get a session's lines next to a line, in output order."""
+        if before:
+            rows = conn.execute(
+                "SELECT text FROM lines WHERE session = ? AND id < ? ORDER BY id DESC LIMIT ?",
+                (session, line_id, count),
+            ).fetchall()
+            rows.reverse()
+        else:
+            rows = conn.execute(
+                "SELECT text FROM lines WHERE session = ? AND id > ? ORDER BY id LIMIT ?",
+                (session, line_id, count),
+            ).fetchall()
+        return [text for (text,) in rows]
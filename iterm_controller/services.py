@@ -13,23 +13,34 @@ from __future__ import annotations
 import logging
 from collections.abc import Callable
 from dataclasses import dataclass
+from pathlib import Path
 from typing import TYPE_CHECKING
 
 from textual.screen import ModalScreen, Screen
 
 from iterm_controller.git_service import GitService
-from iterm_controller.github import GitHubIntegration
+from iterm_controller.github import GitHubIntegration, GitHubPoller
 from iterm_controller.iterm import (
+    ConnectionSupervisor,
     FocusWatcher,
     ItermController,
+    SessionPool,
     SessionSpawner,
     SessionTerminator,
     WindowLayoutManager,
     WindowLayoutSpawner,
 )
 from iterm_controller.models import WorkflowMode, WorkflowStage
-from iterm_controller.notifications import Notifier
+from iterm_controller.notifications import (
+    Notifier,
+    SessionMonitorWithNotifications,
+    default_notification_backend,
+)
+from iterm_controller.resource_monitor import ResourceSampler, resolve_session_pid
 from iterm_controller.review_service import ReviewService
+from iterm_controller.search_index import SearchIndex
+from iterm_controller.session_monitor import SessionMonitor
+from iterm_controller.transcripts import TranscriptWriter
 
 # Import all screens and modals in services.py - this is the single place where
 # they are imported to avoid circular dependencies elsewhere
@@ -39,7 +50,8 @@ from iterm_controller.screens.modes.test_mode import TestModeScreen
 from iterm_controller.script_service import ScriptService
 
 if TYPE_CHECKING:
-    from iterm_controller.models import Project, WindowLayout
+    from iterm_controller.models import NotificationSettings, Project, WindowLayout
+    from iterm_controller.state import AppState
     from iterm_controller.state.plan_manager import PlanStateManager
 
 logger = logging.getLogger(__name__)
@@ -63,10 +75,17 @@ class ServiceContainer:
         layout_manager: Service for managing window layouts.
         layout_spawner: Service for spawning window layouts.
         github: GitHub integration service.
+        github_poller: Background scheduler that owns GitHub refreshes.
         notifier: macOS notification service.
         scripts: Script execution service.
         git: Git operations service.
         reviews: Review pipeline service.
+        resources: Per-session CPU/RSS sampler.
+        monitor: Session output monitor (started on demand by reviews).
+        supervisor: Reconnects to iTerm2 and purges sessions that vanished.
+        transcripts: Writes monitored output to disk, if enabled.
+        search_index: Indexes monitored output for full-text search, if enabled.
+        notifications: Notifies on monitored attention changes, if enabled.
     """
 
     iterm: ItermController
@@ -76,10 +95,17 @@ class ServiceContainer:
     layout_spawner: WindowLayoutSpawner
     focus_watcher: FocusWatcher
     github: GitHubIntegration
+    github_poller: GitHubPoller
     notifier: Notifier
     scripts: ScriptService
     git: GitService
     reviews: ReviewService
+    resources: ResourceSampler
+    monitor: SessionMonitor
+    supervisor: ConnectionSupervisor
+    transcripts: TranscriptWriter | None = None
+    search_index: SearchIndex | None = None
+    notifications: SessionMonitorWithNotifications | None = None
 
     @classmethod
     def create(cls, plan_manager: PlanStateManager | None = None) -> ServiceContainer:
@@ -109,12 +135,16 @@ class ServiceContainer:
 
         # Create integration services
         github = GitHubIntegration()
-        notifier = Notifier()
-        scripts = ScriptService(spawner)
+        github_poller = GitHubPoller(github)
+        notifier = Notifier(backend=default_notification_backend())
+        scripts = ScriptService(spawner, terminator)
 
         # Create git service
         git = GitService()
 
+        # Create session monitor (review output capture starts it on demand)
+        monitor = SessionMonitor(iterm, spawner)
+
         # Create review service (needs spawner, git, and plan manager)
         # Import here to avoid circular import issues with PlanStateManager
         reviews = ReviewService(
@@ -122,6 +152,16 @@ class ServiceContainer:
             git_service=git,
             plan_manager=plan_manager,  # type: ignore[arg-type]
             notifier=notifier,
+            session_monitor=monitor,
+        )
+
+        # Reconnect after iTerm2 restarts and drop sessions that went with it
+        supervisor = ConnectionSupervisor(iterm, spawner)
+        supervisor.add_purge_hook(monitor.purge_sessions)
+
+        # Create resource sampler (sessions are supplied by the app)
+        resources = ResourceSampler(
+            pid_resolver=lambda session_id: resolve_session_pid(iterm, session_id),
         )
 
         return cls(
@@ -132,10 +172,14 @@ class ServiceContainer:
             layout_spawner=layout_spawner,
             focus_watcher=focus_watcher,
             github=github,
+            github_poller=github_poller,
             notifier=notifier,
             scripts=scripts,
             git=git,
             reviews=reviews,
+            resources=resources,
+            monitor=monitor,
+            supervisor=supervisor,
         )
 
     async def connect_iterm(self) -> None:
@@ -145,11 +189,29 @@ class ServiceContainer:
             Exception: If the connection fails.
         """
         await self.iterm.connect()
+        await self.supervisor.start()
+        if self.spawner.pool:
+            await self.spawner.pool.start()
+        if self.transcripts or self.search_index or self.notifications:
+            await self._ensure_monitor_running()
 
     async def disconnect_iterm(self) -> None:
         """Disconnect from iTerm2."""
-        # Stop focus watcher before disconnecting
+        # Stop background services before disconnecting
+        await self.supervisor.stop()
+        if self.spawner.pool:
+            await self.spawner.pool.stop()
         await self.focus_watcher.stop()
+        await self.github_poller.stop()
+        await self.resources.stop()
+        await self.monitor.stop()
+        if self.transcripts:
+            await self.transcripts.stop()
+        if self.search_index:
+            await self.search_index.stop()
+        if self.notifications:
+            await self.notifications.close()
+        await self.terminator.close()
         await self.iterm.disconnect()
 
     async def start_focus_watcher(
@@ -169,8 +231,79 @@ class ServiceContainer:
         await self.focus_watcher.stop()
 
     async def initialize_github(self) -> None:
-        """Initialize the GitHub integration."""
-        await self.github.initialize()
+        """Initialize the GitHub integration and start background polling."""
+        if await self.github.initialize():
+            await self.github_poller.start()
+
+    def configure_session_pool(self, size: int, idle_timeout: float) -> None:
+        """Enable or disable warm shells for session spawning.
+
+        Call before connect_iterm; the pool starts with the connection.
+
+        Args:
+            size: Warm shells to keep per project context (0 disables the pool).
+            idle_timeout: Seconds an unclaimed warm shell is kept.
+        """
+        self.spawner.pool = (
+            SessionPool(self.iterm, size=size, idle_timeout=idle_timeout) if size > 0 else None
+        )
+
+    async def enable_transcripts(self, directory: Path | None = None) -> None:
+        """Write every chunk of output the monitor sees to session transcripts.
+
+        Args:
+            directory: Transcript directory (defaults to the config directory).
+        """
+        if self.transcripts is not None:
+            return
+        self.transcripts = TranscriptWriter(directory)
+        self.monitor.add_output_hook(self.transcripts.on_output)
+        await self.transcripts.start()
+        await self._ensure_monitor_running()
+
+    async def enable_search_index(self, path: Path | None = None) -> None:
+        """Index every line of output the monitor sees for full-text search.
+
+        Args:
+            path: Search database (defaults to the config directory).
+        """
+        if self.search_index is not None:
+            return
+        self.search_index = SearchIndex(path)
+        self.monitor.add_output_hook(self.search_index.on_output)
+        await self.search_index.start()
+        await self._ensure_monitor_running()
+
+    async def enable_notifications(
+        self,
+        state: AppState,
+        settings: NotificationSettings,
+        latency_log: Path | None = None,
+    ) -> None:
+        """Send notifications when monitored sessions need attention.
+
+        Args:
+            state: Application state, for project names and session lookups.
+            settings: Notification settings to apply.
+            latency_log: File to append notification latency samples to.
+        """
+        if self.notifications is not None:
+            return
+        self.notifications = SessionMonitorWithNotifications(
+            self.notifier, state, settings, latency_log=latency_log
+        )
+        self.notifications.attach(self.monitor)
+        await self._ensure_monitor_running()
+
+    async def _ensure_monitor_running(self) -> None:
+        """Keep the session monitor polling for output hooks.
+
+        The monitor is otherwise only started on demand by reviews and test
+        mode; transcripts, the search index and notifications need every
+        session's output.
+        """
+        if not self.monitor.is_running:
+            await self.monitor.start()
 
     def load_layouts(self, layouts: list[WindowLayout]) -> None:
         """Load window layouts into the layout manager.
@@ -11,7 +11,9 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import math
 import re
+import time
 from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
@@ -597,6 +599,170 @@ class AttentionDetector:
         return AttentionState.IDLE, None
 
 
+# =============================================================================
+# Output Capture
+# =============================================================================
+
+
+class SessionOutputCapture:
+    """Accumulates a session's streamed output until the session finishes.
+
+    Subscribes to a SessionOutputStream and keeps the most recent
+    ``max_bytes`` of output. Completion is detected without polling:
+    either a completion pattern shows up in the output, or the output goes
+    quiet for ``settle_seconds`` and the AttentionDetector sees a prompt
+    (IDLE at a shell prompt, or WAITING for input).
+
+    Example:
+        capture = SessionOutputCapture(monitor.get_output_stream(session_id))
+        async with capture:
+            await send_prompt()
+            finished = await capture.wait(timeout=600)
+        output = capture.text
+    """
+
+    def __init__(
+        self,
+        stream: SessionOutputStream,
+        detector: AttentionDetector | None = None,
+        completion_patterns: list[re.Pattern[str]] | None = None,
+        max_bytes: int = MAX_OUTPUT_BUFFER_BYTES,
+        settle_seconds: float = 3.0,
+        transform: Callable[[str], str] | None = None,
+    ) -> None:
+        """Initialize the capture.
+
+        Args:
+            stream: Output stream of the session to capture.
+            detector: Attention detector used for idle detection.
+            completion_patterns: Patterns that mark the output as complete.
+            max_bytes: Maximum bytes kept; older output is dropped.
+            settle_seconds: Quiet time before checking for a prompt.
+            transform: Applied to the captured output before completion
+                checks and in ``text``, e.g. to drop echoed input.
+        """
+        self.stream = stream
+        self.detector = detector or AttentionDetector()
+        self.completion_patterns = completion_patterns or []
+        self.max_bytes = max_bytes
+        self.settle_seconds = settle_seconds
+        self.transform = transform
+        self.truncated = False
+        self.completion_reason: str | None = None
+        self._chunks: deque[str] = deque()
+        self._size = 0
+        self._done = asyncio.Event()
+        self._settle_handle: asyncio.TimerHandle | None = None
+
+    async def __aenter__(self) -> SessionOutputCapture:
+        self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        self.stop()
+
+    def start(self) -> None:
+        """Start receiving output from the stream."""
+        self.stream.subscribe(self._on_output)
+
+    def stop(self) -> None:
+        """Stop receiving output and cancel any pending idle check."""
+        self.stream.unsubscribe(self._on_output)
+        self._cancel_settle()
+
+    @property
+    def text(self) -> str:
+        """Get the captured output."""
+        text = "".join(self._chunks)
+        return self.transform(text) if self.transform else text
+
+    @property
+    def is_complete(self) -> bool:
+        """Check whether completion has been detected."""
+        return self._done.is_set()
+
+    async def wait(self, timeout: float | None = None) -> bool:
+        """Wait until completion is detected.
+
+        Args:
+            timeout: Maximum seconds to wait, or None to wait indefinitely.
+
+        Returns:
+            True if the output completed, False if the timeout expired.
+        """
+        try:
+            await asyncio.wait_for(self._done.wait(), timeout)
+        except TimeoutError:
+            return False
+        return True
+
+    async def _on_output(self, chunk: str) -> None:
+        """Stream subscriber: buffer a chunk and check for completion."""
+        if self._done.is_set() or not chunk:
+            return
+        self._append(chunk)
+
+        tail = self._tail()
+        for pattern in self.completion_patterns:
+            if pattern.search(tail):
+                self._complete("marker")
+                return
+
+        # Restart the quiet timer; the idle check runs once output stops
+        self._cancel_settle()
+        loop = asyncio.get_running_loop()
+        self._settle_handle = loop.call_later(self.settle_seconds, self._on_settled)
+
+    def _append(self, chunk: str) -> None:
+        """Add a chunk, dropping the oldest output beyond max_bytes."""
+        self._chunks.append(chunk)
+        self._size += len(chunk.encode("utf-8"))
+        while self._size > self.max_bytes and len(self._chunks) > 1:
+            dropped = self._chunks.popleft()
+            self._size -= len(dropped.encode("utf-8"))
+            self.truncated = True
+        if self._size > self.max_bytes:
+            # A single oversized chunk: keep its end
+            kept = truncate_output(self._chunks[0], self.max_bytes)
+            self._chunks[0] = kept
+            self._size = len(kept.encode("utf-8"))
+            self.truncated = True
+
+    def _tail(self, max_chars: int = 4096) -> str:
+        """Get the end of the captured output for pattern matching."""
+        parts: list[str] = []
+        length = 0
+        for chunk in reversed(self._chunks):
+            parts.append(chunk)
+            length += len(chunk)
+            if length >= max_chars:
+                break
+        tail = "".join(reversed(parts))[-max_chars:]
+        return self.transform(tail) if self.transform else tail
+
+    def _on_settled(self) -> None:
+        """Output has been quiet for settle_seconds; look for a prompt."""
+        self._settle_handle = None
+        if self._done.is_set():
+            return
+        state, matched = self.detector.get_pattern_match(self._tail())
+        if state == AttentionState.WAITING or (
+            state == AttentionState.IDLE and matched is not None
+        ):
+            self._complete(state.value)
+
+    def _complete(self, reason: str) -> None:
+        """Mark the capture complete."""
+        self.completion_reason = reason
+        self._cancel_settle()
+        self._done.set()
+
+    def _cancel_settle(self) -> None:
+        if self._settle_handle is not None:
+            self._settle_handle.cancel()
+            self._settle_handle = None
+
+
 # =============================================================================
 # Output Cache
 # =============================================================================
@@ -800,6 +966,120 @@ class AdaptivePoller:
         return dict(self._session_intervals)
 
 
+# =============================================================================
+# Read Window Sizing
+# =============================================================================
+
+
+@dataclass
+class _SessionRate:
+    """Observed output rate of one session."""
+
+    last_seen: float
+    rate: float | None = None  # Smoothed lines per second
+    floor: int = 0  # Minimum window for the next read, raised after a gap
+
+
+class ReadWindowSizer:
+    """Sizes each session's read window from its recent output rate.
+
+    A fixed window is too large for a quiet shell and too small for a fast
+    producer: between two polls a test runner can print more lines than the
+    window holds, and those lines are never seen. The sizer keeps a smoothed
+    lines-per-second rate per session and sizes the next read to cover the
+    lines expected since the previous one, with headroom, plus ``min_lines``
+    of overlap so the processor can find where the previous read ended.
+    A read that missed output doubles the window for the next read.
+    """
+
+    def __init__(
+        self,
+        default_lines: int = 50,
+        min_lines: int = 10,
+        max_lines: int = 1000,
+        headroom: float = 2.0,
+        smoothing: float = 0.5,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the sizer.
+
+        Args:
+            default_lines: Window for sessions without a measured rate yet.
+            min_lines: Smallest window (the overlap kept with the previous read).
+            max_lines: Largest window.
+            headroom: Multiplier on the expected number of new lines.
+            smoothing: Weight of the newest rate sample (0-1).
+            clock: Monotonic clock (injectable for tests).
+        """
+        self.default_lines = default_lines
+        self.min_lines = min_lines
+        self.max_lines = max_lines
+        self.headroom = headroom
+        self.smoothing = smoothing
+        self._clock = clock
+        self._sessions: dict[str, _SessionRate] = {}
+
+    def window_size(self, session_id: str) -> int:
+        """Get the number of lines to read from a session now.
+
+        Args:
+            session_id: The session ID.
+
+        Returns:
+            The window size in lines.
+        """
+        state = self._sessions.get(session_id)
+        if state is None or state.rate is None:
+            return max(self.default_lines, state.floor if state else 0)
+
+        elapsed = max(self._clock() - state.last_seen, 0.0)
+        expected = math.ceil(state.rate * elapsed * self.headroom)
+        window = max(expected + self.min_lines, state.floor)
+        return min(window, self.max_lines)
+
+    def observe(self, session_id: str, new_lines: int, gap: bool = False) -> None:
+        """Record the result of a read.
+
+        Args:
+            session_id: The session ID.
+            new_lines: Lines that were new since the previous read.
+            gap: Whether output scrolled past between the reads. new_lines
+                is then only a lower bound.
+        """
+        now = self._clock()
+        state = self._sessions.get(session_id)
+        if state is None:
+            # The first read's lines are the whole screen, not a rate
+            self._sessions[session_id] = _SessionRate(last_seen=now)
+            return
+
+        elapsed = max(now - state.last_seen, 1e-3)
+        sample = new_lines / elapsed
+        if state.rate is None:
+            state.rate = sample
+        else:
+            state.rate = self.smoothing * sample + (1 - self.smoothing) * state.rate
+        if gap:
+            state.rate = max(state.rate, sample)
+            state.floor = min(max(new_lines, self.min_lines) * 2, self.max_lines)
+        else:
+            state.floor = 0
+        state.last_seen = now
+
+    def get_rate(self, session_id: str) -> float | None:
+        """Get a session's smoothed output rate in lines per second."""
+        state = self._sessions.get(session_id)
+        return state.rate if state else None
+
+    def reset_session(self, session_id: str) -> None:
+        """Forget a session's rate."""
+        self._sessions.pop(session_id, None)
+
+    def reset_all(self) -> None:
+        """Forget all rates."""
+        self._sessions.clear()
+
+
 # =============================================================================
 # Batch Output Reader
 # =============================================================================
@@ -812,17 +1092,65 @@ class SessionNotFoundError(Exception):
 
 
 class BatchOutputReader:
-    """Efficiently reads output from multiple sessions concurrently."""
+    """Efficiently reads output from multiple sessions concurrently.
+
+    With a ReadWindowSizer, each session's read window follows its output
+    rate. Otherwise every read fetches ``lines_to_read`` lines.
+    """
 
-    def __init__(self, controller: ItermController, lines_to_read: int = 50) -> None:
+    def __init__(
+        self,
+        controller: ItermController,
+        lines_to_read: int = 50,
+        sizer: ReadWindowSizer | None = None,
+    ) -> None:
         self.controller = controller
         self.lines_to_read = lines_to_read
+        self.sizer = sizer
+        self._windows: dict[str, int] = {}
+
+    @property
+    def windows(self) -> dict[str, int]:
+        """Get the window size of each session's last sized read."""
+        return dict(self._windows)
+
+    def window_size(self, session_id: str) -> int:
+        """Get the number of lines the next read of a session fetches."""
+        if self.sizer is None:
+            return self.lines_to_read
+        return self.sizer.window_size(session_id)
+
+    def observe(self, session_id: str, new_lines: int, gap: bool = False) -> None:
+        """Feed the result of a read back into window sizing.
+
+        Args:
+            session_id: The session ID.
+            new_lines: Lines that were new since the previous read.
+            gap: Whether output was missed between the reads.
+        """
+        if self.sizer is not None:
+            self.sizer.observe(session_id, new_lines, gap)
 
-    async def read_batch(self, session_ids: list[str]) -> dict[str, str]:
+    def clear(self, session_id: str | None = None) -> None:
+        """Clear window state for a session or all sessions."""
+        if session_id:
+            self._windows.pop(session_id, None)
+            if self.sizer is not None:
+                self.sizer.reset_session(session_id)
+        else:
+            self._windows.clear()
+            if self.sizer is not None:
+                self.sizer.reset_all()
+
+    async def read_batch(
+        self, session_ids: list[str], lines: int | None = None
+    ) -> dict[str, str]:
         """Read output from multiple sessions concurrently.
 
         Args:
             session_ids: List of session IDs to read from.
+            lines: Lines to read from every session, instead of each
+                session's window size.
 
         Returns:
             Dictionary mapping session_id to output content.
@@ -831,7 +1159,7 @@ class BatchOutputReader:
         if not session_ids:
             return {}
 
-        tasks = [self._read_one(session_id) for session_id in session_ids]
+        tasks = [self._read_one(session_id, lines) for session_id in session_ids]
         results = await asyncio.gather(*tasks, return_exceptions=True)
 
         output: dict[str, str] = {}
@@ -844,11 +1172,12 @@ class BatchOutputReader:
 
         return output
 
-    async def _read_one(self, session_id: str) -> str:
+    async def _read_one(self, session_id: str, lines: int | None = None) -> str:
         """Read output from a single session.
 
         Args:
             session_id: The iTerm2 session ID.
+            lines: Lines to read, or None for the session's window size.
 
         Returns:
             The session's recent output.
@@ -863,11 +1192,13 @@ class BatchOutputReader:
         if not session:
             raise SessionNotFoundError(f"Session {session_id} not found")
 
+        if lines is None:
+            lines = self.window_size(session_id)
+            self._windows[session_id] = lines
+
         # Get the last N lines of output
         # first_line=-N means start N lines from the end
-        contents = await session.async_get_contents(
-            first_line=-self.lines_to_read, number_of_lines=self.lines_to_read
-        )
+        contents = await session.async_get_contents(first_line=-lines, number_of_lines=lines)
 
         return contents
 
@@ -879,12 +1210,24 @@ class BatchOutputReader:
 
 @dataclass
 class OutputChange:
-    """Represents a change in session output."""
+    """Represents a change in session output.
+
+    Attributes:
+        session_id: The session ID.
+        old_output: The output seen by the previous poll.
+        new_output: The output that is new since the previous poll.
+        changed: Whether the output changed.
+        new_lines: Number of lines that are new since the previous poll.
+        gap: Whether the previous output no longer overlaps the current
+            output, so lines may have scrolled past unseen.
+    """
 
     session_id: str
     old_output: str | None
     new_output: str
     changed: bool
+    new_lines: int = 0
+    gap: bool = False
 
 
 class OutputProcessor:
@@ -921,10 +1264,12 @@ class OutputProcessor:
                 old_output=None,
                 new_output=current_output,
                 changed=True,
+                new_lines=len(current_output.splitlines()),
             )
 
-        if old_output == truncated_current:
-            # No change
+        if old_output == truncated_current or (old_output and current_output in old_output):
+            # No change (a shrunken read window returns a suffix of the old output)
+            self._last_output[session_id] = truncated_current
             return OutputChange(
                 session_id=session_id,
                 old_output=old_output,
@@ -935,22 +1280,67 @@ class OutputProcessor:
         # Find new content
         # Strategy: Look for where the old output ends in the new output
         new_content = current_output
+        gap = False
         if old_output and old_output in current_output:
             idx = current_output.index(old_output) + len(old_output)
             new_content = current_output[idx:]
+            new_lines = new_content.count("\n")
         elif old_output:
-            # Output scrolled - old content no longer visible
-            # Treat entire current output as new
-            new_content = current_output
+            # The read window slid: the end of the old output should be
+            # at the start of the current output
+            new_content, new_lines, gap = self._after_overlap(old_output, current_output)
+        else:
+            new_lines = len(current_output.splitlines())
 
         self._last_output[session_id] = truncated_current
         return OutputChange(
             session_id=session_id,
             old_output=old_output,
             new_output=new_content,
-            changed=True,
+            # Nothing after the overlap: the read only moved over old output
+            changed=bool(new_content) or gap,
+            new_lines=new_lines,
+            gap=gap,
         )
 
+    @staticmethod
+    def _after_overlap(old_output: str, current_output: str) -> tuple[str, int, bool]:
+        """Find the output after the longest overlap with the previous output.
+
+        The last old line may have grown since (e.g. a prompt being typed
+        at), so it only has to be a prefix of its current line. Trailing
+        blank lines are ignored.
+
+        Returns:
+            (new content, new line count, gap). Without an overlap the
+            whole current output is new and gap is True.
+        """
+        old_lines = old_output.splitlines()
+        current_lines = current_output.splitlines()
+        for lines in (old_lines, current_lines):
+            while lines and not lines[-1].strip():
+                lines.pop()
+        if old_lines and current_lines:
+            last = old_lines[-1]
+            # The earliest start gives the longest overlap
+            for start in range(max(len(old_lines) - len(current_lines), 0), len(old_lines)):
+                overlap = len(old_lines) - start
+                if overlap > 1 and old_lines[start] != current_lines[0]:
+                    continue
+                if (
+                    old_lines[start:-1] == current_lines[: overlap - 1]
+                    and current_lines[overlap - 1].startswith(last)
+                ):
+                    rest = current_lines[overlap:]
+                    content = current_lines[overlap - 1][len(last) :]
+                    if rest:
+                        content += "\n" + "\n".join(rest)
+                    return content, len(rest), False
+
+        # Output scrolled - old content no longer visible
+        # Treat entire current output as new
+        return current_output, len(current_output.splitlines()), True
+
     def clear(self, session_id: str | None = None) -> None:
         """Clear stored output for a session or all sessions."""
         if session_id:
@@ -983,6 +1373,11 @@ class MonitorConfig:
     adaptive_max_interval_ms: int = 2000
     adaptive_default_interval_ms: int = 500
 
+    # Read window sizing (lines_to_read is the window before a rate is known)
+    adaptive_read_window_enabled: bool = True
+    read_window_min_lines: int = 10
+    read_window_max_lines: int = 1000
+
     # Output streaming settings
     streaming_enabled: bool = True
     streaming_buffer_lines: int = 100
@@ -992,6 +1387,7 @@ class MonitorConfig:
 OutputCallback = Callable[["ManagedSession", str, bool], None]
 AttentionStateCallback = Callable[["ManagedSession", AttentionState, AttentionState], None]
 OutputStreamCallback = Callable[[str, str], Awaitable[None]]  # (session_id, output) -> None
+OutputHook = Callable[["ManagedSession", OutputChange], None]
 
 
 class SessionMonitor:
@@ -1035,7 +1431,16 @@ class SessionMonitor:
         self.on_output_stream = on_output_stream
 
         # Components
-        self._reader = BatchOutputReader(controller, self.config.lines_to_read)
+        sizer = (
+            ReadWindowSizer(
+                default_lines=self.config.lines_to_read,
+                min_lines=self.config.read_window_min_lines,
+                max_lines=self.config.read_window_max_lines,
+            )
+            if self.config.adaptive_read_window_enabled
+            else None
+        )
+        self._reader = BatchOutputReader(controller, self.config.lines_to_read, sizer)
         self._processor = OutputProcessor(self.config.max_output_buffer_bytes)
         self._cache = OutputCache(self.config.cache_max_entries)
         self._throttle = OutputThrottle(self.config.throttle_interval_ms)
@@ -1056,6 +1461,8 @@ class SessionMonitor:
         self._running = False
         self._task: asyncio.Task | None = None
         self._poll_count = 0
+        self._metrics = MetricsCollector()
+        self._output_hooks: list[OutputHook] = []
 
     @property
     def is_running(self) -> bool:
@@ -1117,6 +1524,7 @@ class SessionMonitor:
                 self._poll_count += 1
             except Exception as e:
                 logger.error(f"Error in poll loop: {e}")
+                self._metrics.record_error()
 
             # Determine sleep interval
             interval = self._get_next_poll_interval()
@@ -1155,6 +1563,7 @@ class SessionMonitor:
         if not sessions:
             return {}
 
+        started = time.perf_counter()
         changes: dict[str, OutputChange] = {}
 
         # Process in batches
@@ -1163,6 +1572,9 @@ class SessionMonitor:
             batch_changes = await self._poll_batch(batch)
             changes.update(batch_changes)
 
+        self._metrics.record_poll(
+            (time.perf_counter() - started) * 1000, len(sessions), len(changes)
+        )
         return changes
 
     async def _poll_batch(self, sessions: list[ManagedSession]) -> dict[str, OutputChange]:
@@ -1192,11 +1604,16 @@ class SessionMonitor:
             if output is None:
                 continue
 
+            window = self._reader.windows.get(session.id)
+            if window is not None:
+                self._metrics.record_read_window(session.id, window)
+
             # Check cache first
             cached = self._cache.get(session.id)
             if cached == output:
                 # No change since last poll
                 self._throttle.mark_processed(session.id)
+                self._reader.observe(session.id, 0)
                 # Update adaptive polling to slow down
                 if self.config.adaptive_polling_enabled:
                     self._adaptive_poller.on_output(session.id, had_output=False)
@@ -1209,7 +1626,21 @@ class SessionMonitor:
             change = self._processor.extract_new_output(session.id, output)
             self._throttle.mark_processed(session.id)
 
-            if change.changed:
+            # Without an overlap, lines were only missed if the read came
+            # back full; a cleared screen is not a gap
+            if change.gap and window is not None and len(output.splitlines()) < window:
+                change.gap = False
+            if change.gap:
+                self._metrics.record_gap(session.id)
+                logger.info(
+                    f"Missed output in session {session.id}: more than {window} lines "
+                    "since the last poll, widening its read window"
+                )
+            self._reader.observe(session.id, change.new_lines, change.gap)
+
+            # An empty change without a gap carries nothing to act on, and
+            # would blank last_output and read as a WORKING session
+            if change.changed and (change.new_output or change.gap):
                 changes[session.id] = change
                 # Update session state (truncate to prevent memory bloat)
                 session.last_output = truncate_output(
@@ -1249,6 +1680,12 @@ class SessionMonitor:
                     except Exception as e:
                         logger.error(f"Error in output callback: {e}")
 
+                for hook in self._output_hooks:
+                    try:
+                        hook(session, change)
+                    except Exception as e:
+                        logger.error(f"Error in output hook: {e}")
+
                 # Stream output to subscribers (if streaming enabled)
                 if self.config.streaming_enabled:
                     await self._stream_output(session.id, change.new_output)
@@ -1259,6 +1696,23 @@ class SessionMonitor:
 
         return changes
 
+    def add_output_hook(self, hook: OutputHook) -> None:
+        """Register a callable that receives every chunk of new output.
+
+        Unlike on_output, hooks get the full OutputChange (including gaps),
+        and any number can be registered. Hooks run inside the poll loop
+        and must not block.
+
+        Args:
+            hook: Called with (session, change) for each changed session.
+        """
+        self._output_hooks.append(hook)
+
+    def remove_output_hook(self, hook: OutputHook) -> None:
+        """Unregister an output hook."""
+        if hook in self._output_hooks:
+            self._output_hooks.remove(hook)
+
     async def clear_session(self, session_id: str) -> None:
         """Clear all cached state for a session.
 
@@ -1268,15 +1722,33 @@ class SessionMonitor:
         self._processor.clear(session_id)
         self._throttle.clear(session_id)
         self._adaptive_poller.reset_session(session_id)
+        self._reader.clear(session_id)
+        self._metrics.forget(session_id)
         # Clean up output stream
         await self._stream_manager.remove_stream(session_id)
 
+    async def purge_sessions(self, session_ids: list[str]) -> None:
+        """Clear cached state for sessions that no longer exist.
+
+        Used after reconnecting to iTerm2, when sessions may have vanished
+        without a close event.
+
+        Args:
+            session_ids: IDs of the sessions to forget.
+        """
+        for session_id in session_ids:
+            await self.clear_session(session_id)
+        if session_ids:
+            logger.debug(f"Purged {len(session_ids)} dead session(s) from the monitor")
+
     async def clear_all(self) -> None:
         """Clear all cached state."""
         self._cache.clear()
         self._processor.clear()
         self._throttle.clear()
         self._adaptive_poller.reset_all()
+        self._reader.clear()
+        self._metrics.reset()
         # Clean up all output streams
         await self._stream_manager.clear_all()
 
@@ -1320,6 +1792,11 @@ class SessionMonitor:
         """Access the adaptive poller for advanced use."""
         return self._adaptive_poller
 
+    @property
+    def metrics(self) -> MonitorMetrics:
+        """Get poll metrics, including each session's read window size."""
+        return self._metrics.metrics
+
     # =========================================================================
     # Output Streaming API
     # =========================================================================
@@ -1429,13 +1906,22 @@ class SessionMonitor:
 
 @dataclass
 class MonitorMetrics:
-    """Metrics about monitor performance."""
+    """Metrics about monitor performance.
+
+    Attributes:
+        read_windows: Lines fetched by each session's last read.
+        output_gaps: Polls where output scrolled past unseen.
+        session_gaps: Output gaps per session.
+    """
 
     poll_count: int = 0
     sessions_polled: int = 0
     output_changes: int = 0
     errors: int = 0
     avg_poll_duration_ms: float = 0.0
+    read_windows: dict[str, int] = field(default_factory=dict)
+    output_gaps: int = 0
+    session_gaps: dict[str, int] = field(default_factory=dict)
 
 
 class MetricsCollector:
@@ -1465,6 +1951,20 @@ class MetricsCollector:
         """Record an error."""
         self._metrics.errors += 1
 
+    def record_read_window(self, session_id: str, lines: int) -> None:
+        """Record the window size of a session's read."""
+        self._metrics.read_windows[session_id] = lines
+
+    def record_gap(self, session_id: str) -> None:
+        """Record that a session's output scrolled past unseen."""
+        self._metrics.output_gaps += 1
+        self._metrics.session_gaps[session_id] = self._metrics.session_gaps.get(session_id, 0) + 1
+
+    def forget(self, session_id: str) -> None:
+        """Drop per-session metrics for a session."""
+        self._metrics.read_windows.pop(session_id, None)
+        self._metrics.session_gaps.pop(session_id, None)
+
     @property
     def metrics(self) -> MonitorMetrics:
         """Get current metrics."""
@@ -12,6 +12,7 @@ or the convenience functions in `iterm_controller.api`.
 from iterm_controller.state.app_state import AppState
 from iterm_controller.state.events import (
     ConfigChanged,
+    GitHubStatusChanged,
     GitStatusChanged,
     HealthStatusChanged,
     OrchestratorProgress,
@@ -21,12 +22,14 @@ from iterm_controller.state.events import (
     ProjectOpened,
     ReviewCompleted,
     ReviewFailed,
+    ReviewQueueChanged,
     ReviewStarted,
     ScriptCompleted,
     ScriptStarted,
     SessionClosed,
     SessionOutputUpdated,
     SessionSpawned,
+    SessionsReconciled,
     SessionStatusChanged,
     StateEvent,
     StateMessage,
@@ -39,6 +42,7 @@ from iterm_controller.state.events import (
 )
 from iterm_controller.state.git_manager import GitStateManager
 from iterm_controller.state.review_manager import ReviewStateManager
+from iterm_controller.state.session_index import SessionIndex, SessionSelector
 from iterm_controller.state.snapshot import StateSnapshot
 
 __all__ = [
@@ -47,10 +51,14 @@ __all__ = [
     # State managers
     "GitStateManager",
     "ReviewStateManager",
+    # Session selection
+    "SessionIndex",
+    "SessionSelector",
     # Snapshot for external observation
     "StateSnapshot",
     # Events
     "ConfigChanged",
+    "GitHubStatusChanged",
     "GitStatusChanged",
     "HealthStatusChanged",
     "OrchestratorProgress",
@@ -60,12 +68,14 @@ __all__ = [
     "ProjectOpened",
     "ReviewCompleted",
     "ReviewFailed",
+    "ReviewQueueChanged",
     "ReviewStarted",
     "ScriptCompleted",
     "ScriptStarted",
     "SessionClosed",
     "SessionOutputUpdated",
     "SessionSpawned",
+    "SessionsReconciled",
     "SessionStatusChanged",
     "StateEvent",
     "StateMessage",
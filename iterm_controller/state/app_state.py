@@ -24,12 +24,15 @@ from iterm_controller.state.health_manager import HealthStateManager
 from iterm_controller.state.plan_manager import PlanStateManager
 from iterm_controller.state.project_manager import ProjectStateManager
 from iterm_controller.state.review_manager import ReviewStateManager
+from iterm_controller.state.session_index import SessionSelector
 from iterm_controller.state.session_manager import SessionStateManager
 from iterm_controller.state.snapshot import StateSnapshot
 
 if TYPE_CHECKING:
     from textual.app import App
 
+    from iterm_controller.review_scheduler import ReviewQueueStats
+
 
 @dataclass
 class AppState:
@@ -254,6 +257,20 @@ class AppState:
         """
         self._session_manager.remove_session(session_id)
 
+    def purge_sessions(
+        self, session_ids: list[str], reconnected: bool = False
+    ) -> list[ManagedSession]:
+        """Remove sessions that no longer exist, posting one summary message.
+
+        Args:
+            session_ids: IDs of the sessions to remove.
+            reconnected: Whether this follows a reconnect to iTerm2.
+
+        Returns:
+            The sessions that were removed.
+        """
+        return self._session_manager.purge_sessions(session_ids, reconnected)
+
     def update_session_status(self, session_id: str, **kwargs: Any) -> None:
         """Update session status.
 
@@ -274,6 +291,17 @@ class AppState:
         """
         return self._session_manager.get_sessions_for_project(project_id)
 
+    def select_sessions(self, selector: SessionSelector) -> list[ManagedSession]:
+        """Get the sessions matching a selector.
+
+        Args:
+            selector: The selection criteria.
+
+        Returns:
+            Matching sessions.
+        """
+        return self._session_manager.select_sessions(selector)
+
     # =========================================================================
     # Plan Operations (delegated to PlanStateManager)
     # =========================================================================
@@ -603,6 +631,25 @@ class AppState:
 
         return self._review_manager.get_all_active_reviews()
 
+    def get_review_queue_position(self, task_id: str) -> int | None:
+        """Get a task's 1-based position in the review queue.
+
+        Args:
+            task_id: The task ID.
+
+        Returns:
+            Queue position, or None if the task is not waiting.
+        """
+        return self._review_manager.get_queue_position(task_id)
+
+    def get_review_queue_stats(self) -> "ReviewQueueStats":
+        """Get review queue depth and slot usage.
+
+        Returns:
+            Snapshot of the review queue.
+        """
+        return self._review_manager.get_queue_stats()
+
     def clear_reviews(self) -> None:
         """Clear all active reviews."""
         self._review_manager.clear()
@@ -14,6 +14,7 @@ from textual.message import Message
 if TYPE_CHECKING:
     from iterm_controller.models import (
         AppConfig,
+        GitHubStatus,
         GitStatus,
         ManagedSession,
         Plan,
@@ -23,6 +24,7 @@ if TYPE_CHECKING:
         TaskReview,
         TestPlan,
     )
+    from iterm_controller.review_scheduler import ReviewQueueStats
 
 
 class StateEvent(Enum):
@@ -34,6 +36,7 @@ class StateEvent(Enum):
     SESSION_CLOSED = "session_closed"
     SESSION_STATUS_CHANGED = "session_status_changed"
     SESSION_OUTPUT_UPDATED = "session_output_updated"
+    SESSIONS_RECONCILED = "sessions_reconciled"
     TASK_STATUS_CHANGED = "task_status_changed"
     PLAN_RELOADED = "plan_reloaded"
     PLAN_CONFLICT = "plan_conflict"
@@ -47,10 +50,13 @@ class StateEvent(Enum):
     TEST_STEP_UPDATED = "test_step_updated"
     # Git events
     GIT_STATUS_CHANGED = "git_status_changed"
+    # GitHub events
+    GITHUB_STATUS_CHANGED = "github_status_changed"
     # Review events
     REVIEW_STARTED = "review_started"
     REVIEW_COMPLETED = "review_completed"
     REVIEW_FAILED = "review_failed"
+    REVIEW_QUEUE_CHANGED = "review_queue_changed"
     # Script events
     SCRIPT_STARTED = "script_started"
     SCRIPT_COMPLETED = "script_completed"
@@ -111,6 +117,19 @@ class SessionStatusChanged(StateMessage):
         self.session = session
 
 
+class SessionsReconciled(StateMessage):
+    """Posted once after sessions were reconciled with iTerm2.
+
+    Sessions that vanished (e.g. because iTerm2 restarted) are removed in
+    one batch instead of posting SessionClosed for each of them.
+    """
+
+    def __init__(self, closed: list[ManagedSession], reconnected: bool = False) -> None:
+        super().__init__()
+        self.closed = closed
+        self.reconnected = reconnected
+
+
 class SessionOutputUpdated(StateMessage):
     """Posted when new output is available for a session.
 
@@ -223,6 +242,15 @@ class GitStatusChanged(StateMessage):
         self.status = status
 
 
+class GitHubStatusChanged(StateMessage):
+    """Posted when the GitHub poller refreshes a project's status."""
+
+    def __init__(self, project_path: str, status: GitHubStatus | None) -> None:
+        super().__init__()
+        self.project_path = project_path
+        self.status = status
+
+
 class ReviewStarted(StateMessage):
     """Posted when a review begins for a task."""
 
@@ -253,6 +281,14 @@ class ReviewFailed(StateMessage):
         self.review = review
 
 
+class ReviewQueueChanged(StateMessage):
+    """Posted when reviews are queued, started or finished."""
+
+    def __init__(self, stats: ReviewQueueStats) -> None:
+        super().__init__()
+        self.stats = stats
+
+
 class ScriptStarted(StateMessage):
     """Posted when a script starts running."""
 
@@ -47,14 +47,17 @@ class HealthStateManager:
     ) -> None:
         """Update and notify about a health check status change.
 
+        No message is posted if the status is unchanged.
+
         Args:
             project_id: The project ID.
             check_name: The name of the health check.
             status: The new health status.
         """
-        if project_id not in self._health_statuses:
-            self._health_statuses[project_id] = {}
-        self._health_statuses[project_id][check_name] = status
+        statuses = self._health_statuses.setdefault(project_id, {})
+        if statuses.get(check_name) == status:
+            return
+        statuses[check_name] = status
 
         self._post_message(HealthStatusChanged(project_id, check_name, status.value))
 
@@ -5,6 +5,7 @@ Manages review state for tasks with event dispatch.
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import TYPE_CHECKING, Any
 
@@ -12,9 +13,11 @@ from iterm_controller.models import (
     ReviewResult,
     TaskReview,
 )
+from iterm_controller.review_scheduler import ReviewQueueStats, ReviewScheduler
 from iterm_controller.state.events import (
     ReviewCompleted,
     ReviewFailed,
+    ReviewQueueChanged,
     ReviewStarted,
 )
 
@@ -35,22 +38,35 @@ class ReviewStateManager:
     This manager coordinates between the ReviewService (which handles the
     actual review execution) and the app state (which UI components observe).
 
+    Reviews are admitted through a ReviewScheduler, which limits how many
+    run at once (globally and per project), runs tasks that block the most
+    other tasks first, and merges repeated requests for the same task.
+
     Attributes:
         active_reviews: Dictionary of currently running reviews by task ID.
         review_service: Optional ReviewService for running reviews.
+        scheduler: Queue that admits reviews into concurrency slots.
     """
 
-    def __init__(self, review_service: ReviewService | None = None) -> None:
+    def __init__(
+        self,
+        review_service: ReviewService | None = None,
+        scheduler: ReviewScheduler | None = None,
+    ) -> None:
         """Initialize the review state manager.
 
         Args:
             review_service: The ReviewService to use for running reviews.
                            If None, reviews cannot be started but state
                            can still be tracked.
+            scheduler: Review queue to use. A default one is created if
+                       not provided.
         """
         self.review_service = review_service
         self.active_reviews: dict[str, TaskReview] = {}
         self._app: App | None = None
+        self.scheduler = scheduler or ReviewScheduler()
+        self.scheduler.on_change = self._on_queue_changed
 
     def connect_app(self, app: App) -> None:
         """Connect to a Textual App for message posting.
@@ -65,6 +81,10 @@ class ReviewStateManager:
         if self._app is not None:
             self._app.post_message(message)
 
+    def _on_queue_changed(self, stats: ReviewQueueStats) -> None:
+        """Forward review queue changes to the UI."""
+        self._post_message(ReviewQueueChanged(stats))
+
     def _get_project(self, project_id: str) -> Any:
         """Get a project by ID from the app state.
 
@@ -116,8 +136,11 @@ class ReviewStateManager:
     ) -> TaskReview | None:
         """Start a new review for a task.
 
+        Queues the review with the scheduler and waits for it to run.
         Builds review context and runs the review using the ReviewService.
-        Posts ReviewStarted, then ReviewCompleted or ReviewFailed when done.
+        Posts ReviewStarted when the review gets a slot, then
+        ReviewCompleted or ReviewFailed when done. Requesting a review for
+        a task that is already queued or running waits for that review.
 
         Args:
             project_id: The project ID.
@@ -140,10 +163,48 @@ class ReviewStateManager:
             logger.error("Task %s not found in project %s", task_id, project_id)
             return None
 
-        # Check if already reviewing
-        if task_id in self.active_reviews:
-            logger.warning("Review already in progress for task %s", task_id)
-            return self.active_reviews[task_id]
+        future = self.scheduler.submit(
+            project_id,
+            task_id,
+            lambda: self._run_review(project_id, project, task),
+            priority=self._review_priority(project_id, task_id),
+        )
+        # Shielded so one cancelled caller does not cancel a shared review
+        return await asyncio.shield(future)
+
+    def _review_priority(self, project_id: str, task_id: str) -> int:
+        """Get the scheduling priority for a task's review.
+
+        Tasks that other tasks depend on are reviewed first, since they
+        block the most work; the more dependents, the sooner.
+
+        Args:
+            project_id: The project ID.
+            task_id: The task ID.
+
+        Returns:
+            Priority value (lower runs first).
+        """
+        if self._app is None or not hasattr(self._app, "state"):
+            return 0
+        plan = self._app.state.get_plan(project_id)
+        if plan is None:
+            return 0
+        return -sum(1 for t in plan.all_tasks if task_id in t.depends)
+
+    async def _run_review(self, project_id: str, project: Any, task: Any) -> TaskReview:
+        """Run one review once the scheduler has given it a slot.
+
+        Args:
+            project_id: The project ID.
+            project: The project containing the task.
+            task: The task to review.
+
+        Returns:
+            The completed TaskReview, or a failed review record.
+        """
+        assert self.review_service is not None
+        task_id = task.id
 
         # Post review started event
         self._post_message(ReviewStarted(task_id, project_id))
@@ -257,9 +318,28 @@ class ReviewStateManager:
             task_id: The task ID.
 
         Returns:
-            True if a review is in progress.
+            True if a review is in progress or queued.
+        """
+        return task_id in self.active_reviews or self.scheduler.is_pending(task_id)
+
+    def get_queue_position(self, task_id: str) -> int | None:
+        """Get a task's 1-based position in the review queue.
+
+        Args:
+            task_id: The task ID.
+
+        Returns:
+            Queue position, or None if the task is not waiting.
+        """
+        return self.scheduler.position(task_id)
+
+    def get_queue_stats(self) -> ReviewQueueStats:
+        """Get review queue depth and slot usage.
+
+        Returns:
+            Snapshot of the review queue.
         """
-        return task_id in self.active_reviews
+        return self.scheduler.stats()
 
     def clear(self) -> None:
         """Clear all active reviews.
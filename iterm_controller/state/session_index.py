@@ -0,0 +1,187 @@
+"""Session selection by project, template and attention state.
+
+SessionSelector parses a small selector language used to address many
+sessions at once:
+
+    project=my-app template=claude state=waiting,working
+
+Terms are separated by whitespace and must all match. Comma-separated
+values within a term are alternatives. Selecting every session takes the
+explicit selector ``all``; an empty selector is rejected, so a blank
+``--select ""`` cannot address everything by accident.
+
+SessionIndex buckets session IDs by project and template, so a selector is
+answered from the matching buckets instead of by scanning all sessions.
+Attention state changes in place on every SessionMonitor poll, so it is
+checked on the candidates the index returns rather than indexed.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+
+from iterm_controller.models import AttentionState, ManagedSession
+
+# Selector keys and their aliases
+_SELECTOR_KEYS = {
+    "project": "project",
+    "template": "template",
+    "state": "state",
+    "attention": "state",
+}
+
+# Selector text that matches every session
+SELECT_ALL = "all"
+
+
+@dataclass(frozen=True)
+class SessionSelector:
+    """Criteria for selecting sessions.
+
+    Each field is a set of accepted values. An empty set accepts anything.
+    """
+
+    project_ids: frozenset[str] = frozenset()
+    template_ids: frozenset[str] = frozenset()
+    attention_states: frozenset[AttentionState] = frozenset()
+
+    @classmethod
+    def parse(cls, text: str) -> SessionSelector:
+        """Parse a selector such as ``"project=app state=waiting,working"``.
+
+        Args:
+            text: The selector text.
+
+        Returns:
+            The parsed selector.
+
+        Raises:
+            ValueError: If the selector is empty, or a term is malformed or
+                uses an unknown key or state.
+        """
+        terms = text.split()
+        if not terms:
+            raise ValueError(f"Empty selector (use '{SELECT_ALL}' to select every session)")
+        if terms == [SELECT_ALL]:
+            return cls()
+
+        values: dict[str, set[str]] = {"project": set(), "template": set(), "state": set()}
+        for term in terms:
+            key, sep, raw = term.partition("=")
+            if not sep or not raw:
+                raise ValueError(f"Invalid selector term '{term}', expected key=value")
+            if key not in _SELECTOR_KEYS:
+                raise ValueError(
+                    f"Unknown selector key '{key}' (use project, template or state)"
+                )
+            values[_SELECTOR_KEYS[key]].update(v for v in raw.split(",") if v)
+
+        try:
+            states = frozenset(AttentionState(v) for v in values["state"])
+        except ValueError:
+            valid = ", ".join(s.value for s in AttentionState)
+            raise ValueError(f"Unknown attention state in selector (use {valid})") from None
+
+        return cls(
+            project_ids=frozenset(values["project"]),
+            template_ids=frozenset(values["template"]),
+            attention_states=states,
+        )
+
+    def matches(self, session: ManagedSession) -> bool:
+        """Check whether a session satisfies the selector."""
+        return (
+            (not self.project_ids or session.project_id in self.project_ids)
+            and (not self.template_ids or session.template_id in self.template_ids)
+            and (not self.attention_states or session.attention_state in self.attention_states)
+        )
+
+    def __str__(self) -> str:
+        """Format the selector in the form accepted by parse()."""
+        terms = []
+        if self.project_ids:
+            terms.append("project=" + ",".join(sorted(self.project_ids)))
+        if self.template_ids:
+            terms.append("template=" + ",".join(sorted(self.template_ids)))
+        if self.attention_states:
+            terms.append("state=" + ",".join(sorted(s.value for s in self.attention_states)))
+        return " ".join(terms) or SELECT_ALL
+
+
+class SessionIndex:
+    """Session IDs bucketed by project and template.
+
+    Buckets are insertion-ordered dicts, so sessions from one bucket come
+    back in the order they were added.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty index."""
+        self._by_project: dict[str, dict[str, None]] = {}
+        self._by_template: dict[str, dict[str, None]] = {}
+        self._keys: dict[str, tuple[str, str]] = {}
+
+    def __len__(self) -> int:
+        """Get the number of indexed sessions."""
+        return len(self._keys)
+
+    def add(self, session: ManagedSession) -> None:
+        """Index a session, replacing any previous entry with its ID."""
+        self.remove(session.id)
+        self._keys[session.id] = (session.project_id, session.template_id)
+        self._by_project.setdefault(session.project_id, {})[session.id] = None
+        self._by_template.setdefault(session.template_id, {})[session.id] = None
+
+    def remove(self, session_id: str) -> None:
+        """Drop a session from the index."""
+        keys = self._keys.pop(session_id, None)
+        if keys is None:
+            return
+        for buckets, key in ((self._by_project, keys[0]), (self._by_template, keys[1])):
+            bucket = buckets[key]
+            del bucket[session_id]
+            if not bucket:
+                del buckets[key]
+
+    def rebuild(self, sessions: Iterable[ManagedSession]) -> None:
+        """Re-index from scratch."""
+        self._by_project.clear()
+        self._by_template.clear()
+        self._keys.clear()
+        for session in sessions:
+            self.add(session)
+
+    def select(
+        self, selector: SessionSelector, sessions: Mapping[str, ManagedSession]
+    ) -> list[ManagedSession]:
+        """Get the sessions matching a selector.
+
+        Args:
+            selector: The selection criteria.
+            sessions: Current sessions by ID, used to resolve indexed IDs.
+
+        Returns:
+            Matching sessions.
+        """
+        candidates: Iterable[str] = sessions.keys()
+        narrowed: dict[str, None] | None = None
+        for buckets, wanted in (
+            (self._by_project, selector.project_ids),
+            (self._by_template, selector.template_ids),
+        ):
+            if not wanted:
+                continue
+            ids: dict[str, None] = {}
+            for value in wanted:
+                ids.update(buckets.get(value, {}))
+            narrowed = ids if narrowed is None else {i: None for i in narrowed if i in ids}
+        if narrowed is not None:
+            candidates = narrowed
+
+        selected = []
+        for session_id in candidates:
+            session = sessions.get(session_id)
+            if session is not None and selector.matches(session):
+                selected.append(session)
+        return selected
@@ -12,8 +12,10 @@ from iterm_controller.models import ManagedSession
 from iterm_controller.state.events import (
     SessionClosed,
     SessionSpawned,
+    SessionsReconciled,
     SessionStatusChanged,
 )
+from iterm_controller.state.session_index import SessionIndex, SessionSelector
 
 if TYPE_CHECKING:
     from textual.app import App
@@ -27,11 +29,13 @@ class SessionStateManager:
     - Adding and removing sessions
     - Updating session status
     - Filtering sessions by project
+    - Selecting sessions by project, template and attention state
     """
 
     def __init__(self) -> None:
         """Initialize the session state manager."""
         self.sessions: dict[str, ManagedSession] = {}
+        self._index = SessionIndex()
         self._app: App | None = None
 
     def connect_app(self, app: App) -> None:
@@ -59,6 +63,7 @@ class SessionStateManager:
             session: The managed session to add.
         """
         self.sessions[session.id] = session
+        self._index.add(session)
         self._post_message(SessionSpawned(session))
 
     def remove_session(self, session_id: str) -> None:
@@ -69,8 +74,33 @@ class SessionStateManager:
         """
         if session_id in self.sessions:
             session = self.sessions.pop(session_id)
+            self._index.remove(session_id)
             self._post_message(SessionClosed(session))
 
+    def purge_sessions(
+        self, session_ids: list[str], reconnected: bool = False
+    ) -> list[ManagedSession]:
+        """Remove sessions that no longer exist in iTerm2.
+
+        Posts a single SessionsReconciled message rather than one
+        SessionClosed per session.
+
+        Args:
+            session_ids: IDs of the sessions to remove.
+            reconnected: Whether this follows a reconnect to iTerm2.
+
+        Returns:
+            The sessions that were removed.
+        """
+        closed = []
+        for session_id in session_ids:
+            session = self.sessions.pop(session_id, None)
+            if session is not None:
+                self._index.remove(session_id)
+                closed.append(session)
+        self._post_message(SessionsReconciled(closed, reconnected))
+        return closed
+
     def update_session_status(self, session_id: str, **kwargs: Any) -> None:
         """Update session status.
 
@@ -106,3 +136,17 @@ class SessionStateManager:
             The session if found, None otherwise.
         """
         return self.sessions.get(session_id)
+
+    def select_sessions(self, selector: SessionSelector) -> list[ManagedSession]:
+        """Get the sessions matching a selector.
+
+        Args:
+            selector: The selection criteria.
+
+        Returns:
+            Matching sessions.
+        """
+        if len(self._index) != len(self.sessions):
+            # The sessions dict was changed directly rather than via add/remove
+            self._index.rebuild(self.sessions.values())
+        return self._index.select(selector, self.sessions)
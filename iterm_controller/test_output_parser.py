@@ -2,6 +2,11 @@
 
 Parses output from pytest, npm test, cargo test, and other test runners
 to extract test results for display in the UnitTestWidget.
+
+Output can be parsed in one go once the run has finished
+(``parse_test_output``) or incrementally while it runs
+(``create_streaming_parser``), which keeps live pass/fail/skip counts
+without holding the whole output in memory.
 """
 
 from __future__ import annotations
@@ -9,24 +14,42 @@ from __future__ import annotations
 import logging
 import re
 from abc import ABC, abstractmethod
+from collections import deque
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from datetime import datetime
+
+from iterm_controller.models import SessionProgress
+
 logger = logging.getLogger(__name__)
 
 __all__ = [
     "TestResult",
     "UnitTestResults",
     "TestOutputParser",
+    "StreamingOutputParser",
     "PytestParser",
     "NpmTestParser",
     "CargoTestParser",
     "GoTestParser",
     "MakeTestParser",
     "OutputParserRegistry",
+    "StreamState",
+    "StreamingTestParser",
     "parse_test_output",
+    "create_streaming_parser",
     "get_parser_registry",
 ]
 
+# Matches ANSI escape sequences (colors, cursor movement) in terminal output
+ANSI_ESCAPE_PATTERN = re.compile(r"\x1b\[[0-9;?]*[ -/]*[@-~]|\x1b\][^\x07]*\x07")
+
+# Characters of output kept as raw_output by the streaming parser
+STREAM_TAIL_BYTES = 64 * 1024
+
+# Characters buffered while the streaming parser is still detecting the runner
+STREAM_DETECT_BYTES = 16 * 1024
+
 
 # =============================================================================
 # Data Models
@@ -59,6 +82,48 @@ class UnitTestResults:
     raw_output: str = ""
 
 
+@dataclass
+class StreamState:
+    """Running state of an incremental parse.
+
+    Attributes:
+        results: Counts and failures seen so far.
+        expected_total: Number of tests the runner announced, if known.
+        summary_seen: Whether the runner's final summary has been parsed
+            (its counts replace the running counts).
+        package_passed: Passing packages/suites (runners without per-test lines).
+        package_failed: Failing packages/suites.
+    """
+
+    results: UnitTestResults = field(default_factory=UnitTestResults)
+    expected_total: int | None = None
+    summary_seen: bool = False
+    package_passed: int = 0
+    package_failed: int = 0
+    _failure_names: set[str] = field(default_factory=set, repr=False)
+
+    @property
+    def completed(self) -> int:
+        """Get the number of tests that have finished."""
+        r = self.results
+        return r.passed + r.failed + r.skipped + r.errors
+
+    def add_failure(
+        self, name: str, error_message: str | None = None, duration_ms: float = 0
+    ) -> None:
+        """Record a failed test name once."""
+        if name and name not in self._failure_names:
+            self._failure_names.add(name)
+            self.results.failed_tests.append(
+                TestResult(
+                    name=name,
+                    passed=False,
+                    duration_ms=duration_ms,
+                    error_message=error_message,
+                )
+            )
+
+
 # =============================================================================
 # Abstract Parser
 # =============================================================================
@@ -78,12 +143,43 @@ class TestOutputParser(ABC):
         pass
 
 
+class StreamingOutputParser(TestOutputParser):
+    """Base class for parsers that can also update counts line by line.
+
+    Parsers that only subclass TestOutputParser parse whole output: a
+    streamed run is parsed from its retained tail when it ends.
+    """
+
+    @abstractmethod
+    def scan_line(self, line: str, state: StreamState) -> None:
+        """Update a streaming parse with one complete output line.
+
+        Args:
+            line: Output line without the trailing newline or ANSI codes.
+            state: Running parse state to update.
+        """
+        pass
+
+    def finish_stream(self, state: StreamState) -> None:
+        """Apply fallbacks once a streamed run has ended.
+
+        Falls back to package/suite counts when no per-test lines were seen.
+
+        Args:
+            state: Running parse state to finalize.
+        """
+        results = state.results
+        if results.passed == 0 and results.failed == 0:
+            results.passed = state.package_passed
+            results.failed = state.package_failed
+
+
 # =============================================================================
 # Pytest Parser
 # =============================================================================
 
 
-class PytestParser(TestOutputParser):
+class PytestParser(StreamingOutputParser):
     """Parser for pytest output.
 
     Handles various pytest output formats:
@@ -189,7 +285,11 @@ class PytestParser(TestOutputParser):
         for match in self.ERROR_PATTERN.finditer(output):
             test_name = match.group(1).strip()
             results.failed_tests.append(
-                TestResult(name=test_name, passed=False, error_message="Error during collection/setup")
+                TestResult(
+                    name=test_name,
+                    passed=False,
+                    error_message="Error during collection/setup",
+                )
             )
 
         results.last_run = datetime.now()
@@ -202,13 +302,106 @@ class PytestParser(TestOutputParser):
             return int(match.group(1))
         return 0
 
+    # Streaming patterns (matched per line)
+    COLLECTED_PATTERN = re.compile(
+        r"^collected (?P<collected>\d+) items?(?:.*?(?P<selected>\d+) selected)?"
+    )
+    VERBOSE_RESULT_PATTERN = re.compile(
+        r"^(?P<name>\S+::\S+)\s+(?P<status>PASSED|FAILED|SKIPPED|ERROR|XFAIL|XPASS)\b"
+    )
+    # pytest-xdist verbose lines: "[gw0] [ 10%] PASSED tests/test_x.py::test_a"
+    XDIST_RESULT_PATTERN = re.compile(
+        r"^\[gw\d+\]\s+\[\s*\d+%\]\s+"
+        r"(?P<status>PASSED|FAILED|SKIPPED|ERROR|XFAIL|XPASS)\s+(?P<name>\S+)"
+    )
+    # Progress lines: "tests/test_x.py ..F.s   [ 10%]" or "....F  [ 10%]"
+    PROGRESS_PATTERN = re.compile(
+        r"^(?:(?P<file>\S+\.py)\s+)?(?P<marks>[.FEsxX]+)\s*(?P<percent>\[\s*\d+%\])?\s*$"
+    )
+    SUMMARY_LINE_PATTERN = re.compile(r"\bin\s+[\d.]+s\b")
+    SUMMARY_COUNT_PATTERN = re.compile(
+        r"(?P<count>\d+)\s+(?P<kind>passed|failed|skipped|errors?|xfailed|xpassed)\b"
+    )
+    SUMMARY_DURATION_PATTERN = re.compile(r"\bin\s+(?P<duration>[\d.]+)s\b")
+    SHORT_SUMMARY_PATTERN = re.compile(r"^(?P<status>FAILED|ERROR)\s+(?P<name>\S+)")
+
+    _STATUS_FIELDS = {
+        "PASSED": "passed",
+        "XPASS": "passed",
+        "FAILED": "failed",
+        "SKIPPED": "skipped",
+        "XFAIL": "skipped",
+        "ERROR": "errors",
+    }
+    _MARK_FIELDS = {
+        ".": "passed",
+        "X": "passed",
+        "F": "failed",
+        "s": "skipped",
+        "x": "skipped",
+        "E": "errors",
+    }
+
+    def scan_line(self, line: str, state: StreamState) -> None:
+        """Update running counts from one line of pytest output."""
+        results = state.results
+
+        match = self.COLLECTED_PATTERN.match(line)
+        if match:
+            state.expected_total = int(match.group("selected") or match.group("collected"))
+            return
+
+        match = self.VERBOSE_RESULT_PATTERN.match(line) or self.XDIST_RESULT_PATTERN.match(line)
+        if match:
+            status = match.group("status")
+            attr = self._STATUS_FIELDS[status]
+            setattr(results, attr, getattr(results, attr) + 1)
+            if status == "FAILED":
+                state.add_failure(match.group("name"))
+            return
+
+        match = self.SHORT_SUMMARY_PATTERN.match(line)
+        if match:
+            if match.group("status") == "FAILED":
+                state.add_failure(match.group("name"))
+            else:
+                state.add_failure(
+                    match.group("name"), error_message="Error during collection/setup"
+                )
+            return
+
+        match = self.PROGRESS_PATTERN.match(line)
+        if match and (match.group("file") or match.group("percent")):
+            for mark in match.group("marks"):
+                attr = self._MARK_FIELDS[mark]
+                setattr(results, attr, getattr(results, attr) + 1)
+            return
+
+        if line.lstrip("= ").startswith(tuple("0123456789")) and self.SUMMARY_LINE_PATTERN.search(
+            line
+        ):
+            counts = {
+                m.group("kind"): int(m.group("count"))
+                for m in self.SUMMARY_COUNT_PATTERN.finditer(line)
+            }
+            if not counts:
+                return
+            results.passed = counts.get("passed", 0) + counts.get("xpassed", 0)
+            results.failed = counts.get("failed", 0)
+            results.skipped = counts.get("skipped", 0) + counts.get("xfailed", 0)
+            results.errors = counts.get("error", 0) + counts.get("errors", 0)
+            duration = self.SUMMARY_DURATION_PATTERN.search(line)
+            if duration:
+                results.duration_seconds = float(duration.group("duration"))
+            state.summary_seen = True
+
 
 # =============================================================================
 # NPM Test Parser
 # =============================================================================
 
 
-class NpmTestParser(TestOutputParser):
+class NpmTestParser(StreamingOutputParser):
     """Parser for npm test output (Jest, Mocha, etc.).
 
     Handles Jest and Mocha output formats commonly used in npm projects.
@@ -316,13 +509,85 @@ class NpmTestParser(TestOutputParser):
         results.last_run = datetime.now()
         return results
 
+    # Streaming patterns (matched per line)
+    PASSED_LINE_PATTERN = re.compile(r"^\s*[✓√✔]\s+(?P<name>.+?)(?:\s+\(\d+\s*m?s\))?$")
+    FAILED_LINE_PATTERN = re.compile(r"^\s*[✕×✖]\s+(?P<name>.+?)(?:\s+\(\d+\s*m?s\))?$")
+    SKIPPED_LINE_PATTERN = re.compile(r"^\s*○\s+")
+    MOCHA_PENDING_PATTERN = re.compile(r"^\s*(?P<skipped>\d+)\s+pending\b")
+
+    def scan_line(self, line: str, state: StreamState) -> None:
+        """Update running counts from one line of Jest or Mocha output."""
+        results = state.results
+
+        match = self.JEST_SUMMARY_PATTERN.search(line)
+        if match:
+            groups = match.groupdict()
+            results.passed = int(groups.get("passed") or 0)
+            results.failed = int(groups.get("failed") or 0)
+            results.skipped = int(groups.get("skipped") or 0)
+            state.expected_total = int(groups["total"])
+            state.summary_seen = True
+            return
+
+        match = self.JEST_TIME_PATTERN.search(line)
+        if match:
+            results.duration_seconds = float(match.group("duration"))
+            return
+
+        match = self.MOCHA_SUMMARY_PATTERN.search(line)
+        if match:
+            results.passed = int(match.group("passed"))
+            duration = float(match.group("duration"))
+            if "ms)" in line:
+                duration /= 1000
+            results.duration_seconds = duration
+            # Mocha prints "N failing" only when something failed
+            results.failed = 0
+            state.summary_seen = True
+            return
+
+        match = self.MOCHA_FAILING_PATTERN.search(line)
+        if match and state.summary_seen:
+            results.failed = int(match.group("failed"))
+            return
+
+        match = self.MOCHA_PENDING_PATTERN.match(line)
+        if match and state.summary_seen:
+            results.skipped = int(match.group("skipped"))
+            return
+
+        if state.summary_seen:
+            match = self.JEST_FAILED_PATTERN.search(line)
+            if match and not match.group(1).strip().startswith("›"):
+                state.add_failure(match.group(1).strip())
+            return
+
+        match = self.PASSED_LINE_PATTERN.match(line)
+        if match:
+            results.passed += 1
+            return
+
+        # Failure names come from the "●" detail headers, which carry the
+        # full describe path; the "✕" lines only count
+        if self.FAILED_LINE_PATTERN.match(line):
+            results.failed += 1
+            return
+
+        if self.SKIPPED_LINE_PATTERN.match(line):
+            results.skipped += 1
+            return
+
+        match = self.JEST_FAILED_PATTERN.search(line)
+        if match and not match.group(1).strip().startswith("›"):
+            state.add_failure(match.group(1).strip())
+
 
 # =============================================================================
 # Cargo Test Parser
 # =============================================================================
 
 
-class CargoTestParser(TestOutputParser):
+class CargoTestParser(StreamingOutputParser):
     """Parser for cargo test output (Rust).
 
     Handles Rust's cargo test output format.
@@ -386,13 +651,48 @@ class CargoTestParser(TestOutputParser):
         results.last_run = datetime.now()
         return results
 
+    # Streaming patterns (matched per line)
+    RUNNING_PATTERN = re.compile(r"^running (?P<count>\d+) tests?$")
+    TEST_LINE_PATTERN = re.compile(
+        r"^test\s+(?P<name>.+?)\s+\.\.\.\s+(?P<status>ok|FAILED|ignored)\b"
+    )
+
+    def scan_line(self, line: str, state: StreamState) -> None:
+        """Update running counts from one line of cargo test output.
+
+        Each test binary prints its own ``running N tests`` header and
+        summary, so announced totals and durations are summed across them.
+        """
+        results = state.results
+
+        match = self.TEST_LINE_PATTERN.match(line)
+        if match:
+            status = match.group("status")
+            if status == "ok":
+                results.passed += 1
+            elif status == "ignored":
+                results.skipped += 1
+            else:
+                results.failed += 1
+                state.add_failure(match.group("name").strip())
+            return
+
+        match = self.RUNNING_PATTERN.match(line)
+        if match:
+            state.expected_total = (state.expected_total or 0) + int(match.group("count"))
+            return
+
+        match = self.DURATION_PATTERN.search(line)
+        if match and line.startswith("test result:"):
+            results.duration_seconds += float(match.group("duration"))
+
 
 # =============================================================================
 # Go Test Parser
 # =============================================================================
 
 
-class GoTestParser(TestOutputParser):
+class GoTestParser(StreamingOutputParser):
     """Parser for go test output.
 
     Handles Go's test output format.
@@ -454,6 +754,42 @@ class GoTestParser(TestOutputParser):
         results.last_run = datetime.now()
         return results
 
+    # Streaming patterns (matched per line)
+    TEST_LINE_PATTERN = re.compile(
+        r"^---\s+(?P<status>PASS|FAIL|SKIP):\s+(?P<name>\S+)\s+\((?P<duration>[\d.]+)s\)$"
+    )
+    PACKAGE_LINE_PATTERN = re.compile(
+        r"^(?P<status>ok|FAIL)\s+\S+(?:\s+(?P<duration>[\d.]+)s)?"
+    )
+
+    def scan_line(self, line: str, state: StreamState) -> None:
+        """Update running counts from one line of go test output."""
+        results = state.results
+
+        match = self.TEST_LINE_PATTERN.match(line)
+        if match:
+            status = match.group("status")
+            if status == "PASS":
+                results.passed += 1
+            elif status == "SKIP":
+                results.skipped += 1
+            else:
+                results.failed += 1
+                state.add_failure(
+                    match.group("name"),
+                    duration_ms=float(match.group("duration")) * 1000,
+                )
+            return
+
+        match = self.PACKAGE_LINE_PATTERN.match(line)
+        if match:
+            if match.group("status") == "ok":
+                state.package_passed += 1
+            else:
+                state.package_failed += 1
+            if match.group("duration"):
+                results.duration_seconds = float(match.group("duration"))
+
 
 # =============================================================================
 # Make Test Parser
@@ -556,6 +892,55 @@ class OutputParserRegistry:
         """Add a custom parser (inserted at the beginning for priority)."""
         self._parsers.insert(0, parser)
 
+    def parser_for_command(self, test_command: str) -> TestOutputParser | None:
+        """Get the parser matching a test command, if any.
+
+        Args:
+            test_command: The command that was run.
+
+        Returns:
+            The matching parser, or None if the command is not recognized.
+        """
+        for keyword, parser in self._command_parsers.items():
+            if keyword in test_command:
+                return parser
+        return None
+
+    def detect_parser(self, output: str) -> TestOutputParser | None:
+        """Get the parser for a runner recognized from its output.
+
+        The make parser is skipped since make output is produced by one of
+        the other runners.
+
+        Args:
+            output: Test runner output seen so far.
+
+        Returns:
+            The matching parser, or None if no runner is recognized yet.
+        """
+        for parser in self._parsers:
+            if parser is not self._make_parser and parser.can_parse(output):
+                return parser
+        return None
+
+    def create_stream(
+        self,
+        test_command: str = "",
+        on_progress: Callable[[StreamingTestParser], None] | None = None,
+    ) -> StreamingTestParser:
+        """Create a streaming parser for a test run.
+
+        Args:
+            test_command: The command being run (helps with parser selection).
+            on_progress: Called after each chunk that changes the counts.
+
+        Returns:
+            A new StreamingTestParser.
+        """
+        return StreamingTestParser(
+            test_command=test_command, registry=self, on_progress=on_progress
+        )
+
     def parse(self, output: str, test_command: str = "") -> UnitTestResults:
         """Parse test output using the appropriate parser.
 
@@ -588,6 +973,197 @@ class OutputParserRegistry:
         return results
 
 
+# =============================================================================
+# Streaming Parser
+# =============================================================================
+
+
+class StreamingTestParser:
+    """Parses test output incrementally while the run is in progress.
+
+    Output chunks are split into lines and each complete line is passed to
+    the runner's parser (``scan_line``), which updates running counts. Only
+    a bounded tail of the output is kept, so long runs do not accumulate
+    megabytes that would otherwise be re-parsed at the end.
+
+    The runner is picked from the test command when possible, otherwise
+    from the first output. Output seen before the runner is recognized is
+    buffered (up to ``STREAM_DETECT_BYTES``) and replayed once it is.
+
+    Example:
+        parser = create_streaming_parser("pytest", on_progress=show_progress)
+        monitor.subscribe_output(session_id, parser.feed_async)
+        ...
+        results = parser.finish()
+    """
+
+    def __init__(
+        self,
+        test_command: str = "",
+        registry: OutputParserRegistry | None = None,
+        on_progress: Callable[[StreamingTestParser], None] | None = None,
+        tail_bytes: int = STREAM_TAIL_BYTES,
+    ) -> None:
+        """Initialize the streaming parser.
+
+        Args:
+            test_command: The command being run.
+            registry: Registry used to pick the runner's parser.
+            on_progress: Called after each chunk that changes the counts.
+            tail_bytes: Amount of raw output kept for ``raw_output``.
+        """
+        self.test_command = test_command
+        self.registry = registry or _registry
+        self.on_progress = on_progress
+        self.state = StreamState(
+            results=UnitTestResults(test_command=test_command, is_running=True)
+        )
+        self.parser = self.registry.parser_for_command(test_command) if test_command else None
+        self._partial = ""
+        self._tail: deque[str] = deque()
+        self._tail_size = 0
+        self._tail_limit = tail_bytes
+        self._undetected: deque[str] = deque()
+        self._undetected_size = 0
+        self._lines_seen = 0
+        self._finished = False
+
+    @property
+    def results(self) -> UnitTestResults:
+        """Get the results parsed so far."""
+        return self.state.results
+
+    @property
+    def lines_seen(self) -> int:
+        """Get the number of complete output lines processed."""
+        return self._lines_seen
+
+    @property
+    def progress(self) -> SessionProgress:
+        """Get the run's progress for display in session cards.
+
+        When the runner has not announced a total, the total grows with
+        the number of completed tests.
+        """
+        completed = self.state.completed
+        total = max(self.state.expected_total or 0, completed)
+        return SessionProgress(
+            total_tasks=total,
+            completed_tasks=completed,
+            current_task_title=self.test_command or None,
+        )
+
+    def feed(self, chunk: str) -> None:
+        """Process a chunk of output.
+
+        Args:
+            chunk: New output, possibly ending mid-line.
+        """
+        if not chunk or self._finished:
+            return
+        self._append_tail(chunk)
+
+        data = self._partial + chunk
+        lines = data.split("\n")
+        self._partial = lines.pop()
+        if not lines:
+            return
+
+        before = (self.state.completed, len(self.results.failed_tests))
+        for line in lines:
+            self._process_line(line)
+        after = (self.state.completed, len(self.results.failed_tests))
+
+        if after != before and self.on_progress is not None:
+            try:
+                self.on_progress(self)
+            except Exception as e:
+                logger.warning("Test progress listener failed: %s", e)
+
+    async def feed_async(self, chunk: str) -> None:
+        """Process a chunk of output (SessionOutputStream subscriber form).
+
+        Args:
+            chunk: New output, possibly ending mid-line.
+        """
+        self.feed(chunk)
+
+    def finish(self) -> UnitTestResults:
+        """Process any trailing partial line and return the final results.
+
+        Falls back to a whole-output parse of the retained tail if the
+        runner was never recognized, or its parser cannot stream.
+
+        Returns:
+            The final UnitTestResults.
+        """
+        if not self._finished:
+            self._finished = True
+            if self._partial:
+                self._process_line(self._partial)
+                self._partial = ""
+
+        raw_output = "".join(self._tail)
+        if not isinstance(self.parser, StreamingOutputParser):
+            if self.parser is None:
+                results = self.registry.parse(raw_output, self.test_command)
+            else:
+                results = self.parser.parse(raw_output)
+                results.test_command = self.test_command
+            results.is_running = False
+            self.state.results = results
+            return results
+
+        self.parser.finish_stream(self.state)
+        results = self.state.results
+        results.raw_output = raw_output
+        results.is_running = False
+        results.last_run = datetime.now()
+        return results
+
+    def _process_line(self, raw_line: str) -> None:
+        """Strip terminal codes from a line and pass it to the parser."""
+        line = ANSI_ESCAPE_PATTERN.sub("", raw_line).rstrip("\r")
+        # Carriage returns redraw the line in place; keep what ends up visible
+        if "\r" in line:
+            line = line.rsplit("\r", 1)[-1]
+        self._lines_seen += 1
+
+        if self.parser is None:
+            self._detect(line)
+        elif isinstance(self.parser, StreamingOutputParser):
+            self.parser.scan_line(line, self.state)
+
+    def _detect(self, line: str) -> None:
+        """Buffer a line until the runner is recognized, then replay."""
+        self._undetected.append(line)
+        self._undetected_size += len(line) + 1
+        while self._undetected_size > STREAM_DETECT_BYTES and len(self._undetected) > 1:
+            self._undetected_size -= len(self._undetected.popleft()) + 1
+
+        parser = self.registry.detect_parser("\n".join(self._undetected))
+        if parser is None:
+            return
+        self.parser = parser
+        buffered = list(self._undetected)
+        self._undetected.clear()
+        self._undetected_size = 0
+        if not isinstance(parser, StreamingOutputParser):
+            return
+        for buffered_line in buffered:
+            parser.scan_line(buffered_line, self.state)
+
+    def _append_tail(self, chunk: str) -> None:
+        """Keep the last ``tail_bytes`` of raw output."""
+        self._tail.append(chunk)
+        self._tail_size += len(chunk)
+        while self._tail_size > self._tail_limit and len(self._tail) > 1:
+            self._tail_size -= len(self._tail.popleft())
+        if self._tail_size > self._tail_limit:
+            self._tail[0] = self._tail[0][-self._tail_limit :]
+            self._tail_size = len(self._tail[0])
+
+
 # Global registry instance
 _registry = OutputParserRegistry()
 
@@ -607,6 +1183,22 @@ def parse_test_output(output: str, test_command: str = "") -> UnitTestResults:
     return _registry.parse(output, test_command)
 
 
+def create_streaming_parser(
+    test_command: str = "",
+    on_progress: Callable[[StreamingTestParser], None] | None = None,
+) -> StreamingTestParser:
+    """Create a parser that consumes test output as it is produced.
+
+    Args:
+        test_command: The command being run (optional, helps with parser selection).
+        on_progress: Called after each chunk that changes the counts.
+
+    Returns:
+        A new StreamingTestParser.
+    """
+    return _registry.create_stream(test_command, on_progress)
+
+
 def get_parser_registry() -> OutputParserRegistry:
     """Get the global parser registry for customization."""
     return _registry
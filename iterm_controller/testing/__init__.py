@@ -1,9 +1,17 @@
 """Testing utilities for iterm_controller.
 
-This package provides mock implementations of terminal protocols
-for unit testing without requiring iTerm2 to be running.
+This package provides mock implementations of terminal protocols and
+iTerm2 app objects for unit testing without requiring iTerm2 to be
+running, and an in-memory notification backend for testing
+notifications headless.
 """
 
+from iterm_controller.testing.mock_iterm import (
+    MockItermApp,
+    MockItermSession,
+    MockItermTab,
+    MockItermWindow,
+)
 from iterm_controller.testing.mock_terminal import (
     MockConnection,
     MockOutputReader,
@@ -12,6 +20,10 @@ from iterm_controller.testing.mock_terminal import (
     MockTerminalProvider,
     MockWindowTracker,
 )
+from iterm_controller.testing.notification_sink import (
+    DeliveredNotification,
+    InMemoryNotificationSink,
+)
 
 __all__ = [
     "MockTerminalProvider",
@@ -20,4 +32,10 @@ __all__ = [
     "MockSessionTerminator",
     "MockOutputReader",
     "MockWindowTracker",
+    "MockItermApp",
+    "MockItermWindow",
+    "MockItermTab",
+    "MockItermSession",
+    "InMemoryNotificationSink",
+    "DeliveredNotification",
 ]
@@ -0,0 +1,227 @@
+"""Mock iTerm2 app objects with simulated RPC latency.
+
+Code such as WindowLayoutSpawner drives iterm2.Window, Tab and Session
+objects directly rather than going through the terminal protocols. These
+mocks stand in for those objects. Every ``async_*`` call sleeps for
+``rpc_latency`` seconds, like one websocket round-trip to iTerm2, so tests
+can measure how many round-trips are on an operation's critical path.
+
+Example usage in tests:
+    from unittest.mock import patch
+
+    from iterm_controller.testing import MockTerminalProvider
+
+    async def test_layout():
+        provider = MockTerminalProvider(rpc_latency=0.01)
+        app = provider.mock_iterm_app
+        controller.app = app
+
+        with patch("iterm2.Window.async_create", app.async_create_window):
+            result = await layout_spawner.spawn_layout(layout, project, templates)
+
+        assert len(app.sessions) == 3
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+
+
+class MockItermSession:
+    """Mock iterm2.Session."""
+
+    def __init__(self, app: MockItermApp, session_id: str, tab: MockItermTab) -> None:
+        self.app = app
+        self.session_id = session_id
+        self.tab = tab
+        self.sent_text: list[str] = []
+
+    async def async_send_text(self, text: str) -> None:
+        """Record text sent to the session."""
+        await self.app.rpc("send_text")
+        self.sent_text.append(text)
+
+    async def async_split_pane(
+        self, vertical: bool = False, before: bool = False, profile: str | None = None
+    ) -> MockItermSession:
+        """Split the session, adding a new session to its tab."""
+        await self.app.rpc("split_pane")
+        session = self.app.new_session(self.tab)
+        position = self.tab.sessions.index(self) + (0 if before else 1)
+        self.tab.sessions.insert(position, session)
+        return session
+
+    async def async_close(self, force: bool = False) -> None:
+        """Close the session, and its tab if it was the last one."""
+        await self.app.rpc("close")
+        self.app.remove_session(self)
+
+
+class MockItermTab:
+    """Mock iterm2.Tab."""
+
+    def __init__(self, app: MockItermApp, tab_id: str, window: MockItermWindow) -> None:
+        self.app = app
+        self.tab_id = tab_id
+        self.window = window
+        self.title = ""
+        self.sessions: list[MockItermSession] = []
+        self.sessions.append(app.new_session(self))
+
+    @property
+    def current_session(self) -> MockItermSession | None:
+        """Get the tab's first session."""
+        return self.sessions[0] if self.sessions else None
+
+    async def async_set_title(self, title: str) -> None:
+        """Set the tab title."""
+        await self.app.rpc("set_title")
+        self.title = title
+
+    async def async_get_variable(self, name: str) -> str | None:
+        """Get a tab variable (only "title" is known)."""
+        await self.app.rpc("get_variable")
+        return self.title if name == "title" else None
+
+
+class MockItermWindow:
+    """Mock iterm2.Window."""
+
+    def __init__(self, app: MockItermApp, window_id: str) -> None:
+        self.app = app
+        self.window_id = window_id
+        self.tabs: list[MockItermTab] = []
+        self.tabs.append(app.new_tab(self))
+
+    @property
+    def current_tab(self) -> MockItermTab | None:
+        """Get the window's first tab."""
+        return self.tabs[0] if self.tabs else None
+
+    async def async_create_tab(self, **kwargs: object) -> MockItermTab:
+        """Append a new tab to the window."""
+        await self.app.rpc("create_tab")
+        tab = self.app.new_tab(self)
+        self.tabs.append(tab)
+        return tab
+
+    async def async_set_tabs(self, tabs: list[MockItermTab]) -> None:
+        """Make tabs (from any window) this window's tabs, in order."""
+        await self.app.rpc("set_tabs")
+        for tab in tabs:
+            if tab.window is not self:
+                tab.window.tabs.remove(tab)
+                tab.window = self
+        self.tabs = list(tabs)
+        self.app.drop_empty_windows()
+
+    async def async_activate(self) -> None:
+        """Make this the current window."""
+        await self.app.rpc("activate")
+        self.app.current_terminal_window = self
+
+
+class MockItermApp:
+    """Mock iterm2.App holding windows, tabs and sessions.
+
+    Attributes:
+        rpc_latency: Seconds each async_* call takes.
+        rpc_counts: Number of calls per RPC name.
+        max_in_flight: Largest number of RPCs that were in flight at once.
+    """
+
+    def __init__(self, rpc_latency: float = 0.0) -> None:
+        """Initialize the app.
+
+        Args:
+            rpc_latency: Seconds each async_* call takes.
+        """
+        self.rpc_latency = rpc_latency
+        self.windows: list[MockItermWindow] = []
+        self.current_terminal_window: MockItermWindow | None = None
+        self.rpc_counts: dict[str, int] = {}
+        self.max_in_flight = 0
+        self._in_flight = 0
+        self._sessions: dict[str, MockItermSession] = {}
+        self._ids = itertools.count(1)
+
+    async def rpc(self, name: str) -> None:
+        """Simulate one round-trip to iTerm2."""
+        self.rpc_counts[name] = self.rpc_counts.get(name, 0) + 1
+        self._in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self._in_flight)
+        try:
+            await asyncio.sleep(self.rpc_latency)
+        finally:
+            self._in_flight -= 1
+
+    async def async_create_window(
+        self, connection: object = None, **kwargs: object
+    ) -> MockItermWindow:
+        """Create a window (stands in for iterm2.Window.async_create)."""
+        await self.rpc("create_window")
+        window = MockItermWindow(self, f"mock-window-{next(self._ids)}")
+        self.windows.append(window)
+        self.current_terminal_window = window
+        return window
+
+    @property
+    def terminal_windows(self) -> list[MockItermWindow]:
+        """Get all windows (stands in for iterm2.App.terminal_windows)."""
+        return self.windows
+
+    def get_session_by_id(self, session_id: str) -> MockItermSession | None:
+        """Look up a session by ID."""
+        return self._sessions.get(session_id)
+
+    def get_tab_by_id(self, tab_id: str) -> MockItermTab | None:
+        """Look up a tab by ID."""
+        for window in self.windows:
+            for tab in window.tabs:
+                if tab.tab_id == tab_id:
+                    return tab
+        return None
+
+    def get_window_by_id(self, window_id: str) -> MockItermWindow | None:
+        """Look up a window by ID."""
+        for window in self.windows:
+            if window.window_id == window_id:
+                return window
+        return None
+
+    @property
+    def sessions(self) -> list[MockItermSession]:
+        """Get all sessions, in creation order."""
+        return list(self._sessions.values())
+
+    @property
+    def total_rpcs(self) -> int:
+        """Get the total number of RPCs made."""
+        return sum(self.rpc_counts.values())
+
+    def new_tab(self, window: MockItermWindow) -> MockItermTab:
+        """Create a tab object (no RPC)."""
+        return MockItermTab(self, f"mock-tab-{next(self._ids)}", window)
+
+    def new_session(self, tab: MockItermTab) -> MockItermSession:
+        """Create a session object (no RPC)."""
+        session = MockItermSession(self, f"mock-session-{next(self._ids)}", tab)
+        self._sessions[session.session_id] = session
+        return session
+
+    def remove_session(self, session: MockItermSession) -> None:
+        """Drop a closed session, closing its tab and window when they empty (no RPC)."""
+        self._sessions.pop(session.session_id, None)
+        tab = session.tab
+        if session in tab.sessions:
+            tab.sessions.remove(session)
+        if not tab.sessions and tab in tab.window.tabs:
+            tab.window.tabs.remove(tab)
+        self.drop_empty_windows()
+
+    def drop_empty_windows(self) -> None:
+        """Close windows without tabs, like iTerm2 does (no RPC)."""
+        self.windows = [w for w in self.windows if w.tabs]
+        if self.current_terminal_window not in self.windows:
+            self.current_terminal_window = self.windows[-1] if self.windows else None
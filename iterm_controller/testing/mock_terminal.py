@@ -27,6 +27,7 @@ from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
 from iterm_controller.models import ManagedSession
+from iterm_controller.testing.mock_iterm import MockItermApp
 from iterm_controller.ports import (
     CloseResultData,
     OutputReaderProtocol,
@@ -482,12 +483,19 @@ class MockTerminalProvider:
             assert "Should I proceed" in output
     """
 
-    def __init__(self) -> None:
+    def __init__(self, rpc_latency: float = 0.0) -> None:
+        """Initialize the provider.
+
+        Args:
+            rpc_latency: Seconds each call on mock_iterm_app's windows, tabs
+                and sessions takes.
+        """
         self._connection = MockConnection()
         self._spawner = MockSessionSpawner()
         self._terminator = MockSessionTerminator(self._spawner)
         self._output_reader = MockOutputReader()
         self._tracker = MockWindowTracker()
+        self._iterm_app = MockItermApp(rpc_latency)
 
     @property
     def connection(self) -> TerminalConnection:
@@ -529,3 +537,8 @@ class MockTerminalProvider:
     @property
     def mock_tracker(self) -> MockWindowTracker:
         return self._tracker
+
+    @property
+    def mock_iterm_app(self) -> MockItermApp:
+        """Mock iTerm2 app for code that drives windows, tabs and sessions."""
+        return self._iterm_app
@@ -0,0 +1,176 @@
+"""In-memory notification backend for testing.
+
+Records every notification instead of showing it, so notification
+behaviour, throughput and latency can be tested headless on any platform.
+
+Example usage in tests:
+    from iterm_controller.notifications import Notifier
+    from iterm_controller.testing import InMemoryNotificationSink
+
+    async def test_waiting_notification():
+        sink = InMemoryNotificationSink()
+        notifier = Notifier(backend=sink)
+        await notifier.initialize()
+
+        await notifier.notify("my-project", "Session needs your attention")
+        assert sink.messages == ["Session needs your attention"]
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import dataclass
+
+from iterm_controller.ports import NotificationRequest
+
+
+@dataclass
+class DeliveredNotification:
+    """A notification recorded by the sink."""
+
+    request: NotificationRequest
+    """The delivered notification."""
+
+    delivered_at: float
+    """time.monotonic() when the notification was recorded."""
+
+    batch: int
+    """Index of the send/send_batch call that delivered it."""
+
+
+class InMemoryNotificationSink:
+    """Notification backend that records deliveries in memory.
+
+    Implements NotificationBackend. Deliveries are timestamped with
+    time.monotonic(), the same clock NotificationLatencyTracker uses.
+    ``delay`` simulates a slow backend, and set_available() and
+    set_send_failure() simulate a missing or failing one.
+    """
+
+    name = "memory"
+
+    def __init__(self, delay: float = 0.0) -> None:
+        """Initialize the sink.
+
+        Args:
+            delay: Seconds each send or batch takes.
+        """
+        self.delay = delay
+        self.deliveries: list[DeliveredNotification] = []
+        self.removed_groups: list[str] = []
+        self._visible: dict[str, NotificationRequest] = {}
+        self._available = True
+        self._fail_groups: set[str] = set()
+        self._fail_all = False
+        self._batches = 0
+        self._delivered = asyncio.Condition()
+
+    # -------------------------------------------------------------------------
+    # NotificationBackend
+    # -------------------------------------------------------------------------
+
+    async def check_available(self) -> tuple[bool, str | None]:
+        """Report availability as configured with set_available()."""
+        if self._available:
+            return (True, None)
+        return (False, "memory sink disabled")
+
+    async def send(self, request: NotificationRequest) -> bool:
+        """Record one notification."""
+        return (await self.send_batch([request]))[0]
+
+    async def send_batch(self, requests: list[NotificationRequest]) -> list[bool]:
+        """Record several notifications as one batch."""
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        batch = self._batches
+        self._batches += 1
+        results = []
+        for request in requests:
+            ok = not self._fail_all and request.group not in self._fail_groups
+            if ok:
+                self.deliveries.append(
+                    DeliveredNotification(request, time.monotonic(), batch)
+                )
+                # A new notification replaces the previous one in its group
+                self._visible.pop(request.group, None)
+                self._visible[request.group] = request
+            results.append(ok)
+        async with self._delivered:
+            self._delivered.notify_all()
+        return results
+
+    async def remove_group(self, group: str) -> bool:
+        """Record the removal of a group."""
+        self.removed_groups.append(group)
+        self._visible.pop(group, None)
+        return True
+
+    # -------------------------------------------------------------------------
+    # Inspection
+    # -------------------------------------------------------------------------
+
+    @property
+    def messages(self) -> list[str]:
+        """Get the message of every delivered notification, in order."""
+        return [d.request.message for d in self.deliveries]
+
+    @property
+    def batch_count(self) -> int:
+        """Get the number of send/send_batch calls."""
+        return self._batches
+
+    def visible(self) -> list[NotificationRequest]:
+        """Get notifications still shown, oldest first.
+
+        A notification stays visible until its group is removed or a later
+        notification in the same group replaces it.
+        """
+        return list(self._visible.values())
+
+    async def wait_for(self, count: int, timeout: float = 5.0) -> list[DeliveredNotification]:
+        """Wait until at least ``count`` notifications have been delivered.
+
+        Args:
+            count: Number of deliveries to wait for.
+            timeout: Seconds to wait before raising TimeoutError.
+
+        Returns:
+            The deliveries so far.
+        """
+        async with self._delivered:
+            await asyncio.wait_for(
+                self._delivered.wait_for(lambda: len(self.deliveries) >= count),
+                timeout,
+            )
+        return list(self.deliveries)
+
+    def clear(self) -> None:
+        """Forget all recorded deliveries and removals."""
+        self.deliveries.clear()
+        self.removed_groups.clear()
+        self._visible.clear()
+        self._batches = 0
+
+    # -------------------------------------------------------------------------
+    # Failure simulation
+    # -------------------------------------------------------------------------
+
+    def set_available(self, available: bool) -> None:
+        """Configure what check_available() reports."""
+        self._available = available
+
+    def set_send_failure(self, group: str | None = None, fail: bool = True) -> None:
+        """Make sends fail.
+
+        Args:
+            group: Only fail notifications in this group (all if None).
+            fail: Whether to fail (False restores delivery).
+        """
+        if group is None:
+            self._fail_all = fail
+        elif fail:
+            self._fail_groups.add(group)
+        else:
+            self._fail_groups.discard(group)
@@ -0,0 +1,440 @@
+"""Persistent session transcripts in compressed append-only files.
+
+The monitor only keeps recent output in memory, so anything older is lost.
+TranscriptWriter appends every chunk of new output the monitor extracts to a
+per-session transcript on disk:
+
+    transcripts/<session>/
+        meta.json           session, project and template IDs
+        000001.jsonl.gz     segments of gzip frames
+        index.jsonl         one line per frame: segment, offset, length, times
+
+Chunks are buffered in memory and written by a background flush, in a
+worker thread so the event loop never blocks on disk. Each flush appends
+one gzip member (a frame) per session holding JSON lines
+``{"t": timestamp, "o": output}``, so a segment is a valid gzip file that
+``zcat`` reads whole. Segments rotate when they reach ``segment_bytes``.
+The index lets TranscriptStore decompress only the frames in a time range,
+so transcripts can be read back without loading them into memory.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import gzip
+import json
+import logging
+import re
+import time
+from collections.abc import Callable, Iterator
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from iterm_controller.config import get_config_dir
+
+if TYPE_CHECKING:
+    from iterm_controller.models import ManagedSession
+    from iterm_controller.session_monitor import OutputChange
+
+logger = logging.getLogger(__name__)
+
+# Rotate to a new segment file at this compressed size
+DEFAULT_SEGMENT_BYTES = 8 * 1024 * 1024
+
+# Flush early once this much output is buffered
+DEFAULT_MAX_BUFFERED_BYTES = 256 * 1024
+
+INDEX_FILE = "index.jsonl"
+META_FILE = "meta.json"
+SEGMENT_SUFFIX = ".jsonl.gz"
+
+_UNSAFE_CHARS = re.compile(r"[^A-Za-z0-9_.-]")
+
+
+def default_transcript_dir() -> Path:
+    """Get the default transcript directory (in the config directory)."""
+    return get_config_dir() / "transcripts"
+
+
+def session_dir_name(session_id: str) -> str:
+    """Get a filesystem-safe directory name for a session ID.
+
+    iTerm2 session IDs look like ``w0t1p0:UUID``; the colon is replaced.
+    """
+    return _UNSAFE_CHARS.sub("_", session_id)
+
+
+@dataclass
+class TranscriptRecord:
+    """One chunk of session output.
+
+    Attributes:
+        session_id: The session that produced the output.
+        timestamp: Unix time the monitor saw the output.
+        output: The new output.
+        gap: Whether output before this chunk was missed.
+    """
+
+    session_id: str
+    timestamp: float
+    output: str
+    gap: bool = False
+
+
+@dataclass
+class FrameIndexEntry:
+    """Where one frame of a transcript lives.
+
+    Attributes:
+        segment: Segment file name.
+        offset: Byte offset of the frame in the segment.
+        length: Compressed length of the frame.
+        start: Timestamp of the frame's first record.
+        end: Timestamp of the frame's last record.
+        records: Number of records in the frame.
+    """
+
+    segment: str
+    offset: int
+    length: int
+    start: float
+    end: float
+    records: int
+
+
+@dataclass
+class TranscriptInfo:
+    """A transcript on disk.
+
+    Attributes:
+        session_id: The session ID.
+        project_id: The session's project.
+        template_id: The template the session was spawned from.
+        created: Unix time of the first record.
+        path: The transcript directory.
+    """
+
+    session_id: str
+    project_id: str
+    template_id: str
+    created: float
+    path: Path
+
+
+class TranscriptWriter:
+    """Appends session output to compressed per-session transcripts.
+
+    Example:
+        writer = TranscriptWriter()
+        monitor.add_output_hook(writer.on_output)
+        await writer.start()
+        ...
+        await writer.stop()  # Flushes what is still buffered
+    """
+
+    def __init__(
+        self,
+        directory: Path | None = None,
+        segment_bytes: int = DEFAULT_SEGMENT_BYTES,
+        flush_interval: float = 1.0,
+        max_buffered_bytes: int = DEFAULT_MAX_BUFFERED_BYTES,
+        compresslevel: int = 6,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """Initialize the writer.
+
+        Args:
+            directory: Transcript directory (defaults to the config directory).
+            segment_bytes: Compressed size at which a segment is rotated.
+            flush_interval: Seconds between background flushes.
+            max_buffered_bytes: Buffered output that triggers an early flush.
+            compresslevel: gzip compression level (1-9).
+            clock: Wall clock for record timestamps (injectable for tests).
+        """
+        self.directory = directory or default_transcript_dir()
+        self.segment_bytes = segment_bytes
+        self.flush_interval = flush_interval
+        self.max_buffered_bytes = max_buffered_bytes
+        self.compresslevel = compresslevel
+        self._clock = clock
+        self._buffers: dict[str, list[dict[str, Any]]] = {}
+        self._buffered_bytes = 0
+        self._pending_meta: dict[str, dict[str, Any]] = {}
+        self._known_sessions: set[str] = set()
+        # Current segment (name, size) per session; only used by the writer thread
+        self._segments: dict[str, tuple[str, int]] = {}
+        self._lock = asyncio.Lock()
+        self._task: asyncio.Task[None] | None = None
+        self._flush_task: asyncio.Task[int] | None = None
+
+    @property
+    def buffered_bytes(self) -> int:
+        """Get the size of output waiting to be written."""
+        return self._buffered_bytes
+
+    def append(
+        self,
+        session_id: str,
+        output: str,
+        gap: bool = False,
+        project_id: str = "",
+        template_id: str = "",
+        timestamp: float | None = None,
+    ) -> None:
+        """Buffer a chunk of output for a session's transcript.
+
+        Args:
+            session_id: The session that produced the output.
+            output: The new output.
+            gap: Whether output before this chunk was missed.
+            project_id: The session's project (recorded once per transcript).
+            template_id: The session's template (recorded once per transcript).
+            timestamp: Unix time of the output (defaults to now).
+        """
+        if not output and not gap:
+            return
+        timestamp = self._clock() if timestamp is None else timestamp
+        record: dict[str, Any] = {"t": timestamp, "o": output}
+        if gap:
+            record["gap"] = True
+        self._buffers.setdefault(session_id, []).append(record)
+        self._buffered_bytes += len(output)
+
+        if session_id not in self._known_sessions:
+            self._known_sessions.add(session_id)
+            self._pending_meta[session_id] = {
+                "session_id": session_id,
+                "project_id": project_id,
+                "template_id": template_id,
+                "created": timestamp,
+            }
+
+        if self._buffered_bytes >= self.max_buffered_bytes:
+            self._schedule_flush()
+
+    def on_output(self, session: ManagedSession, change: OutputChange) -> None:
+        """Monitor output hook: buffer a session's new output."""
+        self.append(
+            session.id,
+            change.new_output,
+            gap=change.gap,
+            project_id=session.project_id,
+            template_id=session.template_id,
+        )
+
+    def _schedule_flush(self) -> None:
+        """Flush in the background unless a flush is already scheduled."""
+        if self._flush_task is not None and not self._flush_task.done():
+            return
+        try:
+            self._flush_task = asyncio.get_running_loop().create_task(self.flush())
+        except RuntimeError:
+            pass  # No loop; the next flush picks the output up
+
+    # -------------------------------------------------------------------------
+    # Lifecycle
+    # -------------------------------------------------------------------------
+
+    async def start(self) -> None:
+        """Start flushing buffered output periodically."""
+        if self._task is not None and not self._task.done():
+            return
+        self._task = asyncio.create_task(self._run())
+        logger.debug(f"Transcript writer started ({self.directory})")
+
+    async def stop(self) -> None:
+        """Stop the periodic flush and write what is still buffered."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+        logger.debug("Transcript writer stopped")
+
+    async def _run(self) -> None:
+        """Flush periodically."""
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            await self.flush()
+
+    # -------------------------------------------------------------------------
+    # Writing
+    # -------------------------------------------------------------------------
+
+    async def flush(self) -> int:
+        """Write buffered output to disk in a worker thread.
+
+        Returns:
+            The number of records written.
+        """
+        async with self._lock:
+            if not self._buffers:
+                return 0
+            buffers, self._buffers = self._buffers, {}
+            meta, self._pending_meta = self._pending_meta, {}
+            self._buffered_bytes = 0
+            try:
+                return await asyncio.to_thread(self._write, buffers, meta)
+            except Exception as e:
+                logger.error(f"Failed to write transcripts: {e}")
+                return 0
+
+    def _write(
+        self, buffers: dict[str, list[dict[str, Any]]], meta: dict[str, dict[str, Any]]
+    ) -> int:
+        """Append one frame per session (runs in a worker thread)."""
+        written = 0
+        for session_id, records in buffers.items():
+            session_dir = self.directory / session_dir_name(session_id)
+            try:
+                session_dir.mkdir(parents=True, exist_ok=True)
+                if session_id in meta and not (session_dir / META_FILE).exists():
+                    (session_dir / META_FILE).write_text(json.dumps(meta[session_id]))
+                self._append_frame(session_id, session_dir, records)
+                written += len(records)
+            except OSError as e:
+                logger.error(f"Failed to write transcript for session {session_id}: {e}")
+        return written
+
+    def _append_frame(
+        self, session_id: str, session_dir: Path, records: list[dict[str, Any]]
+    ) -> None:
+        """Compress records into a gzip member and append it to a segment."""
+        payload = "".join(json.dumps(record) + "\n" for record in records)
+        frame = gzip.compress(payload.encode("utf-8"), self.compresslevel, mtime=0)
+
+        segment, size = self._current_segment(session_id, session_dir)
+        if size and size + len(frame) > self.segment_bytes:
+            segment = f"{int(segment.split('.', 1)[0]) + 1:06d}{SEGMENT_SUFFIX}"
+            size = 0
+
+        with open(session_dir / segment, "ab") as f:
+            f.write(frame)
+        self._segments[session_id] = (segment, size + len(frame))
+
+        # The frame is written first, so the index never points past the data
+        entry = FrameIndexEntry(
+            segment=segment,
+            offset=size,
+            length=len(frame),
+            start=records[0]["t"],
+            end=records[-1]["t"],
+            records=len(records),
+        )
+        with open(session_dir / INDEX_FILE, "a", encoding="utf-8") as f:
+            f.write(json.dumps(asdict(entry)) + "\n")
+
+    def _current_segment(self, session_id: str, session_dir: Path) -> tuple[str, int]:
+        """Get the newest segment of a transcript and its size."""
+        current = self._segments.get(session_id)
+        if current is not None:
+            return current
+        segments = sorted(session_dir.glob(f"*{SEGMENT_SUFFIX}"))
+        if not segments:
+            return f"{1:06d}{SEGMENT_SUFFIX}", 0
+        return segments[-1].name, segments[-1].stat().st_size
+
+
+class TranscriptStore:
+    """Reads transcripts written by TranscriptWriter.
+
+    Reads stream frame by frame, so memory use does not grow with the
+    transcript's size.
+    """
+
+    def __init__(self, directory: Path | None = None) -> None:
+        """Initialize the store.
+
+        Args:
+            directory: Transcript directory (defaults to the config directory).
+        """
+        self.directory = directory or default_transcript_dir()
+
+    def sessions(self) -> list[TranscriptInfo]:
+        """List transcripts on disk, oldest first."""
+        if not self.directory.is_dir():
+            return []
+        infos = []
+        for meta_path in self.directory.glob(f"*/{META_FILE}"):
+            try:
+                meta = json.loads(meta_path.read_text())
+            except (OSError, ValueError) as e:
+                logger.debug(f"Skipping unreadable transcript {meta_path.parent}: {e}")
+                continue
+            infos.append(
+                TranscriptInfo(
+                    session_id=meta.get("session_id", meta_path.parent.name),
+                    project_id=meta.get("project_id", ""),
+                    template_id=meta.get("template_id", ""),
+                    created=meta.get("created", 0.0),
+                    path=meta_path.parent,
+                )
+            )
+        return sorted(infos, key=lambda info: info.created)
+
+    def index(self, session_id: str) -> list[FrameIndexEntry]:
+        """Get a transcript's frame index, in write order."""
+        index_path = self.directory / session_dir_name(session_id) / INDEX_FILE
+        try:
+            with open(index_path, encoding="utf-8") as f:
+                lines = f.readlines()
+        except FileNotFoundError:
+            return []
+        entries = []
+        for line in lines:
+            try:
+                entries.append(FrameIndexEntry(**json.loads(line)))
+            except (TypeError, ValueError):
+                continue  # Torn last line from a crash mid-write
+        return entries
+
+    def read(
+        self,
+        session_id: str,
+        since: float | None = None,
+        until: float | None = None,
+    ) -> Iterator[TranscriptRecord]:
+        """Stream a transcript's records, optionally limited to a time range.
+
+        Frames entirely outside the range are skipped without decompressing.
+
+        Args:
+            session_id: The session ID.
+            since: Only records at or after this Unix time.
+            until: Only records at or before this Unix time.
+
+        Yields:
+            TranscriptRecord for each chunk of output, oldest first.
+        """
+        session_dir = self.directory / session_dir_name(session_id)
+        for entry in self.index(session_id):
+            if (since is not None and entry.end < since) or (
+                until is not None and entry.start > until
+            ):
+                continue
+            for record in self._read_frame(session_dir, entry):
+                if since is not None and record["t"] < since:
+                    continue
+                if until is not None and record["t"] > until:
+                    continue
+                yield TranscriptRecord(
+                    session_id=session_id,
+                    timestamp=record["t"],
+                    output=record["o"],
+                    gap=record.get("gap", False),
+                )
+
+    def _read_frame(self, session_dir: Path, entry: FrameIndexEntry) -> list[dict[str, Any]]:
+        """Decompress one frame into its records."""
+        try:
+            with open(session_dir / entry.segment, "rb") as f:
+                f.seek(entry.offset)
+                data = gzip.decompress(f.read(entry.length))
+        except (OSError, EOFError, gzip.BadGzipFile) as e:
+            logger.warning(f"Skipping unreadable transcript frame in {session_dir}: {e}")
+            return []
+        return [json.loads(line) for line in data.decode("utf-8").splitlines() if line]
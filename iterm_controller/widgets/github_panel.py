@@ -6,13 +6,16 @@ Handles unavailable/unauthenticated states gracefully.
 
 from __future__ import annotations
 
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from rich.text import Text
 from textual.widgets import Static
 
 from iterm_controller.models import GitHubStatus, PullRequest
 
+if TYPE_CHECKING:
+    from iterm_controller.github import GitHubPoller
+
 
 class GitHubPanelWidget(Static):
     """Displays GitHub status with graceful degradation.
@@ -87,6 +90,26 @@ class GitHubPanelWidget(Static):
         self._error_message = None
         self.update(self._render_panel())
 
+    def load_from_poller(self, poller: GitHubPoller, project_path: str) -> None:
+        """Show the poller's cached status for a project.
+
+        Never triggers a fetch; the poller owns all GitHub refreshes and the
+        panel is updated again when it posts GitHubStatusChanged.
+
+        Args:
+            poller: The GitHub poller holding the cache.
+            project_path: Path to the project directory.
+        """
+        if not poller.github.available:
+            self.set_unavailable(poller.github.error_message)
+            return
+        status = poller.get_cached_status(project_path)
+        if status is None:
+            poller.request_refresh(project_path)
+            self.set_error("Loading...")
+            return
+        self.update_status(status)
+
     def set_error(self, message: str) -> None:
         """Set an error message and refresh display.
 
@@ -16,11 +16,14 @@ from textual.message import Message
 from textual.widgets import Static
 
 from iterm_controller.models import AttentionState, ManagedSession, SessionProgress, SessionType
+from iterm_controller.resource_monitor import format_bytes, render_sparkline
 from iterm_controller.status_display import get_attention_color, get_attention_icon
 
 if TYPE_CHECKING:
     from textual.app import ComposeResult
 
+    from iterm_controller.resource_monitor import ResourceTimeline
+
 
 # Constants for output log sizing
 COLLAPSED_OUTPUT_LINES = 4
@@ -254,6 +257,78 @@ class OrchestratorProgress(Static):
         self.refresh()
 
 
+class ResourceSparkline(Static):
+    """CPU and memory sparklines for a session's process tree.
+
+    Hidden until the first sample arrives.
+
+    Example:
+        CPU ▁▁▂▅█▇▃  42% | RSS ▃▃▄▄▅▅▆ 512.0M | 38 fds
+    """
+
+    DEFAULT_CSS = """
+    ResourceSparkline {
+        height: 1;
+        padding: 0 1;
+    }
+    """
+
+    # Number of samples shown in each sparkline
+    SPARKLINE_WIDTH = 20
+
+    def __init__(self, timeline: ResourceTimeline | None = None, **kwargs: Any) -> None:
+        """Initialize the sparkline widget.
+
+        Args:
+            timeline: Resource samples to display.
+            **kwargs: Additional arguments passed to Static.
+        """
+        super().__init__(**kwargs)
+        self.timeline = timeline
+        self.display = bool(timeline and timeline.latest)
+
+    def render(self) -> Text:
+        """Render CPU and RSS sparklines with the latest values.
+
+        Returns:
+            Rich Text object containing the sparklines.
+        """
+        latest = self.timeline.latest if self.timeline else None
+        if not self.timeline or latest is None:
+            return Text("")
+
+        cpu = self.timeline.cpu_series()
+        text = Text()
+        text.append("CPU ", style="dim")
+        # Scale to at least one full core so idle noise stays flat
+        text.append(
+            render_sparkline(cpu, self.SPARKLINE_WIDTH, max(100.0, max(cpu))),
+            style="yellow" if latest.cpu_percent >= 50 else "cyan",
+        )
+        text.append(f" {latest.cpu_percent:3.0f}%")
+        text.append(" | ", style="dim")
+        text.append("RSS ", style="dim")
+        text.append(
+            render_sparkline(self.timeline.rss_series(), self.SPARKLINE_WIDTH),
+            style="magenta",
+        )
+        text.append(f" {format_bytes(latest.rss_bytes)}")
+        if latest.open_fds is not None:
+            text.append(" | ", style="dim")
+            text.append(f"{latest.open_fds} fds", style="dim")
+        return text
+
+    def update_timeline(self, timeline: ResourceTimeline | None) -> None:
+        """Update the timeline and refresh display.
+
+        Args:
+            timeline: New resource samples to display.
+        """
+        self.timeline = timeline
+        self.display = bool(timeline and timeline.latest)
+        self.refresh()
+
+
 class OutputLog(Static):
     """Scrollable output display with ANSI color support.
 
@@ -376,6 +451,7 @@ class SessionCard(Static, can_focus=True):
     Each session gets a card showing:
     - Header with project name, session info, status, duration
     - Progress bar (only for orchestrator sessions)
+    - CPU/RSS sparklines (once resource samples are available)
     - Live output log
 
     Cards can be expanded/collapsed to show more or less output.
@@ -459,6 +535,9 @@ class SessionCard(Static, can_focus=True):
         if self.session.session_type == SessionType.ORCHESTRATOR:
             yield OrchestratorProgress(self.session.progress, id="progress")
 
+        # CPU/RSS sparklines (hidden until sampled)
+        yield ResourceSparkline(id="resources")
+
         # Separator
         yield Static("─" * 70, classes="separator")
 
@@ -510,6 +589,18 @@ class SessionCard(Static, can_focus=True):
         except Exception:
             pass
 
+    def update_resources(self, timeline: ResourceTimeline | None) -> None:
+        """Update the resource sparklines.
+
+        Args:
+            timeline: The session's resource samples.
+        """
+        try:
+            sparkline = self.query_one("#resources", ResourceSparkline)
+            sparkline.update_timeline(timeline)
+        except Exception:
+            pass
+
     def toggle_expanded(self) -> None:
         """Toggle between expanded and collapsed views."""
         self.expanded = not self.expanded
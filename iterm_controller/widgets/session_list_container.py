@@ -19,6 +19,8 @@ from iterm_controller.widgets.session_card import SessionCard
 if TYPE_CHECKING:
     from textual.app import ComposeResult
 
+    from iterm_controller.resource_monitor import ResourceTimeline
+
 
 def sort_sessions(sessions: list[ManagedSession]) -> list[ManagedSession]:
     """Sort sessions by attention state and last activity.
@@ -356,6 +358,21 @@ class SessionList(ScrollableContainer, can_focus=True):
         except Exception:
             pass  # Card may not exist
 
+    def update_session_resources(
+        self, session_id: str, timeline: ResourceTimeline | None
+    ) -> None:
+        """Update the resource sparklines for a session.
+
+        Args:
+            session_id: ID of the session to update.
+            timeline: The session's resource samples.
+        """
+        try:
+            card = self.query_one(f"#session-{session_id}", SessionCard)
+            card.update_resources(timeline)
+        except Exception:
+            pass  # Card may not exist
+
     def remove_session(self, session_id: str) -> None:
         """Remove a session from the list.
 
@@ -23,6 +23,7 @@ from iterm_controller.task_dependency import TaskDependencyResolver
 
 if TYPE_CHECKING:
     from iterm_controller.models import Project
+    from iterm_controller.review_scheduler import ReviewQueueStats
 
 
 class TaskRow(Static):
@@ -221,6 +222,7 @@ class TasksSection(Static):
         self._collapsed_phases: set[str] = set()
         self._selected_index = 0
         self._plan: Plan | None = None
+        self._review_queue: ReviewQueueStats | None = None
         self._dependency_resolver = TaskDependencyResolver()
         super().__init__(**kwargs)
 
@@ -285,6 +287,24 @@ class TasksSection(Static):
         self._dependency_resolver.update_plan(plan)
         self.refresh()
 
+    def set_review_queue(self, stats: ReviewQueueStats) -> None:
+        """Show the review queue depth in the section header.
+
+        Args:
+            stats: Latest review queue snapshot.
+        """
+        self._review_queue = stats
+        self.refresh()
+
+    def _format_header(self) -> str:
+        """Format the section header, with review queue depth if busy."""
+        collapse_icon = ">" if self._collapsed else "v"
+        header = f"{collapse_icon} Tasks"
+        queue = self._review_queue
+        if queue is not None and not queue.is_idle:
+            header += f"  (reviews: {queue.running} running, {queue.queued} queued)"
+        return header
+
     def toggle_collapsed(self) -> None:
         """Toggle section collapsed state."""
         self._collapsed = not self._collapsed
@@ -345,9 +365,8 @@ class TasksSection(Static):
         from textual.app import ComposeResult
 
         # Section header
-        collapse_icon = ">" if self._collapsed else "v"
         header_class = "section-header-collapsed" if self._collapsed else "section-header"
-        yield Static(f"{collapse_icon} Tasks", classes=header_class, id="section-header")
+        yield Static(self._format_header(), classes=header_class, id="section-header")
 
         if not self._collapsed:
             # Pre-create the content Static to avoid remove/mount cycles
@@ -489,8 +508,7 @@ class TasksSection(Static):
         # Update section header
         try:
             header = self.query_one("#section-header", Static)
-            collapse_icon = ">" if self._collapsed else "v"
-            header.update(f"{collapse_icon} Tasks")
+            header.update(self._format_header())
             header.set_class(self._collapsed, "section-header-collapsed")
             header.set_class(not self._collapsed, "section-header")
         except Exception:
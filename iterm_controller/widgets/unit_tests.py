@@ -149,6 +149,15 @@ class UnitTestWidget(Static):
         if self._results.is_running:
             text.append("⟳ Running tests...\n", style="yellow")
             text.append("\n")
+            # Live counts from the streaming parser, if any yet
+            results = self._results
+            if results.passed + results.failed + results.skipped + results.errors > 0:
+                text.append(f"✓ {results.passed}", style="green")
+                text.append("  ")
+                text.append(f"✗ {results.failed}", style="red" if results.failed else "dim")
+                text.append("  ")
+                text.append(f"○ {results.skipped}", style="yellow" if results.skipped else "dim")
+                text.append("\n")
             return text
 
         # Last run time
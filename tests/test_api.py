@@ -1,6 +1,7 @@
 """Tests for the public API module."""
 
 import tempfile
+import time
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -8,22 +9,28 @@ import pytest
 
 from iterm_controller.api import (
     APIResult,
+    BroadcastResult,
     ItermControllerAPI,
     ProjectResult,
     SessionResult,
     TaskResult,
     TestStepResult,
     claim_task,
+    close_shared_api,
     get_plan,
     get_project,
     get_sessions,
+    get_shared_api,
     get_state,
     get_task_progress,
     get_test_plan,
     list_projects,
+    spawn_session,
     toggle_test_step,
 )
-from iterm_controller.state import StateSnapshot
+from iterm_controller.exceptions import ItermConnectionError
+from iterm_controller.state import SessionSelector, StateSnapshot
+from iterm_controller.testing import MockItermApp
 from iterm_controller.models import (
     AppConfig,
     AppSettings,
@@ -481,6 +488,157 @@ class TestSessionOperations:
             assert waiting[0].id == "session-2"
 
 
+class TestSendToSessions:
+    """Tests for sending text to many sessions at once."""
+
+    async def make_api(
+        self, config: AppConfig, count: int, rpc_latency: float = 0.0
+    ) -> tuple[ItermControllerAPI, MockItermApp]:
+        """Create an API connected to a mock iTerm2 app with managed sessions.
+
+        The first half of the sessions belong to project p1, the rest to p2.
+        Odd sessions use the claude template and every third one is waiting.
+        """
+        api = ItermControllerAPI()
+        with patch("iterm_controller.config.load_global_config", return_value=config):
+            await api.initialize(connect_iterm=False)
+
+        app = MockItermApp(rpc_latency=rpc_latency)
+        tab = (await app.async_create_window()).current_tab
+        api._iterm._connected = True
+        api._iterm.connection = MagicMock()
+        api._iterm.app = app
+        for i in range(count):
+            session = app.new_session(tab)
+            tab.sessions.append(session)
+            api._state.add_session(
+                ManagedSession(
+                    id=session.session_id,
+                    template_id="claude" if i % 2 else "dev-server",
+                    project_id="p1" if i < count // 2 else "p2",
+                    tab_id=tab.tab_id,
+                    attention_state=AttentionState.WAITING if i % 3 == 0 else AttentionState.IDLE,
+                )
+            )
+        return api, app
+
+    def received(self, app: MockItermApp) -> dict[str, list[str]]:
+        """Get the text each session received, for sessions that got any."""
+        return {s.session_id: s.sent_text for s in app.sessions if s.sent_text}
+
+    @pytest.mark.asyncio
+    async def test_send_by_ids(self, sample_config: AppConfig) -> None:
+        """Each listed session gets the text; unknown IDs fail individually."""
+        api, app = await self.make_api(sample_config, 3)
+        ids = [s.id for s in await api.list_sessions()][:2]
+
+        result = await api.send_to_sessions([*ids, "missing"], "hello")
+
+        assert isinstance(result, BroadcastResult)
+        assert result.success is False
+        assert result.error == "1 of 3 sends failed"
+        assert result.sent == ids
+        assert result.failed == ["missing"]
+        assert "not found" in result.results["missing"].error
+        assert self.received(app) == {sid: ["hello\n"] for sid in ids}
+
+    @pytest.mark.asyncio
+    async def test_send_by_selector(self, sample_config: AppConfig) -> None:
+        """A selector picks sessions by project, template and attention state."""
+        api, app = await self.make_api(sample_config, 12)
+        sessions = await api.list_sessions()
+        expected = [
+            s.id
+            for s in sessions
+            if s.project_id == "p1"
+            and s.template_id == "claude"
+            and s.attention_state == AttentionState.WAITING
+        ]
+
+        result = await api.send_to_sessions("project=p1 template=claude state=waiting", "go")
+
+        assert result.success is True
+        assert expected and result.sent == expected
+        assert set(self.received(app)) == set(expected)
+
+    @pytest.mark.asyncio
+    async def test_send_ctrl_c(self, sample_config: AppConfig) -> None:
+        """With newline=False the text is sent as-is."""
+        api, app = await self.make_api(sample_config, 2)
+
+        result = await api.send_to_sessions(SessionSelector(), "\x03", newline=False)
+
+        assert result.success is True
+        assert list(self.received(app).values()) == [["\x03"], ["\x03"]]
+
+    @pytest.mark.asyncio
+    async def test_no_matching_sessions(self, sample_config: AppConfig) -> None:
+        """A selector that matches nothing is not an error."""
+        api, app = await self.make_api(sample_config, 2)
+
+        result = await api.send_to_sessions("project=nope", "hello")
+
+        assert result.success is True
+        assert result.results == {}
+
+    @pytest.mark.asyncio
+    async def test_invalid_selector(self, sample_config: AppConfig) -> None:
+        """A selector that does not parse fails the whole call."""
+        api, app = await self.make_api(sample_config, 2)
+
+        result = await api.send_to_sessions("color=blue", "hello")
+
+        assert result.success is False
+        assert "Unknown selector key" in result.error
+        assert app.total_rpcs == 1  # Only the window creation
+
+    @pytest.mark.asyncio
+    async def test_empty_selector_is_rejected(self, sample_config: AppConfig) -> None:
+        """A blank selector is an error rather than a send to every session."""
+        api, app = await self.make_api(sample_config, 2)
+
+        result = await api.send_to_sessions("  ", "rm -rf build")
+
+        assert result.success is False
+        assert "Empty selector" in result.error
+        assert self.received(app) == {}
+
+    @pytest.mark.asyncio
+    async def test_not_connected(self, sample_config: AppConfig) -> None:
+        """Sending requires an iTerm2 connection."""
+        api = ItermControllerAPI()
+        with patch("iterm_controller.config.load_global_config", return_value=sample_config):
+            await api.initialize(connect_iterm=False)
+
+        result = await api.send_to_sessions(["session-1"], "hello")
+
+        assert result.success is False
+        assert "not connected" in result.error.lower()
+
+    @pytest.mark.asyncio
+    async def test_sends_overlap_within_window(self, sample_config: AppConfig) -> None:
+        """Sends run concurrently, at most max_in_flight at a time."""
+        api, app = await self.make_api(sample_config, 20, rpc_latency=0.001)
+        ids = [s.id for s in await api.list_sessions()]
+
+        app.max_in_flight = 0
+        app.rpc_counts.clear()
+        for session_id in ids:
+            await api.send_to_session(session_id, "hello")
+        assert app.max_in_flight == 1
+        assert app.rpc_counts == {"send_text": 20}
+
+        app.max_in_flight = 0
+        app.rpc_counts.clear()
+        result = await api.send_to_sessions(ids, "hello", max_in_flight=5)
+
+        assert result.success is True
+        # Same round trips as the loop, five at a time
+        assert app.rpc_counts == {"send_text": 20}
+        assert app.max_in_flight == 5
+        assert self.received(app) == {sid: ["hello\n", "hello\n"] for sid in ids}
+
+
 # =============================================================================
 # Task Operations Tests
 # =============================================================================
@@ -677,6 +835,103 @@ class TestConvenienceFunctions:
             assert projects[0].id == "test-project"
 
 
+class TestSharedAPI:
+    """Tests for the shared API behind the convenience functions."""
+
+    @pytest.mark.asyncio
+    async def test_config_loaded_once(self, sample_config: AppConfig) -> None:
+        """Repeated convenience calls reuse one API and config load."""
+        with patch(
+            "iterm_controller.config.load_global_config", return_value=sample_config
+        ) as load:
+            for _ in range(5):
+                assert len(await list_projects()) == 1
+            await get_project("test-project")
+            await get_state()
+
+        assert load.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_connects_only_for_iterm_operations(
+        self, sample_config: AppConfig
+    ) -> None:
+        """iTerm2 is only contacted by operations that need it."""
+        with (
+            patch("iterm_controller.config.load_global_config", return_value=sample_config),
+            patch(
+                "iterm_controller.iterm.ItermController.connect",
+                new_callable=AsyncMock,
+                side_effect=ItermConnectionError("iTerm2 not running"),
+            ) as connect,
+        ):
+            await list_projects()
+            await get_project("test-project")
+            assert connect.call_count == 0
+
+            result = await spawn_session("test-project", "dev-server")
+            assert result.success is False
+            assert "not connected" in result.error.lower()
+            assert connect.call_count == 1
+
+            # A failed connection is retried by the next iTerm2 operation
+            await spawn_session("test-project", "dev-server")
+            assert connect.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_close_shared_api(self, sample_config: AppConfig) -> None:
+        """Closing the shared API makes the next call create a new one."""
+        with patch("iterm_controller.config.load_global_config", return_value=sample_config):
+            first = await get_shared_api()
+            assert await get_shared_api() is first
+
+            await close_shared_api()
+
+            assert first.is_initialized is False
+            assert await get_shared_api() is not first
+
+    def test_new_event_loop_gets_new_api(self, sample_config: AppConfig) -> None:
+        """An API is shut down with its event loop and not reused."""
+        import asyncio
+
+        with patch("iterm_controller.config.load_global_config", return_value=sample_config):
+            first = asyncio.run(get_shared_api())
+            second = asyncio.run(get_shared_api())
+
+        assert first is not second
+        assert first.is_initialized is False
+        assert second.is_initialized is False
+
+    @pytest.mark.asyncio
+    async def test_init_failure(self) -> None:
+        """A config error is reported by the convenience function."""
+        from iterm_controller.exceptions import ConfigLoadError
+
+        with patch(
+            "iterm_controller.config.load_global_config",
+            side_effect=ConfigLoadError("bad config"),
+        ):
+            result = await claim_task("test-project", "1.1")
+
+        assert result.success is False
+        assert "bad config" in result.error
+
+    @pytest.mark.asyncio
+    async def test_context_manager(self, sample_config: AppConfig) -> None:
+        """async with initializes without connecting and shuts down on exit."""
+        with (
+            patch("iterm_controller.config.load_global_config", return_value=sample_config),
+            patch(
+                "iterm_controller.iterm.ItermController.connect", new_callable=AsyncMock
+            ) as connect,
+        ):
+            async with ItermControllerAPI() as api:
+                assert api.is_initialized
+                assert len(await api.list_projects()) == 1
+                assert connect.call_count == 0
+
+        assert api.is_initialized is False
+
+
 # =============================================================================
 # Edge Cases and Error Handling
 # =============================================================================
@@ -955,6 +1210,34 @@ class TestStateQueryFunctions:
 # =============================================================================
 
 
+class TestNotificationLatency:
+    """Test notification latency reporting through the API."""
+
+    @pytest.mark.asyncio
+    async def test_get_notification_latency(self, tmp_path: Path) -> None:
+        """Report is read from the latency log, with SLA violations listed."""
+        import json
+
+        from iterm_controller.notifications import LatencySample
+
+        now = time.time()
+        samples = [
+            LatencySample("fast", now - 10, 0.1, 0.2, 0.1),
+            LatencySample("slow", now - 5, 0.5, 5.0, 0.2),
+            LatencySample("old", now - 7200, 0.1, 0.1, 0.1),
+        ]
+        log = tmp_path / "latency.jsonl"
+        log.write_text("".join(json.dumps(s.to_dict()) + "\n" for s in samples))
+
+        api = ItermControllerAPI()
+        report = await api.get_notification_latency(window_seconds=3600, log_path=log)
+
+        assert report["count"] == 2
+        assert report["sla_violated"] == 1
+        assert [v["session_id"] for v in report["violations"]] == ["slow"]
+        assert report["stages"]["dispatch"]["max"] == pytest.approx(5.0)
+
+
 class TestAppAPI:
     """Tests for the AppAPI class that integrates with the TUI app."""
 
@@ -1001,6 +1284,26 @@ class TestAppAPI:
         assert result.success is False
         assert "not connected" in result.error.lower()
 
+    @pytest.mark.asyncio
+    async def test_app_api_send_to_sessions(self, sample_session: ManagedSession) -> None:
+        """AppAPI sends to the sessions a selector picks from the app state."""
+        from iterm_controller.app import ItermControllerApp
+
+        app = ItermControllerApp()
+        iterm_app = MockItermApp()
+        tab = (await iterm_app.async_create_window()).current_tab
+        app.iterm._connected = True
+        app.iterm.connection = MagicMock()
+        app.iterm.app = iterm_app
+        sample_session.id = tab.current_session.session_id
+        app.state.add_session(sample_session)
+
+        result = await app.api.send_to_sessions("project=test-project", "hello")
+
+        assert result.success is True
+        assert result.sent == [sample_session.id]
+        assert tab.current_session.sent_text == ["hello\n"]
+
     @pytest.mark.asyncio
     async def test_app_api_kill_session_not_connected(
         self, sample_config: AppConfig, sample_session: ManagedSession
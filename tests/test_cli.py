@@ -17,6 +17,9 @@ from iterm_controller.__main__ import (
     _print_table,
     cmd_list_projects,
     cmd_list_sessions,
+    cmd_notification_latency,
+    cmd_search,
+    cmd_send,
     cmd_task_claim,
     cmd_task_done,
     cmd_task_list,
@@ -184,6 +187,69 @@ class TestArgumentParser:
         assert args.log_level == "DEBUG"
 
 
+    def test_notification_latency_subcommand(self) -> None:
+        """Test notification-latency subcommand parsing."""
+        parser = _create_parser()
+        args = parser.parse_args(["notification-latency", "--window", "3600", "--violations"])
+        assert args.command == "notification-latency"
+        assert args.window == 3600.0
+        assert args.violations is True
+        assert args.json is False
+
+    def test_search_subcommand(self) -> None:
+        """Test search subcommand parsing."""
+        parser = _create_parser()
+        args = parser.parse_args(
+            ["search", "connection refused", "--project", "proj1", "--since", "86400"]
+        )
+        assert args.command == "search"
+        assert args.query == "connection refused"
+        assert args.project == "proj1"
+        assert args.since == 86400.0
+        assert args.limit == 20
+        assert args.context == 2
+        assert args.raw is False
+
+    def test_daemon_subcommands(self) -> None:
+        """Test daemon subcommand parsing."""
+        parser = _create_parser()
+        for command in ("run", "start", "stop", "status"):
+            args = parser.parse_args(["daemon", command])
+            assert args.command == "daemon"
+            assert args.daemon_command == command
+        assert parser.parse_args(["daemon", "start", "--timeout", "3"]).timeout == 3.0
+
+    def test_send_subcommand(self) -> None:
+        """Test send subcommand parsing."""
+        parser = _create_parser()
+        args = parser.parse_args(["send", "hello", "--session", "s1", "--session", "s2"])
+        assert args.command == "send"
+        assert args.text == "hello"
+        assert args.session == ["s1", "s2"]
+        assert args.select is None
+
+        args = parser.parse_args(["send", "--select", "project=p state=waiting", "--ctrl-c"])
+        assert args.select == "project=p state=waiting"
+        assert args.text is None
+        assert args.ctrl_c is True
+
+    def test_send_requires_one_target(self) -> None:
+        """Test send takes either --session or --select."""
+        parser = _create_parser()
+        with pytest.raises(SystemExit):
+            parser.parse_args(["send", "hello"])
+        with pytest.raises(SystemExit):
+            parser.parse_args(["send", "hello", "--session", "s1", "--select", "project=p"])
+        with pytest.raises(SystemExit):
+            parser.parse_args(["send", "hello", "--select", "project=p", "--all"])
+
+    def test_global_no_daemon_flag(self) -> None:
+        """Test --no-daemon global flag."""
+        parser = _create_parser()
+        assert parser.parse_args(["--no-daemon", "list-projects"]).no_daemon is True
+        assert parser.parse_args(["list-projects"]).no_daemon is False
+
+
 class TestOutputFormatting:
     """Test output formatting helpers."""
 
@@ -277,6 +343,78 @@ class TestCommandHandlers:
             assert result == 0
             mock_api.list_sessions.assert_called_once_with("proj1")
 
+    @pytest.mark.asyncio
+    async def test_send_to_selector(self, capsys: pytest.CaptureFixture[str]) -> None:
+        """Test send passes the selector and reports per-session results."""
+        from iterm_controller.api import APIResult, BroadcastResult
+
+        parser = _create_parser()
+        args = parser.parse_args(["send", "--select", "state=waiting", "--ctrl-c", "--json"])
+
+        with mock.patch("iterm_controller.api.ItermControllerAPI") as MockAPI:
+            mock_api = mock.AsyncMock()
+            mock_api.initialize = mock.AsyncMock(return_value=mock.Mock(success=True))
+            mock_api.is_connected = True
+            mock_api.send_to_sessions = mock.AsyncMock(
+                return_value=BroadcastResult(
+                    success=False,
+                    error="1 of 2 sends failed",
+                    results={"s1": APIResult.ok(), "s2": APIResult.fail("gone")},
+                )
+            )
+            mock_api.shutdown = mock.AsyncMock()
+            MockAPI.return_value = mock_api
+
+            result = await cmd_send(args)
+
+        assert result == 1
+        mock_api.send_to_sessions.assert_called_once_with("state=waiting", "\x03", newline=False)
+        output = json.loads(capsys.readouterr().out)
+        assert output["results"]["s1"]["success"] is True
+        assert output["results"]["s2"]["error"] == "gone"
+
+    @pytest.mark.asyncio
+    async def test_send_rejects_empty_selector(self, capsys: pytest.CaptureFixture[str]) -> None:
+        """Test an empty --select is an error, not a send to every session."""
+        args = _create_parser().parse_args(["send", "hello", "--select", ""])
+
+        with mock.patch("iterm_controller.api.ItermControllerAPI") as MockAPI:
+            result = await cmd_send(args)
+
+        assert result == 1
+        assert "--all" in capsys.readouterr().err
+        MockAPI.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_send_to_all(self) -> None:
+        """Test --all sends to every session."""
+        from iterm_controller.api import BroadcastResult
+        from iterm_controller.state import SessionSelector
+
+        args = _create_parser().parse_args(["send", "hello", "--all"])
+
+        with mock.patch("iterm_controller.api.ItermControllerAPI") as MockAPI:
+            mock_api = mock.AsyncMock()
+            mock_api.initialize = mock.AsyncMock(return_value=mock.Mock(success=True))
+            mock_api.is_connected = True
+            mock_api.send_to_sessions = mock.AsyncMock(return_value=BroadcastResult(success=True))
+            mock_api.shutdown = mock.AsyncMock()
+            MockAPI.return_value = mock_api
+
+            result = await cmd_send(args)
+
+        assert result == 0
+        mock_api.send_to_sessions.assert_called_once_with(
+            SessionSelector(), "hello", newline=True
+        )
+
+    @pytest.mark.asyncio
+    async def test_send_requires_text_or_ctrl_c(self) -> None:
+        """Test send rejects a missing text without --ctrl-c."""
+        args = _create_parser().parse_args(["send", "--session", "s1"])
+
+        assert await cmd_send(args) == 1
+
     @pytest.mark.asyncio
     async def test_task_claim_not_found(self) -> None:
         """Test task claim with nonexistent project."""
@@ -349,6 +487,92 @@ class TestCommandHandlers:
             mock_api.list_tasks.assert_called_once_with("proj1", TaskStatus.PENDING)
 
 
+    @pytest.mark.asyncio
+    async def test_notification_latency_report(self, tmp_path: Any, capsys: Any) -> None:
+        """Test notification-latency prints percentiles and violations."""
+        from iterm_controller.notifications import NotificationLatencyTracker
+
+        log = tmp_path / "latency.jsonl"
+        tracker = NotificationLatencyTracker(log_path=log)
+        tracker.record_state_change("session-1")
+        tracker.record_delivery("session-1")
+        await tracker.flush_log()
+
+        parser = _create_parser()
+        args = parser.parse_args(["notification-latency", "--violations"])
+        with mock.patch(
+            "iterm_controller.api.default_latency_log_path", return_value=log
+        ):
+            result = await cmd_notification_latency(args)
+
+        assert result == 0
+        out = capsys.readouterr().out
+        assert "1 notifications" in out
+        assert "dispatch" in out
+        assert "End-to-end histogram" in out
+        assert "1 met, 0 violated" in out
+        assert "SLA violations:" in out
+
+    @pytest.mark.asyncio
+    async def test_notification_latency_json(self, tmp_path: Any, capsys: Any) -> None:
+        """Test notification-latency JSON output without samples."""
+        parser = _create_parser()
+        args = parser.parse_args(["notification-latency", "--json"])
+        with mock.patch(
+            "iterm_controller.api.default_latency_log_path",
+            return_value=tmp_path / "missing.jsonl",
+        ):
+            result = await cmd_notification_latency(args)
+
+        assert result == 0
+        assert json.loads(capsys.readouterr().out) == {"count": 0, "sla_seconds": 5.0}
+
+    @pytest.mark.asyncio
+    async def test_search_prints_matches_with_context(self, tmp_path: Any, capsys: Any) -> None:
+        """Test search prints each match with its session and context lines."""
+        from iterm_controller.search_index import SearchIndex
+
+        db = tmp_path / "search.db"
+        index = SearchIndex(db)
+        index.append(
+            "w0t0p0:A", "npm start\nError: connect ECONNREFUSED\nretrying", project_id="proj1"
+        )
+        await index.stop()
+
+        parser = _create_parser()
+        args = parser.parse_args(["--no-daemon", "search", "econnrefused", "--index", str(db)])
+        with mock.patch("iterm_controller.api.ItermControllerAPI.initialize", mock.AsyncMock()):
+            result = await cmd_search(args)
+
+        assert result == 0
+        out = capsys.readouterr().out.splitlines()
+        assert "w0t0p0:A  (proj1)" in out[0]
+        assert out[1:] == [
+            "    npm start",
+            "  > Error: connect ECONNREFUSED",
+            "    retrying",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_search_invalid_raw_query(self, tmp_path: Any, capsys: Any) -> None:
+        """Test search reports invalid FTS5 syntax instead of crashing."""
+        from iterm_controller.search_index import SearchIndex
+
+        db = tmp_path / "search.db"
+        index = SearchIndex(db)
+        index.append("s1", "some output")
+        await index.stop()
+
+        parser = _create_parser()
+        args = parser.parse_args(
+            ["--no-daemon", "search", '"unbalanced', "--raw", "--index", str(db)]
+        )
+
+        with mock.patch("iterm_controller.api.ItermControllerAPI.initialize", mock.AsyncMock()):
+            assert await cmd_search(args) == 1
+        assert "Invalid search query" in capsys.readouterr().err
+
+
 class TestNoSubcommandLaunchesTUI:
     """Test that no subcommand launches the TUI."""
 
@@ -0,0 +1,450 @@
+"""Tests for the headless daemon and its client."""
+
+import asyncio
+import os
+import socket
+import tempfile
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from iterm_controller.__main__ import _create_parser, cmd_list_projects, cmd_task_list
+from iterm_controller.api import (
+    BroadcastResult,
+    ItermControllerAPI,
+    ProjectResult,
+    TaskResult,
+    get_state,
+)
+from iterm_controller.daemon import (
+    DAEMON_ENV_VAR,
+    DaemonClient,
+    DaemonServer,
+    RemoteAPI,
+    _bind_private_socket,
+    connect_to_daemon,
+)
+from iterm_controller.exceptions import DaemonError
+from iterm_controller.iterm import ReconcileResult
+from iterm_controller.models import (
+    AppConfig,
+    AppSettings,
+    ManagedSession,
+    Plan,
+    Project,
+    SessionTemplate,
+    Task,
+    TaskStatus,
+)
+from iterm_controller.plan_parser import PlanParser
+from iterm_controller.state import SessionSelector, StateSnapshot
+
+
+def build_plan(phases: int, tasks_per_phase: int) -> str:
+    """Build PLAN.md content with pending tasks."""
+    lines = ["# Plan", "", "## Tasks", ""]
+    for p in range(1, phases + 1):
+        lines += [f"### Phase {p}: Phase {p}", ""]
+        for t in range(1, tasks_per_phase + 1):
+            lines += [
+                f"- [ ] **Task {p}.{t} does something useful** `[pending]`",
+                f"  - Scope: Part {t} of phase {p}",
+                "",
+            ]
+    return "\n".join(lines)
+
+
+@pytest.fixture
+def project_dir():
+    """Project directory with a small PLAN.md."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        (Path(tmpdir) / "PLAN.md").write_text(build_plan(1, 2))
+        yield Path(tmpdir)
+
+
+@pytest.fixture
+def config(project_dir: Path) -> AppConfig:
+    """Config with one project."""
+    return AppConfig(
+        settings=AppSettings(),
+        projects=[Project(id="proj", name="Project", path=str(project_dir))],
+        session_templates=[SessionTemplate(id="shell", name="Shell", command="")],
+    )
+
+
+@pytest.fixture
+def socket_path():
+    """Short socket path (Unix socket paths are limited to ~100 bytes)."""
+    with tempfile.TemporaryDirectory(prefix="itc", dir="/tmp") as tmpdir:
+        path = Path(tmpdir) / "d.sock"
+        with patch("iterm_controller.daemon.default_socket_path", return_value=path):
+            yield path
+
+
+@pytest.fixture
+async def server(config: AppConfig, socket_path: Path):
+    """Running daemon serving an API without an iTerm2 connection."""
+    with patch("iterm_controller.config.load_global_config", return_value=config):
+        api = ItermControllerAPI()
+        await api.initialize(connect_iterm=False)
+    server = DaemonServer(api, socket_path=socket_path)
+    await server.start()
+    yield server
+    if server.is_serving:
+        await server.stop()
+
+
+@pytest.fixture
+async def remote(server: DaemonServer):
+    """RemoteAPI connected to the running daemon."""
+    client = await connect_to_daemon(server.socket_path)
+    assert client is not None
+    api = RemoteAPI(client)
+    await api.initialize()
+    yield api
+    await api.shutdown()
+
+
+class TestDaemonServer:
+    """Tests for DaemonServer and DaemonClient."""
+
+    @pytest.mark.asyncio
+    async def test_status(self, server: DaemonServer, remote: RemoteAPI) -> None:
+        """Status reports the daemon's process and counters."""
+        status = await remote.status()
+
+        assert status["connected"] is False
+        assert status["requests"] >= 1
+        assert remote.is_connected is False
+
+    @pytest.mark.asyncio
+    async def test_socket_is_private(self, server: DaemonServer) -> None:
+        """Only the owner can connect to the socket."""
+        assert server.socket_path.stat().st_mode & 0o777 == 0o600
+
+    def test_private_socket_restores_umask(self, socket_path: Path) -> None:
+        """The socket is bound with mode 0600 and the umask is put back."""
+        old_umask = os.umask(0o022)
+        try:
+            sock = _bind_private_socket(socket_path)
+            sock.close()
+            assert os.umask(0o022) == 0o022
+        finally:
+            os.umask(old_umask)
+
+        assert socket_path.stat().st_mode & 0o777 == 0o600
+
+    @pytest.mark.asyncio
+    async def test_unknown_method(self, server: DaemonServer) -> None:
+        """Methods outside the whitelist are rejected."""
+        client = DaemonClient(server.socket_path)
+        await client.connect()
+        try:
+            with pytest.raises(DaemonError, match="Unknown method"):
+                await client.call("_load_plan_for_project")
+            # The connection stays usable after an error
+            assert (await client.call("status"))["pid"]
+        finally:
+            await client.close()
+
+    @pytest.mark.asyncio
+    async def test_malformed_request(self, server: DaemonServer) -> None:
+        """A line that is not JSON gets an error response."""
+        reader, writer = await asyncio.open_unix_connection(str(server.socket_path))
+        writer.write(b"not json\n")
+        await writer.drain()
+
+        response = await reader.readline()
+        writer.close()
+
+        assert b"Malformed request" in response
+
+    @pytest.mark.asyncio
+    async def test_second_daemon_refused(self, server: DaemonServer) -> None:
+        """A second daemon will not take over a live socket."""
+        other = DaemonServer(server.api, socket_path=server.socket_path)
+
+        with pytest.raises(DaemonError, match="already running"):
+            await other.start()
+
+    @pytest.mark.asyncio
+    async def test_stale_socket_replaced(self, config: AppConfig, socket_path: Path) -> None:
+        """A socket left behind by a dead daemon is removed on start."""
+        stale = socket.socket(socket.AF_UNIX)
+        stale.bind(str(socket_path))
+        stale.close()
+        assert socket_path.exists()
+
+        with patch("iterm_controller.config.load_global_config", return_value=config):
+            server = DaemonServer(socket_path=socket_path)
+            await server.start()
+        try:
+            client = await connect_to_daemon(socket_path)
+            assert client is not None
+            await client.close()
+        finally:
+            await server.stop()
+        assert not socket_path.exists()
+
+    @pytest.mark.asyncio
+    async def test_no_supervisor_without_iterm(self, server: DaemonServer) -> None:
+        """The connection supervisor only runs while connected to iTerm2."""
+        assert server._supervisor is None
+
+    @pytest.mark.asyncio
+    async def test_reconcile_purges_api_state(self, server: DaemonServer) -> None:
+        """Sessions that vanished from iTerm2 are dropped from the served state."""
+        for session_id in ("s1", "s2"):
+            server.api.state.add_session(
+                ManagedSession(id=session_id, template_id="t", project_id="p", tab_id="tab")
+            )
+
+        server._on_sessions_reconciled(
+            ReconcileResult(live_session_ids=["s2"], purged_session_ids=["s1"], reconnected=True)
+        )
+
+        assert list(server.api.state.sessions) == ["s2"]
+
+    @pytest.mark.asyncio
+    async def test_shutdown_request(self, server: DaemonServer) -> None:
+        """A client can ask the daemon to stop."""
+        client = DaemonClient(server.socket_path)
+        await client.connect()
+
+        assert await client.call("shutdown") is True
+        await client.close()
+        await asyncio.wait_for(server.serve_forever(), 2.0)
+
+        assert not server.is_serving
+        assert not server.socket_path.exists()
+
+
+class TestConnectToDaemon:
+    """Tests for connect_to_daemon."""
+
+    @pytest.mark.asyncio
+    async def test_no_daemon(self, socket_path: Path) -> None:
+        """No socket means no client."""
+        assert await connect_to_daemon(socket_path) is None
+
+    @pytest.mark.asyncio
+    async def test_dead_socket(self, socket_path: Path) -> None:
+        """A socket nobody listens on means no client."""
+        stale = socket.socket(socket.AF_UNIX)
+        stale.bind(str(socket_path))
+        stale.close()
+
+        assert await connect_to_daemon(socket_path) is None
+
+    @pytest.mark.asyncio
+    async def test_disabled_by_environment(
+        self, server: DaemonServer, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """The environment variable makes clients ignore the daemon."""
+        monkeypatch.setenv(DAEMON_ENV_VAR, "0")
+
+        assert await connect_to_daemon(server.socket_path) is None
+
+
+class TestRemoteAPI:
+    """Tests for RemoteAPI round trips."""
+
+    @pytest.mark.asyncio
+    async def test_list_projects(self, remote: RemoteAPI) -> None:
+        """Projects come back as Project models."""
+        projects = await remote.list_projects()
+
+        assert len(projects) == 1
+        assert isinstance(projects[0], Project)
+        assert projects[0].id == "proj"
+
+    @pytest.mark.asyncio
+    async def test_get_missing_project(self, remote: RemoteAPI) -> None:
+        """A missing project comes back as None."""
+        assert await remote.get_project("nope") is None
+
+    @pytest.mark.asyncio
+    async def test_open_project_failure(self, remote: RemoteAPI) -> None:
+        """A failed API result keeps its error."""
+        result = await remote.open_project("nope")
+
+        assert isinstance(result, ProjectResult)
+        assert result.success is False
+        assert "not found" in result.error.lower()
+
+    @pytest.mark.asyncio
+    async def test_plan_and_tasks(self, remote: RemoteAPI) -> None:
+        """Plans and tasks decode with their enums."""
+        assert (await remote.open_project("proj")).success
+
+        plan = await remote.get_plan("proj")
+        pending = await remote.list_tasks("proj", TaskStatus.PENDING)
+
+        assert isinstance(plan, Plan)
+        assert len(plan.all_tasks) == 2
+        assert [t.id for t in pending] == ["1.1", "1.2"]
+        assert all(isinstance(t, Task) and t.status == TaskStatus.PENDING for t in pending)
+
+    @pytest.mark.asyncio
+    async def test_claim_task_updates_plan(
+        self, remote: RemoteAPI, project_dir: Path
+    ) -> None:
+        """Task updates are written by the daemon."""
+        await remote.open_project("proj")
+
+        result = await remote.claim_task("proj", "1.1")
+
+        assert isinstance(result, TaskResult)
+        assert result.success
+        assert result.task.status == TaskStatus.IN_PROGRESS
+        for _ in range(100):
+            if "[in_progress]" in (project_dir / "PLAN.md").read_text():
+                break
+            await asyncio.sleep(0.02)
+        assert "[in_progress]" in (project_dir / "PLAN.md").read_text()
+
+    @pytest.mark.asyncio
+    async def test_reopen_keeps_watcher(self, server: DaemonServer, remote: RemoteAPI) -> None:
+        """Opening a project again reuses its plan watcher."""
+        await remote.open_project("proj")
+        watcher = server.api._plan_watchers["proj"]
+
+        await remote.open_project("proj")
+
+        assert server.api._plan_watchers["proj"] is watcher
+
+    @pytest.mark.asyncio
+    async def test_state_snapshot(self, remote: RemoteAPI) -> None:
+        """The state snapshot decodes into a StateSnapshot."""
+        await remote.open_project("proj")
+
+        snapshot = await remote.get_state_snapshot()
+
+        assert isinstance(snapshot, StateSnapshot)
+        assert "proj" in snapshot.projects
+        assert snapshot.get_plan("proj") is not None
+
+    @pytest.mark.asyncio
+    async def test_search_output(self, remote: RemoteAPI, tmp_path: Path) -> None:
+        """Search hits come back as dictionaries; bad queries as errors."""
+        from iterm_controller.search_index import SearchIndex
+
+        index = SearchIndex(tmp_path / "search.db")
+        index.append("s1", "build\nerror: missing semicolon", project_id="proj")
+        await index.stop()
+
+        hits = await remote.search_output("semicolon", index_path=tmp_path / "search.db")
+
+        assert [(h["session_id"], h["line"], h["before"]) for h in hits] == [
+            ("s1", "error: missing semicolon", ["build"])
+        ]
+        with pytest.raises(DaemonError, match="Invalid search query"):
+            await remote.search_output('"x', raw=True, index_path=tmp_path / "search.db")
+
+    @pytest.mark.asyncio
+    async def test_spawn_without_iterm(self, remote: RemoteAPI) -> None:
+        """Failures on the daemon side come back as failed results."""
+        result = await remote.spawn_session("proj", "shell")
+
+        assert result.success is False
+        assert result.session is None
+
+
+    @pytest.mark.asyncio
+    async def test_send_to_sessions(self, server: DaemonServer, remote: RemoteAPI) -> None:
+        """Selectors are sent as text and the batch result decodes."""
+        with patch.object(
+            server.api,
+            "send_to_sessions",
+            wraps=server.api.send_to_sessions,
+        ) as send:
+            result = await remote.send_to_sessions(
+                SessionSelector.parse("project=proj state=waiting"), "go"
+            )
+
+        assert isinstance(result, BroadcastResult)
+        assert result.success is False
+        assert "not connected" in result.error.lower()
+        assert send.call_args.kwargs["target"] == "project=proj state=waiting"
+
+class TestDaemonAutoDetect:
+    """Tests for CLI commands and convenience functions using the daemon."""
+
+    @pytest.mark.asyncio
+    async def test_cli_uses_daemon(self, server: DaemonServer, capsys) -> None:
+        """CLI commands are served by a running daemon."""
+        args = _create_parser().parse_args(["list-projects", "--json"])
+        before = server.requests_served
+
+        with patch("iterm_controller.api.ItermControllerAPI") as local_api:
+            assert await cmd_list_projects(args) == 0
+
+        local_api.assert_not_called()
+        assert server.requests_served > before
+        assert '"id": "proj"' in capsys.readouterr().out
+
+    @pytest.mark.asyncio
+    async def test_cli_no_daemon_flag(self, server: DaemonServer, config: AppConfig) -> None:
+        """--no-daemon runs the command in-process."""
+        args = _create_parser().parse_args(["--no-daemon", "list-projects", "--json"])
+        before = server.requests_served
+
+        with patch("iterm_controller.config.load_global_config", return_value=config):
+            assert await cmd_list_projects(args) == 0
+
+        assert server.requests_served == before
+
+    @pytest.mark.asyncio
+    async def test_convenience_function_uses_daemon(self, server: DaemonServer) -> None:
+        """Convenience functions are served by a running daemon."""
+        before = server.requests_served
+
+        state = await get_state()
+
+        assert state is not None
+        assert "proj" in state.projects
+        assert server.requests_served > before
+
+    @pytest.mark.asyncio
+    async def test_repeated_commands_reuse_daemon_state(
+        self, config: AppConfig, project_dir: Path, socket_path: Path, capsys
+    ) -> None:
+        """A warm daemon answers task list without reloading config or PLAN.md."""
+        (project_dir / "PLAN.md").write_text(build_plan(10, 20))
+        args = _create_parser().parse_args(
+            ["task", "list", "--project", "proj", "--status", "complete", "--json"]
+        )
+        local_args = _create_parser().parse_args(
+            ["--no-daemon", "task", "list", "--project", "proj", "--status", "complete", "--json"]
+        )
+        runs = 10
+
+        with (
+            patch("iterm_controller.config.load_global_config", return_value=config) as load,
+            patch.object(
+                PlanParser, "parse_file", autospec=True, side_effect=PlanParser.parse_file
+            ) as parse,
+        ):
+            for _ in range(runs):
+                assert await cmd_task_list(local_args) == 0
+            # Every in-process run starts cold
+            assert (load.call_count, parse.call_count) == (runs, runs)
+
+            server = DaemonServer(socket_path=socket_path)
+            await server.start()
+            try:
+                assert await cmd_task_list(args) == 0  # open the project once
+                load.reset_mock()
+                parse.reset_mock()
+                before = server.requests_served
+                for _ in range(runs):
+                    assert await cmd_task_list(args) == 0
+                served = server.requests_served - before
+            finally:
+                await server.stop()
+        capsys.readouterr()
+
+        assert (load.call_count, parse.call_count) == (0, 0)
+        # status, open_project and list_tasks: one round trip each
+        assert served == runs * 3
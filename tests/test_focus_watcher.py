@@ -6,6 +6,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 
 from iterm_controller.iterm import FocusWatcher, ItermController
+from iterm_controller.process_tree import ProcessInfo, ProcessTable, ProcessTreeCache
 
 
 class TestFocusWatcher:
@@ -111,6 +112,70 @@ class TestFocusWatcher:
         pids = watcher._get_parent_pids(12345)
         assert 12345 in pids
 
+    def test_get_parent_pids_uses_process_tree(self):
+        """_get_parent_pids reads the chain from the process tree snapshot."""
+        table = ProcessTable.from_processes(
+            [
+                ProcessInfo(pid=1, ppid=0),
+                ProcessInfo(pid=100, ppid=1),
+                ProcessInfo(pid=200, ppid=100),
+            ]
+        )
+        reader = MagicMock(return_value=table)
+        watcher = FocusWatcher(ItermController(), process_tree=ProcessTreeCache(reader=reader))
+
+        assert watcher._get_parent_pids(200) == [200, 100, 1]
+        assert watcher._get_parent_pids(100) == [100, 1]
+        assert reader.call_count == 1
+
+    def test_get_parent_pids_read_failure(self):
+        """_get_parent_pids falls back to the starting PID."""
+        reader = MagicMock(side_effect=OSError("no /proc"))
+        watcher = FocusWatcher(ItermController(), process_tree=ProcessTreeCache(reader=reader))
+
+        assert watcher._get_parent_pids(12345) == [12345]
+
+    @pytest.mark.asyncio
+    async def test_find_our_tab_fetches_pids_concurrently(self):
+        """find_our_tab fetches session pids concurrently and keeps tab order."""
+        controller = ItermController()
+        controller._connected = True
+        in_flight = 0
+        max_in_flight = 0
+
+        def make_session(session_id: str, pid: int) -> MagicMock:
+            async def get_variable(name: str) -> int:
+                nonlocal in_flight, max_in_flight
+                in_flight += 1
+                max_in_flight = max(max_in_flight, in_flight)
+                await asyncio.sleep(0.01)
+                in_flight -= 1
+                return pid
+
+            session = MagicMock()
+            session.session_id = session_id
+            session.async_get_variable = get_variable
+            return session
+
+        tabs = []
+        for i in range(20):
+            tab = MagicMock()
+            tab.tab_id = f"tab-{i}"
+            tab.sessions = [make_session(f"session-{i}", 1000 + i)]
+            tabs.append(tab)
+        mock_window = MagicMock()
+        mock_window.tabs = tabs
+        controller.app = MagicMock()
+        controller.app.terminal_windows = [mock_window]
+
+        watcher = FocusWatcher(controller)
+        with patch.object(watcher, "_get_parent_pids", return_value=[1, 1015, 1007]):
+            result = await watcher.find_our_tab()
+
+        assert result == "tab-7"
+        assert watcher._our_session_id == "session-7"
+        assert max_in_flight == 20
+
     @pytest.mark.asyncio
     async def test_start_not_connected(self):
         """start does nothing when not connected."""
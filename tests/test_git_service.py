@@ -1,6 +1,8 @@
 """Tests for GitService."""
 
 import asyncio
+import shutil
+import subprocess
 from datetime import datetime, timedelta
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -13,7 +15,7 @@ from iterm_controller.exceptions import (
     GitNotARepoError,
     GitPushRejectedError,
 )
-from iterm_controller.git_service import GitService
+from iterm_controller.git_service import DiffStat, GitService
 from iterm_controller.models import GitCommit, GitFileStatus, GitStatus
 
 
@@ -606,6 +608,185 @@ class TestGitServiceDiff:
             assert "main...HEAD" in args
 
 
+def _make_streaming_process(
+    stdout: bytes, stderr: bytes = b"", returncode: int = 0
+) -> MagicMock:
+    """Create a fake git process whose stdout is a real StreamReader."""
+    reader = asyncio.StreamReader()
+    reader.feed_data(stdout)
+    reader.feed_eof()
+    err_reader = asyncio.StreamReader()
+    err_reader.feed_data(stderr)
+    err_reader.feed_eof()
+
+    process = MagicMock()
+    process.stdout = reader
+    process.stderr = err_reader
+    process.returncode = None
+
+    async def wait() -> int:
+        if process.returncode is None:
+            process.returncode = returncode
+        return process.returncode
+
+    def kill() -> None:
+        process.returncode = -9
+
+    process.wait = wait
+    process.kill = MagicMock(side_effect=kill)
+    return process
+
+
+def _file_diff(path: str, body: str) -> str:
+    """Build a minimal git diff section for one file."""
+    return (
+        f"diff --git a/{path} b/{path}\n"
+        f"--- a/{path}\n"
+        f"+++ b/{path}\n"
+        f"@@ -1 +1 @@\n"
+        f"{body}"
+    )
+
+
+class TestGitServiceStreamingDiff:
+    """Tests for streaming, size-capped diff retrieval."""
+
+    @pytest.fixture
+    def service(self) -> GitService:
+        """Create a GitService instance."""
+        return GitService()
+
+    async def _collect(self, service: GitService, stdout: bytes, **kwargs):
+        process = _make_streaming_process(stdout)
+        with patch(
+            "asyncio.create_subprocess_exec", new_callable=AsyncMock
+        ) as mock_exec:
+            mock_exec.return_value = process
+            files = [f async for f in service.iter_diff(Path("/repo"), **kwargs)]
+        return files, process, mock_exec
+
+    @pytest.mark.asyncio
+    async def test_iter_diff_splits_per_file(self, service: GitService):
+        """Test each file's diff is yielded separately."""
+        stdout = (_file_diff("a.py", "+a\n") + _file_diff("b.py", "+b\n")).encode()
+
+        files, _, mock_exec = await self._collect(service, stdout)
+
+        assert [f.path for f in files] == ["a.py", "b.py"]
+        assert files[0].text.endswith("+a\n")
+        assert not files[0].truncated
+        assert "--no-ext-diff" in mock_exec.call_args[0]
+
+    @pytest.mark.asyncio
+    async def test_iter_diff_caps_file_bytes(self, service: GitService):
+        """Test bytes beyond the per-file cap are dropped but counted."""
+        big = "+" + "x" * 10_000 + "\n"
+        stdout = (_file_diff("big.py", big) + _file_diff("small.py", "+s\n")).encode()
+
+        files, _, _ = await self._collect(service, stdout, max_file_bytes=500)
+
+        assert files[0].truncated is True
+        assert len(files[0].text) == 500
+        assert files[0].size_bytes > 10_000
+        assert files[1].path == "small.py"
+        assert files[1].truncated is False
+
+    @pytest.mark.asyncio
+    async def test_iter_diff_stops_at_total_cap(self, service: GitService):
+        """Test iteration stops and git is killed at the total cap."""
+        stdout = "".join(
+            _file_diff(f"f{i}.py", "+" + "y" * 200 + "\n") for i in range(20)
+        ).encode()
+
+        files, process, _ = await self._collect(service, stdout, max_total_bytes=1000)
+
+        assert len(files) < 20
+        assert files[-1].truncated is True
+        assert sum(len(f.text) for f in files) <= 1000
+        process.kill.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_iter_diff_binary_short_circuit(self, service: GitService):
+        """Test binary payloads are not buffered."""
+        binary = (
+            "diff --git a/img.png b/img.png\n"
+            "index 123..456 100644\n"
+            "GIT binary patch\n"
+            "literal 5000\n" + "z" * 5000 + "\n"
+        )
+        stdout = (binary + _file_diff("a.py", "+a\n")).encode()
+
+        files, _, _ = await self._collect(service, stdout)
+
+        assert files[0].binary is True
+        assert "z" * 10 not in files[0].text
+        assert files[1].binary is False
+
+    @pytest.mark.asyncio
+    async def test_iter_diff_long_line_bounded(self, service: GitService):
+        """Test a single huge line does not need to fit in memory."""
+        stdout = _file_diff("min.js", "+" + "m" * 300_000 + "\n").encode()
+
+        files, _, _ = await self._collect(service, stdout, max_file_bytes=1000)
+
+        assert len(files) == 1
+        assert files[0].truncated is True
+        assert files[0].size_bytes == len(stdout)
+
+    @pytest.mark.asyncio
+    async def test_iter_diff_passes_paths(self, service: GitService):
+        """Test path filters are passed after --."""
+        _, _, mock_exec = await self._collect(service, b"", paths=["a.py"])
+
+        args = mock_exec.call_args[0]
+        assert args[-2:] == ("--", "a.py")
+
+    @pytest.mark.asyncio
+    async def test_iter_diff_raises_on_error(self, service: GitService):
+        """Test git failures surface as git errors."""
+        process = _make_streaming_process(
+            b"", stderr=b"fatal: not a git repository", returncode=128
+        )
+        with patch(
+            "asyncio.create_subprocess_exec", new_callable=AsyncMock
+        ) as mock_exec:
+            mock_exec.return_value = process
+            with pytest.raises(GitNotARepoError):
+                async for _ in service.iter_diff(Path("/repo")):
+                    pass
+
+    @pytest.mark.asyncio
+    async def test_get_diff_with_caps_adds_truncation_note(self, service: GitService):
+        """Test capped get_diff returns a bounded string with notes."""
+        stdout = _file_diff("big.py", "+" + "x" * 5000 + "\n").encode()
+        process = _make_streaming_process(stdout)
+        with patch(
+            "asyncio.create_subprocess_exec", new_callable=AsyncMock
+        ) as mock_exec:
+            mock_exec.return_value = process
+            diff = await service.get_diff(Path("/repo"), max_file_bytes=200)
+
+        assert "diff truncated: big.py" in diff
+        assert len(diff) < 400
+
+    @pytest.mark.asyncio
+    async def test_get_diff_stat(self, service: GitService, tmp_path: Path):
+        """Test --numstat output is parsed, including binary files."""
+        with patch.object(service, "_run_git", new_callable=AsyncMock) as mock_run:
+            mock_run.return_value = "3\t1\tsrc/a.py\n-\t-\timg.png\n"
+
+            stats = await service.get_diff_stat(tmp_path, base_branch="main")
+
+        assert stats == [
+            DiffStat(path="src/a.py", added=3, deleted=1),
+            DiffStat(path="img.png", added=None, deleted=None),
+        ]
+        assert stats[1].binary is True
+        args = mock_run.call_args[0]
+        assert "--numstat" in args
+        assert "main...HEAD" in args
+
+
 class TestGitServiceCacheManagement:
     """Tests for cache management."""
 
@@ -1052,3 +1233,69 @@ class TestGitServiceCommitInvalidatesCache:
 
             # Cache should be invalidated
             assert cache_key not in service._status_cache
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+class TestGitServiceWorktreeHash:
+    """Tests for get_worktree_hash against a real repository."""
+
+    @pytest.fixture
+    def repo(self, tmp_path: Path) -> Path:
+        """Create a repository with one commit."""
+        def git(*args: str) -> None:
+            subprocess.run(["git", "-C", str(tmp_path), *args], check=True, capture_output=True)
+
+        git("init", "-q")
+        git("config", "user.email", "test@example.com")
+        git("config", "user.name", "Test")
+        (tmp_path / "a.txt").write_text("one\n")
+        git("add", "a.txt")
+        git("commit", "-q", "-m", "init")
+        return tmp_path
+
+    @pytest.mark.asyncio
+    async def test_stable_for_unchanged_tree(self, repo: Path):
+        """The same working copy hashes the same twice."""
+        service = GitService()
+
+        assert await service.get_worktree_hash(repo) == await service.get_worktree_hash(repo)
+
+    @pytest.mark.asyncio
+    async def test_changes_with_modified_and_untracked_files(self, repo: Path):
+        """Edits and new untracked files change the hash."""
+        service = GitService()
+        clean = await service.get_worktree_hash(repo)
+
+        (repo / "a.txt").write_text("two\n")
+        modified = await service.get_worktree_hash(repo)
+        (repo / "new.txt").write_text("new\n")
+        untracked = await service.get_worktree_hash(repo)
+
+        assert len({clean, modified, untracked}) == 3
+
+    @pytest.mark.asyncio
+    async def test_ignores_ignored_files_and_leaves_index_alone(self, repo: Path):
+        """Ignored files do not count and the real index is not modified."""
+        service = GitService()
+        (repo / ".gitignore").write_text("*.log\n")
+        before = await service.get_worktree_hash(repo)
+
+        (repo / "debug.log").write_text("noise\n")
+        after = await service.get_worktree_hash(repo)
+
+        assert before == after
+        staged = subprocess.run(
+            ["git", "-C", str(repo), "diff", "--cached", "--name-only"],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        assert staged.stdout == ""
+
+    @pytest.mark.asyncio
+    async def test_not_a_repo(self, tmp_path: Path):
+        """A non-repository raises GitNotARepoError."""
+        service = GitService()
+
+        with pytest.raises(GitNotARepoError):
+            await service.get_worktree_hash(tmp_path)
@@ -8,7 +8,9 @@ import pytest
 
 from iterm_controller.github import (
     GitHubIntegration,
+    GitHubPoller,
     NetworkError,
+    RateLimitBudget,
     RateLimitError,
 )
 from iterm_controller.models import GitHubStatus, PullRequest
@@ -870,3 +872,296 @@ class TestGracefulDegradation:
         assert result is not None
         assert result.current_branch == "develop"
         assert result.offline is True
+
+
+class TestRateLimitBudget:
+    """Tests for RateLimitBudget parsing and accounting."""
+
+    def test_from_api_uses_tightest_resource(self):
+        """Test the most constrained of core and graphql is tracked."""
+        data = {
+            "resources": {
+                "core": {"limit": 5000, "remaining": 4000, "reset": 1700000000},
+                "graphql": {"limit": 5000, "remaining": 100, "reset": 1700000100},
+            }
+        }
+        budget = RateLimitBudget.from_api(data)
+
+        assert budget.limit == 5000
+        assert budget.remaining == 100
+        assert budget.reset_at == 1700000100
+
+    def test_from_api_falls_back_to_rate(self):
+        """Test the top-level rate block is used when resources are missing."""
+        budget = RateLimitBudget.from_api(
+            {"rate": {"limit": 60, "remaining": 30, "reset": 10}}
+        )
+
+        assert budget.limit == 60
+        assert budget.remaining == 30
+
+    def test_consume_does_not_go_negative(self):
+        """Test consuming more than remaining clamps to zero."""
+        budget = RateLimitBudget(limit=10, remaining=3)
+        budget.consume(5)
+
+        assert budget.remaining == 0
+        assert budget.fraction_remaining == 0.0
+
+    def test_seconds_until_reset(self):
+        """Test reset countdown."""
+        budget = RateLimitBudget(reset_at=1100.0)
+
+        assert budget.seconds_until_reset(now=1000.0) == 100.0
+        assert budget.seconds_until_reset(now=2000.0) == 0.0
+
+    @pytest.mark.asyncio
+    async def test_get_rate_limit(self):
+        """Test GitHubIntegration.get_rate_limit parses gh api output."""
+        integration = GitHubIntegration()
+        integration.available = True
+        payload = json.dumps(
+            {"resources": {"core": {"limit": 5000, "remaining": 42, "reset": 1}}}
+        )
+
+        with patch.object(
+            integration, "_run_gh", new_callable=AsyncMock, return_value=payload
+        ) as mock_gh:
+            budget = await integration.get_rate_limit()
+
+        mock_gh.assert_called_once_with(None, "api", "rate_limit")
+        assert budget is not None
+        assert budget.remaining == 42
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestGitHubPoller:
+    """Tests for the GitHubPoller scheduler."""
+
+    @pytest.fixture
+    def clock(self):
+        """Create a fake clock."""
+        return FakeClock()
+
+    @pytest.fixture
+    def github(self):
+        """Create an available integration with mocked fetches."""
+        gh = GitHubIntegration()
+        gh.available = True
+
+        async def fake_status(path):
+            status = GitHubStatus(available=True, current_branch="main")
+            gh.cached_status[path] = status
+            return status
+
+        gh.get_status = AsyncMock(side_effect=fake_status)
+        gh.get_workflow_runs = AsyncMock(return_value=[{"id": 1}])
+        gh.get_rate_limit = AsyncMock(
+            return_value=RateLimitBudget(limit=5000, remaining=5000)
+        )
+        return gh
+
+    @pytest.fixture
+    def poller(self, github, clock):
+        """Create a poller with a fake clock and seeded jitter."""
+        import random
+
+        return GitHubPoller(github, clock=clock, rng=random.Random(1))
+
+    def test_track_staggers_initial_polls(self, poller, clock):
+        """Test newly tracked repos are spread over the jitter window."""
+        for i in range(10):
+            poller.track(f"/repo{i}")
+
+        due_times = {r.next_due for r in poller._repos.values()}
+        assert len(due_times) == 10
+        assert all(
+            clock.now <= t <= clock.now + poller.base_interval * poller.jitter
+            for t in due_times
+        )
+
+    def test_interval_jitter_bounds(self, poller):
+        """Test intervals stay within the jitter band."""
+        poller.track("/repo")
+        for _ in range(50):
+            interval = poller.interval_for("/repo")
+            assert poller.base_interval * 0.8 <= interval <= poller.base_interval * 1.2
+
+    def test_active_project_polled_more_often(self, poller):
+        """Test the active project uses the shorter interval."""
+        poller.track("/bg")
+        poller.track("/active", active=True)
+
+        assert poller.interval_for("/active") < poller.base_interval * 0.8
+        assert poller.active_path == "/active"
+
+    def test_backoff_grows_as_budget_drains(self, poller):
+        """Test intervals stretch as the remaining budget falls."""
+        poller.budget = RateLimitBudget(limit=5000, remaining=5000)
+        assert poller.backoff_factor() == 1.0
+
+        poller.budget = RateLimitBudget(limit=5000, remaining=625)
+        assert poller.backoff_factor() == pytest.approx(2.0)
+
+        poller.budget = RateLimitBudget(limit=5000, remaining=1)
+        assert poller.backoff_factor() == poller.max_backoff
+
+    @pytest.mark.asyncio
+    async def test_poll_once_refreshes_due_repos_active_first(
+        self, poller, github, clock
+    ):
+        """Test due repos are refreshed with the active project first."""
+        poller.track("/bg")
+        poller.track("/active", active=True)
+        clock.now += poller.base_interval
+
+        refreshed = await poller.poll_once()
+
+        assert refreshed == 2
+        paths = [call.args[0] for call in github.get_status.call_args_list]
+        assert paths == ["/active", "/bg"]
+        # Only the active project fetches workflow runs
+        github.get_workflow_runs.assert_called_once_with("/active")
+        assert poller.get_cached_runs("/active") == [{"id": 1}]
+        assert poller.get_cached_status("/bg") is not None
+
+    @pytest.mark.asyncio
+    async def test_poll_once_skips_repos_not_due(self, poller, github, clock):
+        """Test repos are not refetched before their interval elapses."""
+        poller.track("/repo")
+        clock.now += poller.base_interval
+        await poller.poll_once()
+        github.get_status.reset_mock()
+
+        clock.now += 1.0
+        refreshed = await poller.poll_once()
+
+        assert refreshed == 0
+        github.get_status.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_poll_once_pauses_when_budget_exhausted(self, poller, github, clock):
+        """Test no fetches happen once the budget reaches the reserve."""
+        github.get_rate_limit.return_value = RateLimitBudget(
+            limit=5000, remaining=poller.reserve_requests
+        )
+        poller.track("/repo")
+        clock.now += poller.base_interval
+
+        refreshed = await poller.poll_once()
+
+        assert refreshed == 0
+        github.get_status.assert_not_called()
+        assert poller.seconds_until_next_poll() >= poller.base_interval
+
+    @pytest.mark.asyncio
+    async def test_refresh_marks_cached_rate_limited_when_exhausted(self, poller, github):
+        """Test refresh returns cached status flagged as rate limited."""
+        github.cached_status["/repo"] = GitHubStatus(available=True)
+        poller.budget = RateLimitBudget(limit=5000, remaining=0)
+
+        status = await poller.refresh("/repo")
+
+        assert status is not None
+        assert status.rate_limited is True
+        github.get_status.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_rate_limited_response_exhausts_budget(self, poller, github):
+        """Test a rate-limited fetch stops further polling."""
+        github.get_status.side_effect = None
+        github.get_status.return_value = GitHubStatus(available=True, rate_limited=True)
+
+        await poller.refresh("/repo", include_runs=True)
+
+        assert poller.is_budget_exhausted
+        github.get_workflow_runs.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_refresh_consumes_budget_and_notifies(self, github, clock):
+        """Test refresh accounts for spent requests and calls on_update."""
+        updates = []
+        poller = GitHubPoller(
+            github, on_update=lambda p, s: updates.append((p, s)), clock=clock
+        )
+        poller.budget = RateLimitBudget(limit=5000, remaining=1000)
+
+        await poller.refresh("/repo", include_runs=True)
+
+        assert poller.budget.remaining == 997
+        assert updates[0][0] == "/repo"
+
+    def test_request_refresh_makes_repo_due(self, poller, clock):
+        """Test request_refresh schedules an immediate poll."""
+        poller.track("/repo")
+        poller._repos["/repo"].next_due = clock.now + 500
+
+        poller.request_refresh("/repo", include_runs=True)
+
+        assert poller.seconds_until_next_poll() == 0
+        assert poller._repos["/repo"].include_runs is True
+
+    def test_untrack_clears_cache(self, poller, github):
+        """Test untracking drops cached data."""
+        poller.track("/repo", active=True)
+        github.cached_status["/repo"] = GitHubStatus()
+        poller._cached_runs["/repo"] = []
+
+        poller.untrack("/repo")
+
+        assert poller.tracked_paths == []
+        assert poller.active_path is None
+        assert poller.get_cached_status("/repo") is None
+        assert poller.get_cached_runs("/repo") is None
+
+    @pytest.mark.asyncio
+    async def test_start_and_stop(self, github):
+        """Test the background task polls and stops cleanly."""
+        poller = GitHubPoller(github)
+        poller.track("/repo", active=True)
+
+        await poller.start()
+        assert poller.is_running
+        await asyncio.sleep(0.05)
+        await poller.stop()
+
+        assert not poller.is_running
+        github.get_status.assert_called_with("/repo")
+
+    @pytest.mark.asyncio
+    async def test_failed_poll_does_not_spin(self, github):
+        """Test a poll that keeps failing is retried at the next interval."""
+        github.get_status = AsyncMock(side_effect=RuntimeError("gh crashed"))
+        poller = GitHubPoller(github, active_interval=60.0, min_sleep=0.5)
+        poller.track("/repo", active=True)
+
+        await poller.start()
+        await asyncio.sleep(0.1)
+        await poller.stop()
+
+        assert github.get_status.await_count == 1
+        assert poller.seconds_until_next_poll() > 40
+
+    @pytest.mark.asyncio
+    async def test_sleep_is_clamped(self, github):
+        """Test a repo that stays due waits min_sleep between rounds."""
+        github.available = True
+        poller = GitHubPoller(github, min_sleep=0.05)
+        poller.track("/repo")
+        poller.poll_once = AsyncMock(return_value=0)  # Leaves the repo due
+        poller._repos["/repo"].next_due = 0
+
+        await poller.start()
+        await asyncio.sleep(0.12)
+        await poller.stop()
+
+        assert 2 <= poller.poll_once.await_count <= 4
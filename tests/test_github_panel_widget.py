@@ -571,3 +571,58 @@ class TestGitHubPanelWidgetGracefulDegradation:
         assert "Offline" in result.plain
         assert "Branch:" in result.plain
         assert "PR #10:" in result.plain
+
+
+class TestGitHubPanelWidgetPoller:
+    """Tests for reading status from the GitHub poller's cache.
+
+    update() requires a mounted app context, so it is stubbed out.
+    """
+
+    @pytest.fixture
+    def widget(self):
+        """Create a widget with update() stubbed."""
+        from unittest.mock import MagicMock
+
+        widget = GitHubPanelWidget()
+        widget.update = MagicMock()
+        return widget
+
+    def _make_poller(self, available=True):
+        from unittest.mock import MagicMock
+
+        from iterm_controller.github import GitHubIntegration, GitHubPoller
+
+        github = GitHubIntegration(available=available, error_message="gh CLI not installed")
+        poller = GitHubPoller(github)
+        poller.request_refresh = MagicMock()
+        return poller
+
+    def test_load_from_poller_uses_cache(self, widget):
+        """Test cached status is shown without fetching."""
+        poller = self._make_poller()
+        status = GitHubStatus(available=True, current_branch="main")
+        poller.github.cached_status["/repo"] = status
+
+        widget.load_from_poller(poller, "/repo")
+
+        assert widget.status is status
+        poller.request_refresh.assert_not_called()
+
+    def test_load_from_poller_cache_miss_requests_refresh(self, widget):
+        """Test a cache miss asks the poller rather than fetching."""
+        poller = self._make_poller()
+
+        widget.load_from_poller(poller, "/repo")
+
+        poller.request_refresh.assert_called_once_with("/repo")
+        assert widget.status is None
+
+    def test_load_from_poller_unavailable(self, widget):
+        """Test unavailable integration shows the error message."""
+        poller = self._make_poller(available=False)
+
+        widget.load_from_poller(poller, "/repo")
+
+        assert widget.is_available is False
+        poller.request_refresh.assert_not_called()
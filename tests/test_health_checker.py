@@ -6,7 +6,11 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import httpx
 import pytest
 
-from iterm_controller.health_checker import HealthCheckPoller, ProjectHealthManager
+from iterm_controller.health_checker import (
+    HealthCheckEngine,
+    HealthCheckPoller,
+    ProjectHealthManager,
+)
 from iterm_controller.models import HealthCheck, HealthStatus, Project
 
 
@@ -708,3 +712,331 @@ class TestProjectHealthManager:
         result = manager.get_poller("nonexistent")
 
         assert result is None
+
+    @pytest.mark.asyncio
+    async def test_projects_share_engine(self):
+        """Pollers for different projects schedule on the manager's engine."""
+        manager = ProjectHealthManager()
+        checks = [HealthCheck(name="test", url="http://localhost:8080", interval_seconds=60.0)]
+
+        poller1 = await manager.start_project_checks(self.make_project("p1"), checks, env={})
+        poller2 = await manager.start_project_checks(self.make_project("p2"), checks, env={})
+
+        assert poller1.engine is manager.engine
+        assert poller2.engine is manager.engine
+        assert manager.engine.scheduled_count == 2
+        assert poller1._tasks == {}
+
+        await manager.stop_all()
+        assert manager.engine.scheduled_count == 0
+        assert manager.engine.is_running is False
+
+
+def make_response(status_code: int = 200) -> MagicMock:
+    """Create a mock HTTP response."""
+    response = MagicMock()
+    response.status_code = status_code
+    return response
+
+
+class TestHealthCheckEngine:
+    """Test the shared HealthCheckEngine."""
+
+    @pytest.mark.asyncio
+    async def test_single_scheduler_task_for_many_checks(self):
+        """Checks from many pollers run on one scheduler task."""
+        engine = HealthCheckEngine()
+        pollers = [HealthCheckPoller(env={}, engine=engine) for _ in range(5)]
+        checks = [
+            HealthCheck(name=f"check-{i}", url=f"http://localhost:{8000 + i}", interval_seconds=0.05)
+            for i in range(10)
+        ]
+
+        with patch.object(engine, "request", AsyncMock(return_value=make_response())):
+            tasks_before = len(asyncio.all_tasks())
+            for poller in pollers:
+                await poller.start_polling(checks)
+            assert len(asyncio.all_tasks()) - tasks_before <= 1 + len(engine._in_flight)
+
+            await asyncio.sleep(0.15)
+
+            for poller in pollers:
+                assert set(poller.get_all_status().values()) == {HealthStatus.HEALTHY}
+            assert engine.request.await_count >= 50
+
+        await engine.close()
+
+    @pytest.mark.asyncio
+    async def test_reschedules_at_interval(self):
+        """A check runs again after its interval."""
+        engine = HealthCheckEngine()
+        poller = HealthCheckPoller(env={}, engine=engine)
+        check = HealthCheck(name="api", url="http://localhost:8080", interval_seconds=0.05)
+
+        with patch.object(engine, "request", AsyncMock(return_value=make_response())):
+            await poller.start_polling([check])
+            await asyncio.sleep(0.13)
+            count = engine.request.await_count
+
+        assert 2 <= count <= 4
+        await engine.close()
+
+    @pytest.mark.asyncio
+    async def test_manual_checks_not_scheduled(self):
+        """Checks with interval 0 are not scheduled."""
+        engine = HealthCheckEngine()
+        poller = HealthCheckPoller(env={}, engine=engine)
+        check = HealthCheck(name="manual", url="http://localhost", interval_seconds=0.0)
+
+        await poller.start_polling([check])
+
+        assert engine.is_scheduled(poller, "manual") is False
+        await engine.close()
+
+    @pytest.mark.asyncio
+    async def test_stop_polling_unschedules_only_own_checks(self):
+        """Stopping one poller leaves other pollers' checks scheduled."""
+        engine = HealthCheckEngine()
+        poller1 = HealthCheckPoller(env={}, engine=engine)
+        poller2 = HealthCheckPoller(env={}, engine=engine)
+        check = HealthCheck(name="api", url="http://localhost:8080", interval_seconds=60.0)
+
+        with patch.object(engine, "request", AsyncMock(return_value=make_response())):
+            await poller1.start_polling([check])
+            await poller2.start_polling([check])
+            await poller1.stop_polling()
+
+        assert engine.is_scheduled(poller1, "api") is False
+        assert engine.is_scheduled(poller2, "api") is True
+        await engine.close()
+
+    @pytest.mark.asyncio
+    async def test_check_now_uses_engine(self):
+        """Manual checks go through the engine's client."""
+        engine = HealthCheckEngine()
+        poller = HealthCheckPoller(env={"PORT": "9000"}, engine=engine)
+        check = HealthCheck(name="api", url="http://localhost:{env.PORT}/health")
+
+        with patch.object(engine, "request", AsyncMock(return_value=make_response(503))):
+            result = await poller.check_now(check)
+            engine.request.assert_awaited_once_with("GET", "http://localhost:9000/health", 5.0)
+
+        assert result == HealthStatus.UNHEALTHY
+        await engine.close()
+
+    @pytest.mark.asyncio
+    async def test_global_concurrency_limit(self):
+        """No more than max_concurrent requests are in flight."""
+        engine = HealthCheckEngine(max_concurrent=2, max_connections_per_host=10)
+        in_flight = 0
+        peak = 0
+
+        async def slow_request(**kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.02)
+            in_flight -= 1
+            return make_response()
+
+        client = MagicMock()
+        client.request = slow_request
+        client.aclose = AsyncMock()
+        engine._client = client
+
+        await asyncio.gather(
+            *(engine.request("GET", f"http://host-{i}:80/", 1.0) for i in range(6))
+        )
+
+        assert peak == 2
+        await engine.close()
+
+    @pytest.mark.asyncio
+    async def test_per_host_limit(self):
+        """Requests to one host are limited separately from other hosts."""
+        engine = HealthCheckEngine(max_concurrent=10, max_connections_per_host=1)
+        active: dict[str, int] = {}
+        peaks: dict[str, int] = {}
+
+        async def slow_request(method, url, timeout):
+            host = httpx.URL(url).host
+            active[host] = active.get(host, 0) + 1
+            peaks[host] = max(peaks.get(host, 0), active[host])
+            await asyncio.sleep(0.02)
+            active[host] -= 1
+            return make_response()
+
+        client = MagicMock()
+        client.request = slow_request
+        client.aclose = AsyncMock()
+        engine._client = client
+
+        await asyncio.gather(
+            *(engine.request("GET", f"http://{host}:80/", 1.0) for host in ["a", "a", "a", "b", "b"])
+        )
+
+        assert peaks == {"a": 1, "b": 1}
+        await engine.close()
+
+    @pytest.mark.asyncio
+    async def test_client_created_once_with_limits(self):
+        """The shared client is created lazily, once, with pool limits."""
+        engine = HealthCheckEngine(max_connections=7)
+
+        with patch("iterm_controller.health_checker.httpx.AsyncClient") as mock_client_class:
+            mock_client = MagicMock()
+            mock_client.aclose = AsyncMock()
+            mock_client_class.return_value = mock_client
+
+            assert engine.client is mock_client
+            assert engine.client is mock_client
+
+            assert mock_client_class.call_count == 1
+            limits = mock_client_class.call_args.kwargs["limits"]
+            assert limits.max_connections == 7
+
+            await engine.close()
+            mock_client.aclose.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_close_cancels_scheduler(self):
+        """close stops the scheduler and forgets every check."""
+        engine = HealthCheckEngine()
+        poller = HealthCheckPoller(env={}, engine=engine)
+        check = HealthCheck(name="api", url="http://localhost", interval_seconds=60.0)
+
+        with patch.object(engine, "request", AsyncMock(return_value=make_response())):
+            await poller.start_polling([check])
+            assert engine.is_running is True
+            await engine.close()
+
+        assert engine.is_running is False
+        assert engine.scheduled_count == 0
+
+
+class TestAdaptiveIntervals:
+    """Test adaptive scheduling and settled status reporting."""
+
+    async def run_results(self, poller, check, statuses):
+        """Feed a sequence of HTTP status codes through _perform_check."""
+        for code in statuses:
+            with patch("httpx.AsyncClient.request", AsyncMock(return_value=make_response(code))):
+                await poller._perform_check(check)
+
+    @pytest.mark.asyncio
+    async def test_healthy_keeps_base_interval(self):
+        """A healthy check runs at its configured interval."""
+        poller = HealthCheckPoller(env={})
+        check = HealthCheck(name="api", url="http://localhost", interval_seconds=10.0)
+
+        await self.run_results(poller, check, [200, 200])
+
+        assert poller.next_interval(check) == 10.0
+
+    @pytest.mark.asyncio
+    async def test_failures_back_off_exponentially(self):
+        """Repeated failures double the interval up to the cap."""
+        poller = HealthCheckPoller(env={}, max_backoff_seconds=60.0)
+        check = HealthCheck(name="api", url="http://localhost", interval_seconds=10.0)
+
+        intervals = []
+        for _ in range(5):
+            await self.run_results(poller, check, [500])
+            intervals.append(poller.next_interval(check))
+
+        assert intervals == [10.0, 20.0, 40.0, 60.0, 60.0]
+        assert poller.get_failure_count("api") == 5
+
+    @pytest.mark.asyncio
+    async def test_backoff_cap_never_below_base_interval(self):
+        """A cap smaller than the base interval does not speed polling up."""
+        poller = HealthCheckPoller(env={}, max_backoff_seconds=5.0)
+        check = HealthCheck(name="api", url="http://localhost", interval_seconds=30.0)
+
+        await self.run_results(poller, check, [500, 500, 500])
+
+        assert poller.next_interval(check) == 30.0
+
+    @pytest.mark.asyncio
+    async def test_recovery_probes_quickly_then_settles(self):
+        """After a recovery a few fast probes run before the steady cadence."""
+        poller = HealthCheckPoller(
+            env={}, recovery_probe_seconds=1.0, recovery_probes=2
+        )
+        check = HealthCheck(name="api", url="http://localhost", interval_seconds=10.0)
+
+        await self.run_results(poller, check, [500, 500])
+        await self.run_results(poller, check, [200])
+        assert poller.next_interval(check) == 1.0
+        assert poller.get_failure_count("api") == 0
+
+        await self.run_results(poller, check, [200])
+        assert poller.next_interval(check) == 1.0
+
+        await self.run_results(poller, check, [200])
+        assert poller.next_interval(check) == 10.0
+
+    @pytest.mark.asyncio
+    async def test_failure_during_recovery_resumes_backoff(self):
+        """A flapping check goes back to backing off."""
+        poller = HealthCheckPoller(env={})
+        check = HealthCheck(name="api", url="http://localhost", interval_seconds=10.0)
+
+        await self.run_results(poller, check, [500, 500, 200, 500, 500])
+
+        assert poller.next_interval(check) == 20.0
+
+    @pytest.mark.asyncio
+    async def test_recheck_does_not_flip_to_checking(self):
+        """Re-checks keep the settled status instead of showing CHECKING."""
+        poller = HealthCheckPoller(env={})
+        check = HealthCheck(name="api", url="http://localhost")
+        seen = []
+
+        async def observe(*args, **kwargs):
+            seen.append(poller.get_status("api"))
+            return make_response(200)
+
+        with patch("httpx.AsyncClient.request", side_effect=observe):
+            await poller._perform_check(check)
+            await poller._perform_check(check)
+
+        assert seen == [HealthStatus.CHECKING, HealthStatus.HEALTHY]
+
+    @pytest.mark.asyncio
+    async def test_engine_uses_adaptive_interval(self):
+        """The engine reschedules checks using the poller's next interval."""
+        engine = HealthCheckEngine()
+        poller = HealthCheckPoller(env={}, engine=engine)
+        check = HealthCheck(name="api", url="http://localhost", interval_seconds=0.05)
+
+        with patch.object(engine, "request", AsyncMock(return_value=make_response(500))), \
+                patch.object(poller, "next_interval", return_value=60.0) as next_interval:
+            await poller.start_polling([check])
+            await asyncio.sleep(0.15)
+
+            assert engine.request.await_count == 1
+            next_interval.assert_called_with(check)
+
+        await engine.close()
+
+    @pytest.mark.asyncio
+    async def test_manual_recovery_pulls_next_run_forward(self):
+        """A manual check that recovers reschedules a backed-off check."""
+        engine = HealthCheckEngine()
+        poller = HealthCheckPoller(env={}, engine=engine, recovery_probe_seconds=0.05)
+        check = HealthCheck(name="api", url="http://localhost", interval_seconds=60.0)
+
+        with patch.object(engine, "request", AsyncMock(return_value=make_response(500))):
+            await poller.start_polling([check])
+            await asyncio.sleep(0.02)
+            await poller._perform_check(check)
+        assert poller.get_failure_count("api") == 2
+
+        with patch.object(engine, "request", AsyncMock(return_value=make_response(200))):
+            await poller.check_now(check)
+            await asyncio.sleep(0.12)
+            # Fast recovery probes ran without waiting out the backoff
+            assert engine.request.await_count >= 2
+
+        await engine.close()
@@ -1,5 +1,8 @@
 """Tests for iTerm2 connection and session management."""
 
+import asyncio
+import json
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -29,6 +32,7 @@ from iterm_controller.models import (
     TabLayout,
     WindowLayout,
 )
+from iterm_controller.testing import MockItermApp, MockItermSession, MockTerminalProvider
 
 
 class TestItermController:
@@ -158,13 +162,12 @@ class TestItermController:
         assert "3.5+" in message
 
     def test_require_connection_when_connected(self):
-        """require_connection does nothing when connected."""
+        """require_connection returns the connection when connected."""
         controller = ItermController()
         controller.connection = MagicMock()
         controller._connected = True
 
-        # Should not raise
-        controller.require_connection()
+        assert controller.require_connection() is controller.connection
 
     def test_require_connection_when_not_connected(self):
         """require_connection raises when not connected."""
@@ -486,6 +489,235 @@ class TestWindowTracker:
         assert window_state.tabs[0].session_ids == ["session-1"]
 
 
+class FakeLayoutNotifications:
+    """Stands in for iTerm2's layout-change and variable-change subscriptions."""
+
+    def __init__(self) -> None:
+        self.on_layout = None
+        self.on_title = None
+        self.watched_tabs: list[str] = []
+        self.unsubscribed: list[object] = []
+        self.subscribe_layout = AsyncMock(side_effect=self._subscribe_layout)
+        self.subscribe_variable = AsyncMock(side_effect=self._subscribe_variable)
+        self.unsubscribe = AsyncMock(side_effect=self._unsubscribe)
+
+    async def _subscribe_layout(self, connection, callback):
+        self.on_layout = callback
+        return ("layout",)
+
+    async def _subscribe_variable(self, connection, callback, scope, name, identifier):
+        self.on_title = callback
+        self.watched_tabs.append(identifier)
+        return ("title", identifier)
+
+    async def _unsubscribe(self, connection, token):
+        self.unsubscribed.append(token)
+
+    def patch(self):
+        """Patch the iterm2 subscription functions."""
+        return patch.multiple(
+            "iterm2.notifications",
+            async_subscribe_to_layout_change_notification=self.subscribe_layout,
+            async_subscribe_to_variable_change_notification=self.subscribe_variable,
+            async_unsubscribe=self.unsubscribe,
+        )
+
+    async def layout_changed(self) -> None:
+        """Deliver a layout-change notification and let spawned loads finish."""
+        await self.on_layout(None, SimpleNamespace())
+        await asyncio.sleep(0.05)
+
+    async def title_changed(self, tab_id: str, title: str) -> None:
+        """Deliver a tab title variable-change notification."""
+        message = SimpleNamespace(identifier=tab_id, json_new_value=json.dumps(title))
+        await self.on_title(None, message)
+
+
+class TestIncrementalWindowTracker:
+    """Test WindowTracker driven by layout and title notifications."""
+
+    @staticmethod
+    async def make_app(windows: int, tabs: int, rpc_latency: float = 0.0) -> MockItermApp:
+        """Create a mock app with titled tabs, then reset its RPC counts."""
+        app = MockItermApp()
+        for _ in range(windows):
+            window = await app.async_create_window()
+            for _ in range(tabs - 1):
+                await window.async_create_tab()
+        for i, tab in enumerate(tab for w in app.windows for tab in w.tabs):
+            tab.title = f"Tab {i}"
+        app.rpc_latency = rpc_latency
+        app.rpc_counts.clear()
+        app.max_in_flight = 0
+        return app
+
+    @staticmethod
+    def make_tracker(app: MockItermApp) -> WindowTracker:
+        controller = ItermController()
+        controller._connected = True
+        controller.connection = MagicMock()
+        controller.app = app
+        return WindowTracker(controller)
+
+    async def test_initial_load_fetches_titles_concurrently(self):
+        """The first refresh loads every title in one concurrent batch."""
+        app = await self.make_app(windows=4, tabs=30, rpc_latency=0.01)
+        tracker = self.make_tracker(app)
+        notifications = FakeLayoutNotifications()
+
+        with notifications.patch():
+            await tracker.refresh()
+
+        assert tracker.is_watching
+        # One round trip per tab, all of them in flight at once
+        assert app.rpc_counts["get_variable"] == 120
+        assert app.max_in_flight == 120
+        titles = [t.title for w in tracker.windows.values() for t in w.tabs]
+        assert titles == [f"Tab {i}" for i in range(120)]
+        assert len(notifications.watched_tabs) == 120
+
+    async def test_refresh_while_watching_skips_known_tabs(self):
+        """Refreshing an unchanged layout makes no RPCs."""
+        app = await self.make_app(windows=2, tabs=5)
+        tracker = self.make_tracker(app)
+        notifications = FakeLayoutNotifications()
+
+        with notifications.patch():
+            await tracker.refresh()
+            app.rpc_counts.clear()
+            await tracker.refresh()
+
+        assert app.total_rpcs == 0
+        assert notifications.subscribe_layout.await_count == 1
+        assert len(tracker.windows) == 2
+
+    async def test_layout_change_adds_and_removes_tabs(self):
+        """A layout change patches the model and loads only new tabs."""
+        app = await self.make_app(windows=1, tabs=3)
+        tracker = self.make_tracker(app)
+        notifications = FakeLayoutNotifications()
+
+        with notifications.patch():
+            await tracker.refresh()
+            window = app.windows[0]
+            closed = window.tabs.pop(0)
+            added = app.new_tab(window)
+            added.title = "New"
+            window.tabs.append(added)
+            app.rpc_counts.clear()
+
+            await notifications.layout_changed()
+
+        tabs = tracker.windows[window.window_id].tabs
+        assert [t.tab_id for t in tabs] == [t.tab_id for t in window.tabs]
+        assert tabs[-1].title == "New"
+        assert app.rpc_counts == {"get_variable": 1}
+        assert ("title", closed.tab_id) in notifications.unsubscribed
+        assert notifications.watched_tabs[-1] == added.tab_id
+
+    async def test_layout_change_keeps_tab_state_objects(self):
+        """Tabs that survive a layout change keep their state objects."""
+        app = await self.make_app(windows=1, tabs=2)
+        tracker = self.make_tracker(app)
+        notifications = FakeLayoutNotifications()
+
+        with notifications.patch():
+            await tracker.refresh()
+            before = tracker.windows[app.windows[0].window_id].tabs[0]
+            window = app.windows[0]
+            window.tabs[0].sessions.append(app.new_session(window.tabs[0]))
+
+            await notifications.layout_changed()
+
+        after = tracker.windows[window.window_id].tabs[0]
+        assert after is before
+        assert after.session_ids == [s.session_id for s in window.tabs[0].sessions]
+
+    async def test_title_change_updates_tab(self):
+        """A title variable change updates the tracked title."""
+        app = await self.make_app(windows=1, tabs=2)
+        tracker = self.make_tracker(app)
+        notifications = FakeLayoutNotifications()
+
+        with notifications.patch():
+            await tracker.refresh()
+            tab_id = app.windows[0].tabs[1].tab_id
+            await notifications.title_changed(tab_id, "Renamed")
+
+        assert tracker.windows[app.windows[0].window_id].tabs[1].title == "Renamed"
+
+    async def test_managed_marks_survive_refresh_and_moves(self):
+        """Managed marks stay on their tabs, including across windows."""
+        app = await self.make_app(windows=2, tabs=2)
+        tracker = self.make_tracker(app)
+        notifications = FakeLayoutNotifications()
+        first, second = app.windows
+
+        with notifications.patch():
+            await tracker.refresh()
+            tab = first.tabs[1]
+            tracker.mark_managed(tab.tab_id, first.window_id)
+            await tracker.refresh()
+            assert tracker.get_managed_tab_ids(first.window_id) == {tab.tab_id}
+
+            first.tabs.remove(tab)
+            second.tabs.append(tab)
+            await notifications.layout_changed()
+
+        assert tracker.get_managed_tab_ids(first.window_id) == set()
+        assert tracker.get_managed_tab_ids(second.window_id) == {tab.tab_id}
+        assert tracker.windows[second.window_id].tabs[-1].is_managed
+
+    async def test_mark_managed_before_tab_is_seen(self):
+        """A tab marked before the tracker sees it is managed once it appears."""
+        app = await self.make_app(windows=1, tabs=1)
+        tracker = self.make_tracker(app)
+        notifications = FakeLayoutNotifications()
+
+        with notifications.patch():
+            await tracker.refresh()
+            window = await app.async_create_window()
+            tracker.mark_managed(window.tabs[0].tab_id, window.window_id)
+            await notifications.layout_changed()
+
+        assert tracker.get_managed_tab_ids(window.window_id) == {window.tabs[0].tab_id}
+
+    async def test_stop_watching_unsubscribes(self):
+        """stop_watching drops the layout and title subscriptions."""
+        app = await self.make_app(windows=1, tabs=2)
+        tracker = self.make_tracker(app)
+        notifications = FakeLayoutNotifications()
+
+        with notifications.patch():
+            await tracker.refresh()
+            await tracker.stop_watching()
+
+        assert not tracker.is_watching
+        assert ("layout",) in notifications.unsubscribed
+        assert len(notifications.unsubscribed) == 3
+
+    async def test_falls_back_to_full_reload(self):
+        """Without notifications every refresh reloads all titles."""
+        app = await self.make_app(windows=1, tabs=3)
+        tracker = self.make_tracker(app)
+        tab_id = app.windows[0].tabs[0].tab_id
+
+        with patch(
+            "iterm2.notifications.async_subscribe_to_layout_change_notification",
+            AsyncMock(side_effect=TypeError("not a connection")),
+        ):
+            await tracker.refresh()
+            tracker.mark_managed(tab_id, app.windows[0].window_id)
+            app.windows[0].tabs[0].title = "Changed"
+            await tracker.refresh()
+
+        assert not tracker.is_watching
+        assert app.rpc_counts["get_variable"] == 6
+        tabs = tracker.windows[app.windows[0].window_id].tabs
+        assert tabs[0].title == "Changed"
+        assert tabs[0].is_managed
+
+
 class TestSessionSpawner:
     """Test SessionSpawner session spawning functionality."""
 
@@ -1834,6 +2066,169 @@ class TestWindowLayoutSpawner:
         mock_tab.async_set_title.assert_called_once_with("Empty")
 
 
+def make_grid_layout(tabs: int, panes: int) -> WindowLayout:
+    """Build a layout of ``tabs`` tabs with ``panes`` sessions each."""
+    return WindowLayout(
+        id="grid",
+        name="Grid",
+        tabs=[
+            TabLayout(
+                name=f"Tab {t}",
+                sessions=[
+                    SessionLayout(
+                        template_id=f"t{t}p{p}",
+                        split="vertical" if p % 2 else "horizontal",
+                    )
+                    for p in range(panes)
+                ],
+            )
+            for t in range(tabs)
+        ],
+    )
+
+
+def make_grid_templates(tabs: int, panes: int) -> dict[str, SessionTemplate]:
+    """Build templates matching make_grid_layout."""
+    return {
+        f"t{t}p{p}": SessionTemplate(id=f"t{t}p{p}", name=f"T{t}P{p}", command=f"run {t}.{p}")
+        for t in range(tabs)
+        for p in range(panes)
+    }
+
+
+async def spawn_layout_sequentially(
+    app: MockItermApp, layout: WindowLayout, templates: dict[str, SessionTemplate]
+) -> int:
+    """Spawn a layout awaiting one RPC at a time, the unpipelined way.
+
+    Returns:
+        Number of sessions started.
+    """
+    started = 0
+    window = await app.async_create_window()
+    for tab_index, tab_layout in enumerate(layout.tabs):
+        tab = window.current_tab if tab_index == 0 else await window.async_create_tab()
+        await tab.async_set_title(tab_layout.name)
+        session = tab.current_session
+        for session_index, session_layout in enumerate(tab_layout.sessions):
+            if session_index > 0:
+                session = await session.async_split_pane(
+                    vertical=session_layout.split == "vertical"
+                )
+            await session.async_send_text(templates[session_layout.template_id].command + "\n")
+            started += 1
+    return started
+
+
+class TestPipelinedLayoutSpawning:
+    """Test WindowLayoutSpawner against mock iTerm2 objects with RPC latency."""
+
+    def make_spawner(self, provider: MockTerminalProvider) -> WindowLayoutSpawner:
+        controller = ItermController()
+        controller._connected = True
+        controller.connection = MagicMock()
+        controller.app = provider.mock_iterm_app
+        return WindowLayoutSpawner(controller, SessionSpawner(controller))
+
+    @pytest.mark.asyncio
+    async def test_builds_layout_tree(self):
+        """Every tab gets its title and panes, each pane its own command."""
+        provider = MockTerminalProvider()
+        app = provider.mock_iterm_app
+        layout_spawner = self.make_spawner(provider)
+
+        with patch("iterm2.Window.async_create", app.async_create_window):
+            result = await layout_spawner.spawn_layout(
+                make_grid_layout(4, 3), Project(id="p", name="P", path="/p"),
+                make_grid_templates(4, 3),
+            )
+
+        assert result.success is True
+        (window,) = app.windows
+        assert [tab.title for tab in window.tabs] == ["Tab 0", "Tab 1", "Tab 2", "Tab 3"]
+        # Results are in layout order: tab by tab, pane by pane
+        expected = [s.session_id for tab in window.tabs for s in tab.sessions]
+        assert [r.session_id for r in result.results] == expected
+        for t, tab in enumerate(window.tabs):
+            assert len(tab.sessions) == 3
+            for p, session in enumerate(tab.sessions):
+                assert len(session.sent_text) == 1
+                assert session.sent_text[0].endswith(f"run {t}.{p}\n")
+        managed = layout_spawner.spawner.managed_sessions
+        assert set(managed) == set(expected)
+        assert all(m.window_id == window.window_id for m in managed.values())
+
+    @pytest.mark.asyncio
+    async def test_reports_results_as_they_land(self):
+        """on_result sees every session before spawn_layout returns."""
+        provider = MockTerminalProvider(rpc_latency=0.001)
+        app = provider.mock_iterm_app
+        layout_spawner = self.make_spawner(provider)
+        landed: list[SpawnResult] = []
+
+        with patch("iterm2.Window.async_create", app.async_create_window):
+            result = await layout_spawner.spawn_layout(
+                make_grid_layout(2, 2), Project(id="p", name="P", path="/p"),
+                make_grid_templates(2, 2), on_result=landed.append,
+            )
+
+        assert len(landed) == 4
+        assert {r.session_id for r in landed} == set(result.spawned_session_ids)
+
+    @pytest.mark.asyncio
+    async def test_failed_split_continues_from_last_pane(self):
+        """A failed split is reported and later panes split the last good one."""
+        provider = MockTerminalProvider()
+        app = provider.mock_iterm_app
+        layout_spawner = self.make_spawner(provider)
+        original_split = MockItermSession.async_split_pane
+        calls = 0
+
+        async def flaky_split(session, **kwargs):
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                raise RuntimeError("split refused")
+            return await original_split(session, **kwargs)
+
+        with (
+            patch("iterm2.Window.async_create", app.async_create_window),
+            patch.object(MockItermSession, "async_split_pane", flaky_split),
+        ):
+            result = await layout_spawner.spawn_layout(
+                make_grid_layout(1, 3), Project(id="p", name="P", path="/p"),
+                make_grid_templates(1, 3),
+            )
+
+        assert [r.success for r in result.results] == [True, False, True]
+        assert "split refused" in result.results[1].error
+        assert len(app.windows[0].tabs[0].sessions) == 2
+
+    @pytest.mark.asyncio
+    async def test_pipelined_against_sequential_spawning(self):
+        """Pipelining makes the same round trips with several in flight at once."""
+        tabs, panes = 4, 3
+        layout = make_grid_layout(tabs, panes)
+        templates = make_grid_templates(tabs, panes)
+
+        sequential_app = MockItermApp(rpc_latency=0.001)
+        assert await spawn_layout_sequentially(sequential_app, layout, templates) == 12
+
+        provider = MockTerminalProvider(rpc_latency=0.001)
+        app = provider.mock_iterm_app
+        layout_spawner = self.make_spawner(provider)
+        with patch("iterm2.Window.async_create", app.async_create_window):
+            result = await layout_spawner.spawn_layout(
+                layout, Project(id="p", name="P", path="/p"), templates
+            )
+
+        assert len(result.spawned_session_ids) == 12
+        # Same round-trips, fewer of them on the critical path
+        assert app.rpc_counts == sequential_app.rpc_counts
+        assert sequential_app.max_in_flight == 1
+        assert app.max_in_flight >= tabs
+
+
 class TestCloseResult:
     """Test CloseResult dataclass."""
 
@@ -2222,6 +2617,212 @@ class TestSessionTerminator:
         assert results == []
 
 
+class FakeItermNotifications:
+    """Stands in for iTerm2's termination and prompt notification subscriptions."""
+
+    def __init__(self, rpc_latency: float = 0.0) -> None:
+        self.rpc_latency = rpc_latency
+        self.on_terminated = None
+        self.on_prompt = None
+        self.subscribe_terminate = AsyncMock(side_effect=self._subscribe_terminate)
+        self.subscribe_prompt = AsyncMock(side_effect=self._subscribe_prompt)
+        self.unsubscribed: list[object] = []
+        self.unsubscribe = AsyncMock(side_effect=self._unsubscribe)
+
+    async def _subscribe_terminate(self, connection, callback):
+        self.on_terminated = callback
+        return ("terminate", callback)
+
+    async def _subscribe_prompt(self, connection, callback, session, modes):
+        self.on_prompt = callback
+        return ("prompt", callback)
+
+    async def _unsubscribe(self, connection, token):
+        self.unsubscribed.append(token[0])
+
+    def patch(self):
+        """Patch the iterm2 subscription functions."""
+        return patch.multiple(
+            "iterm2.notifications",
+            async_subscribe_to_terminate_session_notification=self.subscribe_terminate,
+            async_subscribe_to_prompt_notification=self.subscribe_prompt,
+            async_unsubscribe=self.unsubscribe,
+        )
+
+    def make_session(self, session_id: str, exits: bool = True) -> MagicMock:
+        """Create a session that shows a prompt on Ctrl+C and ends on exit."""
+        session = MagicMock()
+        session.session_id = session_id
+        session.async_close = AsyncMock()
+        session.async_get_screen_contents = AsyncMock()
+
+        async def send_text(text: str) -> None:
+            await asyncio.sleep(self.rpc_latency)
+            if text == "\x03":
+                message = SimpleNamespace(session=session_id)
+                asyncio.get_running_loop().create_task(self.on_prompt(None, message))
+            elif text == "exit\n" and exits:
+                message = SimpleNamespace(session_id=session_id)
+                asyncio.get_running_loop().create_task(self.on_terminated(None, message))
+
+        session.async_send_text = AsyncMock(side_effect=send_text)
+        return session
+
+
+class TestEventDrivenTermination:
+    """Test SessionTerminator driven by iTerm2 notifications."""
+
+    def make_connected_controller(self) -> ItermController:
+        """Create a controller in connected state."""
+        controller = ItermController()
+        controller._connected = True
+        controller.connection = MagicMock()
+        controller.app = MagicMock()
+        return controller
+
+    @pytest.mark.asyncio
+    async def test_close_session_on_notifications(self):
+        """Prompt and termination notifications replace the sleep and polling."""
+        controller = self.make_connected_controller()
+        terminator = SessionTerminator(controller)
+        notifications = FakeItermNotifications()
+        session = notifications.make_session("s1")
+
+        with (
+            notifications.patch(),
+            patch.object(
+                terminator, "_wait_for_prompt", wraps=terminator._wait_for_prompt
+            ) as wait_for_prompt,
+        ):
+            result = await terminator.close_session(session)
+
+        assert result.success is True
+        assert result.force_required is False
+        # The prompt notification resolved the wait; a timeout would cancel it
+        (prompt,) = wait_for_prompt.call_args.args
+        assert prompt.done() and not prompt.cancelled()
+        session.async_get_screen_contents.assert_not_called()
+        assert terminator._prompt_waiters == {}
+        assert terminator._termination_waiters == {}
+
+    @pytest.mark.asyncio
+    async def test_subscribes_once_per_connection(self):
+        """Subscriptions are shared by all closes on a connection."""
+        controller = self.make_connected_controller()
+        terminator = SessionTerminator(controller)
+        notifications = FakeItermNotifications()
+
+        with notifications.patch():
+            await terminator.close_session(notifications.make_session("s1"))
+            await terminator.close_session(notifications.make_session("s2"))
+            controller.connection = MagicMock()
+            await terminator.close_session(notifications.make_session("s3"))
+
+        assert notifications.subscribe_terminate.await_count == 2
+        assert notifications.subscribe_prompt.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_close_unsubscribes(self):
+        """close() drops the subscriptions of the current connection."""
+        controller = self.make_connected_controller()
+        terminator = SessionTerminator(controller)
+        notifications = FakeItermNotifications()
+
+        with notifications.patch():
+            await terminator.close_session(notifications.make_session("s1"))
+            await terminator.close()
+            await terminator.close()
+
+        assert notifications.unsubscribed == ["terminate", "prompt"]
+        assert terminator._subscribed_connection is None
+
+    @pytest.mark.asyncio
+    async def test_no_termination_forces_close(self):
+        """A session that never terminates is force-closed after the timeout."""
+        controller = self.make_connected_controller()
+        terminator = SessionTerminator(controller)
+        terminator.SIGTERM_TIMEOUT = 0.1
+        notifications = FakeItermNotifications()
+        session = notifications.make_session("stuck", exits=False)
+
+        with notifications.patch():
+            result = await terminator.close_session(session)
+
+        assert result.success is True
+        assert result.force_required is True
+        session.async_close.assert_called_once_with(force=True)
+        assert terminator._termination_waiters == {}
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_polling(self):
+        """Without termination notifications the session state is polled."""
+        controller = self.make_connected_controller()
+        terminator = SessionTerminator(controller)
+        terminator.PROMPT_TIMEOUT = 0.01
+        session = MagicMock()
+        session.session_id = "s1"
+        session.async_send_text = AsyncMock()
+        session.async_get_screen_contents = AsyncMock(side_effect=Exception("Closed"))
+
+        failing = AsyncMock(side_effect=Exception("Not supported"))
+        with patch(
+            "iterm2.notifications.async_subscribe_to_terminate_session_notification", failing
+        ):
+            result = await terminator.close_session(session)
+            await terminator.close_session(session)
+
+        assert result.success is True
+        assert result.force_required is False
+        session.async_get_screen_contents.assert_called()
+        failing.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_close_many_sessions_overlaps(self):
+        """Closing 30 sessions runs every close at once."""
+        controller = self.make_connected_controller()
+        spawner = SessionSpawner(controller)
+        terminator = SessionTerminator(controller)
+        terminator.SIGTERM_TIMEOUT = 0.05
+        notifications = FakeItermNotifications(rpc_latency=0.001)
+
+        from iterm_controller.models import ManagedSession
+
+        managed = [
+            ManagedSession(id=f"s{i}", template_id="t", project_id="p", tab_id="tab")
+            for i in range(30)
+        ]
+        spawner.managed_sessions = {m.id: m for m in managed}
+        # Every fifth session ignores exit and has to be force-closed
+        sessions = {
+            m.id: notifications.make_session(m.id, exits=i % 5 != 0)
+            for i, m in enumerate(managed)
+        }
+        controller.app.get_session_by_id = MagicMock(side_effect=sessions.get)
+
+        in_flight = max_in_flight = 0
+        close_session = terminator.close_session
+
+        async def counting_close(*args, **kwargs):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            try:
+                return await close_session(*args, **kwargs)
+            finally:
+                in_flight -= 1
+
+        with notifications.patch(), patch.object(terminator, "close_session", counting_close):
+            closed, results = await terminator.close_all_managed(managed, spawner)
+
+        assert closed == 30
+        assert sum(r.force_required for r in results) == 6
+        assert spawner.managed_sessions == {}
+        # Stuck sessions share one timeout window instead of queuing
+        assert max_in_flight == 30
+        assert notifications.subscribe_terminate.await_count == 1
+        assert all(not s.async_get_screen_contents.called for s in sessions.values())
+
+
 class TestWindowLayoutManager:
     """Test WindowLayoutManager layout persistence functionality."""
 
@@ -2,19 +2,31 @@
 
 import asyncio
 import time
-from datetime import datetime
+import json
+from datetime import datetime, timedelta
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from iterm_controller.models import AttentionState, ManagedSession, NotificationSettings, Project
 from iterm_controller.notifications import (
+    LatencySample,
+    NotifySendBackend,
+    TerminalNotifierBackend,
+    NotificationDispatcher,
     NotificationLatencyTracker,
     NotificationManager,
+    NotificationPriority,
     Notifier,
     SessionMonitorWithNotifications,
+    default_notification_backend,
+    load_latency_log,
+    output_shows_error,
+    summarize_latencies,
 )
+from iterm_controller.ports import NotificationBackend, NotificationRequest
 from iterm_controller.state import AppState
+from iterm_controller.testing import InMemoryNotificationSink
 
 
 # =============================================================================
@@ -321,6 +333,133 @@ class TestNotifier:
             assert result is False
 
 
+# =============================================================================
+# Notification Backend Tests
+# =============================================================================
+
+
+def completed_process(returncode: int = 0) -> AsyncMock:
+    """Create a mock subprocess that exits with the given code."""
+    proc = AsyncMock()
+    proc.returncode = returncode
+    proc.wait = AsyncMock(return_value=returncode)
+    return proc
+
+
+class TestNotificationBackends:
+    """Test the platform backends and backend selection."""
+
+    def test_backends_implement_protocol(self):
+        """All backends satisfy NotificationBackend."""
+        for backend in (
+            TerminalNotifierBackend(),
+            NotifySendBackend(),
+            InMemoryNotificationSink(),
+        ):
+            assert isinstance(backend, NotificationBackend)
+
+    def test_default_backend_by_platform(self):
+        """Linux gets notify-send; everything else terminal-notifier."""
+        with patch("sys.platform", "linux"):
+            assert isinstance(default_notification_backend(), NotifySendBackend)
+        with patch("sys.platform", "darwin"):
+            assert isinstance(default_notification_backend(), TerminalNotifierBackend)
+
+    @pytest.mark.asyncio
+    async def test_terminal_notifier_batch_in_order(self):
+        """A batch starts one terminal-notifier per request, in order."""
+        backend = TerminalNotifierBackend(max_concurrency=2)
+        requests = [NotificationRequest(title="P", message=f"m{i}") for i in range(5)]
+
+        with patch("asyncio.create_subprocess_exec") as mock_exec:
+            mock_exec.return_value = completed_process()
+            results = await backend.send_batch(requests)
+
+        assert results == [True] * 5
+        messages = [c.args[c.args.index("-message") + 1] for c in mock_exec.call_args_list]
+        assert messages == [f"m{i}" for i in range(5)]
+
+    @pytest.mark.asyncio
+    async def test_notify_send_args(self):
+        """notify-send gets the subtitle folded into the title."""
+        backend = NotifySendBackend()
+        request = NotificationRequest(title="P", message="m", subtitle="claude")
+
+        with patch("asyncio.create_subprocess_exec") as mock_exec:
+            mock_exec.return_value = completed_process()
+            assert await backend.send(request) is True
+
+        assert mock_exec.call_args.args == (
+            "notify-send",
+            "--app-name=iterm-controller",
+            "P - claude",
+            "m",
+        )
+        assert await backend.remove_group("session-1") is False
+
+    @pytest.mark.asyncio
+    async def test_notifier_uses_backend_availability(self):
+        """Notifier.initialize asks the backend."""
+        sink = InMemoryNotificationSink()
+        sink.set_available(False)
+        notifier = Notifier(backend=sink)
+
+        assert await notifier.initialize() is False
+        assert notifier.error_message == "memory sink disabled"
+        assert await notifier.notify("P", "m") is False
+        assert await notifier.notify_batch([NotificationRequest("P", "m")]) == [False]
+        assert sink.deliveries == []
+
+    @pytest.mark.asyncio
+    async def test_notifier_backend_exception_degrades(self):
+        """A backend error is reported as a failed delivery."""
+        sink = InMemoryNotificationSink()
+        sink.send_batch = AsyncMock(side_effect=RuntimeError("boom"))
+        notifier = Notifier(available=True, backend=sink)
+
+        assert await notifier.notify_batch([NotificationRequest("P", "m")]) == [False]
+
+
+class TestInMemoryNotificationSink:
+    """Test the in-memory sink used for headless notification tests."""
+
+    @pytest.mark.asyncio
+    async def test_records_deliveries_with_timestamps(self):
+        """Deliveries are recorded in order with monotonic timestamps."""
+        sink = InMemoryNotificationSink()
+        notifier = Notifier(backend=sink)
+        await notifier.initialize()
+
+        before = time.monotonic()
+        await notifier.notify("P", "first", group="g1")
+        await notifier.notify_batch(
+            [NotificationRequest("P", "second", group="g2"), NotificationRequest("P", "third")]
+        )
+
+        assert sink.messages == ["first", "second", "third"]
+        assert [d.batch for d in sink.deliveries] == [0, 1, 1]
+        assert all(d.delivered_at >= before for d in sink.deliveries)
+        assert sink.batch_count == 2
+
+    @pytest.mark.asyncio
+    async def test_visible_tracks_groups(self):
+        """A group shows its latest notification until removed."""
+        sink = InMemoryNotificationSink()
+        await sink.send(NotificationRequest("P", "old", group="g1"))
+        await sink.send(NotificationRequest("P", "new", group="g1"))
+        await sink.send(NotificationRequest("P", "other", group="g2"))
+        await sink.remove_group("g2")
+
+        assert [r.message for r in sink.visible()] == ["new"]
+
+    @pytest.mark.asyncio
+    async def test_wait_for_times_out(self):
+        """wait_for raises when deliveries do not arrive."""
+        sink = InMemoryNotificationSink()
+        with pytest.raises(asyncio.TimeoutError):
+            await sink.wait_for(1, timeout=0.01)
+
+
 # =============================================================================
 # NotificationLatencyTracker Tests
 # =============================================================================
@@ -447,6 +586,163 @@ class TestNotificationLatencyTracker:
         assert tracker.notification_times == {}
 
 
+def make_sample(total: float, timestamp: float | None = None, session_id: str = "s") -> LatencySample:
+    """Create a sample whose latency is all in the dispatch stage."""
+    return LatencySample(
+        session_id=session_id,
+        timestamp=time.time() if timestamp is None else timestamp,
+        detection=0.0,
+        dispatch=total,
+        delivery=0.0,
+    )
+
+
+class TestLatencyReporting:
+    """Test per-stage latency samples, percentiles and the latency log."""
+
+    def test_delivery_records_stage_breakdown(self):
+        """Detection, dispatch and delivery are measured separately."""
+        tracker = NotificationLatencyTracker()
+        clock = iter([100.0, 101.5, 101.75])
+
+        with patch("time.monotonic", side_effect=lambda: next(clock)):
+            tracker.record_state_change(
+                "s1", observed_at=datetime.now() - timedelta(seconds=0.5)
+            )
+            tracker.record_dispatch("s1")
+            tracker.record_delivery("s1")
+
+        (sample,) = tracker.samples
+        assert sample.detection == pytest.approx(0.5, abs=0.1)
+        assert sample.dispatch == pytest.approx(1.5)
+        assert sample.delivery == pytest.approx(0.25)
+        assert sample.total == pytest.approx(2.25, abs=0.1)
+
+    def test_one_sample_per_state_change(self):
+        """Repeated deliveries for one state change record one sample."""
+        tracker = NotificationLatencyTracker()
+        tracker.record_state_change("s1")
+        tracker.record_delivery("s1")
+        tracker.record_delivery("s1")
+
+        assert len(tracker.samples) == 1
+
+    def test_samples_kept_after_session_cleared(self):
+        """Clearing a session keeps its history for reporting."""
+        tracker = NotificationLatencyTracker()
+        tracker.record_state_change("s1")
+        tracker.record_delivery("s1")
+        tracker.clear_session("s1")
+
+        assert tracker.get_report()["count"] == 1
+
+    def test_rolling_window_is_bounded(self):
+        """Only the most recent max_samples samples are kept."""
+        tracker = NotificationLatencyTracker(max_samples=5)
+        for i in range(8):
+            tracker.record_state_change(f"s{i}")
+            tracker.record_delivery(f"s{i}")
+
+        assert [s.session_id for s in tracker.samples] == [f"s{i}" for i in range(3, 8)]
+
+    def test_violation_log(self, caplog):
+        """Samples over the SLA are kept as violations and logged with stages."""
+        tracker = NotificationLatencyTracker()
+        clock = iter([100.0, 106.0, 106.0])
+
+        with patch("time.monotonic", side_effect=lambda: next(clock)):
+            tracker.record_state_change("slow")
+            tracker.record_dispatch("slow")
+            tracker.record_delivery("slow")
+
+        assert [v.session_id for v in tracker.get_violations()] == ["slow"]
+        assert any("dispatch 6.00s" in r.message for r in caplog.records)
+
+    def test_report_percentiles_and_histogram(self):
+        """Percentiles use nearest rank; histogram buckets are per bucket."""
+        samples = [make_sample(i / 10) for i in range(1, 101)]  # 0.1s .. 10.0s
+
+        report = summarize_latencies(samples, sla_seconds=5.0)
+        total = report["stages"]["total"]
+
+        assert report["count"] == 100
+        assert report["sla_met"] == 50
+        assert report["sla_violated"] == 50
+        assert total["p50"] == pytest.approx(5.0)
+        assert total["p90"] == pytest.approx(9.0)
+        assert total["p99"] == pytest.approx(9.9)
+        assert total["max"] == pytest.approx(10.0)
+        histogram = {b["le"]: b["count"] for b in total["histogram"]}
+        assert histogram[0.1] == 1
+        assert histogram[5.0] == 25  # 2.6 .. 5.0
+        assert histogram[10.0] == 50
+        assert histogram["+Inf"] == 0
+        assert sum(histogram.values()) == 100
+        assert report["stages"]["detection"]["max"] == 0.0
+
+    def test_report_window(self):
+        """Only samples inside the window are reported."""
+        tracker = NotificationLatencyTracker()
+        tracker.samples.append(make_sample(1.0, timestamp=time.time() - 7200))
+        tracker.samples.append(make_sample(2.0))
+
+        assert tracker.get_report()["count"] == 2
+        assert tracker.get_report(window_seconds=3600)["count"] == 1
+
+    def test_empty_report(self):
+        """A report with no samples only has the count and SLA."""
+        assert summarize_latencies([]) == {"count": 0, "sla_seconds": 5.0}
+
+    def test_log_round_trip_and_rotation(self, tmp_path):
+        """Samples are appended to the log and read back across rotation."""
+        log = tmp_path / "latency.jsonl"
+        tracker = NotificationLatencyTracker(log_path=log, max_log_bytes=1)
+        for sid in ("s1", "s2", "s3"):
+            tracker.record_state_change(sid)
+            tracker.record_delivery(sid)
+        log.open("a").write("not json\n")
+
+        samples = load_latency_log(log)
+
+        assert (tmp_path / "latency.jsonl.1").exists()
+        assert [s.session_id for s in samples] == ["s2", "s3"]
+        assert json.loads((tmp_path / "latency.jsonl.1").read_text())["session_id"] == "s2"
+
+    async def test_log_written_off_the_event_loop(self, tmp_path):
+        """With a running loop, samples are appended from a worker thread."""
+        import threading
+
+        log = tmp_path / "latency.jsonl"
+        tracker = NotificationLatencyTracker(log_path=log)
+        writer_threads = []
+        append_log = tracker._append_log
+
+        def record_thread(path, sample):
+            writer_threads.append(threading.current_thread())
+            append_log(path, sample)
+
+        tracker._append_log = record_thread
+        tracker.record_state_change("s1")
+        tracker.record_delivery("s1")
+        await tracker.flush_log()
+
+        assert writer_threads and writer_threads[0] is not threading.main_thread()
+        assert [s.session_id for s in load_latency_log(log)] == ["s1"]
+
+    def test_log_since(self, tmp_path):
+        """load_latency_log filters by delivery time."""
+        log = tmp_path / "latency.jsonl"
+        log.write_text(
+            json.dumps(make_sample(1.0, timestamp=100.0).to_dict())
+            + "\n"
+            + json.dumps(make_sample(1.0, timestamp=200.0).to_dict())
+            + "\n"
+        )
+
+        assert [s.timestamp for s in load_latency_log(log, since=150.0)] == [200.0]
+        assert load_latency_log(tmp_path / "missing.jsonl") == []
+
+
 # =============================================================================
 # NotificationSettings Tests
 # =============================================================================
@@ -760,6 +1056,397 @@ class TestNotificationManager:
             assert "sla_violated" in stats
 
 
+# =============================================================================
+# NotificationDispatcher Tests
+# =============================================================================
+
+
+def make_waiting_session(index: int) -> ManagedSession:
+    """Create a session in project-1 for dispatcher tests."""
+    return ManagedSession(
+        id=f"session-{index}",
+        template_id=f"agent-{index}",
+        project_id="project-1",
+        tab_id=f"tab-{index}",
+        attention_state=AttentionState.IDLE,
+    )
+
+
+@pytest.fixture
+def sink():
+    """In-memory notification backend."""
+    return InMemoryNotificationSink()
+
+
+@pytest.fixture
+def sink_notifier(sink):
+    """Available notifier that delivers to the in-memory sink."""
+    return Notifier(available=True, backend=sink)
+
+
+class TestNotificationDispatcher:
+    """Test NotificationDispatcher coalescing, priority and rate limiting."""
+
+    @pytest.mark.asyncio
+    async def test_single_notification_sent_as_is(self, sink, sink_notifier):
+        """One queued notification is delivered unchanged."""
+        dispatcher = NotificationDispatcher(sink_notifier)
+
+        dispatcher.submit("s1", "Project", "Session needs your attention", subtitle="claude")
+        sent = await dispatcher.flush()
+
+        assert sent == 1
+        assert sink.deliveries[0].request == NotificationRequest(
+            title="Project",
+            message="Session needs your attention",
+            subtitle="claude",
+            sound="default",
+            group="session-s1",
+        )
+        await dispatcher.stop()
+
+    @pytest.mark.asyncio
+    async def test_simultaneous_waiting_coalesced(self, sink, sink_notifier):
+        """Ten sessions going WAITING together produce one summary."""
+        dispatcher = NotificationDispatcher(sink_notifier, coalesce_window=0.01)
+
+        for i in range(10):
+            dispatcher.submit(f"s{i}", "Project", "Session needs your attention", subtitle=f"a{i}")
+        (delivered,) = await sink.wait_for(1)
+
+        assert delivered.request.title == "Project"
+        assert delivered.request.message == "10 sessions need your attention"
+        assert delivered.request.subtitle == "a0, a1, a2 +7"
+        assert delivered.request.group == "iterm-controller-question"
+        await dispatcher.stop()
+
+    @pytest.mark.asyncio
+    async def test_priority_order_and_single_sound(self, sink, sink_notifier):
+        """Errors go out before questions before idle; only the first has sound."""
+        dispatcher = NotificationDispatcher(sink_notifier)
+
+        dispatcher.submit("idle", "P", "idle", priority=NotificationPriority.IDLE)
+        dispatcher.submit("q", "P", "question", priority=NotificationPriority.QUESTION)
+        dispatcher.submit("err", "P", "error", priority=NotificationPriority.ERROR)
+        await dispatcher.flush()
+
+        assert sink.messages == ["error", "question", "idle"]
+        assert [d.request.sound for d in sink.deliveries] == ["default", None, None]
+        assert sink.batch_count == 1
+        await dispatcher.stop()
+
+    @pytest.mark.asyncio
+    async def test_per_session_rate_limit(self, sink_notifier):
+        """A session notified recently is not notified again."""
+        now = [100.0]
+        dispatcher = NotificationDispatcher(
+            sink_notifier, rate_limit_seconds=30.0, clock=lambda: now[0]
+        )
+
+        assert dispatcher.submit("s1", "P", "first") is True
+        await dispatcher.flush()
+
+        now[0] = 110.0
+        assert dispatcher.submit("s1", "P", "again") is False
+        assert dispatcher.submit("s2", "P", "other") is True
+
+        now[0] = 131.0
+        assert dispatcher.submit("s1", "P", "later") is True
+        await dispatcher.stop()
+
+    @pytest.mark.asyncio
+    async def test_clear_session_resets_rate_limit(self, sink_notifier):
+        """A session that left and re-entered WAITING is notified again."""
+        now = [100.0]
+        dispatcher = NotificationDispatcher(
+            sink_notifier, rate_limit_seconds=30.0, clock=lambda: now[0]
+        )
+        dispatcher.submit("s1", "P", "first")
+        await dispatcher.flush()
+
+        now[0] = 110.0
+        await dispatcher.clear_session("s1")
+        assert dispatcher.submit("s1", "P", "second") is True
+        await dispatcher.stop()
+
+    @pytest.mark.asyncio
+    async def test_duplicate_queued_dropped(self, sink_notifier):
+        """A session has at most one queued notification."""
+        dispatcher = NotificationDispatcher(sink_notifier)
+
+        assert dispatcher.submit("s1", "P", "one") is True
+        assert dispatcher.submit("s1", "P", "two") is False
+        assert dispatcher.pending == 1
+        await dispatcher.stop()
+
+    @pytest.mark.asyncio
+    async def test_clear_session_cancels_queued_and_summary(self, sink, sink_notifier):
+        """Clearing drops queued notifications and empties summaries."""
+        dispatcher = NotificationDispatcher(sink_notifier)
+        dispatcher.submit("s1", "P", "m")
+        dispatcher.submit("s2", "P", "m")
+        await dispatcher.flush()
+
+        await dispatcher.clear_session("s1")
+        assert sink.removed_groups == ["session-s1"]
+        assert len(sink.visible()) == 1
+
+        await dispatcher.clear_session("s2")
+        assert "iterm-controller-question" in sink.removed_groups
+        assert sink.visible() == []
+
+        dispatcher.submit("s3", "P", "m")
+        await dispatcher.clear_session("s3")
+        assert dispatcher.pending == 0
+        await dispatcher.stop()
+
+    @pytest.mark.asyncio
+    async def test_records_latency(self, sink_notifier):
+        """Delivery is recorded in the latency tracker for every session."""
+        tracker = NotificationLatencyTracker()
+        dispatcher = NotificationDispatcher(sink_notifier, latency_tracker=tracker)
+        for sid in ("s1", "s2"):
+            tracker.record_state_change(sid)
+            dispatcher.submit(sid, "P", "m")
+
+        await dispatcher.flush()
+
+        assert tracker.get_stats()["count"] == 2
+        assert tracker.check_sla("s1")
+        await dispatcher.stop()
+
+    @pytest.mark.asyncio
+    async def test_coalescing_window_counts_as_dispatch(self, sink, sink_notifier):
+        """Time spent queued is reported in the dispatch stage."""
+        tracker = NotificationLatencyTracker()
+        dispatcher = NotificationDispatcher(
+            sink_notifier, coalesce_window=0.05, latency_tracker=tracker
+        )
+        tracker.record_state_change("s1")
+        dispatcher.submit("s1", "P", "m")
+        await sink.wait_for(1)
+
+        (sample,) = tracker.samples
+        assert sample.dispatch >= 0.05
+        await dispatcher.stop()
+
+    @pytest.mark.asyncio
+    async def test_failed_delivery_not_rate_limited(self, sink, sink_notifier):
+        """A notification that failed to send does not start the rate limit."""
+        sink.set_send_failure()
+        dispatcher = NotificationDispatcher(sink_notifier)
+
+        dispatcher.submit("s1", "P", "m")
+        assert await dispatcher.flush() == 0
+
+        assert dispatcher.submit("s1", "P", "m") is True
+        await dispatcher.stop()
+
+    @pytest.mark.asyncio
+    async def test_partial_batch_failure(self, sink, sink_notifier):
+        """Only the notifications that failed are left un-sent."""
+        sink.set_send_failure(group="session-idle")
+        dispatcher = NotificationDispatcher(sink_notifier)
+
+        dispatcher.submit("err", "P", "error", priority=NotificationPriority.ERROR)
+        dispatcher.submit("idle", "P", "idle", priority=NotificationPriority.IDLE)
+
+        assert await dispatcher.flush() == 1
+        assert sink.messages == ["error"]
+        assert dispatcher.submit("idle", "P", "idle") is True
+        await dispatcher.stop()
+
+
+class TestNotificationManagerWithDispatcher:
+    """Test NotificationManager routing through a dispatcher."""
+
+    @pytest.mark.asyncio
+    async def test_waiting_sessions_coalesced(self, app_state, sink, sink_notifier):
+        """Sessions entering WAITING in one cycle produce one notification."""
+        dispatcher = NotificationDispatcher(sink_notifier, coalesce_window=0.01)
+        manager = NotificationManager(sink_notifier, app_state, dispatcher=dispatcher)
+
+        for i in range(3):
+            await manager.on_session_state_change(
+                make_waiting_session(i), AttentionState.WORKING, AttentionState.WAITING
+            )
+        await sink.wait_for(1)
+        await asyncio.sleep(0.03)
+
+        assert sink.messages == ["3 sessions need your attention"]
+        assert manager.get_latency_stats()["count"] == 3
+        await manager.close()
+
+    @pytest.mark.asyncio
+    async def test_leaving_waiting_clears_via_dispatcher(self, app_state, sink, sink_notifier):
+        """Leaving WAITING drops the queued notification."""
+        dispatcher = NotificationDispatcher(sink_notifier, coalesce_window=10)
+        manager = NotificationManager(sink_notifier, app_state, dispatcher=dispatcher)
+        session = make_waiting_session(1)
+
+        await manager.on_session_state_change(
+            session, AttentionState.WORKING, AttentionState.WAITING
+        )
+        await manager.on_session_state_change(
+            session, AttentionState.WAITING, AttentionState.WORKING
+        )
+
+        assert dispatcher.pending == 0
+        assert sink.deliveries == []
+        await manager.close()
+
+    @pytest.mark.asyncio
+    async def test_idle_notification_when_enabled(self, app_state, sink, sink_notifier):
+        """on_session_idle queues a low-priority, silent notification."""
+        dispatcher = NotificationDispatcher(sink_notifier)
+        settings = NotificationSettings(on_session_idle=True)
+        manager = NotificationManager(sink_notifier, app_state, settings, dispatcher)
+
+        await manager.on_session_state_change(
+            make_waiting_session(1), AttentionState.WORKING, AttentionState.IDLE
+        )
+        await dispatcher.flush()
+
+        request = sink.deliveries[0].request
+        assert request.message == "Session is idle"
+        assert request.sound is None
+        await manager.close()
+
+    @pytest.mark.asyncio
+    async def test_error_output_sent_as_error(self, app_state, sink, sink_notifier):
+        """A session waiting on a traceback is notified at ERROR priority."""
+        dispatcher = NotificationDispatcher(sink_notifier)
+        manager = NotificationManager(sink_notifier, app_state, dispatcher=dispatcher)
+        session = make_waiting_session(1)
+        session.last_output = 'Traceback (most recent call last):\n  File "x.py"\nKeyError: 1\n$ '
+
+        with patch.object(dispatcher, "submit", wraps=dispatcher.submit) as submit:
+            await manager.on_session_state_change(
+                session, AttentionState.WORKING, AttentionState.WAITING
+            )
+        await dispatcher.flush()
+
+        assert submit.call_args.kwargs["priority"] is NotificationPriority.ERROR
+        request = sink.deliveries[0].request
+        assert request.message == "Session hit an error"
+        assert request.sound is not None
+        await manager.close()
+
+    @pytest.mark.asyncio
+    async def test_idle_with_error_sent_as_error(self, app_state, sink, sink_notifier):
+        """A session that went idle on an error is not reported as merely idle."""
+        dispatcher = NotificationDispatcher(sink_notifier)
+        settings = NotificationSettings(on_session_idle=True)
+        manager = NotificationManager(sink_notifier, app_state, settings, dispatcher)
+        session = make_waiting_session(1)
+        session.last_output = "npm ERR! code ENOENT\n"
+
+        await manager.on_session_state_change(
+            session, AttentionState.WORKING, AttentionState.IDLE
+        )
+        await dispatcher.flush()
+
+        request = sink.deliveries[0].request
+        assert request.message == "Session stopped with an error"
+        assert request.sound is not None
+        await manager.close()
+
+    @pytest.mark.asyncio
+    async def test_second_waiting_within_rate_limit(self, app_state, sink, sink_notifier):
+        """Re-entering WAITING soon after answering still notifies."""
+        dispatcher = NotificationDispatcher(sink_notifier, rate_limit_seconds=30.0)
+        manager = NotificationManager(sink_notifier, app_state, dispatcher=dispatcher)
+        session = make_waiting_session(1)
+
+        for old, new in [
+            (AttentionState.WORKING, AttentionState.WAITING),
+            (AttentionState.WAITING, AttentionState.WORKING),
+            (AttentionState.WORKING, AttentionState.WAITING),
+        ]:
+            await manager.on_session_state_change(session, old, new)
+            await dispatcher.flush()
+
+        assert len(sink.deliveries) == 2
+        await manager.close()
+
+
+class TestOutputShowsError:
+    """Test error detection in session output."""
+
+    @pytest.mark.parametrize(
+        "output",
+        [
+            "Traceback (most recent call last):\n  ...\nValueError: bad",
+            "src/main.rs\nerror[E0308]: mismatched types",
+            "npm ERR! missing script: build",
+            "  requests.exceptions.ConnectionError: refused",
+            "API Error: 529 overloaded",
+        ],
+    )
+    def test_errors_detected(self, output):
+        assert output_shows_error(output)
+
+    def test_plain_output(self):
+        assert not output_shows_error("All tests passed\n? Continue (y/n)")
+
+    def test_old_error_scrolled_away(self):
+        """Only the last lines count."""
+        output = "ValueError: old\n" + "\n".join(f"line {i}" for i in range(20))
+        assert not output_shows_error(output)
+
+
+class TestNotificationBenchmarks:
+    """Headless throughput and latency checks against the in-memory sink."""
+
+    @pytest.mark.asyncio
+    async def test_fifty_sessions_waiting_meet_sla(self, app_state, sink, sink_notifier):
+        """50 sessions entering WAITING at once are notified well within the SLA."""
+        sink.delay = 0.02  # roughly one terminal-notifier launch
+        wrapper = SessionMonitorWithNotifications(sink_notifier, app_state)
+        sessions = [make_waiting_session(i) for i in range(50)]
+
+        start = time.monotonic()
+        for session in sessions:
+            await wrapper.on_attention_change(
+                session, AttentionState.WORKING, AttentionState.WAITING
+            )
+        await sink.wait_for(1)
+        elapsed = time.monotonic() - start
+
+        report = wrapper.get_latency_report()
+        print(
+            f"\n50 WAITING sessions: {len(sink.deliveries)} notification(s) in "
+            f"{elapsed * 1000:.0f}ms, p99 {report['stages']['total']['p99'] * 1000:.0f}ms"
+        )
+        assert sink.messages == ["50 sessions need your attention"]
+        assert report["count"] == 50
+        assert report["sla_violated"] == 0
+        assert report["stages"]["total"]["p99"] < 1.0
+        await wrapper.close()
+
+    @pytest.mark.asyncio
+    async def test_dispatch_throughput(self, sink, sink_notifier):
+        """The dispatcher sustains a high rate of distinct notifications."""
+        tracker = NotificationLatencyTracker()
+        dispatcher = NotificationDispatcher(
+            sink_notifier, coalesce_window=0.0, latency_tracker=tracker
+        )
+
+        start = time.monotonic()
+        for i in range(500):
+            tracker.record_state_change(f"s{i}")
+            dispatcher.submit(
+                f"s{i}", "P", "m", priority=NotificationPriority(i % 3)
+            )
+            await dispatcher.flush()
+        elapsed = time.monotonic() - start
+
+        print(f"\n500 notifications dispatched in {elapsed * 1000:.0f}ms")
+        assert len(sink.deliveries) == 500
+        assert tracker.get_report()["sla_violated"] == 0
+        await dispatcher.stop()
+
+
 # =============================================================================
 # SessionMonitorWithNotifications Tests
 # =============================================================================
@@ -799,6 +1486,25 @@ class TestSessionMonitorWithNotifications:
                 AttentionState.WAITING,
             )
 
+    async def test_attach_handles_monitor_changes(
+        self, mock_session, app_state, sink, sink_notifier, tmp_path
+    ):
+        """Attached to a monitor, state changes notify and log their latency."""
+        log = tmp_path / "latency.jsonl"
+        wrapper = SessionMonitorWithNotifications(sink_notifier, app_state, latency_log=log)
+        monitor = MagicMock()
+
+        wrapper.attach(monitor)
+        monitor.on_attention_state_change(
+            mock_session, AttentionState.WORKING, AttentionState.WAITING
+        )
+        await asyncio.sleep(0)
+        await wrapper.notification_manager.dispatcher.flush()
+        await wrapper.close()
+
+        assert len(sink.deliveries) == 1
+        assert [s.session_id for s in load_latency_log(log)] == [mock_session.id]
+
     def test_get_latency_stats(self, app_state):
         """get_latency_stats returns manager stats."""
         notifier = Notifier(available=True)
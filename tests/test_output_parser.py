@@ -10,7 +10,11 @@ from iterm_controller.test_output_parser import (
     NpmTestParser,
     OutputParserRegistry,
     PytestParser,
+    StreamingOutputParser,
+    StreamingTestParser,
+    TestOutputParser,
     UnitTestResults,
+    create_streaming_parser,
     parse_test_output,
 )
 
@@ -462,6 +466,218 @@ class TestParserRegistry:
         assert registry._make_parser in registry._parsers
 
 
+# =============================================================================
+# Streaming Parser Tests
+# =============================================================================
+
+
+def feed_in_chunks(parser: StreamingTestParser, output: str, size: int = 7) -> None:
+    """Feed output in small chunks that split lines mid-way."""
+    for i in range(0, len(output), size):
+        parser.feed(output[i : i + size])
+
+
+class TestStreamingTestParser:
+    """Tests for incremental test output parsing."""
+
+    PYTEST_OUTPUT = """============================= test session starts ==============================
+collected 6 items
+
+tests/test_a.py ..F                                                    [ 50%]
+tests/test_b.py .sE                                                    [100%]
+
+=========================== short test summary info ============================
+FAILED tests/test_a.py::test_three - assert 1 == 2
+ERROR tests/test_b.py::test_six - fixture 'db' not found
+============== 1 failed, 3 passed, 1 skipped, 1 error in 0.52s ================
+"""
+
+    def test_pytest_running_counts(self):
+        """Progress lines update counts before the summary arrives."""
+        parser = create_streaming_parser("pytest")
+        parser.feed("collected 6 items\n\ntests/test_a.py ..F   [ 50%]\n")
+
+        assert parser.results.passed == 2
+        assert parser.results.failed == 1
+        assert parser.results.is_running is True
+        assert parser.progress.total_tasks == 6
+        assert parser.progress.completed_tasks == 3
+
+    def test_pytest_summary_is_authoritative(self):
+        """Final results match the summary line and list failures."""
+        parser = create_streaming_parser("pytest")
+        feed_in_chunks(parser, self.PYTEST_OUTPUT)
+        results = parser.finish()
+
+        assert results.passed == 3
+        assert results.failed == 1
+        assert results.skipped == 1
+        assert results.errors == 1
+        assert results.duration_seconds == 0.52
+        assert results.is_running is False
+        assert results.last_run is not None
+        names = [t.name for t in results.failed_tests]
+        assert names == ["tests/test_a.py::test_three", "tests/test_b.py::test_six"]
+
+    def test_pytest_verbose_with_ansi(self):
+        """Verbose result lines are counted after stripping color codes."""
+        parser = create_streaming_parser("pytest -v")
+        parser.feed(
+            "\x1b[32mtests/x.py::test_a PASSED\x1b[0m [ 50%]\n"
+            "tests/x.py::test_b \x1b[31mFAILED\x1b[0m [100%]\n"
+        )
+
+        assert parser.results.passed == 1
+        assert parser.results.failed == 1
+        assert parser.results.failed_tests[0].name == "tests/x.py::test_b"
+
+    def test_matches_batch_parser(self):
+        """Streaming and whole-output parsing agree on the counts."""
+        parser = create_streaming_parser("pytest")
+        feed_in_chunks(parser, self.PYTEST_OUTPUT, size=3)
+        streamed = parser.finish()
+        batch = parse_test_output(self.PYTEST_OUTPUT, "pytest")
+
+        assert (streamed.passed, streamed.failed, streamed.skipped) == (
+            batch.passed,
+            batch.failed,
+            batch.skipped,
+        )
+
+    def test_jest(self):
+        """Jest check marks count live and the summary finalizes."""
+        parser = create_streaming_parser("npm test")
+        parser.feed("PASS src/a.test.js\n  ✓ adds (3 ms)\n  ✕ subtracts (2 ms)\n")
+        assert parser.results.passed == 1
+        assert parser.results.failed == 1
+
+        parser.feed(
+            "  ● math › subtracts\n"
+            "Tests:       1 failed, 1 skipped, 1 passed, 3 total\n"
+            "Time:        1.5 s\n"
+        )
+        results = parser.finish()
+
+        assert (results.passed, results.failed, results.skipped) == (1, 1, 1)
+        assert results.duration_seconds == 1.5
+        assert [t.name for t in results.failed_tests] == ["math › subtracts"]
+
+    def test_cargo_sums_test_binaries(self):
+        """Totals and durations add up across cargo test binaries."""
+        parser = create_streaming_parser("cargo test")
+        block = (
+            "running 2 tests\n"
+            "test a ... ok\n"
+            "test b ... FAILED\n"
+            "test result: FAILED. 1 passed; 1 failed; 0 ignored; finished in 0.10s\n"
+        )
+        parser.feed(block)
+        parser.feed(block.replace("test b", "test c"))
+        results = parser.finish()
+
+        assert results.passed == 2
+        assert results.failed == 2
+        assert results.duration_seconds == pytest.approx(0.2)
+        assert parser.progress.total_tasks == 4
+
+    def test_go_package_fallback(self):
+        """Package lines are used when no per-test lines were printed."""
+        parser = create_streaming_parser("go test ./...")
+        parser.feed("ok  \tpkg/a\t0.01s\nFAIL\tpkg/b\t0.02s\n")
+        results = parser.finish()
+
+        assert results.passed == 1
+        assert results.failed == 1
+
+    def test_go_failure_duration(self):
+        """Failed go tests carry their duration."""
+        parser = create_streaming_parser("go test")
+        parser.feed("--- PASS: TestA (0.00s)\n--- FAIL: TestB (0.25s)\n")
+
+        assert parser.results.failed_tests[0].duration_ms == 250.0
+
+    def test_detects_runner_from_output(self):
+        """Without a known command the runner is detected and earlier lines replayed."""
+        parser = create_streaming_parser("make test")
+        parser.feed("tests/test_a.py ..  [ 50%]\n")
+        assert parser.parser is None
+
+        parser.feed("platform linux -- Python 3.12, pytest-8.0\n")
+
+        assert isinstance(parser.parser, PytestParser)
+        assert parser.results.passed == 2
+
+    def test_undetected_falls_back_to_batch_parse(self):
+        """Unrecognized output is parsed in one go at the end."""
+        parser = create_streaming_parser("")
+        parser.feed("some random text\n")
+        results = parser.finish()
+
+        assert results.passed == 0
+        assert results.last_run is not None
+
+    def test_partial_line_processed_on_finish(self):
+        """A final line without a newline is still parsed."""
+        parser = create_streaming_parser("pytest")
+        parser.feed("==== 4 passed in 0.10s ====")
+        assert parser.results.passed == 0
+
+        assert parser.finish().passed == 4
+
+    def test_on_progress_called_when_counts_change(self):
+        """The progress callback fires only when counts change."""
+        calls = []
+        parser = create_streaming_parser("pytest", on_progress=calls.append)
+
+        parser.feed("collected 2 items\n")
+        assert calls == []
+
+        parser.feed("tests/test_a.py .. [100%]\n")
+        assert calls == [parser]
+
+    def test_tail_is_bounded(self):
+        """Only the configured amount of raw output is kept."""
+        parser = StreamingTestParser("pytest", tail_bytes=100)
+        for _ in range(50):
+            parser.feed("tests/test_a.py " + "." * 40 + " [ 10%]\n")
+        results = parser.finish()
+
+        assert len(results.raw_output) <= 100
+        assert results.passed == 2000
+
+    def test_custom_parser_without_streaming(self):
+        """A custom parser that only implements parse() still gets counts."""
+
+        class TapParser(TestOutputParser):
+            def can_parse(self, output):
+                return "TAP version" in output
+
+            def parse(self, output):
+                return UnitTestResults(
+                    passed=output.count("\nok "), failed=output.count("\nnot ok ")
+                )
+
+        registry = OutputParserRegistry()
+        registry.add_parser(TapParser())
+        parser = registry.create_stream("prove -v")
+
+        feed_in_chunks(parser, "TAP version 13\nok 1 - a\nnot ok 2 - b\nok 3 - c\n1..3\n")
+        assert isinstance(parser.parser, TapParser)
+        assert not isinstance(parser.parser, StreamingOutputParser)
+        results = parser.finish()
+
+        assert (results.passed, results.failed) == (2, 1)
+        assert results.test_command == "prove -v"
+        assert results.is_running is False
+
+    def test_builtin_parsers_stream(self):
+        """The built-in runners update counts line by line."""
+        registry = OutputParserRegistry()
+        streaming = [p for p in registry._parsers if p is not registry._make_parser]
+
+        assert all(isinstance(p, StreamingOutputParser) for p in streaming)
+
+
 # =============================================================================
 # UnitTestResults Tests
 # =============================================================================
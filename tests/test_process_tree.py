@@ -0,0 +1,256 @@
+"""Tests for process table snapshots."""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from iterm_controller.process_tree import (
+    PROC_ROOT,
+    ProcessInfo,
+    ProcessTable,
+    ProcessTreeCache,
+    _parse_proc_stat,
+    _parse_ps_time,
+    read_proc_table,
+    read_ps_table,
+)
+
+
+def make_proc_entry(
+    root: Path,
+    pid: int,
+    ppid: int,
+    comm: str = "bash",
+    utime: int = 0,
+    stime: int = 0,
+    rss_pages: int = 0,
+    fds: int = 0,
+) -> None:
+    """Create a fake /proc/<pid> directory with stat and fd entries."""
+    proc_dir = root / str(pid)
+    (proc_dir / "fd").mkdir(parents=True)
+    # Fields after the command: state ppid pgrp session tty tpgid flags
+    # minflt cminflt majflt cmajflt utime stime cutime cstime priority nice
+    # num_threads itrealvalue starttime vsize rss
+    fields = ["S", str(ppid)] + ["0"] * 9 + [str(utime), str(stime)]
+    fields += ["0"] * 8 + [str(rss_pages)]
+    (proc_dir / "stat").write_text(f"{pid} ({comm}) {' '.join(fields)}\n")
+    for fd in range(fds):
+        (proc_dir / "fd" / str(fd)).touch()
+
+
+class TestProcessTable:
+    """Tests for ProcessTable indexing."""
+
+    @pytest.fixture
+    def table(self) -> ProcessTable:
+        """Create a small tree: 1 -> 10 -> (11, 12 -> 13), plus 20."""
+        return ProcessTable.from_processes(
+            [
+                ProcessInfo(pid=1, ppid=0),
+                ProcessInfo(pid=10, ppid=1),
+                ProcessInfo(pid=11, ppid=10),
+                ProcessInfo(pid=12, ppid=10),
+                ProcessInfo(pid=13, ppid=12),
+                ProcessInfo(pid=20, ppid=1),
+            ]
+        )
+
+    def test_children(self, table: ProcessTable):
+        """Test direct children lookup."""
+        assert sorted(table.children(10)) == [11, 12]
+        assert table.children(13) == []
+
+    def test_descendants(self, table: ProcessTable):
+        """Test the whole subtree is walked."""
+        pids = sorted(p.pid for p in table.descendants(10))
+        assert pids == [10, 11, 12, 13]
+
+    def test_descendants_exclude_root(self, table: ProcessTable):
+        """Test the root can be excluded."""
+        pids = sorted(p.pid for p in table.descendants(10, include_root=False))
+        assert pids == [11, 12, 13]
+
+    def test_descendants_missing_root(self, table: ProcessTable):
+        """Test a vanished root yields nothing."""
+        assert list(table.descendants(999)) == []
+
+    def test_count_fds_without_counter(self, table: ProcessTable):
+        """Test FD counts are None when the backend has no counter."""
+        assert table.count_fds(10) is None
+
+    def test_ancestors(self, table: ProcessTable):
+        """Test the parent chain is walked nearest first."""
+        assert table.ancestors(13) == [13, 12, 10, 1]
+        assert table.ancestors(13, include_self=False) == [12, 10, 1]
+
+    def test_ancestors_missing_pid(self, table: ProcessTable):
+        """Test a pid not in the table is its own chain."""
+        assert table.ancestors(999) == [999]
+        assert table.ancestors(999, include_self=False) == []
+
+    def test_ancestors_stops_on_cycle(self):
+        """Test a ppid loop does not walk forever."""
+        table = ProcessTable.from_processes(
+            [ProcessInfo(pid=5, ppid=6), ProcessInfo(pid=6, ppid=5)]
+        )
+        assert table.ancestors(5) == [5, 6]
+
+    def test_is_descendant(self, table: ProcessTable):
+        """Test ancestry checks."""
+        assert table.is_descendant(13, 10)
+        assert table.is_descendant(10, 10)
+        assert not table.is_descendant(20, 10)
+
+
+class TestProcReader:
+    """Tests for the /proc backend against fake process trees."""
+
+    def test_read_proc_table(self, tmp_path: Path):
+        """Test pids, parents, CPU time, RSS and FDs are read."""
+        make_proc_entry(tmp_path, 100, 1, utime=150, stime=50, rss_pages=10, fds=3)
+        make_proc_entry(tmp_path, 101, 100, comm="node (dev) server", fds=2)
+        (tmp_path / "self").mkdir()  # Non-numeric entries are ignored
+
+        with patch("os.sysconf", side_effect=lambda name: 100 if "TCK" in name else 4096):
+            table = read_proc_table(tmp_path)
+
+        assert len(table) == 2
+        root = table.get(100)
+        assert root is not None
+        assert root.cpu_seconds == pytest.approx(2.0)
+        assert root.rss_bytes == 10 * 4096
+        assert table.get(101).ppid == 100
+        assert table.count_fds(100) == 3
+        assert [p.pid for p in table.descendants(100, include_root=False)] == [101]
+
+    def test_read_proc_table_skips_unreadable(self, tmp_path: Path):
+        """Test processes that exit mid-scan are skipped."""
+        make_proc_entry(tmp_path, 100, 1)
+        (tmp_path / "200").mkdir()  # No stat file
+
+        table = read_proc_table(tmp_path)
+
+        assert 100 in table
+        assert 200 not in table
+
+    def test_parse_proc_stat_invalid(self):
+        """Test malformed stat lines are rejected."""
+        assert _parse_proc_stat("garbage", 100, 4096) is None
+
+
+@pytest.mark.skipif(not PROC_ROOT.is_dir(), reason="requires /proc")
+class TestLiveProcTable:
+    """Tests against the real /proc filesystem."""
+
+    def test_ancestors_of_this_process(self):
+        """Test our parent chain matches the kernel's view."""
+        table = read_proc_table()
+
+        chain = table.ancestors(os.getpid())
+
+        assert chain[:2] == [os.getpid(), os.getppid()]
+
+    def test_child_process_is_descendant(self):
+        """Test a child we spawn shows up below us."""
+        child = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(5)"])
+        try:
+            table = read_proc_table()
+            assert table.is_descendant(child.pid, os.getpid())
+            assert child.pid in table.children(os.getpid())
+        finally:
+            child.kill()
+            child.wait()
+
+
+class TestPsReader:
+    """Tests for the ps fallback backend."""
+
+    def test_parse_ps_time(self):
+        """Test the ps TIME formats of Linux and macOS."""
+        assert _parse_ps_time("00:01:05") == 65
+        assert _parse_ps_time("1-00:00:01") == 86401
+        assert _parse_ps_time("3:04.50") == pytest.approx(184.5)
+
+    def test_read_ps_table(self):
+        """Test ps output is parsed into a table."""
+        output = "    1     0   1024 00:00:01\n  100     1   2048 0:02.00\nbad line\n"
+        with patch(
+            "subprocess.run", return_value=MagicMock(stdout=output)
+        ) as mock_run:
+            table = read_ps_table()
+
+        assert "-axo" in mock_run.call_args[0][0]
+        assert table.get(100).rss_bytes == 2048 * 1024
+        assert table.get(100).cpu_seconds == pytest.approx(2.0)
+        assert table.count_fds(100) is None
+
+
+class TestProcessTreeCache:
+    """Tests for shared process table snapshots."""
+
+    @pytest.fixture
+    def clock(self) -> MagicMock:
+        return MagicMock(return_value=100.0)
+
+    @pytest.fixture
+    def reader(self) -> MagicMock:
+        return MagicMock(
+            side_effect=lambda: ProcessTable.from_processes(
+                [ProcessInfo(pid=1, ppid=0), ProcessInfo(pid=10, ppid=1)]
+            )
+        )
+
+    def test_snapshot_is_reused(self, reader: MagicMock, clock: MagicMock):
+        """Test calls within max_age share one read."""
+        cache = ProcessTreeCache(reader=reader, max_age=1.0, clock=clock)
+
+        first = cache.snapshot()
+        clock.return_value = 100.5
+        second = cache.snapshot()
+
+        assert first is second
+        assert reader.call_count == 1
+
+    def test_snapshot_expires(self, reader: MagicMock, clock: MagicMock):
+        """Test an old snapshot is re-read."""
+        cache = ProcessTreeCache(reader=reader, max_age=1.0, clock=clock)
+
+        first = cache.snapshot()
+        clock.return_value = 101.5
+        second = cache.snapshot()
+
+        assert first is not second
+        assert reader.call_count == 2
+
+    def test_snapshot_max_age_override(self, reader: MagicMock, clock: MagicMock):
+        """Test max_age=0 forces a fresh read that later calls reuse."""
+        cache = ProcessTreeCache(reader=reader, max_age=1.0, clock=clock)
+        cache.snapshot()
+
+        fresh = cache.snapshot(max_age=0)
+
+        assert reader.call_count == 2
+        assert cache.snapshot() is fresh
+
+    def test_invalidate(self, reader: MagicMock, clock: MagicMock):
+        """Test invalidate drops the cached snapshot."""
+        cache = ProcessTreeCache(reader=reader, max_age=1.0, clock=clock)
+        cache.snapshot()
+
+        cache.invalidate()
+        cache.snapshot()
+
+        assert reader.call_count == 2
+
+    def test_ancestors(self, reader: MagicMock, clock: MagicMock):
+        """Test ancestry queries use the cached snapshot."""
+        cache = ProcessTreeCache(reader=reader, max_age=1.0, clock=clock)
+
+        assert cache.ancestors(10) == [10, 1]
+        assert cache.ancestors(1) == [1]
+        assert reader.call_count == 1
@@ -445,6 +445,35 @@ class TestProjectScreenEventHandlers:
             assert git_section.git_status.branch == "develop"
             assert git_section.git_status.ahead == 5
 
+    async def test_github_status_changed_updates_panel(self) -> None:
+        """Test that poller refreshes for the project update the GitHub panel."""
+        from iterm_controller.models import GitHubStatus
+        from iterm_controller.widgets import GitHubPanelWidget
+
+        app = ItermControllerApp()
+        async with app.run_test() as pilot:
+            project = make_project()
+            app.state.projects[project.id] = project
+            app.state.git.refresh = AsyncMock(return_value=make_git_status())
+            app.services.github.available = True
+
+            await app.push_screen(ProjectScreen(project_id=project.id))
+            screen = app.screen
+            panel = screen.query_one("#github", GitHubPanelWidget)
+            assert panel.status is None  # Loading; the poller was asked to fetch
+            assert project.path in app.services.github_poller.tracked_paths
+
+            app._on_github_status_updated(
+                "/other", GitHubStatus(available=True, current_branch="other")
+            )
+            app._on_github_status_updated(
+                project.path, GitHubStatus(available=True, current_branch="feature")
+            )
+            await pilot.pause()
+
+            assert panel.status is not None
+            assert panel.status.current_branch == "feature"
+
     async def test_session_spawned_adds_to_list(self) -> None:
         """Test that SessionSpawned event adds session to panel."""
         app = ItermControllerApp()
@@ -493,6 +522,48 @@ class TestProjectScreenEventHandlers:
             # Should now have no sessions
             assert len(screen._sessions) == 0
 
+    async def test_review_queue_changed_updates_tasks_header(self) -> None:
+        """Test that review queue changes show in the tasks section header."""
+        from textual.widgets import Static
+
+        from iterm_controller.review_scheduler import ReviewQueueStats
+        from iterm_controller.state import ReviewQueueChanged
+
+        app = ItermControllerApp()
+        async with app.run_test() as pilot:
+            project = make_project()
+            app.state.projects[project.id] = project
+            app.state.git.refresh = AsyncMock(return_value=make_git_status())
+
+            await app.push_screen(ProjectScreen(project_id=project.id))
+            screen = app.screen
+            header = screen.query_one("#tasks #section-header", Static)
+            assert "reviews" not in str(header.render())
+
+            screen.post_message(ReviewQueueChanged(ReviewQueueStats(queued=2, running=1)))
+            await pilot.pause()
+
+            assert "reviews: 1 running, 2 queued" in str(header.render())
+
+    async def test_selecting_task_in_review_opens_review_modal(self) -> None:
+        """Test that selecting a task awaiting review shows its review."""
+        app = ItermControllerApp()
+        async with app.run_test() as pilot:
+            project = make_project()
+            app.state.projects[project.id] = project
+            app.state.git.refresh = AsyncMock(return_value=make_git_status())
+
+            await app.push_screen(ProjectScreen(project_id=project.id))
+            screen = app.screen
+            assert isinstance(screen, ProjectScreen)
+            task = Task(id="1.1", title="Build API", status=TaskStatus.AWAITING_REVIEW)
+
+            await screen.on_tasks_section_task_selected(TasksSection.TaskSelected(task))
+            await pilot.pause()
+
+            assert isinstance(app.screen, ReviewDetailModal)
+            assert app.screen.review_task is task
+
 
 class TestCommitModal:
     """Tests for CommitModal."""
@@ -26,6 +26,7 @@ class TestPublicAPIExports:
             TaskResult,
             TestStepResult,
             ProjectResult,
+            BroadcastResult,
         )
 
         # Verify they are the correct types
@@ -34,6 +35,7 @@ class TestPublicAPIExports:
         assert hasattr(AppAPI, "spawn_session")
         assert hasattr(APIResult, "ok")
         assert hasattr(APIResult, "fail")
+        assert issubclass(BroadcastResult, APIResult)
 
     def test_convenience_functions(self):
         """Test convenience function exports."""
@@ -43,6 +45,7 @@ class TestPublicAPIExports:
             toggle_test_step,
             list_projects,
             list_sessions,
+            send_to_sessions,
         )
 
         # Verify they are callable
@@ -51,6 +54,7 @@ class TestPublicAPIExports:
         assert callable(toggle_test_step)
         assert callable(list_projects)
         assert callable(list_sessions)
+        assert callable(send_to_sessions)
 
     def test_state_query_functions(self):
         """Test state query function exports."""
@@ -0,0 +1,254 @@
+"""Tests for per-session resource sampling."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from iterm_controller.models import ManagedSession
+from iterm_controller.process_tree import ProcessInfo, ProcessTable
+from iterm_controller.resource_monitor import (
+    ResourceSample,
+    ResourceSampler,
+    ResourceTimeline,
+    format_bytes,
+    render_sparkline,
+    resolve_session_pid,
+)
+
+
+class FakeProcesses:
+    """Mutable fake process table for driving the sampler."""
+
+    def __init__(self) -> None:
+        self.rows: dict[int, ProcessInfo] = {}
+        self.fds: dict[int, int] = {}
+
+    def add(self, pid: int, ppid: int, cpu: float = 0.0, rss: int = 0, fds: int = 0) -> None:
+        self.rows[pid] = ProcessInfo(pid=pid, ppid=ppid, cpu_seconds=cpu, rss_bytes=rss)
+        self.fds[pid] = fds
+
+    def read(self) -> ProcessTable:
+        rows = [ProcessInfo(**vars(r)) for r in self.rows.values()]
+        return ProcessTable.from_processes(rows, fd_counter=self.fds.get)
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_session(session_id: str) -> ManagedSession:
+    """Create a managed session for testing."""
+    return ManagedSession(id=session_id, template_id="dev", project_id="p", tab_id="t")
+
+
+class TestResourceTimeline:
+    """Tests for the ring buffer."""
+
+    def test_ring_buffer_drops_oldest(self):
+        """Test the buffer keeps only the newest samples."""
+        timeline = ResourceTimeline(max_samples=3)
+        for i in range(5):
+            timeline.append(ResourceSample(float(i), float(i), i * 10, None, 1))
+
+        assert len(timeline) == 3
+        assert timeline.cpu_series() == [2.0, 3.0, 4.0]
+        assert timeline.latest.timestamp == 4.0
+        assert timeline.peak_rss == 40
+
+
+class TestRendering:
+    """Tests for sparkline and byte formatting helpers."""
+
+    def test_render_sparkline_scales(self):
+        """Test values map onto the block range."""
+        assert render_sparkline([0, 50, 100]) == "▁▅█"
+
+    def test_render_sparkline_width(self):
+        """Test only the most recent values are kept."""
+        assert len(render_sparkline(range(50), width=10)) == 10
+
+    def test_render_sparkline_flat_and_empty(self):
+        """Test degenerate inputs."""
+        assert render_sparkline([]) == ""
+        assert render_sparkline([0, 0]) == "▁▁"
+
+    def test_format_bytes(self):
+        """Test compact byte formatting."""
+        assert format_bytes(512) == "512B"
+        assert format_bytes(2048) == "2K"
+        assert format_bytes(5 * 1024 * 1024) == "5.0M"
+        assert format_bytes(3 * 1024**3) == "3.0G"
+
+
+class TestResourceSampler:
+    """Tests for ResourceSampler with fake process trees."""
+
+    @pytest.fixture
+    def procs(self) -> FakeProcesses:
+        """Create a tree: shell 100 -> npm 101 -> node 102, and shell 200."""
+        procs = FakeProcesses()
+        procs.add(1, 0)
+        procs.add(100, 1, cpu=1.0, rss=1000, fds=4)
+        procs.add(101, 100, cpu=2.0, rss=2000, fds=5)
+        procs.add(102, 101, cpu=3.0, rss=3000, fds=6)
+        procs.add(200, 1, cpu=0.5, rss=500, fds=3)
+        return procs
+
+    @pytest.fixture
+    def clock(self) -> FakeClock:
+        return FakeClock()
+
+    @pytest.fixture
+    def sampler(self, procs, clock) -> ResourceSampler:
+        sampler = ResourceSampler(table_reader=procs.read, clock=clock)
+        sampler.register("dev", 100)
+        sampler.register("shell", 200)
+        return sampler
+
+    @pytest.mark.asyncio
+    async def test_aggregates_process_tree(self, sampler):
+        """Test RSS, FDs and process count are summed over the tree."""
+        samples = await sampler.sample_once()
+
+        dev = samples["dev"]
+        assert dev.rss_bytes == 6000
+        assert dev.open_fds == 15
+        assert dev.process_count == 3
+        assert dev.cpu_percent == 0.0  # No previous sample yet
+        assert samples["shell"].process_count == 1
+
+    @pytest.mark.asyncio
+    async def test_cpu_percent_from_deltas(self, sampler, procs, clock):
+        """Test CPU% is computed from per-process CPU time deltas."""
+        await sampler.sample_once()
+        procs.rows[102].cpu_seconds += 1.5  # node burns 1.5s of CPU
+        clock.now += 2.0
+
+        samples = await sampler.sample_once()
+
+        assert samples["dev"].cpu_percent == pytest.approx(75.0)
+        assert samples["shell"].cpu_percent == 0.0
+
+    @pytest.mark.asyncio
+    async def test_exited_children_do_not_go_negative(self, sampler, procs, clock):
+        """Test a child exiting between samples does not produce negative CPU."""
+        await sampler.sample_once()
+        del procs.rows[102]
+        clock.now += 2.0
+
+        samples = await sampler.sample_once()
+
+        assert samples["dev"].cpu_percent == 0.0
+        assert samples["dev"].process_count == 2
+
+    @pytest.mark.asyncio
+    async def test_new_child_capped_at_elapsed(self, sampler, procs, clock):
+        """Test a new child counts at most the elapsed time."""
+        await sampler.sample_once()
+        procs.add(103, 100, cpu=50.0)  # Reused pid with a long CPU history
+        clock.now += 2.0
+
+        samples = await sampler.sample_once()
+
+        assert samples["dev"].cpu_percent == pytest.approx(100.0)
+
+    @pytest.mark.asyncio
+    async def test_samples_go_into_timeline(self, sampler, clock):
+        """Test each sample is appended to the session's ring buffer."""
+        for _ in range(3):
+            await sampler.sample_once()
+            clock.now += 1.0
+
+        assert len(sampler.get_timeline("dev")) == 3
+
+    @pytest.mark.asyncio
+    async def test_adaptive_interval(self, sampler, procs, clock):
+        """Test the interval backs off when idle and snaps back when busy."""
+        await sampler.sample_once()
+        clock.now += 2.0
+        await sampler.sample_once()
+        assert sampler.interval > sampler.min_interval
+
+        procs.rows[101].cpu_seconds += 2.0
+        clock.now += 2.0
+        await sampler.sample_once()
+        assert sampler.interval == sampler.min_interval
+
+    @pytest.mark.asyncio
+    async def test_interval_capped_at_max(self, sampler, clock):
+        """Test the interval never exceeds max_interval."""
+        for _ in range(20):
+            await sampler.sample_once()
+            clock.now += 1.0
+
+        assert sampler.interval == sampler.max_interval
+
+    @pytest.mark.asyncio
+    async def test_syncs_sessions_from_provider(self, procs, clock):
+        """Test sessions are registered via the resolver and dropped when gone."""
+        sessions = [make_session("dev"), make_session("shell")]
+        resolver = AsyncMock(side_effect=lambda sid: {"dev": 100, "shell": 200}[sid])
+        sampler = ResourceSampler(
+            sessions_provider=lambda: sessions,
+            pid_resolver=resolver,
+            table_reader=procs.read,
+            clock=clock,
+        )
+
+        await sampler.sample_once()
+        assert sorted(sampler.session_ids) == ["dev", "shell"]
+
+        sessions.pop()
+        await sampler.sample_once()
+        assert sampler.session_ids == ["dev"]
+        assert sampler.get_timeline("shell") is None
+        assert resolver.await_count == 2  # Pids are resolved once
+
+    @pytest.mark.asyncio
+    async def test_no_sessions_skips_table_read(self):
+        """Test the process table is not read with nothing to sample."""
+        reader = MagicMock()
+        sampler = ResourceSampler(table_reader=reader)
+
+        assert await sampler.sample_once() == {}
+        reader.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_start_and_stop(self, sampler):
+        """Test the background loop runs and stops cleanly."""
+        await sampler.start()
+        assert sampler.is_running
+        await asyncio.sleep(0.05)
+        await sampler.stop()
+        assert not sampler.is_running
+        assert len(sampler.get_timeline("dev")) >= 1
+
+
+class TestResolveSessionPid:
+    """Tests for resolving a session's root pid via iTerm2."""
+
+    @pytest.mark.asyncio
+    async def test_resolve_pid(self):
+        """Test the pid variable is read from the session."""
+        session = MagicMock()
+        session.async_get_variable = AsyncMock(return_value=4242)
+        controller = MagicMock()
+        controller.app.get_session_by_id.return_value = session
+
+        assert await resolve_session_pid(controller, "s1") == 4242
+        session.async_get_variable.assert_awaited_once_with("pid")
+
+    @pytest.mark.asyncio
+    async def test_resolve_pid_not_connected(self):
+        """Test None is returned when not connected."""
+        controller = MagicMock()
+        controller.app = None
+
+        assert await resolve_session_pid(controller, "s1") is None
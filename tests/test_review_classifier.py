@@ -0,0 +1,212 @@
+"""Tests for the one-pass review output classifier."""
+
+import re
+from collections import Counter
+
+import pytest
+
+from iterm_controller.models import ReviewResult
+from iterm_controller.review_classifier import (
+    DEFAULT_REVIEW_PATTERNS,
+    ReviewClassifier,
+    ReviewPatternSet,
+)
+
+
+def reference_classify(output: str) -> tuple[ReviewResult, bool, list[str], str]:
+    """Straightforward per-pattern classification used as the reference.
+
+    Scans the output once per pattern, the way ReviewService used to.
+    """
+    patterns = DEFAULT_REVIEW_PATTERNS
+    lower = output.lower()
+
+    result = ReviewResult.NEEDS_REVISION
+    if any(re.search(p, lower) for p in patterns.rejected):
+        result = ReviewResult.REJECTED
+    elif any(re.search(p, lower) for p in patterns.needs_revision):
+        result = ReviewResult.NEEDS_REVISION
+    elif any(re.search(p, lower) for p in patterns.approved):
+        result = ReviewResult.APPROVED
+    blocking = any(re.search(p, lower) for p in patterns.blocking)
+
+    issues: list[str] = []
+    for pattern in (r"^[\s]*[-*•]\s+(.+?)$", r"^[\s]*\d+[.)]\s+(.+?)$"):
+        for match in re.finditer(pattern, output, re.MULTILINE):
+            issue = match.group(1).strip()
+            if len(issue) > 10:
+                issues.append(issue)
+    label = r"(?:issue|problem|error|bug|fix|todo):\s*(.+?)(?:\n|$)"
+    for match in re.finditer(label, output, re.IGNORECASE):
+        if match.group(1).strip():
+            issues.append(match.group(1).strip())
+    issues = list(dict.fromkeys(issues))[:10]
+
+    summary_lines: list[str] = []
+    for line in output.strip().split("\n"):
+        line = line.strip()
+        if not line or line.startswith("#") or line.startswith("```"):
+            if summary_lines:
+                break
+            continue
+        if re.match(r"^[-*•\d]", line):
+            continue
+        summary_lines.append(line)
+        if sum(len(part) for part in summary_lines) > 200:
+            break
+    summary = " ".join(summary_lines)
+    if len(summary) > 300:
+        summary = summary[:297] + "..."
+
+    return result, blocking, issues, summary
+
+
+def build_transcript(target_bytes: int, verdict: str) -> str:
+    """Build a long review transcript ending with a verdict."""
+    block = (
+        "Reading src/module.py to check the implementation against the spec.\n"
+        "The function handles the empty case and returns early as expected.\n"
+        "```python\n"
+        "def handler(event):\n"
+        "    return process(event)\n"
+        "```\n"
+        "Running the test suite: 42 tests collected, all of them ran.\n"
+        "\n"
+    )
+    head = (
+        "The implementation mostly follows the task definition and the tests pass.\n"
+        "\n"
+        "- Missing validation for negative timeouts in the config loader\n"
+        "1. Rename the helper to describe what it returns\n"
+        "Issue: log message uses the wrong level\n"
+        "\n"
+    )
+    body = block * (target_bytes // len(block) + 1)
+    return head + body + verdict + "\n"
+
+
+class CountingPattern:
+    """Compiled pattern wrapper that counts search and match calls."""
+
+    def __init__(self, pattern: re.Pattern[str]) -> None:
+        self.pattern = pattern
+        self.calls: Counter[str] = Counter()
+
+    def search(self, string: str, pos: int = 0) -> re.Match[str] | None:
+        self.calls["search"] += 1
+        return self.pattern.search(string, pos)
+
+    def match(self, string: str, pos: int = 0) -> re.Match[str] | None:
+        self.calls["match"] += 1
+        return self.pattern.match(string, pos)
+
+
+class TestReviewClassifier:
+    """Tests for ReviewClassifier."""
+
+    @pytest.fixture
+    def classifier(self) -> ReviewClassifier:
+        return ReviewClassifier()
+
+    @pytest.mark.parametrize(
+        "output",
+        [
+            "LGTM, looks good",
+            "Needs revision.\n\n- Missing error handling for timeouts\n",
+            "REJECTED: blocking issue in the migration",
+            "Approved, but note a security risk in the token handling",
+            "Summary line here.\n\n# Details\n1. First numbered problem item\n2) short\n",
+            "Problem:\n\n   missing tests for the parser\n- bullet issue item that is long\n",
+            "error: one\nfix: two\nnothing to see\ntodo: three\n",
+            "",
+            "   \n\n",
+            "The change passes all tests. Please fix the typo though.",
+        ],
+    )
+    def test_matches_reference(self, classifier: ReviewClassifier, output: str) -> None:
+        """Classification matches the per-pattern reference implementation."""
+        c = classifier.classify(output)
+        assert (c.result, c.blocking, c.issues, c.summary) == reference_classify(output)
+
+    def test_overlapping_markers_count_for_each_category(
+        self, classifier: ReviewClassifier
+    ) -> None:
+        """'blocking issue' is both a rejection and a blocking marker."""
+        c = classifier.classify("Found a blocking issue.")
+
+        assert c.result == ReviewResult.REJECTED
+        assert c.blocking is True
+
+    def test_rejection_wins_regardless_of_position(
+        self, classifier: ReviewClassifier
+    ) -> None:
+        """A late rejection overrides an earlier approval."""
+        c = classifier.classify("Approved at first glance.\n" * 50 + "Actually rejected.")
+
+        assert c.result == ReviewResult.REJECTED
+
+    def test_label_continues_on_next_line(self, classifier: ReviewClassifier) -> None:
+        """A label at the end of a line takes the next non-blank line."""
+        issues = classifier.extract_issues("Issue:\n\n  config is never reloaded\n")
+
+        assert issues == ["config is never reloaded"]
+
+    def test_custom_pattern_set(self) -> None:
+        """Verdicts and labels come from the supplied pattern set."""
+        patterns = ReviewPatternSet(
+            rejected=(r"\bverdict:\s*fail\b",),
+            needs_revision=(),
+            approved=(r"\bverdict:\s*ship\b",),
+            blocking=(r"\bescalate\b",),
+            issue_labels=("nit",),
+        )
+        classifier = ReviewClassifier(patterns)
+
+        shipped = classifier.classify("Verdict: SHIP\nnit: trailing whitespace")
+        assert shipped.result == ReviewResult.APPROVED
+        assert shipped.issues == ["trailing whitespace"]
+
+        failed = classifier.classify("approved?\nverdict: fail, escalate")
+        assert failed.result == ReviewResult.REJECTED
+        assert failed.blocking is True
+
+    def test_issue_limit_from_pattern_set(self) -> None:
+        """max_issues caps the number of issues returned."""
+        classifier = ReviewClassifier(ReviewPatternSet(max_issues=3))
+        output = "\n".join(f"- issue number {i} is a real problem" for i in range(10))
+
+        assert len(classifier.extract_issues(output)) == 3
+
+
+class TestReviewClassifierLargeTranscripts:
+    """Benchmarks on megabyte-sized review transcripts."""
+
+    @pytest.mark.parametrize(
+        "verdict",
+        ["LGTM, approved.", "Needs changes before merge.", "Rejected: data loss risk."],
+    )
+    def test_large_transcript_matches_reference(self, verdict: str) -> None:
+        """A 1MB+ transcript classifies the same as the reference."""
+        output = build_transcript(1_200_000, verdict)
+        assert len(output) > 1_000_000
+
+        c = ReviewClassifier().classify(output)
+
+        assert (c.result, c.blocking, c.issues, c.summary) == reference_classify(output)
+
+    def test_large_transcript_scanned_once(self) -> None:
+        """Markers are found with one combined scan, not one per pattern."""
+        output = build_transcript(2_000_000, "Approved.")
+        classifier = ReviewClassifier()
+        any_marker = CountingPattern(classifier._any_marker)
+        categories = {name: CountingPattern(p) for name, p in classifier._categories.items()}
+        classifier._any_marker = any_marker
+        classifier._categories = categories
+
+        c = classifier.classify(output)
+
+        assert c.result == ReviewResult.APPROVED
+        # One search finds the verdict, one more runs off the end
+        assert any_marker.calls == {"search": 2}
+        # Categories are only tried at the hit, never scanned over the whole output
+        assert all(p.calls == {"match": 1} for p in categories.values())
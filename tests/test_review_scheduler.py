@@ -0,0 +1,218 @@
+"""Tests for the review admission scheduler."""
+
+import asyncio
+
+import pytest
+
+from iterm_controller.review_scheduler import ReviewQueueStats, ReviewScheduler
+
+
+def make_review(started: list[str], gate: asyncio.Event, name: str, result=None):
+    """Build a review coroutine function that records its start and waits."""
+
+    async def run():
+        started.append(name)
+        await gate.wait()
+        return result if result is not None else name
+
+    return run
+
+
+@pytest.mark.asyncio
+class TestReviewScheduler:
+    """Tests for ReviewScheduler."""
+
+    async def test_runs_within_global_limit(self) -> None:
+        """Only max_concurrent reviews run at once."""
+        scheduler = ReviewScheduler(max_concurrent=2, max_per_project=5)
+        gate = asyncio.Event()
+        started: list[str] = []
+
+        futures = [
+            scheduler.submit("p", f"t{i}", make_review(started, gate, f"t{i}"))
+            for i in range(4)
+        ]
+        await asyncio.sleep(0)
+
+        assert started == ["t0", "t1"]
+        assert scheduler.stats().running == 2
+        assert scheduler.stats().queued == 2
+
+        gate.set()
+        results = await asyncio.gather(*futures)
+
+        assert results == ["t0", "t1", "t2", "t3"]
+        assert scheduler.stats().is_idle
+
+    async def test_per_project_limit_skips_to_other_projects(self) -> None:
+        """A project at its limit does not block other projects."""
+        scheduler = ReviewScheduler(max_concurrent=2, max_per_project=1)
+        gate = asyncio.Event()
+        started: list[str] = []
+
+        scheduler.submit("a", "a1", make_review(started, gate, "a1"))
+        scheduler.submit("a", "a2", make_review(started, gate, "a2"))
+        scheduler.submit("b", "b1", make_review(started, gate, "b1"))
+        await asyncio.sleep(0)
+
+        assert started == ["a1", "b1"]
+        stats = scheduler.stats()
+        assert stats.running_by_project == {"a": 1, "b": 1}
+        assert stats.queued_by_project == {"a": 1}
+
+        gate.set()
+        await scheduler.shutdown()
+
+    async def test_priority_order(self) -> None:
+        """Lower priority values run first; ties run in arrival order."""
+        scheduler = ReviewScheduler(max_concurrent=1, max_per_project=1)
+        blocker = asyncio.Event()
+        gate = asyncio.Event()
+        started: list[str] = []
+
+        first = scheduler.submit("p", "first", make_review(started, blocker, "first"))
+        scheduler.submit("p", "low", make_review(started, gate, "low"), priority=5)
+        scheduler.submit("p", "high", make_review(started, gate, "high"), priority=-2)
+        last = scheduler.submit("p", "tie", make_review(started, gate, "tie"), priority=5)
+
+        assert scheduler.position("high") == 1
+        assert scheduler.position("low") == 2
+        assert scheduler.position("tie") == 3
+
+        blocker.set()
+        gate.set()
+        await asyncio.gather(first, last)
+
+        assert started == ["first", "high", "low", "tie"]
+
+    async def test_duplicate_submit_returns_same_future(self) -> None:
+        """Resubmitting a queued or running task reuses the existing review."""
+        scheduler = ReviewScheduler(max_concurrent=1)
+        gate = asyncio.Event()
+        started: list[str] = []
+
+        running = scheduler.submit("p", "t1", make_review(started, gate, "t1"))
+        queued = scheduler.submit("p", "t2", make_review(started, gate, "t2"))
+
+        assert scheduler.submit("p", "t1", make_review(started, gate, "dup")) is running
+        assert scheduler.submit("p", "t2", make_review(started, gate, "dup")) is queued
+        assert scheduler.stats().queued == 1
+
+        gate.set()
+        await asyncio.gather(running, queued)
+        assert "dup" not in started
+
+    async def test_duplicate_with_better_priority_moves_up(self) -> None:
+        """A duplicate with a lower priority value upgrades the queued request."""
+        scheduler = ReviewScheduler(max_concurrent=1)
+        gate = asyncio.Event()
+        started: list[str] = []
+
+        scheduler.submit("p", "blocker", make_review(started, gate, "blocker"))
+        scheduler.submit("p", "a", make_review(started, gate, "a"))
+        scheduler.submit("p", "b", make_review(started, gate, "b"))
+
+        scheduler.submit("p", "b", make_review(started, gate, "b"), priority=-1)
+
+        assert scheduler.position("b") == 1
+        assert scheduler.position("a") == 2
+
+        gate.set()
+        await scheduler.shutdown()
+
+    async def test_cancel_queued(self) -> None:
+        """Cancelling drops a queued review and cancels its future."""
+        scheduler = ReviewScheduler(max_concurrent=1)
+        gate = asyncio.Event()
+        started: list[str] = []
+
+        scheduler.submit("p", "t1", make_review(started, gate, "t1"))
+        queued = scheduler.submit("p", "t2", make_review(started, gate, "t2"))
+
+        assert scheduler.cancel("t2") is True
+        assert queued.cancelled()
+        assert not scheduler.is_pending("t2")
+        # Running reviews are not interrupted
+        assert scheduler.cancel("t1") is False
+        assert scheduler.is_running("t1")
+
+        gate.set()
+        await scheduler.shutdown()
+
+    async def test_exception_propagates_and_frees_slot(self) -> None:
+        """A failed review sets the exception and lets the next one run."""
+        scheduler = ReviewScheduler(max_concurrent=1)
+        gate = asyncio.Event()
+        gate.set()
+        started: list[str] = []
+
+        async def boom():
+            raise RuntimeError("review crashed")
+
+        failing = scheduler.submit("p", "bad", boom)
+        following = scheduler.submit("p", "good", make_review(started, gate, "good"))
+
+        with pytest.raises(RuntimeError, match="review crashed"):
+            await failing
+        assert await following == "good"
+
+    async def test_on_change_receives_stats(self) -> None:
+        """Listeners get a stats snapshot on every queue change."""
+        snapshots: list[ReviewQueueStats] = []
+        scheduler = ReviewScheduler(max_concurrent=1, on_change=snapshots.append)
+        gate = asyncio.Event()
+        started: list[str] = []
+
+        future = scheduler.submit("p", "t1", make_review(started, gate, "t1"))
+        assert snapshots[-1].running == 1
+
+        gate.set()
+        await future
+        await asyncio.sleep(0)
+
+        assert snapshots[-1].is_idle
+
+    async def test_on_change_errors_are_contained(self) -> None:
+        """A failing listener does not break scheduling."""
+
+        def bad_listener(stats: ReviewQueueStats) -> None:
+            raise ValueError("listener broke")
+
+        scheduler = ReviewScheduler(on_change=bad_listener)
+
+        async def run():
+            return "ok"
+
+        assert await scheduler.submit("p", "t1", run) == "ok"
+
+    async def test_oldest_wait_uses_clock(self) -> None:
+        """Queue stats report how long the oldest review has waited."""
+        now = [100.0]
+        scheduler = ReviewScheduler(max_concurrent=1, clock=lambda: now[0])
+        gate = asyncio.Event()
+        started: list[str] = []
+
+        scheduler.submit("p", "t1", make_review(started, gate, "t1"))
+        scheduler.submit("p", "t2", make_review(started, gate, "t2"))
+        now[0] = 112.5
+
+        assert scheduler.stats().oldest_wait_seconds == pytest.approx(12.5)
+
+        gate.set()
+        await scheduler.shutdown()
+
+    async def test_shutdown_cancels_everything(self) -> None:
+        """Shutdown cancels queued and running reviews."""
+        scheduler = ReviewScheduler(max_concurrent=1)
+        gate = asyncio.Event()
+        started: list[str] = []
+
+        running = scheduler.submit("p", "t1", make_review(started, gate, "t1"))
+        queued = scheduler.submit("p", "t2", make_review(started, gate, "t2"))
+        await asyncio.sleep(0)
+
+        await scheduler.shutdown()
+
+        assert running.cancelled()
+        assert queued.cancelled()
+        assert scheduler.stats().is_idle
@@ -1,5 +1,6 @@
 """Tests for ReviewService."""
 
+import asyncio
 from datetime import datetime
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -18,6 +19,8 @@ from iterm_controller.models import (
     TaskStatus,
 )
 from iterm_controller.review_service import (
+    BRACKETED_PASTE_END,
+    BRACKETED_PASTE_START,
     ParsedReviewResult,
     ReviewContext,
     ReviewContextError,
@@ -25,6 +28,7 @@ from iterm_controller.review_service import (
     ReviewService,
     ReviewStateManager,
     generate_id,
+    strip_prompt_echo,
 )
 
 
@@ -1855,3 +1859,405 @@ class TestReviewServiceRunReviewCommand:
         call_args = mock_spawner.spawn_session.call_args
         template = call_args.kwargs.get("template") or call_args.args[0]
         assert template.working_dir == project.path
+
+
+class TestReviewServiceOutputCapture:
+    """Tests for capturing review output through the session monitor."""
+
+    @pytest.fixture
+    def iterm_session(self) -> MagicMock:
+        """Create a mock iTerm2 session."""
+        session = MagicMock()
+        session.async_send_text = AsyncMock()
+        return session
+
+    @pytest.fixture
+    def monitor(self) -> MagicMock:
+        """Create a mock SessionMonitor with a real output stream."""
+        from iterm_controller.session_monitor import AttentionDetector, SessionOutputStream
+
+        monitor = MagicMock()
+        monitor.is_running = True
+        monitor.detector = AttentionDetector()
+        monitor.stream = SessionOutputStream("session-1", batch_interval_ms=0)
+        monitor.get_output_stream = MagicMock(return_value=monitor.stream)
+        return monitor
+
+    @pytest.fixture
+    def service(self, iterm_session: MagicMock, monitor: MagicMock) -> ReviewService:
+        """Create a ReviewService wired to the mock monitor."""
+        startup: list[asyncio.Task[None]] = []
+
+        async def claude_starts() -> None:
+            await asyncio.sleep(0.01)
+            await monitor.stream.push_output("Welcome to Claude Code\n>\n")
+
+        async def spawn(**kwargs):
+            startup.append(asyncio.create_task(claude_starts()))
+            return MagicMock(success=True, session_id="session-1")
+
+        spawner = MagicMock()
+        spawner.controller.app.get_session_by_id = MagicMock(return_value=iterm_session)
+        spawner.controller.app.windows = []
+        spawner.get_sessions_for_project = MagicMock(return_value=[])
+        spawner.spawn_session = AsyncMock(side_effect=spawn)
+        service = ReviewService(
+            session_spawner=spawner,
+            git_service=MagicMock(),
+            plan_manager=MagicMock(),
+            session_monitor=monitor,
+        )
+        service.startup_settle = 0.01
+        return service
+
+    @pytest.fixture
+    def task(self) -> Task:
+        """Create a test task."""
+        return Task(id="1.1", title="Implement feature X", status=TaskStatus.AWAITING_REVIEW)
+
+    def make_project(self, **config) -> Project:
+        """Create a project with review settings."""
+        return Project(
+            id="p1",
+            name="Test",
+            path="/test/path",
+            review_config=ReviewConfig(**config),
+        )
+
+    @pytest.mark.asyncio
+    async def test_returns_output_after_marker(
+        self, service: ReviewService, monitor: MagicMock, iterm_session: MagicMock, task: Task
+    ):
+        """Output streamed before the completion marker is returned."""
+        project = self.make_project(timeout_seconds=1.0)
+
+        async def reviewer(text: str) -> None:
+            await monitor.stream.push_output("LGTM, approved.\n")
+            await monitor.stream.push_output("REVIEW COMPLETE\n")
+
+        iterm_session.async_send_text.side_effect = reviewer
+
+        output = await service._run_review_command(
+            project=project,
+            task=task,
+            context=ReviewContext(task_id="1.1", task_definition="# Task 1.1"),
+            command="/review-task",
+            model=None,
+        )
+
+        assert "LGTM, approved." in output
+        sent = iterm_session.async_send_text.call_args.args[0]
+        assert "# Task 1.1" in sent
+        assert "print REVIEW COMPLETE on its own line" in sent
+        assert monitor.stream.subscriber_count == 0
+
+    @pytest.mark.asyncio
+    async def test_times_out_without_completion(
+        self, service: ReviewService, task: Task
+    ):
+        """A review that never finishes raises ReviewCommandError."""
+        from iterm_controller.review_service import ReviewCommandError
+
+        project = self.make_project(timeout_seconds=0.05)
+
+        with pytest.raises(ReviewCommandError, match="timed out"):
+            await service._run_review_command(
+                project=project,
+                task=task,
+                context=ReviewContext(task_id="1.1"),
+                command="/review-task",
+                model=None,
+            )
+
+    @pytest.mark.asyncio
+    async def test_starts_monitor_if_stopped(
+        self, service: ReviewService, monitor: MagicMock, iterm_session: MagicMock, task: Task
+    ):
+        """The session monitor is started on demand."""
+        monitor.is_running = False
+        monitor.start = AsyncMock()
+
+        async def reviewer(text: str) -> None:
+            await monitor.stream.push_output("REVIEW COMPLETE\n")
+
+        iterm_session.async_send_text.side_effect = reviewer
+
+        await service._run_review_command(
+            project=self.make_project(timeout_seconds=1.0),
+            task=task,
+            context=ReviewContext(task_id="1.1"),
+            command="/review-task",
+            model=None,
+        )
+
+        monitor.start.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_full_review_parses_captured_output(
+        self, service: ReviewService, monitor: MagicMock, iterm_session: MagicMock, task: Task
+    ):
+        """run_review parses the captured output rather than a placeholder."""
+        async def reviewer(text: str) -> None:
+            await monitor.stream.push_output("This is rejected: critical error in parser.\n")
+            await monitor.stream.push_output("REVIEW COMPLETE\n")
+
+        iterm_session.async_send_text.side_effect = reviewer
+        service._handle_review_result = AsyncMock()
+
+        review = await service.run_review(
+            self.make_project(timeout_seconds=1.0),
+            task,
+            ReviewContext(task_id="1.1"),
+        )
+
+        assert review.result == ReviewResult.REJECTED
+        assert "critical error" in review.raw_output
+
+    @pytest.mark.asyncio
+    async def test_prompt_is_sent_once_claude_is_ready(
+        self, service: ReviewService, monitor: MagicMock, iterm_session: MagicMock, task: Task
+    ):
+        """Startup output is neither captured nor raced by the paste."""
+        seen_before_send: list[str] = []
+
+        async def reviewer(text: str) -> None:
+            seen_before_send.append("sent")
+            await monitor.stream.push_output("Approved.\nREVIEW COMPLETE\n")
+
+        iterm_session.async_send_text.side_effect = reviewer
+
+        output = await service._run_review_command(
+            project=self.make_project(timeout_seconds=1.0),
+            task=task,
+            context=ReviewContext(task_id="1.1"),
+            command="/review-task",
+            model=None,
+        )
+
+        assert seen_before_send == ["sent"]
+        assert "Welcome to Claude Code" not in output
+        assert output.strip() == "Approved."
+
+    @pytest.mark.asyncio
+    async def test_sends_anyway_without_startup_prompt(
+        self, service: ReviewService, monitor: MagicMock, iterm_session: MagicMock, task: Task
+    ):
+        """A session that never shows a prompt still gets the review prompt."""
+        service.session_spawner.spawn_session = AsyncMock(
+            return_value=MagicMock(success=True, session_id="session-1")
+        )
+        service.startup_timeout = 0.05
+
+        async def reviewer(text: str) -> None:
+            await monitor.stream.push_output("Approved.\nREVIEW COMPLETE\n")
+
+        iterm_session.async_send_text.side_effect = reviewer
+
+        output = await service._run_review_command(
+            project=self.make_project(timeout_seconds=1.0),
+            task=task,
+            context=ReviewContext(task_id="1.1"),
+            command="/review-task",
+            model=None,
+        )
+
+        assert output.strip() == "Approved."
+
+    @pytest.mark.asyncio
+    async def test_echoed_prompt_is_not_classified(
+        self, service: ReviewService, monitor: MagicMock, iterm_session: MagicMock, task: Task
+    ):
+        """Removal lines and verdict words in the pasted diff do not set the verdict."""
+        context = ReviewContext(
+            task_id="1.1",
+            task_definition="# Task 1.1",
+            git_diff=(
+                "--- a/parser.py\n+++ b/parser.py\n"
+                "- raise ValueError('rejected: blocking input')\n"
+                "+ return None"
+            ),
+            test_results="12 passed; change passes tests, nothing rejected",
+        )
+
+        async def reviewer(text: str) -> None:
+            # The terminal echoes the pasted prompt before claude answers
+            echo = text.removeprefix(BRACKETED_PASTE_START).split(BRACKETED_PASTE_END)[0]
+            await monitor.stream.push_output(echo + "\n")
+            await monitor.stream.push_output("Looks good to me. Approved.\n")
+            await monitor.stream.push_output("REVIEW COMPLETE\n>\n")
+
+        iterm_session.async_send_text.side_effect = reviewer
+        service._handle_review_result = AsyncMock()
+
+        review = await service.run_review(
+            self.make_project(timeout_seconds=1.0), task, context
+        )
+
+        assert review.result == ReviewResult.APPROVED
+        assert review.issues == []
+        assert review.raw_output.strip() == "Looks good to me. Approved."
+
+
+class TestStripPromptEcho:
+    """Tests for removing an echoed prompt from review output."""
+
+    def test_drops_everything_up_to_echo_end(self):
+        prompt = "# Task\n- remove the cache\nprint DONE on its own line."
+        output = "$ claude\n> # Task\n- remove the cache\nprint DONE on its own line.\nFine."
+
+        assert strip_prompt_echo(output, prompt) == "Fine."
+
+    def test_drops_wrapped_echo_fragments(self):
+        prompt = "- raise ValueError('this change is rejected by the parser')"
+        output = "- raise ValueError('this change is\nrejected by the parser')\nLGTM"
+
+        assert strip_prompt_echo(output, prompt).strip() == "LGTM"
+
+    def test_keeps_output_without_echo(self):
+        assert strip_prompt_echo("Approved.", "# Task 1.1") == "Approved."
+
+
+class TestReviewServiceContextCache:
+    """Tests for concurrent context building and the test/lint cache."""
+
+    @pytest.fixture
+    def git_service(self) -> MagicMock:
+        """Create a GitService mock with a fixed worktree hash."""
+        git = MagicMock()
+        git.get_diff = AsyncMock(return_value="diff --git a/x.py")
+        git.get_worktree_hash = AsyncMock(return_value="tree-1")
+        return git
+
+    @pytest.fixture
+    def service(self, git_service: MagicMock) -> ReviewService:
+        """Create a ReviewService with stubbed test and lint runners."""
+        service = ReviewService(
+            session_spawner=MagicMock(),
+            git_service=git_service,
+            plan_manager=MagicMock(),
+        )
+        service._run_tests = AsyncMock(return_value="5 passed")
+        service._run_lint = AsyncMock(return_value="All checks passed")
+        return service
+
+    @pytest.fixture
+    def project(self) -> Project:
+        """Create a test project."""
+        return Project(id="p1", name="Test", path="/test/path")
+
+    @pytest.fixture
+    def config(self) -> ReviewContextConfig:
+        """Context config with every source enabled."""
+        return ReviewContextConfig(include_test_results=True, include_lint_results=True)
+
+    @pytest.mark.asyncio
+    async def test_sources_run_concurrently(
+        self, service: ReviewService, git_service: MagicMock, project: Project, config
+    ):
+        """Diff, tests and lint overlap instead of running in sequence."""
+        import asyncio
+
+        running = 0
+        peak = 0
+
+        async def slow(value):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.02)
+            running -= 1
+            return value
+
+        async def diff(*args, **kwargs):
+            return await slow("diff")
+
+        async def tests(project):
+            return await slow("tests")
+
+        async def lint(project):
+            return await slow("lint")
+
+        git_service.get_diff = AsyncMock(side_effect=diff)
+        service._run_tests = AsyncMock(side_effect=tests)
+        service._run_lint = AsyncMock(side_effect=lint)
+
+        context = await service.build_review_context(project, Task(id="1", title="t"), config)
+
+        assert peak == 3
+        assert (context.git_diff, context.test_results, context.lint_results) == (
+            "diff",
+            "tests",
+            "lint",
+        )
+
+    @pytest.mark.asyncio
+    async def test_reuses_results_for_same_tree(
+        self, service: ReviewService, project: Project, config
+    ):
+        """A second review of an unchanged tree does not re-run tests or lint."""
+        await service.build_review_context(project, Task(id="1", title="a"), config)
+        context = await service.build_review_context(project, Task(id="2", title="b"), config)
+
+        assert context.test_results == "5 passed"
+        assert context.lint_results == "All checks passed"
+        service._run_tests.assert_awaited_once()
+        service._run_lint.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_reruns_when_tree_changes(
+        self, service: ReviewService, git_service: MagicMock, project: Project, config
+    ):
+        """A different worktree hash runs the commands again."""
+        await service.build_review_context(project, Task(id="1", title="a"), config)
+        git_service.get_worktree_hash.return_value = "tree-2"
+        await service.build_review_context(project, Task(id="1", title="a"), config)
+
+        assert service._run_tests.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_reviews_share_one_run(
+        self, service: ReviewService, project: Project, config
+    ):
+        """Simultaneous reviews of the same tree share one test run."""
+        import asyncio
+
+        async def slow_tests(p):
+            await asyncio.sleep(0.02)
+            return "5 passed"
+
+        service._run_tests = AsyncMock(side_effect=slow_tests)
+
+        results = await asyncio.gather(
+            *(
+                service.build_review_context(project, Task(id=str(i), title="t"), config)
+                for i in range(3)
+            )
+        )
+
+        assert [c.test_results for c in results] == ["5 passed"] * 3
+        service._run_tests.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_no_cache_without_worktree_hash(
+        self, service: ReviewService, git_service: MagicMock, project: Project, config
+    ):
+        """When the hash cannot be computed, commands run every time."""
+        git_service.get_worktree_hash = AsyncMock(side_effect=Exception("not a repo"))
+
+        await service.build_review_context(project, Task(id="1", title="a"), config)
+        await service.build_review_context(project, Task(id="1", title="a"), config)
+
+        assert service._run_tests.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_run_not_cached(
+        self, service: ReviewService, project: Project, config
+    ):
+        """A runner that raises is retried on the next review."""
+        service._run_tests = AsyncMock(side_effect=[RuntimeError("boom"), "5 passed"])
+
+        with pytest.raises(ReviewContextError):
+            await service.build_review_context(project, Task(id="1", title="a"), config)
+        context = await service.build_review_context(project, Task(id="1", title="a"), config)
+
+        assert context.test_results == "5 passed"
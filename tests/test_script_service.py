@@ -332,6 +332,29 @@ class TestScriptService:
         assert "s1" not in service._running_scripts
         mock_spawner.untrack_session.assert_called_once_with("sess1")
 
+    @pytest.mark.asyncio
+    async def test_stop_script_reuses_terminator(self, mock_spawner: MagicMock):
+        """Stopping scripts reuses one terminator instead of creating one per stop."""
+        terminator = MagicMock()
+        terminator.close_session = AsyncMock(return_value=MagicMock(success=True))
+        service = ScriptService(mock_spawner, terminator)
+        mock_spawner.get_session.return_value = MagicMock()
+        service._running_scripts = {
+            sid: RunningScript(
+                script=ProjectScript(id=sid, name=sid, command="cmd"),
+                session_id=f"sess-{sid}",
+                started_at=datetime.now(),
+            )
+            for sid in ("s1", "s2")
+        }
+
+        with patch("iterm_controller.iterm.terminator.SessionTerminator") as MockTerminator:
+            assert await service.stop_script("s1") is True
+            assert await service.stop_script("s2") is True
+
+        MockTerminator.assert_not_called()
+        assert terminator.close_session.await_count == 2
+
     def test_on_session_exit_with_callback(self, service: ScriptService):
         """Test session exit handling with callback."""
         callback = MagicMock()
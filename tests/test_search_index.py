@@ -0,0 +1,189 @@
+"""Tests for the session output search index."""
+
+import asyncio
+
+import pytest
+
+from iterm_controller.models import ManagedSession
+from iterm_controller.search_index import SearchIndex, build_match_query
+from iterm_controller.session_monitor import OutputChange
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1_700_000_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_index(tmp_path, **kwargs) -> SearchIndex:
+    kwargs.setdefault("clock", FakeClock())
+    return SearchIndex(tmp_path / "search.db", **kwargs)
+
+
+class TestBuildMatchQuery:
+    def test_terms_are_quoted(self):
+        assert build_match_query("TypeError: foo") == '"TypeError:" "foo"'
+
+    def test_quotes_are_escaped(self):
+        assert build_match_query('say "hi"') == '"say" """hi"""'
+
+    def test_blank(self):
+        assert build_match_query("   ") == ""
+
+
+class TestIndexing:
+    """Test feeding output into the index."""
+
+    async def test_flush_indexes_non_blank_lines(self, tmp_path):
+        """Each non-blank line of a chunk becomes a searchable row."""
+        index = make_index(tmp_path)
+        index.append("s1", "first line\n\n  \nsecond line\n")
+
+        assert index.buffered_lines == 2
+        assert await index.flush() == 2
+        assert index.buffered_lines == 0
+
+        hits = await index.search("line", context=0)
+        assert [h.line for h in hits] == ["second line", "first line"]
+        index.close()
+
+    async def test_large_buffer_flushes_early(self, tmp_path):
+        """Buffered lines past the limit are indexed without waiting."""
+        index = make_index(tmp_path, max_buffered_lines=3)
+
+        index.append("s1", "a\nb\nc\nd")
+        await asyncio.sleep(0.1)
+
+        assert index.buffered_lines == 0
+        assert len(await index.search("d")) == 1
+        index.close()
+
+    async def test_stop_flushes(self, tmp_path):
+        """Stopping indexes what is still buffered."""
+        index = make_index(tmp_path, flush_interval=60)
+        await index.start()
+        index.append("s1", "last words")
+
+        await index.stop()
+
+        assert [h.line for h in await make_index(tmp_path).search("words")] == ["last words"]
+
+    async def test_on_output_records_session_origin(self, tmp_path):
+        """The monitor hook keeps the session's project and template."""
+        index = make_index(tmp_path)
+        session = ManagedSession(id="s1", template_id="claude", project_id="p", tab_id="tab")
+
+        index.on_output(session, OutputChange("s1", "old", "build failed", changed=True))
+        await index.flush()
+
+        (hit,) = await index.search("failed")
+        assert (hit.session_id, hit.project_id, hit.template_id) == ("s1", "p", "claude")
+        assert hit.timestamp == 1_700_000_000.0
+        index.close()
+
+    async def test_reopened_index_keeps_sessions(self, tmp_path):
+        """A restarted index appends to the same database."""
+        first = make_index(tmp_path)
+        first.append("s1", "before restart", project_id="p")
+        await first.stop()
+
+        second = make_index(tmp_path)
+        second.append("s1", "after restart")
+        await second.stop()
+
+        hits = await make_index(tmp_path).search("restart", context=0)
+        assert [(h.line, h.project_id) for h in hits] == [
+            ("after restart", "p"),
+            ("before restart", "p"),
+        ]
+
+    async def test_concurrent_writers_share_a_database(self, tmp_path):
+        """Writers in other processes (app and daemon) never clash on row IDs."""
+        writers = [make_index(tmp_path) for _ in range(4)]
+
+        for round_ in range(10):
+            for n, writer in enumerate(writers):
+                for i in range(200):
+                    writer.append(f"s{n}", f"shared {round_} {i}")
+            assert await asyncio.gather(*(w.flush() for w in writers)) == [200] * 4
+
+        hits = await writers[0].search("shared", limit=10_000, context=0)
+        assert len(hits) == 8000
+        assert len({(h.session_id, h.line) for h in hits}) == 8000
+        for writer in writers:
+            writer.close()
+
+
+class TestSearch:
+    """Test querying the index."""
+
+    @pytest.fixture
+    async def index(self, tmp_path):
+        clock = FakeClock()
+        index = make_index(tmp_path, clock=clock)
+        index.append("s1", "$ make\ncc -c main.c\nerror: undefined reference\nmake: *** [all]")
+        clock.now += 100
+        index.append("s2", "pytest\nerror: connection refused", project_id="other")
+        clock.now += 100
+        index.append("s1", "$ make\nok")
+        await index.flush()
+        yield index
+        index.close()
+
+    async def test_context_stays_in_session(self, index):
+        """Context lines come from the matching session only, in output order."""
+        (hit, _) = await index.search("error", context=2)
+
+        assert hit.session_id == "s2"
+        assert hit.before == ["pytest"]
+        assert hit.after == []
+
+    async def test_context_before_and_after(self, index):
+        """Lines around a match are returned on both sides."""
+        hits = await index.search("undefined", context=2)
+
+        assert hits[0].before == ["$ make", "cc -c main.c"]
+        assert hits[0].after == ["make: *** [all]", "$ make"]
+
+    async def test_all_terms_must_match(self, index):
+        """Free-text queries match lines with every term."""
+        hits = await index.search("error refused")
+
+        assert [h.line for h in hits] == ["error: connection refused"]
+
+    async def test_filters(self, index):
+        """Session, project and time filters narrow the hits."""
+        assert len(await index.search("error", session_id="s1")) == 1
+        assert len(await index.search("error", project_id="other")) == 1
+        assert len(await index.search("make", since=1_700_000_150.0)) == 1
+        assert len(await index.search("make", until=1_700_000_050.0)) == 2
+
+    async def test_limit_returns_newest(self, index):
+        """The limit keeps the most recent hits."""
+        hits = await index.search("make", limit=1, context=0)
+
+        assert [(h.session_id, h.timestamp) for h in hits] == [("s1", 1_700_000_200.0)]
+
+    async def test_raw_query(self, index):
+        """Raw queries use FTS5 syntax."""
+        hits = await index.search('"connection refused" OR undefined', raw=True)
+
+        assert len(hits) == 2
+
+    async def test_invalid_raw_query(self, index):
+        """Invalid FTS5 syntax is reported as a ValueError."""
+        with pytest.raises(ValueError, match="Invalid search query"):
+            await index.search('"unbalanced', raw=True)
+
+    async def test_punctuation_in_free_text(self, index):
+        """Punctuation in free text is not parsed as FTS5 syntax."""
+        assert len(await index.search("error: (undefined")) == 1
+
+    async def test_missing_database(self, tmp_path):
+        """Searching before anything was indexed finds nothing."""
+        index = SearchIndex(tmp_path / "missing.db")
+
+        assert await index.search("error") == []
+        assert not (tmp_path / "missing.db").exists()
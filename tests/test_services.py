@@ -1,8 +1,13 @@
 """Tests for the ServiceContainer."""
 
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
 import pytest
 
+from iterm_controller.models import ManagedSession
 from iterm_controller.services import ServiceContainer
+from iterm_controller.transcripts import TranscriptStore
 
 
 class TestServiceContainer:
@@ -23,6 +28,105 @@ class TestServiceContainer:
         assert container.github is not None
         assert container.notifier is not None
 
+    def test_supervisor_purges_from_monitor(self) -> None:
+        """Test that the supervisor watches the shared controller and spawner."""
+        container = ServiceContainer.create()
+
+        assert container.supervisor.controller is container.iterm
+        assert container.supervisor.spawner is container.spawner
+        assert container.monitor.purge_sessions in container.supervisor._purge_hooks
+
+    def test_configure_session_pool(self) -> None:
+        """Test that the spawner only gets a warm-shell pool when enabled."""
+        container = ServiceContainer.create()
+        assert container.spawner.pool is None
+
+        container.configure_session_pool(3, 120)
+        pool = container.spawner.pool
+        assert pool is not None
+        assert pool.controller is container.iterm
+        assert pool.size == 3
+        assert pool.idle_timeout == 120
+
+        container.configure_session_pool(0, 120)
+        assert container.spawner.pool is None
+
+    @pytest.mark.asyncio
+    async def test_enable_transcripts(self, tmp_path) -> None:
+        """Test that transcripts are fed from the monitor and stopped with iTerm2."""
+        container = ServiceContainer.create()
+        assert container.transcripts is None
+
+        await container.enable_transcripts(tmp_path)
+        writer = container.transcripts
+
+        assert writer is not None
+        assert writer.directory == tmp_path
+        assert writer.on_output in container.monitor._output_hooks
+
+        await container.disconnect_iterm()
+        assert writer._task is None
+
+    async def test_transcripts_record_output_without_review(self, tmp_path) -> None:
+        """Test that enabling transcripts keeps the monitor polling on its own."""
+        container = ServiceContainer.create()
+        container.spawner.managed_sessions["s1"] = ManagedSession(
+            id="s1", template_id="shell", project_id="p", tab_id="tab"
+        )
+        iterm_session = MagicMock()
+        iterm_session.async_get_contents = AsyncMock(return_value="$ make\nbuild ok")
+        container.iterm.app = MagicMock()
+        container.iterm.app.get_session_by_id = MagicMock(return_value=iterm_session)
+
+        await container.enable_transcripts(tmp_path)
+        assert container.monitor.is_running
+        for _ in range(100):
+            if iterm_session.async_get_contents.await_count:
+                break
+            await asyncio.sleep(0.05)
+        await container.disconnect_iterm()
+
+        records = list(TranscriptStore(tmp_path).read("s1"))
+        assert [r.output for r in records] == ["$ make\nbuild ok"]
+
+    async def test_enable_search_index(self, tmp_path) -> None:
+        """Test that the search index is fed from the monitor and stopped with iTerm2."""
+        container = ServiceContainer.create()
+        assert container.search_index is None
+
+        await container.enable_search_index(tmp_path / "search.db")
+        index = container.search_index
+
+        assert index is not None
+        assert index.path == tmp_path / "search.db"
+        assert index.on_output in container.monitor._output_hooks
+        assert container.monitor.is_running
+
+        await container.disconnect_iterm()
+        assert index._task is None
+
+    async def test_enable_notifications(self, tmp_path) -> None:
+        """Test that notifications follow monitor state changes and log latency."""
+        from iterm_controller.models import NotificationSettings
+        from iterm_controller.state import AppState
+
+        container = ServiceContainer.create()
+        assert container.notifications is None
+
+        await container.enable_notifications(
+            AppState(), NotificationSettings(), tmp_path / "latency.jsonl"
+        )
+        notifications = container.notifications
+
+        assert notifications is not None
+        assert notifications.notification_manager.latency_tracker.log_path == (
+            tmp_path / "latency.jsonl"
+        )
+        assert container.monitor.on_attention_state_change is not None
+        assert container.monitor.is_running
+
+        await container.disconnect_iterm()
+
     def test_spawner_depends_on_iterm_controller(self) -> None:
         """Test that spawner is created with the iterm controller."""
         container = ServiceContainer.create()
@@ -562,3 +562,34 @@ class TestOutputLogConstants:
     def test_max_buffer_constant(self) -> None:
         """Test max buffer constant is reasonable."""
         assert MAX_OUTPUT_BUFFER_LINES == 100
+
+
+class TestResourceSparkline:
+    """Tests for the ResourceSparkline widget."""
+
+    def test_hidden_without_samples(self):
+        """Test the widget is hidden until a sample arrives."""
+        from iterm_controller.resource_monitor import ResourceTimeline
+        from iterm_controller.widgets.session_card import ResourceSparkline
+
+        widget = ResourceSparkline(ResourceTimeline())
+
+        assert widget.display is False
+        assert str(widget.render()) == ""
+
+    def test_render_shows_latest_values(self):
+        """Test CPU%, RSS and FD count are rendered."""
+        from iterm_controller.resource_monitor import ResourceSample, ResourceTimeline
+        from iterm_controller.widgets.session_card import ResourceSparkline
+
+        timeline = ResourceTimeline()
+        timeline.append(ResourceSample(1.0, 10.0, 100 * 1024 * 1024, 12, 3))
+        timeline.append(ResourceSample(2.0, 42.0, 200 * 1024 * 1024, 14, 3))
+        widget = ResourceSparkline(timeline)
+
+        rendered = str(widget.render())
+
+        assert widget.display is True
+        assert "42%" in rendered
+        assert "200.0M" in rendered
+        assert "14 fds" in rendered
@@ -23,8 +23,10 @@ from iterm_controller.session_monitor import (
     OutputProcessor,
     OutputStreamManager,
     OutputThrottle,
+    ReadWindowSizer,
     SessionMonitor,
     SessionNotFoundError,
+    SessionOutputCapture,
     SessionOutputStream,
     SHELL_PROMPT_PATTERNS,
     truncate_output,
@@ -226,6 +228,60 @@ class TestOutputProcessor:
         assert change.changed is True
         assert change.new_output == "Completely new content"
 
+    def test_slid_window_extracts_lines_after_overlap(self):
+        """When the window slid, only lines after the old tail are new."""
+        processor = OutputProcessor()
+        processor.extract_new_output("session-1", "a\nb\nc\nd")
+
+        change = processor.extract_new_output("session-1", "c\nd\ne\nf")
+
+        assert change.new_output == "\ne\nf"
+        assert change.new_lines == 2
+        assert change.gap is False
+
+    def test_slid_window_with_grown_last_line(self):
+        """A last line that grew (e.g. typing at a prompt) still overlaps."""
+        processor = OutputProcessor()
+        processor.extract_new_output("session-1", "a\nb\n$ ")
+
+        change = processor.extract_new_output("session-1", "b\n$ make\nbuilding\n")
+
+        assert change.new_output == "make\nbuilding"
+        assert change.new_lines == 1
+        assert change.gap is False
+
+    def test_shrunken_window_is_not_a_change(self):
+        """A smaller read of the same screen is a suffix of the old output."""
+        processor = OutputProcessor()
+        processor.extract_new_output("session-1", "a\nb\nc\nproceed? (y/n)\n\n")
+
+        change = processor.extract_new_output("session-1", "c\nproceed? (y/n)\n\n")
+        assert change.changed is False
+
+        change = processor.extract_new_output("session-1", "proceed? (y/n)\n")
+        assert change.changed is False
+
+    def test_no_overlap_is_a_gap(self):
+        """Output that shares nothing with the previous read reports a gap."""
+        processor = OutputProcessor()
+        processor.extract_new_output("session-1", "a\nb")
+
+        change = processor.extract_new_output("session-1", "x\ny\nz")
+
+        assert change.new_output == "x\ny\nz"
+        assert change.new_lines == 3
+        assert change.gap is True
+
+    def test_appended_output_is_not_a_gap(self):
+        """Output that still contains the old output has no gap."""
+        processor = OutputProcessor()
+        processor.extract_new_output("session-1", "Line 1")
+
+        change = processor.extract_new_output("session-1", "Line 1\nLine 2")
+
+        assert change.new_lines == 1
+        assert change.gap is False
+
     def test_clear_single_session(self):
         """Clear resets state for single session."""
         processor = OutputProcessor()
@@ -390,6 +446,38 @@ class TestBatchOutputReader:
             first_line=-100, number_of_lines=100
         )
 
+    @pytest.mark.asyncio
+    async def test_read_uses_sized_window(self):
+        """With a sizer, each read fetches the session's window size."""
+        controller = self.make_mock_controller()
+        mock_session = MagicMock()
+        mock_session.async_get_contents = AsyncMock(return_value="output")
+        controller.app.get_session_by_id = MagicMock(return_value=mock_session)
+        sizer = MagicMock()
+        sizer.window_size = MagicMock(return_value=240)
+
+        reader = BatchOutputReader(controller, sizer=sizer)
+        await reader.read_batch(["session-1"])
+
+        mock_session.async_get_contents.assert_called_once_with(
+            first_line=-240, number_of_lines=240
+        )
+        assert reader.windows == {"session-1": 240}
+
+    @pytest.mark.asyncio
+    async def test_read_batch_with_explicit_lines(self):
+        """An explicit line count overrides the window and is not recorded."""
+        controller = self.make_mock_controller()
+        mock_session = MagicMock()
+        mock_session.async_get_contents = AsyncMock(return_value="output")
+        controller.app.get_session_by_id = MagicMock(return_value=mock_session)
+
+        reader = BatchOutputReader(controller, sizer=ReadWindowSizer())
+        await reader.read_batch(["session-1"], lines=5)
+
+        mock_session.async_get_contents.assert_called_once_with(first_line=-5, number_of_lines=5)
+        assert reader.windows == {}
+
 
 class TestMonitorConfig:
     """Test MonitorConfig defaults."""
@@ -693,6 +781,26 @@ class TestSessionMonitor:
         assert "session-1" not in monitor._processor._last_output
         assert "session-1" not in monitor._throttle._last_process
 
+    @pytest.mark.asyncio
+    async def test_purge_sessions(self):
+        """purge_sessions clears cached state for each dead session only."""
+        controller = self.make_mock_controller()
+        spawner = self.make_mock_spawner()
+        monitor = SessionMonitor(controller, spawner)
+
+        for session_id in ("session-1", "session-2", "session-3"):
+            monitor._cache.set(session_id, "cached")
+            monitor._processor._last_output[session_id] = "output"
+            monitor._stream_manager.get_stream(session_id)
+
+        await monitor.purge_sessions(["session-1", "session-3"])
+
+        assert monitor._cache.get("session-1") is None
+        assert monitor._cache.get("session-3") is None
+        assert monitor._cache.get("session-2") == "cached"
+        assert list(monitor._processor._last_output) == ["session-2"]
+        assert monitor._stream_manager.active_streams == ["session-2"]
+
     @pytest.mark.asyncio
     async def test_clear_all(self):
         """Clear all removes all cached state."""
@@ -790,6 +898,27 @@ class TestMetricsCollector:
         assert collector.metrics.avg_poll_duration_ms == 150.0
 
 
+    def test_record_read_windows_and_gaps(self):
+        """Read windows and gaps are tracked per session."""
+        collector = MetricsCollector()
+
+        collector.record_read_window("session-1", 50)
+        collector.record_read_window("session-1", 120)
+        collector.record_gap("session-1")
+        collector.record_gap("session-2")
+        collector.record_gap("session-1")
+
+        assert collector.metrics.read_windows == {"session-1": 120}
+        assert collector.metrics.output_gaps == 3
+        assert collector.metrics.session_gaps == {"session-1": 2, "session-2": 1}
+
+        collector.forget("session-1")
+
+        assert collector.metrics.read_windows == {}
+        assert collector.metrics.session_gaps == {"session-2": 1}
+        assert collector.metrics.output_gaps == 3
+
+
 class TestOutputChange:
     """Test OutputChange dataclass."""
 
@@ -1639,6 +1768,216 @@ class TestAdaptivePoller:
         assert poller.get_interval_ms("session-3") == 2000
 
 
+class FakeClock:
+    """Settable monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestReadWindowSizer:
+    """Test ReadWindowSizer functionality."""
+
+    def test_default_window_before_rate_is_known(self):
+        """Sessions use the default window until two reads were observed."""
+        sizer = ReadWindowSizer(default_lines=50)
+
+        assert sizer.window_size("session-1") == 50
+        sizer.observe("session-1", 30)
+        assert sizer.window_size("session-1") == 50
+        assert sizer.get_rate("session-1") is None
+
+    def test_window_follows_output_rate(self):
+        """A fast producer gets a window covering its lines per interval."""
+        clock = FakeClock()
+        sizer = ReadWindowSizer(min_lines=10, headroom=2.0, clock=clock)
+        sizer.observe("session-1", 0)
+        clock.now += 0.5
+        sizer.observe("session-1", 100)  # 200 lines/s
+
+        clock.now += 0.5
+        assert sizer.get_rate("session-1") == 200.0
+        assert sizer.window_size("session-1") == 200 + 10
+
+    def test_quiet_session_shrinks_to_min(self):
+        """A session without output only reads the overlap lines."""
+        clock = FakeClock()
+        sizer = ReadWindowSizer(min_lines=10, clock=clock)
+        sizer.observe("session-1", 0)
+        clock.now += 0.5
+        sizer.observe("session-1", 0)
+
+        clock.now += 0.5
+        assert sizer.window_size("session-1") == 10
+
+    def test_rate_is_smoothed(self):
+        """One quiet poll halves the rate instead of dropping it."""
+        clock = FakeClock()
+        sizer = ReadWindowSizer(smoothing=0.5, clock=clock)
+        sizer.observe("session-1", 0)
+        clock.now += 1.0
+        sizer.observe("session-1", 100)
+        clock.now += 1.0
+        sizer.observe("session-1", 0)
+
+        assert sizer.get_rate("session-1") == 50.0
+
+    def test_window_capped_at_max(self):
+        """The window never exceeds max_lines."""
+        clock = FakeClock()
+        sizer = ReadWindowSizer(max_lines=300, clock=clock)
+        sizer.observe("session-1", 0)
+        clock.now += 0.1
+        sizer.observe("session-1", 1000)
+
+        clock.now += 1.0
+        assert sizer.window_size("session-1") == 300
+
+    def test_gap_doubles_next_window(self):
+        """After missed output the next read is at least twice as large."""
+        clock = FakeClock()
+        sizer = ReadWindowSizer(min_lines=10, max_lines=1000, clock=clock)
+        sizer.observe("session-1", 0)
+        clock.now += 1.0
+        sizer.observe("session-1", 0)
+        clock.now += 1.0
+        sizer.observe("session-1", 50, gap=True)
+
+        assert sizer.window_size("session-1") >= 100
+
+    def test_reset(self):
+        """Reset forgets observed rates."""
+        clock = FakeClock()
+        sizer = ReadWindowSizer(default_lines=50, clock=clock)
+        for session_id in ("session-1", "session-2"):
+            sizer.observe(session_id, 0)
+            clock.now += 1.0
+            sizer.observe(session_id, 500)
+
+        sizer.reset_session("session-1")
+        assert sizer.get_rate("session-1") is None
+        assert sizer.get_rate("session-2") is not None
+
+        sizer.reset_all()
+        assert sizer.window_size("session-2") == 50
+
+
+class TestSessionMonitorReadWindow:
+    """Test SessionMonitor read window sizing and gap reporting."""
+
+    def make_monitor(self, screens, config=None):
+        """Create a monitor for one session whose reads return screens in order."""
+        session = ManagedSession(
+            id="session-1", template_id="t", project_id="p", tab_id="tab-1"
+        )
+        spawner = MagicMock()
+        spawner.managed_sessions = {"session-1": session}
+        iterm_session = MagicMock()
+        iterm_session.async_get_contents = AsyncMock(side_effect=screens)
+        controller = MagicMock()
+        controller.app.get_session_by_id = MagicMock(return_value=iterm_session)
+        config = config or MonitorConfig(throttle_interval_ms=0, lines_to_read=3)
+        return SessionMonitor(controller, spawner, config=config), iterm_session
+
+    def test_read_window_enabled_by_default(self):
+        """The monitor sizes read windows unless disabled."""
+        monitor, _ = self.make_monitor([])
+        assert isinstance(monitor._reader.sizer, ReadWindowSizer)
+
+        config = MonitorConfig(adaptive_read_window_enabled=False)
+        monitor, _ = self.make_monitor([], config)
+        assert monitor._reader.sizer is None
+
+    @pytest.mark.asyncio
+    async def test_metrics_expose_window_sizes(self):
+        """Each session's read window shows up in the monitor metrics."""
+        monitor, _ = self.make_monitor(["a\nb\nc"])
+
+        await monitor.poll_once()
+
+        assert monitor.metrics.read_windows == {"session-1": 3}
+        assert monitor.metrics.poll_count == 1
+        assert monitor.metrics.sessions_polled == 1
+
+    @pytest.mark.asyncio
+    async def test_full_read_without_overlap_reports_gap(self):
+        """Output that overflowed the window is reported and widens it."""
+        monitor, iterm_session = self.make_monitor(["a\nb\nc", "x\ny\nz", "y\nz\nw"])
+
+        await monitor.poll_once()
+        changes = await monitor.poll_once()
+
+        assert changes["session-1"].gap is True
+        assert monitor.metrics.output_gaps == 1
+        assert monitor.metrics.session_gaps == {"session-1": 1}
+
+        await monitor.poll_once()
+        last_call = iterm_session.async_get_contents.call_args
+        assert last_call.kwargs["number_of_lines"] >= 6
+
+    @pytest.mark.asyncio
+    async def test_cleared_screen_is_not_a_gap(self):
+        """A short read without overlap means the screen was cleared."""
+        monitor, _ = self.make_monitor(["a\nb\nc", "$ "])
+
+        await monitor.poll_once()
+        changes = await monitor.poll_once()
+
+        assert changes["session-1"].gap is False
+        assert monitor.metrics.output_gaps == 0
+
+    @pytest.mark.asyncio
+    async def test_shrinking_window_keeps_waiting_session(self):
+        """A smaller read window does not blank output or end WAITING."""
+        screen = [f"line {i}" for i in range(60)] + ["Do you want to proceed? (y/n)"]
+        monitor, iterm_session = self.make_monitor([])
+        iterm_session.async_get_contents.side_effect = lambda *args, **kwargs: "\n".join(
+            screen[-kwargs["number_of_lines"] :]
+        )
+        windows = iter([50, 50, 10, 10])
+        monitor._reader.sizer.window_size = lambda session_id: next(windows)
+        session = monitor.spawner.managed_sessions["session-1"]
+        states = []
+
+        for _ in range(4):
+            await monitor.poll_once()
+            states.append(session.attention_state)
+
+        assert states == [AttentionState.WAITING] * 4
+        assert session.last_output.endswith("Do you want to proceed? (y/n)")
+
+    @pytest.mark.asyncio
+    async def test_output_hooks_receive_changes(self):
+        """Output hooks get every change, and a failing hook is isolated."""
+        monitor, _ = self.make_monitor(["a\nb\nc", "b\nc\nd"])
+        seen = []
+
+        def broken(session, change):
+            raise RuntimeError("boom")
+
+        monitor.add_output_hook(broken)
+        monitor.add_output_hook(lambda session, change: seen.append(change.new_output))
+        await monitor.poll_once()
+        monitor.remove_output_hook(broken)
+        await monitor.poll_once()
+
+        assert seen == ["a\nb\nc", "\nd"]
+
+    @pytest.mark.asyncio
+    async def test_clear_session_drops_window_state(self):
+        """Clearing a session forgets its window and metrics."""
+        monitor, _ = self.make_monitor(["a\nb\nc"])
+        await monitor.poll_once()
+
+        await monitor.clear_session("session-1")
+
+        assert monitor._reader.windows == {}
+        assert monitor.metrics.read_windows == {}
+
+
 class TestSessionMonitorAdaptivePolling:
     """Test SessionMonitor adaptive polling integration."""
 
@@ -3591,3 +3930,88 @@ class TestOutputStreamingIntegration:
 
         # Pending output should be cleared since no subscribers
         assert len(stream._pending_output) == 0
+
+
+class TestSessionOutputCapture:
+    """Test SessionOutputCapture completion detection and buffering."""
+
+    @pytest.fixture
+    def stream(self):
+        """Create a stream that flushes every chunk immediately."""
+        return SessionOutputStream("session-1", batch_interval_ms=0)
+
+    @pytest.mark.asyncio
+    async def test_accumulates_output(self, stream):
+        """Captured text contains every streamed chunk in order."""
+        async with SessionOutputCapture(stream) as capture:
+            await stream.push_output("first\n")
+            await stream.push_output("second\n")
+
+        assert capture.text == "first\nsecond\n"
+        assert stream.subscriber_count == 0
+
+    @pytest.mark.asyncio
+    async def test_completion_marker(self, stream):
+        """A completion pattern finishes the capture immediately."""
+        import re
+
+        pattern = re.compile(r"^DONE$", re.MULTILINE)
+        async with SessionOutputCapture(stream, completion_patterns=[pattern]) as capture:
+            await stream.push_output("working on it\n")
+            assert capture.is_complete is False
+            await stream.push_output("DONE\n")
+
+            assert await capture.wait(timeout=0.1) is True
+
+        assert capture.completion_reason == "marker"
+
+    @pytest.mark.asyncio
+    async def test_marker_inside_sentence_does_not_complete(self, stream):
+        """A marker mentioned mid-line (e.g. an echoed prompt) is ignored."""
+        import re
+
+        pattern = re.compile(r"^\s*DONE\s*$", re.MULTILINE)
+        async with SessionOutputCapture(
+            stream, completion_patterns=[pattern], settle_seconds=10
+        ) as capture:
+            await stream.push_output("When finished, print DONE on its own line.\n")
+
+            assert await capture.wait(timeout=0.05) is False
+
+    @pytest.mark.asyncio
+    async def test_idle_prompt_after_quiet_period(self, stream):
+        """Returning to a shell prompt completes once output settles."""
+        async with SessionOutputCapture(stream, settle_seconds=0.02) as capture:
+            await stream.push_output("review text\n$ ")
+
+            assert await capture.wait(timeout=0.5) is True
+
+        assert capture.completion_reason == AttentionState.IDLE.value
+
+    @pytest.mark.asyncio
+    async def test_new_output_resets_quiet_period(self, stream):
+        """A prompt followed by more output does not complete."""
+        async with SessionOutputCapture(stream, settle_seconds=0.05) as capture:
+            await stream.push_output("$ ")
+            await asyncio.sleep(0.02)
+            await stream.push_output("still running\n")
+
+            assert await capture.wait(timeout=0.1) is False
+
+    @pytest.mark.asyncio
+    async def test_no_prompt_does_not_complete(self, stream):
+        """Quiet output without a prompt keeps waiting."""
+        async with SessionOutputCapture(stream, settle_seconds=0.01) as capture:
+            await stream.push_output("thinking about it")
+
+            assert await capture.wait(timeout=0.05) is False
+
+    @pytest.mark.asyncio
+    async def test_buffer_is_bounded(self, stream):
+        """Only the most recent max_bytes of output are kept."""
+        async with SessionOutputCapture(stream, max_bytes=10) as capture:
+            await stream.push_output("aaaaaaaa")
+            await stream.push_output("bbbbbbbb")
+
+        assert capture.text == "bbbbbbbb"
+        assert capture.truncated is True
@@ -0,0 +1,268 @@
+"""Tests for the pre-warmed session pool."""
+
+import asyncio
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from iterm_controller.iterm import ItermController, SessionPool, SessionSpawner
+from iterm_controller.models import Project, SessionTemplate
+from iterm_controller.testing import MockItermApp
+
+KEY = ("p", "cd /p")
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_controller(app: MockItermApp) -> ItermController:
+    controller = ItermController()
+    controller._connected = True
+    controller.connection = MagicMock()
+    controller.app = app
+    return controller
+
+
+@pytest.fixture
+def app():
+    app = MockItermApp(rpc_latency=0.001)
+    with patch("iterm2.Window.async_create", app.async_create_window):
+        yield app
+
+
+async def settle(pool: SessionPool) -> None:
+    """Wait for background refills to finish."""
+    while pool._tasks:
+        await asyncio.gather(*pool._tasks)
+
+
+class TestFill:
+    """Test preparing warm shells."""
+
+    async def test_fill_prepares_shells_in_one_window(self, app):
+        """Each warm shell runs its prefix, all in the pool window."""
+        pool = SessionPool(make_controller(app), size=3)
+
+        assert await pool.fill(KEY) == 3
+
+        assert pool.available(KEY) == 3
+        (window,) = app.windows
+        assert pool.is_pool_window(window.window_id)
+        assert len(window.tabs) == 3
+        assert all(s.sent_text == ["cd /p\n"] for s in app.sessions)
+
+    async def test_fill_tops_up_to_size(self, app):
+        """A second fill only replaces what is missing."""
+        pool = SessionPool(make_controller(app), size=2)
+        await pool.fill(KEY)
+
+        assert await pool.fill(KEY) == 0
+        assert len(app.sessions) == 2
+
+    async def test_concurrent_fills_do_not_overfill(self, app):
+        """Shells still being created count toward the size."""
+        pool = SessionPool(make_controller(app), size=2)
+
+        added = await asyncio.gather(pool.fill(KEY), pool.fill(KEY), pool.fill(KEY))
+
+        assert sum(added) == 2
+        assert pool.available(KEY) == 2
+
+    async def test_max_sessions_caps_all_keys(self, app):
+        """The pool never holds more than max_sessions shells."""
+        pool = SessionPool(make_controller(app), size=2, max_sessions=3)
+
+        await pool.fill(("a", "cd /a"))
+        await pool.fill(("b", "cd /b"))
+
+        assert len(pool) == 3
+        assert pool.available(("b", "cd /b")) == 1
+
+    async def test_fill_when_disconnected(self, app):
+        """Nothing is prepared without a connection."""
+        controller = make_controller(app)
+        controller._connected = False
+        pool = SessionPool(controller)
+
+        assert await pool.fill(KEY) == 0
+        assert app.windows == []
+
+    async def test_pool_window_hands_focus_back(self, app):
+        """Creating the pool window re-activates the user's window."""
+        user_window = await app.async_create_window()
+        pool = SessionPool(make_controller(app), size=1)
+
+        await pool.fill(KEY)
+
+        assert len(app.windows) == 2
+        assert app.current_terminal_window is user_window
+
+
+class TestClaim:
+    """Test handing warm shells to spawns."""
+
+    async def test_claim_moves_tab_into_window(self, app):
+        """The claimed tab leaves the pool window for the target window."""
+        target = await app.async_create_window()
+        pool = SessionPool(make_controller(app), size=2)
+        await pool.fill(KEY)
+
+        claimed = await pool.claim(KEY, target)
+
+        assert claimed is not None
+        tab, session = claimed
+        assert tab.window is target
+        assert target.tabs[-1] is tab
+        assert session.sent_text == ["cd /p\n"]
+        assert pool.available(KEY) == 1
+
+    async def test_claim_other_context(self, app):
+        """Shells are only reused for the context they were prepared for."""
+        target = await app.async_create_window()
+        pool = SessionPool(make_controller(app), size=1)
+        await pool.fill(KEY)
+
+        assert await pool.claim(("p", "cd /p/sub"), target) is None
+        assert pool.available(KEY) == 1
+
+    async def test_claim_skips_closed_shells(self, app):
+        """A shell closed behind the pool's back is never handed out."""
+        target = await app.async_create_window()
+        pool = SessionPool(make_controller(app), size=2)
+        await pool.fill(KEY)
+        first, second = app.sessions[1:]
+        await first.async_close()
+
+        claimed = await pool.claim(KEY, target)
+
+        assert claimed is not None
+        assert claimed[1] is second
+
+    async def test_claiming_last_tab_closes_pool_window(self, app):
+        """The empty pool window goes away and is recreated on refill."""
+        target = await app.async_create_window()
+        pool = SessionPool(make_controller(app), size=1)
+        await pool.fill(KEY)
+        await pool.claim(KEY, target)
+        assert app.windows == [target]
+
+        await pool.fill(KEY)
+
+        assert len(app.windows) == 2
+        assert app.current_terminal_window is target
+
+
+class TestEviction:
+    """Test closing unclaimed shells."""
+
+    async def test_evict_idle_closes_expired_shells(self, app):
+        """Shells older than the idle timeout are closed."""
+        clock = FakeClock()
+        pool = SessionPool(make_controller(app), size=1, idle_timeout=60, clock=clock)
+        await pool.fill(("a", "cd /a"))
+        clock.now += 30
+        await pool.fill(("b", "cd /b"))
+        clock.now += 40
+
+        assert await pool.evict_idle() == 1
+
+        assert pool.available(("a", "cd /a")) == 0
+        assert pool.available(("b", "cd /b")) == 1
+        assert len(app.sessions) == 1
+
+    async def test_stop_closes_remaining_shells(self, app):
+        """Stopping the pool closes every warm shell and its window."""
+        pool = SessionPool(make_controller(app), size=2)
+        await pool.start()
+        await pool.fill(KEY)
+
+        await pool.stop()
+
+        assert len(pool) == 0
+        assert app.sessions == []
+        assert app.windows == []
+
+
+class TestSpawnerWithPool:
+    """Test SessionSpawner claiming warm shells."""
+
+    def make_spawner(self, app: MockItermApp, size: int = 1) -> SessionSpawner:
+        controller = make_controller(app)
+        return SessionSpawner(controller, pool=SessionPool(controller, size=size))
+
+    async def test_warm_spawn_sends_only_command(self, app):
+        """A claimed shell already ran cd, so only the command is sent."""
+        target = await app.async_create_window()
+        spawner = self.make_spawner(app)
+        project = Project(id="p", name="P", path="/p")
+        spawner.prewarm(project)
+        await settle(spawner.pool)
+
+        template = SessionTemplate(id="claude", name="Claude", command="claude")
+        result = await spawner.spawn_session(template, project)
+
+        assert result.success is True
+        assert result.window_id == target.window_id
+        session = app.get_session_by_id(result.session_id)
+        assert session.sent_text == ["cd /p\n", "claude\n"]
+        assert session.tab.window is target
+        assert spawner.managed_sessions[result.session_id].tab_id == session.tab.tab_id
+
+    async def test_spawn_refills_pool(self, app):
+        """Every spawn tops the pool back up for its context."""
+        await app.async_create_window()
+        spawner = self.make_spawner(app, size=2)
+        project = Project(id="p", name="P", path="/p")
+        template = SessionTemplate(id="shell", name="Shell", command="")
+
+        cold = await spawner.spawn_session(template, project)
+        await settle(spawner.pool)
+        warm = await spawner.spawn_session(template, project)
+        await settle(spawner.pool)
+
+        assert app.get_session_by_id(cold.session_id).sent_text == ["cd /p\n"]
+        assert app.get_session_by_id(warm.session_id).sent_text == ["cd /p\n"]
+        assert spawner.pool.available(KEY) == 2
+
+    async def test_cold_spawn_for_unpooled_context(self, app):
+        """Templates with their own environment take the normal path."""
+        await app.async_create_window()
+        spawner = self.make_spawner(app)
+        project = Project(id="p", name="P", path="/p")
+        spawner.prewarm(project)
+        await settle(spawner.pool)
+
+        template = SessionTemplate(id="dev", name="Dev", command="make", env={"A": "1"})
+        result = await spawner.spawn_session(template, project)
+
+        session = app.get_session_by_id(result.session_id)
+        assert session.sent_text == ["cd /p && export A=1 && make\n"]
+        assert spawner.pool.available(KEY) == 1
+
+    async def test_pool_window_is_never_a_target(self, app):
+        """If the pool window is current, spawns get a new window."""
+        spawner = self.make_spawner(app)
+        project = Project(id="p", name="P", path="/p")
+        await spawner.pool.fill(KEY)
+        (pool_window,) = app.windows
+        app.current_terminal_window = pool_window
+
+        result = await spawner.spawn_session(
+            SessionTemplate(id="claude", name="Claude", command="claude"), project
+        )
+
+        assert result.success is True
+        assert result.window_id != pool_window.window_id
+
+    async def test_prewarm_without_pool(self, app):
+        """Prewarming is a no-op when the pool is disabled."""
+        spawner = SessionSpawner(make_controller(app))
+
+        spawner.prewarm(Project(id="p", name="P", path="/p"))
+
+        assert app.windows == []
@@ -27,7 +27,10 @@ from iterm_controller.state import (
     ScriptCompleted,
     ScriptStarted,
     SessionClosed,
+    SessionIndex,
+    SessionSelector,
     SessionSpawned,
+    SessionsReconciled,
     SessionStatusChanged,
     TaskStatusChanged,
     WorkflowStageChanged,
@@ -255,6 +258,28 @@ class TestAppStateTextualMessages:
         assert isinstance(posted, SessionClosed)
         assert posted.session is session
 
+    def test_purge_sessions_posts_one_message(self) -> None:
+        """Test that purging sessions posts a single SessionsReconciled."""
+        state = AppState()
+        mock_app = MagicMock()
+        state.connect_app(mock_app)
+        for session_id in ("s1", "s2", "s3"):
+            state.add_session(
+                ManagedSession(id=session_id, template_id="t1", project_id="p1", tab_id="tab1")
+            )
+        mock_app.post_message.reset_mock()
+
+        closed = state.purge_sessions(["s1", "s3", "unknown"], reconnected=True)
+
+        assert [s.id for s in closed] == ["s1", "s3"]
+        assert list(state.sessions) == ["s2"]
+        assert [s.id for s in state.select_sessions(SessionSelector())] == ["s2"]
+        mock_app.post_message.assert_called_once()
+        posted = mock_app.post_message.call_args[0][0]
+        assert isinstance(posted, SessionsReconciled)
+        assert posted.closed == closed
+        assert posted.reconnected
+
     def test_update_session_status_posts_message(self) -> None:
         """Test that updating session status posts SessionStatusChanged."""
         state = AppState()
@@ -353,6 +378,18 @@ class TestAppStateTextualMessages:
         assert posted.check_name == "api-health"
         assert posted.status == "healthy"
 
+    def test_update_health_status_skips_unchanged(self) -> None:
+        """Test that repeating the same status does not post again."""
+        state = AppState()
+        mock_app = MagicMock()
+        state.connect_app(mock_app)
+
+        state.update_health_status("p1", "api", HealthStatus.HEALTHY)
+        state.update_health_status("p1", "api", HealthStatus.HEALTHY)
+        state.update_health_status("p1", "api", HealthStatus.UNHEALTHY)
+
+        assert mock_app.post_message.call_count == 2
+
     def test_update_health_status_stores_status(self) -> None:
         """Test that health status update stores the status."""
         state = AppState()
@@ -749,6 +786,112 @@ class TestStateManagers:
         assert snapshot.health_statuses["p1"]["api"] == HealthStatus.HEALTHY
 
 
+class TestSessionSelection:
+    """Tests for SessionSelector and SessionIndex."""
+
+    def make_session(
+        self,
+        session_id: str,
+        project_id: str = "p1",
+        template_id: str = "shell",
+        attention_state: AttentionState = AttentionState.IDLE,
+    ) -> ManagedSession:
+        """Create a managed session."""
+        return ManagedSession(
+            id=session_id,
+            template_id=template_id,
+            project_id=project_id,
+            tab_id="tab",
+            attention_state=attention_state,
+        )
+
+    def test_parse_selector(self) -> None:
+        """Terms are ANDed and comma-separated values are alternatives."""
+        selector = SessionSelector.parse("project=a,b  template=claude attention=waiting")
+
+        assert selector.project_ids == frozenset({"a", "b"})
+        assert selector.template_ids == frozenset({"claude"})
+        assert selector.attention_states == frozenset({AttentionState.WAITING})
+        assert SessionSelector.parse(str(selector)) == selector
+        assert SessionSelector.parse("all") == SessionSelector()
+        assert str(SessionSelector()) == "all"
+
+    @pytest.mark.parametrize(
+        ("text", "message"),
+        [
+            ("project", "expected key=value"),
+            ("project=", "expected key=value"),
+            ("owner=me", "Unknown selector key"),
+            ("state=busy", "Unknown attention state"),
+            ("", "Empty selector"),
+            ("  ", "Empty selector"),
+            ("all project=p", "expected key=value"),
+        ],
+    )
+    def test_parse_invalid_selector(self, text: str, message: str) -> None:
+        """Malformed selectors raise ValueError."""
+        with pytest.raises(ValueError, match=message):
+            SessionSelector.parse(text)
+
+    def test_select_sessions(self) -> None:
+        """Selections combine indexed keys with the current attention state."""
+        state = AppState()
+        s1 = self.make_session("s1", "p1", "claude", AttentionState.WAITING)
+        s2 = self.make_session("s2", "p1", "shell", AttentionState.WAITING)
+        s3 = self.make_session("s3", "p2", "claude", AttentionState.IDLE)
+        for session in (s1, s2, s3):
+            state.add_session(session)
+
+        def select(text: str) -> list[str]:
+            return [s.id for s in state.select_sessions(SessionSelector.parse(text))]
+
+        assert select("all") == ["s1", "s2", "s3"]
+        assert select("project=p1") == ["s1", "s2"]
+        assert select("template=claude") == ["s1", "s3"]
+        assert select("project=p1 template=claude") == ["s1"]
+        assert select("state=waiting") == ["s1", "s2"]
+        assert select("project=p3") == []
+
+        # Attention state changes in place and is picked up without reindexing
+        s3.attention_state = AttentionState.WAITING
+        assert select("template=claude state=waiting") == ["s1", "s3"]
+
+        state.remove_session("s1")
+        assert select("template=claude") == ["s3"]
+
+    def test_select_after_direct_mutation(self) -> None:
+        """Sessions added to the dict directly are indexed on the next select."""
+        state = AppState()
+        state.add_session(self.make_session("s1", "p1"))
+        state.sessions["s2"] = self.make_session("s2", "p1")
+
+        assert [s.id for s in state.select_sessions(SessionSelector.parse("project=p1"))] == [
+            "s1",
+            "s2",
+        ]
+
+    def test_index_narrows_candidates(self) -> None:
+        """A project selector only looks at that project's sessions."""
+        index = SessionIndex()
+        sessions = {}
+        for i in range(1000):
+            session = self.make_session(f"s{i}", project_id=f"p{i % 100}")
+            sessions[session.id] = session
+            index.add(session)
+
+        class CountingDict(dict):
+            lookups = 0
+
+            def get(self, key, default=None):
+                CountingDict.lookups += 1
+                return super().get(key, default)
+
+        selected = index.select(SessionSelector.parse("project=p7"), CountingDict(sessions))
+
+        assert len(selected) == 10
+        assert CountingDict.lookups == 10
+
+
 class TestReviewStateManager:
     """Tests for the ReviewStateManager."""
 
@@ -944,6 +1087,80 @@ class TestReviewStateManagerAsync:
 
         assert result is None
 
+    async def test_start_review_merges_duplicate_requests(self) -> None:
+        """Test repeated start_review calls share one queued review."""
+        import asyncio
+        from datetime import datetime
+        from unittest.mock import AsyncMock
+
+        from iterm_controller.models import ReviewResult, Task, TaskReview
+
+        task = Task(id="task-1", title="Build it")
+        dependent = Task(id="task-2", title="Use it", depends=["task-1"])
+        plan = MagicMock()
+        plan.get_task.return_value = task
+        plan.all_tasks = [task, dependent]
+
+        gate = asyncio.Event()
+        review = TaskReview(
+            id="r1",
+            task_id="task-1",
+            attempt=1,
+            result=ReviewResult.APPROVED,
+            issues=[],
+            summary="ok",
+            blocking=False,
+            reviewed_at=datetime.now(),
+            reviewer_command="",
+        )
+
+        async def run_review(project, task, context):
+            await gate.wait()
+            return review
+
+        mock_service = MagicMock()
+        mock_service.build_review_context = AsyncMock(return_value=MagicMock())
+        mock_service.run_review = AsyncMock(side_effect=run_review)
+
+        manager = ReviewStateManager(review_service=mock_service)
+        mock_app = MagicMock()
+        mock_app.state.projects = {"project-1": MagicMock()}
+        mock_app.state.get_plan.return_value = plan
+        manager.connect_app(mock_app)
+
+        with patch.object(
+            manager.scheduler, "submit", wraps=manager.scheduler.submit
+        ) as submit:
+            first = asyncio.create_task(manager.start_review("project-1", "task-1"))
+            second = asyncio.create_task(manager.start_review("project-1", "task-1"))
+            await asyncio.sleep(0.01)
+
+            assert manager.is_reviewing("task-1")
+            gate.set()
+            results = await asyncio.gather(first, second)
+
+        assert results == [review, review]
+        assert mock_service.run_review.await_count == 1
+        # task-2 depends on task-1, so task-1 is prioritized
+        assert submit.call_args.kwargs["priority"] == -1
+        assert manager.get_queue_stats().is_idle
+
+    def test_queue_changes_post_event(self) -> None:
+        """Test scheduler queue changes are posted as ReviewQueueChanged."""
+        from iterm_controller.review_scheduler import ReviewQueueStats
+        from iterm_controller.state import ReviewQueueChanged
+
+        manager = ReviewStateManager()
+        mock_app = MagicMock()
+        manager.connect_app(mock_app)
+
+        stats = ReviewQueueStats(queued=2, running=1)
+        manager.scheduler.on_change(stats)
+
+        message = mock_app.post_message.call_args[0][0]
+        assert isinstance(message, ReviewQueueChanged)
+        assert message.stats is stats
+
 
 class TestReviewStateManagerEvents:
     """Tests for ReviewStateManager event posting."""
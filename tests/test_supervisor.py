@@ -0,0 +1,213 @@
+"""Tests for the iTerm2 connection supervisor."""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from iterm_controller.exceptions import ItermConnectionError, ItermNotConnectedError
+from iterm_controller.iterm import (
+    ConnectionSupervisor,
+    ItermController,
+    ReconcileResult,
+    SessionSpawner,
+)
+from iterm_controller.models import ManagedSession
+from iterm_controller.testing import MockItermApp
+
+
+def make_managed(session_id: str) -> ManagedSession:
+    return ManagedSession(id=session_id, template_id="shell", project_id="p", tab_id="t")
+
+
+async def make_setup(live: int, dead: int) -> tuple[ItermController, SessionSpawner, MockItermApp]:
+    """Create a controller whose spawner tracks live and dead sessions."""
+    app = MockItermApp()
+    window = await app.async_create_window()
+    for _ in range(live - 1):
+        await window.async_create_tab()
+
+    controller = ItermController()
+    controller._connected = True
+    controller.connection = MagicMock()
+    controller.app = app
+
+    spawner = SessionSpawner(controller)
+    for session in app.sessions:
+        spawner.managed_sessions[session.session_id] = make_managed(session.session_id)
+    for i in range(dead):
+        spawner.managed_sessions[f"dead-{i}"] = make_managed(f"dead-{i}")
+    return controller, spawner, app
+
+
+class TestConnectionLost:
+    """Tests for ItermController.is_connection_lost."""
+
+    def test_not_connected(self):
+        """A controller that never connected has not lost its connection."""
+        assert not ItermController().is_connection_lost
+
+    def test_open_websocket(self):
+        """An open websocket is not lost."""
+        controller = ItermController()
+        controller._connected = True
+        controller.connection = SimpleNamespace(websocket=SimpleNamespace(closed=False))
+        assert not controller.is_connection_lost
+
+    def test_closed_websocket(self):
+        """A closed websocket means iTerm2 went away."""
+        controller = ItermController()
+        controller._connected = True
+        controller.connection = SimpleNamespace(websocket=SimpleNamespace(closed=True))
+        assert controller.is_connection_lost
+
+    def test_mock_connection(self):
+        """A mock connection is never reported as lost."""
+        controller = ItermController()
+        controller._connected = True
+        controller.connection = MagicMock()
+        assert not controller.is_connection_lost
+
+
+class TestReconcileResult:
+    """Tests for ReconcileResult."""
+
+    def test_summary_after_reconnect(self):
+        result = ReconcileResult(
+            live_session_ids=["a"], purged_session_ids=["b", "c"], reconnected=True, attempts=3
+        )
+        assert result.summary == (
+            "Reconnected to iTerm2 after 3 attempts: 1 session(s) live, 2 gone"
+        )
+
+    def test_summary_without_reconnect(self):
+        result = ReconcileResult(live_session_ids=["a", "b"])
+        assert result.summary == "Resynced with iTerm2: 2 session(s) live, 0 gone"
+
+
+class TestConnectionSupervisor:
+    """Tests for ConnectionSupervisor."""
+
+    async def test_reconcile_purges_dead_sessions(self):
+        """Dead sessions are untracked and purged in one pass."""
+        controller, spawner, app = await make_setup(live=3, dead=2)
+        hook = AsyncMock()
+        reported = []
+        supervisor = ConnectionSupervisor(controller, spawner, on_reconciled=reported.append)
+        supervisor.add_purge_hook(hook)
+
+        result = await supervisor.reconcile()
+
+        assert sorted(result.purged_session_ids) == ["dead-0", "dead-1"]
+        assert sorted(result.live_session_ids) == sorted(s.session_id for s in app.sessions)
+        assert sorted(spawner.managed_sessions) == sorted(s.session_id for s in app.sessions)
+        hook.assert_awaited_once_with(["dead-0", "dead-1"])
+        assert reported == [result]
+        assert not result.reconnected
+
+    async def test_reconcile_without_dead_sessions_skips_hooks(self):
+        """Purge hooks are not called when nothing died."""
+        controller, spawner, _ = await make_setup(live=2, dead=0)
+        hook = MagicMock()
+        supervisor = ConnectionSupervisor(controller, spawner)
+        supervisor.add_purge_hook(hook)
+
+        result = await supervisor.reconcile()
+
+        assert result.purged_session_ids == []
+        hook.assert_not_called()
+
+    async def test_failing_hook_does_not_stop_reconcile(self):
+        """An error in one purge hook does not skip the others."""
+        controller, spawner, _ = await make_setup(live=1, dead=1)
+        failing = MagicMock(side_effect=RuntimeError("boom"))
+        working = MagicMock()
+        supervisor = ConnectionSupervisor(controller, spawner)
+        supervisor.add_purge_hook(failing)
+        supervisor.add_purge_hook(working)
+
+        await supervisor.reconcile()
+
+        working.assert_called_once_with(["dead-0"])
+
+    async def test_reconcile_refreshes_tracker(self):
+        """The window tracker is refreshed after reconciling."""
+        controller, spawner, _ = await make_setup(live=1, dead=0)
+        tracker = MagicMock()
+        tracker.refresh = AsyncMock()
+        supervisor = ConnectionSupervisor(controller, spawner, tracker=tracker)
+
+        await supervisor.reconcile()
+
+        tracker.refresh.assert_awaited_once()
+
+    async def test_recover_backs_off_exponentially(self):
+        """Failed reconnects are retried with growing, capped delays."""
+        controller, spawner, _ = await make_setup(live=1, dead=1)
+        failures = [ItermConnectionError("refused")] * 5
+        controller.reconnect = AsyncMock(side_effect=[*failures, True])
+        supervisor = ConnectionSupervisor(
+            controller, spawner, initial_backoff=0.5, max_backoff=4.0, backoff_factor=2.0
+        )
+
+        with patch("iterm_controller.iterm.supervisor.asyncio.sleep", AsyncMock()) as sleep:
+            result = await supervisor.recover()
+
+        assert [c.args[0] for c in sleep.await_args_list] == [0.5, 1.0, 2.0, 4.0, 4.0]
+        assert result.reconnected
+        assert result.attempts == 6
+        assert result.purged_session_ids == ["dead-0"]
+
+    async def test_supervisor_recovers_lost_connection(self):
+        """The background loop notices a dropped websocket and recovers."""
+        controller, spawner, _ = await make_setup(live=1, dead=3)
+        websocket = SimpleNamespace(closed=False)
+        controller.connection = SimpleNamespace(websocket=websocket)
+
+        async def reconnect() -> bool:
+            controller.connection = SimpleNamespace(websocket=SimpleNamespace(closed=False))
+            return True
+
+        controller.reconnect = AsyncMock(side_effect=reconnect)
+        reconciled = asyncio.Event()
+        results = []
+
+        def on_reconciled(result: ReconcileResult) -> None:
+            results.append(result)
+            reconciled.set()
+
+        supervisor = ConnectionSupervisor(
+            controller, spawner, on_reconciled=on_reconciled, check_interval=0.01
+        )
+        await supervisor.start()
+        try:
+            await asyncio.sleep(0.05)
+            assert controller.reconnect.await_count == 0
+
+            websocket.closed = True
+            await asyncio.wait_for(reconciled.wait(), timeout=1.0)
+        finally:
+            await supervisor.stop()
+
+        assert not supervisor.is_running
+        assert len(results) == 1
+        assert results[0].reconnected
+        assert len(results[0].purged_session_ids) == 3
+        assert controller.reconnect.await_count == 1
+
+    async def test_stop_before_start(self):
+        """stop is safe when the supervisor never started."""
+        controller, spawner, _ = await make_setup(live=1, dead=0)
+        supervisor = ConnectionSupervisor(controller, spawner)
+
+        await supervisor.stop()
+
+        assert not supervisor.is_running
+
+    async def test_reconcile_requires_connection(self):
+        """Reconciling without a connection raises."""
+        supervisor = ConnectionSupervisor(ItermController(), MagicMock())
+
+        with pytest.raises(ItermNotConnectedError):
+            await supervisor.reconcile()
@@ -508,6 +508,28 @@ class TestTasksSectionMessages:
         assert msg.task == task
 
 
+class TestTasksSectionReviewQueue:
+    """Tests for the review queue depth in the header."""
+
+    def test_header_shows_review_queue(self) -> None:
+        """Test header shows review queue depth when reviews are pending."""
+        from iterm_controller.review_scheduler import ReviewQueueStats
+
+        widget = TasksSection()
+        widget.set_review_queue(ReviewQueueStats(queued=3, running=2))
+
+        assert widget._format_header() == "v Tasks  (reviews: 2 running, 3 queued)"
+
+    def test_header_hides_idle_review_queue(self) -> None:
+        """Test idle review queue is not shown."""
+        from iterm_controller.review_scheduler import ReviewQueueStats
+
+        widget = TasksSection()
+        widget.set_review_queue(ReviewQueueStats())
+
+        assert widget._format_header() == "v Tasks"
+
+
 class TestTasksSectionHelpers:
     """Tests for helper methods."""
 
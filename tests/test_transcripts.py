@@ -0,0 +1,213 @@
+"""Tests for persistent session transcripts."""
+
+import asyncio
+import gzip
+import json
+
+from iterm_controller.models import ManagedSession
+from iterm_controller.session_monitor import OutputChange
+from iterm_controller.transcripts import (
+    INDEX_FILE,
+    META_FILE,
+    TranscriptStore,
+    TranscriptWriter,
+    session_dir_name,
+)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1_700_000_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_writer(tmp_path, **kwargs) -> TranscriptWriter:
+    kwargs.setdefault("clock", FakeClock())
+    return TranscriptWriter(tmp_path, **kwargs)
+
+
+class TestSessionDirName:
+    def test_iterm_session_id(self):
+        assert session_dir_name("w0t1p0:ABC-123") == "w0t1p0_ABC-123"
+
+    def test_path_separators(self):
+        assert "/" not in session_dir_name("../../etc")
+
+
+class TestTranscriptWriter:
+    """Test appending output to transcripts."""
+
+    async def test_flush_writes_frame_and_index(self, tmp_path):
+        """A flush appends one gzip frame per session and indexes it."""
+        writer = make_writer(tmp_path)
+        writer.append("s1", "hello\n", project_id="p", template_id="shell")
+        writer.append("s1", "world\n")
+
+        assert await writer.flush() == 2
+
+        session_dir = tmp_path / "s1"
+        meta = json.loads((session_dir / META_FILE).read_text())
+        assert meta["project_id"] == "p"
+        assert meta["template_id"] == "shell"
+        index_lines = (session_dir / INDEX_FILE).read_text().splitlines()
+        (entry,) = [json.loads(line) for line in index_lines]
+        assert entry["segment"] == "000001.jsonl.gz"
+        assert entry["offset"] == 0
+        assert entry["records"] == 2
+        assert writer.buffered_bytes == 0
+
+    async def test_segment_is_plain_gzip(self, tmp_path):
+        """Frames are gzip members, so a segment decompresses whole."""
+        writer = make_writer(tmp_path)
+        writer.append("s1", "one")
+        await writer.flush()
+        writer.append("s1", "two")
+        await writer.flush()
+
+        with gzip.open(tmp_path / "s1" / "000001.jsonl.gz", "rt") as f:
+            records = [json.loads(line) for line in f]
+
+        assert [r["o"] for r in records] == ["one", "two"]
+
+    async def test_empty_output_is_skipped(self, tmp_path):
+        """Nothing is written for empty chunks."""
+        writer = make_writer(tmp_path)
+        writer.append("s1", "")
+
+        assert await writer.flush() == 0
+        assert not (tmp_path / "s1").exists()
+
+    async def test_rotates_segments_by_size(self, tmp_path):
+        """A frame that would overflow the segment starts a new one."""
+        writer = make_writer(tmp_path, segment_bytes=200)
+        for i in range(5):
+            writer.append("s1", f"chunk {i} " + "x" * 100)
+            await writer.flush()
+
+        segments = sorted(p.name for p in (tmp_path / "s1").glob("*.jsonl.gz"))
+        assert len(segments) > 1
+        assert all((tmp_path / "s1" / name).stat().st_size <= 200 for name in segments[:-1])
+        records = list(TranscriptStore(tmp_path).read("s1"))
+        assert [r.output[:7] for r in records] == [f"chunk {i}" for i in range(5)]
+
+    async def test_new_writer_appends_to_last_segment(self, tmp_path):
+        """A restarted writer continues the newest segment."""
+        first = make_writer(tmp_path)
+        first.append("s1", "before")
+        await first.flush()
+
+        second = make_writer(tmp_path)
+        second.append("s1", "after")
+        await second.flush()
+
+        index = TranscriptStore(tmp_path).index("s1")
+        assert [e.segment for e in index] == ["000001.jsonl.gz"] * 2
+        assert index[1].offset == index[0].length
+
+    async def test_large_buffer_flushes_early(self, tmp_path):
+        """Buffered output past the limit is flushed without waiting."""
+        writer = make_writer(tmp_path, max_buffered_bytes=10)
+
+        writer.append("s1", "x" * 20)
+        await asyncio.sleep(0.05)
+
+        assert writer.buffered_bytes == 0
+        assert len(TranscriptStore(tmp_path).index("s1")) == 1
+
+    async def test_stop_flushes(self, tmp_path):
+        """Stopping writes what is still buffered."""
+        writer = make_writer(tmp_path, flush_interval=60)
+        await writer.start()
+        writer.append("s1", "last words")
+
+        await writer.stop()
+
+        assert [r.output for r in TranscriptStore(tmp_path).read("s1")] == ["last words"]
+
+    async def test_on_output_records_gaps(self, tmp_path):
+        """The monitor hook keeps the session's project and gap flags."""
+        writer = make_writer(tmp_path)
+        session = ManagedSession(id="s1", template_id="t", project_id="p", tab_id="tab")
+        change = OutputChange("s1", "a", "b", changed=True, new_lines=1, gap=True)
+
+        writer.on_output(session, change)
+        await writer.flush()
+
+        (record,) = TranscriptStore(tmp_path).read("s1")
+        assert record.output == "b"
+        assert record.gap is True
+
+
+class TestTranscriptStore:
+    """Test reading transcripts back."""
+
+    async def test_read_time_range(self, tmp_path):
+        """Only records in the range are returned."""
+        clock = FakeClock()
+        writer = make_writer(tmp_path, clock=clock)
+        for i in range(6):
+            writer.append("s1", f"line {i}")
+            clock.now += 10
+            if i % 2:
+                await writer.flush()
+
+        start = 1_700_000_000.0
+        records = list(TranscriptStore(tmp_path).read("s1", since=start + 15, until=start + 40))
+
+        assert [r.output for r in records] == ["line 2", "line 3", "line 4"]
+
+    async def test_read_skips_frames_outside_range(self, tmp_path, monkeypatch):
+        """Frames wholly outside the range are never decompressed."""
+        clock = FakeClock()
+        writer = make_writer(tmp_path, clock=clock)
+        for i in range(4):
+            writer.append("s1", f"line {i}")
+            await writer.flush()
+            clock.now += 10
+        store = TranscriptStore(tmp_path)
+        decompressed = []
+        original = store._read_frame
+
+        def read_frame(session_dir, entry):
+            decompressed.append(entry)
+            return original(session_dir, entry)
+
+        monkeypatch.setattr(store, "_read_frame", read_frame)
+
+        records = list(store.read("s1", since=1_700_000_025.0))
+
+        assert [r.output for r in records] == ["line 3"]
+        assert len(decompressed) == 1
+
+    async def test_sessions_lists_transcripts(self, tmp_path):
+        """Transcripts are listed with their metadata, oldest first."""
+        clock = FakeClock()
+        writer = make_writer(tmp_path, clock=clock)
+        writer.append("w0t0p0:B", "b", project_id="proj")
+        clock.now += 1
+        writer.append("w0t0p0:A", "a")
+        await writer.flush()
+
+        infos = TranscriptStore(tmp_path).sessions()
+
+        assert [i.session_id for i in infos] == ["w0t0p0:B", "w0t0p0:A"]
+        assert infos[0].project_id == "proj"
+
+    def test_missing_directory(self, tmp_path):
+        """A store without transcripts is empty."""
+        store = TranscriptStore(tmp_path / "missing")
+
+        assert store.sessions() == []
+        assert list(store.read("s1")) == []
+
+    async def test_torn_index_line_is_ignored(self, tmp_path):
+        """A partial index line from a crash does not break reads."""
+        writer = make_writer(tmp_path)
+        writer.append("s1", "kept")
+        await writer.flush()
+        with open(tmp_path / "s1" / INDEX_FILE, "a") as f:
+            f.write('{"segment": "0000')
+
+        assert [r.output for r in TranscriptStore(tmp_path).read("s1")] == ["kept"]